@@ -0,0 +1,14 @@
+-- Copyright 2025 LognLook
+-- Licensed under the Apache License, Version 2.0
+-- LognLook 로그 적재 워터마크 테이블 스키마
+
+-- 프로젝트/시간 버킷별 마지막 로그 적재 시각 (여러 워커가 조회 결과 캐시 무효화에 공유)
+CREATE TABLE `log_ingest_watermarks` (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    project_id INT NOT NULL,
+    bucket_start DATETIME NOT NULL, -- 1시간 버킷 시작 (1970-01-01이면 모든 기간)
+    ingested_at DATETIME(6) NOT NULL, -- 마지막 적재 시각 (UTC)
+    UNIQUE KEY uq_log_ingest_watermarks_bucket (project_id, bucket_start),
+    INDEX ix_log_ingest_watermarks_ingested_at (ingested_at),
+    FOREIGN KEY (project_id) REFERENCES project(id) ON DELETE CASCADE
+);
@@ -0,0 +1,27 @@
+-- Copyright 2025 LognLook
+-- Licensed under the Apache License, Version 2.0
+-- LognLook 로그 집계(rollup) 테이블 스키마
+
+-- 분/시간/일 단위 로그 건수 집계 테이블
+CREATE TABLE `log_rollups` (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    project_id INT NOT NULL,
+    granularity VARCHAR(10) NOT NULL, -- 집계 단위 (minute, hour, day)
+    bucket_start DATETIME NOT NULL, -- 버킷 시작 시각
+    log_level VARCHAR(20) NOT NULL DEFAULT '', -- 로그 레벨
+    keyword VARCHAR(100) NOT NULL DEFAULT '', -- AI 분류 키워드
+    host VARCHAR(255) NOT NULL DEFAULT '', -- 호스트 이름
+    log_count INT NOT NULL DEFAULT 0, -- 로그 건수
+    UNIQUE KEY uq_log_rollups_bucket (project_id, granularity, bucket_start, log_level, keyword, host),
+    INDEX ix_log_rollups_project_bucket (project_id, bucket_start),
+    INDEX ix_log_rollups_granularity_bucket (granularity, bucket_start),
+    FOREIGN KEY (project_id) REFERENCES project(id) ON DELETE CASCADE
+);
+
+-- 집계 건수를 메모리에 누적하는 프로세스 (정상 종료 시 삭제, heartbeat_at이 끊기면 비정상 종료로 판단)
+CREATE TABLE `rollup_writers` (
+    id VARCHAR(32) PRIMARY KEY, -- 프로세스 식별자
+    started_at DATETIME NOT NULL, -- 등록 시각
+    heartbeat_at DATETIME NOT NULL, -- 마지막 저장 시각
+    INDEX ix_rollup_writers_heartbeat_at (heartbeat_at)
+);
@@ -13,5 +13,7 @@ CREATE TABLE `project` (
     language ENUM('KOREAN', 'ENGLISH') NOT NULL DEFAULT 'KOREAN', -- 언어 설정
     create_by INT, -- 프로젝트 생성자
     create_at DATETIME DEFAULT CURRENT_TIMESTAMP, -- 프로젝트 생성 일시
+    UNIQUE KEY uq_project_api_key (api_key), -- 로그 수집마다 조회
+    UNIQUE KEY uq_project_invite_code (invite_code), -- 초대 참여 시 조회
     FOREIGN KEY (create_by) REFERENCES users(id)
 );
\ No newline at end of file
@@ -8,6 +8,12 @@ CREATE TABLE `project_settings` (
     project_id INT NOT NULL UNIQUE, -- 프로젝트 연결 (1:1 관계)
     logstash_config JSON NOT NULL DEFAULT '[]', -- logstash 연결 설정
     log_keywords JSON NOT NULL DEFAULT '[]', -- 로그 키워드 설정
+    ingest_field_allowlist JSON NOT NULL DEFAULT '[]', -- 적재 허용 필드 (비어있으면 전체 허용)
+    ingest_field_denylist JSON NOT NULL DEFAULT '[]', -- 적재 제외 필드
+    log_retention_days INT NULL, -- 원본 로그 보존 기간 (일, NULL이면 무기한)
+    vector_retention_days INT NULL, -- 임베딩 벡터 보존 기간 (일, NULL이면 무기한)
+    rollup_since DATETIME NULL, -- 이 시각 이후 적재된 로그는 log_rollups 집계에 빠짐없이 있음 (NULL이면 대시보드를 OpenSearch로 집계)
+    mapping_profile ENUM('FULL', 'LEAN') NOT NULL DEFAULT 'FULL', -- 인덱스를 만들 때 사용한 OpenSearch 매핑 프로필
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, -- 설정 최종 수정일
     FOREIGN KEY (project_id) REFERENCES project(id) ON DELETE CASCADE
 );
\ No newline at end of file
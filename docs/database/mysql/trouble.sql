@@ -11,7 +11,16 @@ CREATE TABLE `troubles` (
     user_query VARCHAR(1000) NOT NULL, -- 사용자 쿼리
     content VARCHAR(10000) NOT NULL, -- 리포트 내용
     is_shared BOOLEAN NOT NULL DEFAULT FALSE, -- 리포트 공유 여부
+    status ENUM('PENDING', 'RUNNING', 'COMPLETED', 'FAILED') NOT NULL DEFAULT 'COMPLETED', -- AI 생성 상태
+    attempts INT NOT NULL DEFAULT 0, -- AI 생성 시도 횟수
+    error_message VARCHAR(1000) NULL, -- 마지막 AI 생성 실패 사유
+    completed_at DATETIME NULL, -- AI 생성 완료 일시
+    claimed_at DATETIME NULL, -- AI 생성 선점 일시 (오래된 선점은 재등록)
+    prompt_tokens INT NULL, -- AI 생성에 쓴 입력 토큰 수 (로그 요약 포함)
+    generation_ms INT NULL, -- AI 생성 소요 시간 (ms)
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP, -- 리포트 생성 일시
+    INDEX ix_troubles_project_created (project_id, created_at), -- 프로젝트별 최신순 목록
+    FULLTEXT INDEX ft_troubles_text (report_name, user_query, content) WITH PARSER ngram, -- 목록 검색어 전문 검색 (innodb_ft_enable_stopword = OFF 세션에서 생성, BOOLEAN MODE 구문 검색)
     FOREIGN KEY (project_id) REFERENCES project(id) ON DELETE CASCADE,
     FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE CASCADE
 );
\ No newline at end of file
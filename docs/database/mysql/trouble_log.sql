@@ -7,5 +7,6 @@ CREATE TABLE `trouble_logs` (
     id INT AUTO_INCREMENT PRIMARY KEY,
     trouble_id INT NOT NULL,
     log_id VARCHAR(100) NOT NULL, -- OpenSearch 문서 ID
+    INDEX ix_trouble_logs_trouble_id (trouble_id), -- trouble별 로그 조회/개수
     FOREIGN KEY (trouble_id) REFERENCES troubles(id) ON DELETE CASCADE
 );
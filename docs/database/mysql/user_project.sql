@@ -9,6 +9,7 @@ CREATE TABLE `user_project` (
     project_id INT NOT NULL,
     role VARCHAR(20), -- 프로젝트 내 역할 (Owner, Member)
     email_notification BOOLEAN NOT NULL DEFAULT TRUE, -- 프로젝트별 알림 설정
+    UNIQUE KEY uq_user_project_user_project (user_id, project_id), -- 요청마다 멤버십 조회
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     FOREIGN KEY (project_id) REFERENCES project(id) ON DELETE CASCADE
 );
\ No newline at end of file
@@ -7,5 +7,6 @@ CREATE TABLE `users` (
     id INT AUTO_INCREMENT PRIMARY KEY, 
     username VARCHAR(50) NOT NULL UNIQUE, -- 사용자명
     password VARCHAR(255) NOT NULL, -- 해시된 비밀번호
+    token_version INT NOT NULL DEFAULT 0, -- 멤버십 변경 시 증가 (토큰의 멤버십 클레임 무효화)
     create_at DATETIME DEFAULT CURRENT_TIMESTAMP -- 회원 가입 일시
 );
\ No newline at end of file
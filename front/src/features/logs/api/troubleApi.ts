@@ -1,4 +1,4 @@
-import { troubleService, CreateTroubleRequest, ProjectTroublesResponse } from '../../../services/troubleService';
+import { troubleService, CreateTroubleRequest, ProjectTroublesResponse, TroubleStatus } from '../../../services/troubleService';
 
 // Trouble-related API functions
 export interface TroubleListItem {
@@ -8,6 +8,7 @@ export interface TroubleListItem {
   logs_count: number;
   created_at: string;
   creator_username: string;
+  status?: TroubleStatus;
 }
 
 export interface TroubleWithLogs {
@@ -20,6 +21,8 @@ export interface TroubleWithLogs {
     project_id: number;
     created_at: string;
     created_by: number;
+    status?: TroubleStatus;
+    error_message?: string | null;
   };
   logs: string[];
 }
@@ -34,7 +37,8 @@ export interface CreateTroubleResponse {
   project_id: number;
   created_at: string;
   created_by: number;
-  status?: 'processing' | 'completed' | 'failed';
+  status?: TroubleStatus;
+  error_message?: string | null;
 }
 
 // Fetch project trouble list
@@ -80,9 +84,9 @@ export const fetchTroubleById = async (troubleId: number, _userId: number): Prom
 };
 
 // Create trouble
-export const createTrouble = async (request: CreateTroubleRequest): Promise<CreateTroubleResponse> => {
+export const createTrouble = async (request: CreateTroubleRequest, stream: boolean = false): Promise<CreateTroubleResponse> => {
   try {
-    const response = await troubleService.createTrouble(request);
+    const response = await troubleService.createTrouble(request, stream);
     
     return response;
   } catch (error) {
@@ -102,6 +106,35 @@ export const createTrouble = async (request: CreateTroubleRequest): Promise<Crea
   }
 };
 
+// Poll a trouble until its background AI analysis finishes (completed or failed)
+export const waitForTrouble = async (
+  troubleId: number,
+  intervalMs: number = 2000,
+  timeoutMs: number = 180000
+): Promise<CreateTroubleResponse> => {
+  const deadline = Date.now() + timeoutMs;
+  while (true) {
+    const { trouble } = await troubleService.getTrouble(troubleId);
+    if (trouble.status === 'completed' || trouble.status === 'failed' || Date.now() >= deadline) {
+      return trouble;
+    }
+    await new Promise(resolve => setTimeout(resolve, intervalMs));
+  }
+};
+
+// Stream a trouble's AI analysis token by token, falling back to polling if the stream fails
+export const streamTrouble = async (
+  troubleId: number,
+  onToken: (text: string) => void
+): Promise<CreateTroubleResponse> => {
+  try {
+    return await troubleService.streamTrouble(troubleId, onToken);
+  } catch (error) {
+    console.error('Trouble stream failed, polling status instead:', error);
+    return waitForTrouble(troubleId);
+  }
+};
+
 // Get project troubles list
 export const getProjectTroubles = async (
   projectId: number,
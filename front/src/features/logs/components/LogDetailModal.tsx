@@ -2,7 +2,7 @@ import React, { useState, useEffect, useRef } from 'react';
 import ReactMarkdown from 'react-markdown';
 import { DisplayLogItem } from '../../../types/logs';
 import { ApiLogDetailEntry } from '../api/detailLogApi';
-import { createTrouble, TroubleWithLogs } from '../api/troubleApi';
+import { createTrouble, streamTrouble, TroubleWithLogs } from '../api/troubleApi';
 import { ExtendedApiLogDetailEntry } from '../../../types/ExtendedApiLogDetailEntry';
 import { CreateTroubleResponse } from '../api/troubleApi';
 import { troubleService, CreateTroubleRequest } from '../../../services/troubleService'; // 올바른 import
@@ -116,16 +116,16 @@ const LogDetailModal: React.FC<LogDetailModalProps> = ({
 
   if (!isOpen) return null;
 
-  // 백엔드 분석: AI 분석은 동기적으로 처리되며, 실패 시 "진행 중입니다" 메시지로 대체됨
-  // 이후 상태가 변경되지 않으므로 polling이 필요하지 않음
-  // 대신 사용자에게 명확한 피드백을 제공
+  // 백엔드 분석: POST /troubles?stream=true는 pending 상태로 바로 응답하고
+  // GET /troubles/{id}/stream(SSE)으로 분석 내용을 토큰 단위로 받아 바로 표시
+  // 스트림이 실패하면 백그라운드 작업이 재시도하므로 완료(completed) 또는 실패(failed)까지 status를 polling
 
   const handleSendMessage = async () => {
     if (!chatMessage.trim() || troubleSent) return;
     setChatHistory(prev => [...prev, { type: 'user', message: chatMessage }]);
     setIsSending(true);
     
-    // Show simple loading indicator - backend processes synchronously
+    // Show simple loading indicator while the background analysis runs
     setChatHistory(prev => [...prev, { 
       type: 'assistant', 
       message: 'LOADING_PLACEHOLDER'
@@ -169,8 +169,20 @@ const LogDetailModal: React.FC<LogDetailModalProps> = ({
       console.log('📤 Sending trouble request:', troubleReq);
       
       console.log('🔄 Calling createTrouble API...');
-      const troubleRes = await createTrouble(troubleReq);
+      const created = await createTrouble(troubleReq, true);
       console.log('✅ createTrouble API call successful');
+      let streamed = '';
+      const troubleRes = created.status === 'pending'
+        ? await streamTrouble(created.id, (text) => {
+            streamed += text;
+            const message = streamed;
+            setChatHistory(prev => {
+              const newHistory = [...prev];
+              newHistory[newHistory.length - 1] = { type: 'assistant', message };
+              return newHistory;
+            });
+          })
+        : created;
       console.log('📋 Full trouble response:', troubleRes);
       console.log('📝 Trouble content:', troubleRes.content);
       console.log('📝 Trouble report_name:', troubleRes.report_name);
@@ -178,18 +190,18 @@ const LogDetailModal: React.FC<LogDetailModalProps> = ({
       
       setTroubleShootingTitle(troubleRes.report_name);
       
-      // 백엔드 응답에서 status 필드 확인하여 처리 상태를 판단
-      // status가 'processing'이면 AI 분석이 실패했거나 시간 초과되었음을 의미
-      const isProcessing = troubleRes.status === 'processing' || (troubleRes.content && troubleRes.content.includes('진행 중입니다'));
+      // 백엔드 응답의 status로 처리 상태를 판단
+      // completed가 아니면 재시도 후에도 AI 분석이 실패했거나 polling 시간이 초과되었음을 의미
+      const isProcessing = troubleRes.status !== 'completed';
       
       if (isProcessing) {
-        console.log('⚠️ Server returned "진행 중입니다" - AI analysis failed or timed out');
+        console.log('⚠️ AI analysis failed or timed out:', troubleRes.error_message);
         
         // Show user-friendly message for AI analysis failure
         setChatHistory(prev => {
           const newHistory = [...prev];
           const lastIndex = newHistory.length - 1;
-          if (newHistory[lastIndex].message === 'LOADING_PLACEHOLDER') {
+          if (newHistory[lastIndex].type === 'assistant') {
             newHistory[lastIndex] = { 
               type: 'assistant', 
               message: `⚠️ AI analysis encountered an issue\n\n📋 Report: ${troubleRes.report_name}\n🔍 Analyzed: ${related_logs.length} logs\n💬 Query: "${chatMessage}"\n\n🤖 Server AI analysis was not completed.\n\n💡 Solutions:\n• Try with fewer logs\n• Wait and try again\n• Contact administrator\n\n📋 ID: ${troubleRes.id}` 
@@ -214,7 +226,7 @@ const LogDetailModal: React.FC<LogDetailModalProps> = ({
         setChatHistory(prev => {
           const newHistory = [...prev];
           const lastIndex = newHistory.length - 1;
-          if (newHistory[lastIndex].message === 'LOADING_PLACEHOLDER') {
+          if (newHistory[lastIndex].type === 'assistant') {
             newHistory[lastIndex] = { 
               type: 'assistant', 
               message: `✅ AI analysis completed!\n\n${troubleRes.content}` 
@@ -244,7 +256,7 @@ const LogDetailModal: React.FC<LogDetailModalProps> = ({
       setChatHistory(prev => {
         const newHistory = [...prev];
         const lastIndex = newHistory.length - 1;
-        if (newHistory[lastIndex].message === 'LOADING_PLACEHOLDER') {
+        if (newHistory[lastIndex].type === 'assistant') {
           newHistory[lastIndex] = { 
             type: 'assistant', 
             message: `❌ Troubleshooting creation failed\n\n🔍 Error: ${errorMessage}\n\n💡 Solutions:\n• Check network connection\n• Verify login status\n• Try again later\n• Contact administrator if problem persists` 
@@ -16,7 +16,7 @@ const RecentLogs: React.FC<RecentLogsProps> = ({
 }) => {
   const { selectedProject } = useProjects();
   const [selectedLogs, setSelectedLogs] = useState<Set<number>>(new Set());
-  const [currentPeriod, setCurrentPeriod] = useState(1); // 1: 최근 3일, 2: 그 이전 3일, ...
+  const [nextCursor, setNextCursor] = useState<string | null>(null); // 서버가 준 다음 페이지 커서
   const [isLoading, setIsLoading] = useState(false);
   const [selectedLog, setSelectedLog] = useState<DisplayLogItem | null>(null);
   const [isModalOpen, setIsModalOpen] = useState(false);
@@ -35,33 +35,29 @@ const RecentLogs: React.FC<RecentLogsProps> = ({
 
   const observer = useRef<IntersectionObserver | null>(null);
 
-  // API에서 특정 기간의 recent logs 가져오기
-  const loadRecentLogsForPeriod = async (period: number) => {
+  // API에서 커서 다음 페이지의 recent logs 가져오기 (cursor가 null이면 첫 페이지)
+  const loadRecentLogsPage = async (cursor: string | null) => {
     if (!selectedProject?.id) {
-      console.log('RecentLogs - No projectId in loadRecentLogsForPeriod');
-      return [];
+      console.log('RecentLogs - No projectId in loadRecentLogsPage');
+      return { items: [], nextCursor: null };
     }
     
     try {
-      const limit = period * 50; // period에 따라 limit 조정
       console.log(`RecentLogs - Calling logService.getRecentLogs with:`, {
         projectId: selectedProject.id, 
-        period: period,
-        limit: limit,
-        count: period,
+        cursor: cursor,
         size: 50
       });
       
-      const data = await logService.getRecentLogs(selectedProject.id, period, 50);
+      const page = await logService.getRecentLogs(selectedProject.id, cursor, 50);
       console.log(`RecentLogs - logService.getRecentLogs returned:`, {
-        dataLength: data?.length || 0,
-        dataType: typeof data,
-        dataIsArray: Array.isArray(data),
-        dataSample: Array.isArray(data) ? data.slice(0, 2) : data
+        dataLength: page.items.length,
+        hasNextCursor: page.nextCursor !== null,
+        dataSample: page.items.slice(0, 2)
       });
-      return data;
+      return page;
     } catch (error) {
-      console.error(`Failed to load recent logs for period ${period}:`, error);
+      console.error(`Failed to load recent logs page:`, error);
       throw error;
     }
   };
@@ -73,10 +69,11 @@ const RecentLogs: React.FC<RecentLogsProps> = ({
         console.log('RecentLogs - Loading initial logs for projectId:', selectedProject?.id);
         setApiLoading(true);
         setApiError(null);
-        const data = await loadRecentLogsForPeriod(1); // 최근 3일
-        console.log('RecentLogs - Initial logs loaded:', data.length);
-        setAllRecentLogs(data);
-        setHasMoreLogs(data.length > 0); // 데이터가 있으면 더 로드할 수 있다고 가정
+        const page = await loadRecentLogsPage(null); // 최신 로그 첫 페이지
+        console.log('RecentLogs - Initial logs loaded:', page.items.length);
+        setAllRecentLogs(page.items);
+        setNextCursor(page.nextCursor);
+        setHasMoreLogs(page.nextCursor !== null); // 커서가 없으면 마지막 페이지
       } catch (error) {
         console.error('Failed to load initial recent logs:', error);
         setApiError('Failed to load recent logs');
@@ -97,27 +94,35 @@ const RecentLogs: React.FC<RecentLogsProps> = ({
     }
   }, [selectedProject?.id]); // projectId 의존성 추가
 
-  // 다음 기간의 로그 로드 (무한 스크롤)
+  // 다음 페이지 로그 로드 (무한 스크롤)
   const loadMoreLogs = async () => {
-    if (isLoading || !hasMoreLogs) return;
+    if (isLoading || !hasMoreLogs || !nextCursor) return;
     
     try {
       setIsLoading(true);
-      const nextPeriod = currentPeriod + 1;
-      console.log(`RecentLogs - Loading more logs for period: ${nextPeriod}`);
+      console.log('RecentLogs - Loading next page of logs');
       
-      const newData = await loadRecentLogsForPeriod(nextPeriod);
-      console.log(`RecentLogs - Loaded ${newData.length} more logs for period ${nextPeriod}`);
+      const page = await loadRecentLogsPage(nextCursor);
+      console.log(`RecentLogs - Adding ${page.items.length} logs to existing ${allRecentLogs.length} logs`);
       
-      if (newData.length === 0) {
+      setAllRecentLogs(prev => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+      if (page.nextCursor === null) {
         console.log('RecentLogs - No more logs available, stopping infinite scroll');
         setHasMoreLogs(false);
-      } else {
-        console.log(`RecentLogs - Adding ${newData.length} logs to existing ${allRecentLogs.length} logs`);
-        setAllRecentLogs(prev => [...prev, ...newData]);
-        setCurrentPeriod(nextPeriod);
       }
-    } catch (error) {
+    } catch (error: any) {
+      if (error?.response?.status === 410) {
+        // 커서(point in time)가 만료되면 첫 페이지부터 다시 로드
+        console.log('RecentLogs - Cursor expired, reloading from the first page');
+        const page = await loadRecentLogsPage(null).catch(() => null);
+        if (page) {
+          setAllRecentLogs(page.items);
+          setNextCursor(page.nextCursor);
+          setHasMoreLogs(page.nextCursor !== null);
+          return;
+        }
+      }
       console.error('Failed to load more logs:', error);
       setHasMoreLogs(false);
     } finally {
@@ -134,7 +139,7 @@ const RecentLogs: React.FC<RecentLogsProps> = ({
       }
     });
     if (node) observer.current.observe(node);
-  }, [isLoading, apiLoading, hasMoreLogs]);
+  }, [isLoading, apiLoading, hasMoreLogs, nextCursor]);
 
   // LogEntry를 DisplayLogItem으로 변환
   const convertToDisplayLog = (apiLog: LogEntry): DisplayLogItem => {
@@ -23,7 +23,6 @@ const TroubleShootingPage: React.FC<TroubleListPageProps> = ({ userId, isSidebar
   const [modalLogs, setModalLogs] = useState<DisplayLogItem[]>([]);
   const [detailData, setDetailData] = useState<any[]>([]);
   const [isDetailLoading, setIsDetailLoading] = useState(false);
-  const [actualLogCounts, setActualLogCounts] = useState<Record<number, number>>({});
   const [deleteConfirmModal, setDeleteConfirmModal] = useState<{ isOpen: boolean; troubleId: number | null; troubleName: string }>({ isOpen: false, troubleId: null, troubleName: '' });
   const [isDeleting, setIsDeleting] = useState(false);
 
@@ -46,26 +45,6 @@ const TroubleShootingPage: React.FC<TroubleListPageProps> = ({ userId, isSidebar
       .substring(0, 2);
   };
 
-  // 실제 로그 개수 가져오기
-  const fetchActualLogCounts = async (troubles: TroubleListItem[]) => {
-    if (!selectedProject) return;
-    
-    const logCounts: Record<number, number> = {};
-    
-    for (const trouble of troubles) {
-      try {
-        const troubleDetails = await fetchTroubleById(trouble.id, userId);
-        logCounts[trouble.id] = troubleDetails.logs.length;
-      } catch (error) {
-        console.error(`Failed to fetch logs for trouble ${trouble.id}:`, error);
-        // Use default value on error
-        logCounts[trouble.id] = trouble.logs_count;
-      }
-    }
-    
-    setActualLogCounts(logCounts);
-  };
-
   useEffect(() => {
     const load = async () => {
       if (!selectedProject) return;
@@ -74,9 +53,6 @@ const TroubleShootingPage: React.FC<TroubleListPageProps> = ({ userId, isSidebar
       try {
         const res = await getProjectTroubles(selectedProject.id, 1, 50);
         setTroubles(res.items);
-        
-        // Fetch actual log counts
-        await fetchActualLogCounts(res.items);
       } finally {
         setLoading(false);
       }
@@ -163,9 +139,6 @@ const TroubleShootingPage: React.FC<TroubleListPageProps> = ({ userId, isSidebar
       try {
         const res = await getProjectTroubles(selectedProject.id, 1, 50);
         setTroubles(res.items);
-        
-        // Also refresh actual log counts
-        await fetchActualLogCounts(res.items);
       } catch (error) {
         console.error('Failed to refresh trouble list:', error);
       }
@@ -324,7 +297,7 @@ const TroubleShootingPage: React.FC<TroubleListPageProps> = ({ userId, isSidebar
                       />
                     </svg>
                   </div>
-                  <span>Logs: {actualLogCounts[trouble.id] ?? trouble.logs_count}</span>
+                  <span>Logs: {trouble.logs_count}</span>
                 </div>
               </div>
 
@@ -16,6 +16,7 @@ export interface LogSearchParams {
   startTime?: string;
   endTime?: string;
   k: number;
+  mode?: 'vector' | 'hybrid';
 }
 
 export interface LogSearchResponse {
@@ -25,6 +26,11 @@ export interface LogSearchResponse {
   totalPages: number;
 }
 
+export interface RecentLogsPage {
+  items: LogEntry[];
+  nextCursor: string | null;
+}
+
 export interface LogStats {
   totalLogs: number;
   levelDistribution: Record<string, number>;
@@ -35,7 +41,21 @@ export interface LogStats {
   }>;
 }
 
+const LOG_DETAIL_CACHE_LIMIT = 1000;
+
 class LogService {
+  // Log details by `${projectId}:${logId}`, oldest first
+  private logDetailCache = new Map<string, any>();
+
+  private rememberLogDetail(key: string, entry: any) {
+    this.logDetailCache.delete(key);
+    this.logDetailCache.set(key, entry);
+    if (this.logDetailCache.size > LOG_DETAIL_CACHE_LIMIT) {
+      const oldestKey = this.logDetailCache.keys().next().value;
+      if (oldestKey !== undefined) this.logDetailCache.delete(oldestKey);
+    }
+  }
+
   async searchLogs(projectId: number, params: LogSearchParams): Promise<LogSearchResponse> {
     try {
       const apiParams: any = {
@@ -49,6 +69,7 @@ class LogService {
       if (params.logLevel) apiParams.log_level = params.logLevel;
       if (params.startTime) apiParams.start_time = params.startTime;
       if (params.endTime) apiParams.end_time = params.endTime;
+      if (params.mode) apiParams.mode = params.mode;
       
       const response = await api.get('/logs/search', { params: apiParams });
       
@@ -112,25 +133,23 @@ class LogService {
     }
   }
   
-  async getRecentLogs(projectId: number, count: number = 1, size: number = 100): Promise<LogEntry[]> {
+  async getRecentLogs(projectId: number, cursor: string | null = null, size: number = 100): Promise<RecentLogsPage> {
     try {
+      // Server pages newest-first with an opaque cursor; omit it for the first page
       const response = await api.get('/logs/recent', { 
         params: { 
           project_id: projectId, 
-          count: count,
-          size: size
+          size: size,
+          ...(cursor ? { cursor } : {})
         }
       });
       
-      if (Array.isArray(response.data)) {
-        return response.data;
-      } else if (response.data && typeof response.data === 'object' && 'data' in response.data) {
-        return response.data.data || [];
-      }
-      
-      return [];
+      const { items = [], next_cursor = null } = response.data || {};
+      return { items, nextCursor: next_cursor };
     } catch (error) {
       console.error('Recent logs API call failed:', error);
+      // Let callers handle an expired cursor (410) instead of appending mock rows
+      if (cursor) throw error;
       
       // Return mock data
       const mockLogs: LogEntry[] = [];
@@ -149,164 +168,48 @@ class LogService {
           host_name: `host-${i % 3 + 1}`
         });
       }
-      return mockLogs;
+      return { items: mockLogs, nextCursor: null };
     }
   }
   
-  // Helper function to generate time grid with proper intervals
-  private generateTimeGrid(startTime: Date, endTime: Date, timeRange: string): string[] {
-    const timeGrid: string[] = [];
-    let current = new Date(startTime);
-    
-    while (current <= endTime) {
-      let timeKey: string;
-      
-      switch (timeRange) {
-        case 'day':
-          // Day view: 1-hour intervals for better readability
-          timeKey = current.toISOString();
-          current = new Date(current.getTime() + 60 * 60 * 1000); // Add 1 hour
-          break;
-        case 'week':
-          // Week view: use actual times, not fixed noon
-          timeKey = current.toISOString();
-          current = new Date(current.getTime() + 24 * 60 * 60 * 1000); // Add 1 day
-          break;
-        case 'month':
-          // Month view: use actual times, not fixed noon
-          timeKey = current.toISOString();
-          current = new Date(current.getTime() + 24 * 60 * 60 * 1000); // Add 1 day
-          break;
-        default:
-          timeKey = current.toISOString().slice(0, 13) + ':00:00.000Z';
-          current = new Date(current.getTime() + 60 * 60 * 1000);
-      }
-      
-      timeGrid.push(timeKey);
-    }
-    
-    return timeGrid;
-  }
-
   async getLogStats(projectId: number, timeRange: string = 'day'): Promise<LogStats> {
     try {
-      const response = await api.get('/logs/mainboard', { 
+      // Server aggregates the whole range (date_histogram x log_level) in one request
+      const response = await api.get('/logs/dashboard', { 
         params: { 
           project_id: projectId, 
           log_time: timeRange 
         }
       });
       
-      const logs = response.data || [];
-      const filteredLogs = logs;
-      
-      // Calculate log level distribution
-      const levelDistribution: Record<string, number> = {};
-      filteredLogs.forEach((log: any) => {
-        const level = log.log_level || 'UNKNOWN';
-        levelDistribution[level] = (levelDistribution[level] || 0) + 1;
-      });
-      
-      // Generate time grid based on user's local timezone
-      let startTime: Date;
-      let endTime: Date;
-      
-      // Use user's current local time as end time
-      endTime = new Date(); // This is user's local time
+      const { total = 0, timestamps = [], series = {}, levels = {} } = response.data || {};
       
-      // Calculate start time based on selected period (user's local time)
-      switch (timeRange) {
-        case 'day':
-          startTime = new Date(endTime.getTime() - 24 * 60 * 60 * 1000); // 24 hours ago
-          break;
-        case 'week':
-          startTime = new Date(endTime.getTime() - 7 * 24 * 60 * 60 * 1000); // 7 days ago
-          break;
-        case 'month':
-          startTime = new Date(endTime.getTime() - 30 * 24 * 60 * 60 * 1000); // 30 days ago
-          break;
-        default:
-          startTime = new Date(endTime.getTime() - 24 * 60 * 60 * 1000); // Default to 24 hours
-      }
-      
-      const timeGrid = this.generateTimeGrid(startTime, endTime, timeRange);
-      
-      // Initialize time groups with all time slots set to 0
-      const timeGroups: Record<string, Record<string, number>> = {};
-      timeGrid.forEach(timeKey => {
-        timeGroups[timeKey] = { INFO: 0, WARN: 0, ERROR: 0, DEBUG: 0, CRITICAL: 0 };
-      });
+      // Map inconsistent level names
+      const normalizeLevel = (level: string) => (level === 'WARNING' ? 'WARN' : level);
       
-      // Fill in actual log data
-      filteredLogs.forEach((log: any) => {
-        if (log.message_timestamp) {
-          // Parse log timestamp (server sends UTC time without Z suffix)
-          const logTimestamp = log.message_timestamp.endsWith('Z') ? 
-            log.message_timestamp : log.message_timestamp + 'Z';
-          const logDate = new Date(logTimestamp);
-          
-          if (isNaN(logDate.getTime())) {
-            return;
-          }
-          
-          // Check if log is within our time range (user's local time)
-          if (logDate < startTime || logDate > endTime) {
-            return;
-          }
-          
-          // Find the closest time slot in our grid
-          let closestTimeKey: string | null = null;
-          let minTimeDiff = Infinity;
-          
-          for (const timeKey of timeGrid) {
-            const gridDate = new Date(timeKey);
-            const timeDiff = Math.abs(gridDate.getTime() - logDate.getTime());
-            
-            if (timeDiff < minTimeDiff) {
-              minTimeDiff = timeDiff;
-              closestTimeKey = timeKey;
-            }
-          }
-          
-          if (closestTimeKey && timeGroups[closestTimeKey]) {
-            let level = (log.log_level || 'INFO').toUpperCase(); // Default to INFO instead of UNKNOWN
-            
-            // Map inconsistent level names
-            if (level === 'WARNING') {
-              level = 'WARN';
-            }
-            
-            // Ensure the level exists in our timeGroups structure
-            if (!(level in timeGroups[closestTimeKey])) {
-              // Add missing level with 0 count
-              timeGroups[closestTimeKey][level] = 0;
-            }
-            
-            timeGroups[closestTimeKey][level]++;
-          }
-        }
+      const levelDistribution: Record<string, number> = {};
+      Object.entries(levels as Record<string, number>).forEach(([level, count]) => {
+        const key = normalizeLevel(level);
+        levelDistribution[key] = (levelDistribution[key] || 0) + count;
       });
       
-      // Convert time groups to trends array
+      // Convert series to trends array (server sends UTC time without Z suffix)
       const recentTrends: Array<{date: string, count: number, level: string}> = [];
-      Object.entries(timeGroups).forEach(([timeKey, levelCounts]) => {
-        Object.entries(levelCounts).forEach(([level, count]) => {
+      (timestamps as string[]).forEach((timestamp, i) => {
+        const date = new Date(timestamp.endsWith('Z') ? timestamp : timestamp + 'Z').toISOString();
+        Object.entries(series as Record<string, number[]>).forEach(([level, counts]) => {
           // Only include entries with count > 0 to avoid empty data
-          if (count > 0) {
-            recentTrends.push({ date: timeKey, count, level });
+          if (counts[i] > 0) {
+            recentTrends.push({ date, count: counts[i], level: normalizeLevel(level) });
           }
         });
       });
       
-      // Sort by time
-      recentTrends.sort((a, b) => new Date(a.date).getTime() - new Date(b.date).getTime());
-      
-      const result = {
-        totalLogs: filteredLogs.length,
+      return {
+        totalLogs: total,
         levelDistribution,
         recentTrends
       };
-      return result;
     } catch (error: any) {
       console.error('Log stats API call failed:', error);
       return {
@@ -327,24 +230,35 @@ class LogService {
       
       // Convert logId to array if needed
       const logIds = Array.isArray(logId) ? logId : [logId];
+      const cacheKey = (id: string) => `${actualProjectId}:${id}`;
       
-      // Server expects log_ids as List[str] query parameters
-      const params = new URLSearchParams();
-      params.append('project_id', actualProjectId.toString());
-      logIds.forEach(id => {
-        params.append('log_ids', id);
-      });
+      // Log documents never change once written: only fetch ids we have not seen yet
+      // (sorted so the same id set maps to the same, browser-cacheable URL)
+      const missingIds = Array.from(new Set(logIds))
+        .filter(id => !this.logDetailCache.has(cacheKey(id)))
+        .sort();
       
-      const response = await api.get('/logs/detail', { 
-        params: params
-      });
-      
-      // Return array response or empty array
-      if (Array.isArray(response.data)) {
-        return response.data;
-      } else {
-        return [];
+      if (missingIds.length > 0) {
+        // Server expects log_ids as List[str] query parameters
+        const params = new URLSearchParams();
+        params.append('project_id', actualProjectId.toString());
+        missingIds.forEach(id => {
+          params.append('log_ids', id);
+        });
+        
+        const response = await api.get('/logs/detail', { 
+          params: params
+        });
+        
+        if (Array.isArray(response.data)) {
+          response.data.forEach((entry: any) => this.rememberLogDetail(cacheKey(entry._id), entry));
+        }
       }
+      
+      // Return entries in the requested order (ids that do not exist are skipped)
+      return logIds
+        .filter(id => this.logDetailCache.has(cacheKey(id)))
+        .map(id => this.logDetailCache.get(cacheKey(id)));
     } catch (error) {
       console.error('Log detail API call failed:', error);
       
@@ -1,5 +1,8 @@
 import api from '../api/axios';
 
+// AI 분석 상태 (POST /troubles는 pending으로 바로 응답하고 백그라운드에서 분석)
+export type TroubleStatus = 'pending' | 'running' | 'completed' | 'failed';
+
 export interface TroubleItem {
   id: number;
   report_name: string;
@@ -9,6 +12,10 @@ export interface TroubleItem {
   project_id: number;
   created_by: number;
   created_at: string;
+  status: TroubleStatus;
+  attempts?: number;
+  error_message?: string | null;
+  completed_at?: string | null;
   logs_count?: number;
   creator_username?: string;
 }
@@ -23,6 +30,10 @@ export interface TroubleDetail {
     project_id: number;
     created_by: number;
     created_at: string;
+    status: TroubleStatus;
+    attempts?: number;
+    error_message?: string | null;
+    completed_at?: string | null;
   };
   logs: string[];
 }
@@ -47,12 +58,14 @@ export interface ProjectTroublesResponse {
     created_at: string;
     creator_username: string;
     is_shared: boolean;
+    status: TroubleStatus;
     logs_count: number;
   }>;
   page: number;
   pages: number;
   size: number;
   total: number;
+  next_cursor: string | null;
 }
 
 class TroubleService {
@@ -63,7 +76,8 @@ class TroubleService {
     size: number = 10,
     search?: string,
     is_shared?: boolean,
-    created_by?: number
+    created_by?: number,
+    cursor?: string
   ): Promise<ProjectTroublesResponse> {
     try {
       const params = new URLSearchParams({
@@ -74,6 +88,7 @@ class TroubleService {
       if (search) params.append('search', search);
       if (is_shared !== undefined) params.append('is_shared', is_shared.toString());
       if (created_by) params.append('created_by', created_by.toString());
+      if (cursor) params.append('cursor', cursor);
       
       const response = await api.get(`/troubles/list/${projectId}?${params.toString()}`);
       return response.data;
@@ -94,10 +109,10 @@ class TroubleService {
     }
   }
 
-  // Create trouble
-  async createTrouble(troubleData: CreateTroubleRequest): Promise<TroubleItem> {
+  // Create trouble (stream=true: 분석 내용을 streamTrouble로 받음)
+  async createTrouble(troubleData: CreateTroubleRequest, stream: boolean = false): Promise<TroubleItem> {
     try {
-      const response = await api.post(`/troubles`, troubleData);
+      const response = await api.post(`/troubles`, troubleData, { params: stream ? { stream } : undefined });
       return response.data;
     } catch (error) {
       console.error('Failed to create trouble:', error);
@@ -105,6 +120,56 @@ class TroubleService {
     }
   }
 
+  // Stream AI analysis tokens over Server-Sent Events (EventSource는 Authorization 헤더를 보낼 수 없어 fetch 사용)
+  async streamTrouble(troubleId: number, onToken: (text: string) => void): Promise<TroubleItem> {
+    const token = localStorage.getItem('token');
+    const response = await fetch(`/api/troubles/${troubleId}/stream`, {
+      headers: token ? { Authorization: `Bearer ${token}` } : {},
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Failed to stream trouble: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // 이벤트는 빈 줄로 구분됨
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary !== -1) {
+        const message = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+
+        const event = message.match(/^event: (.*)$/m)?.[1];
+        const data = JSON.parse(message.match(/^data: (.*)$/m)?.[1] ?? 'null');
+        if (event === 'token') {
+          onToken(data.text);
+        } else if (event === 'done') {
+          return data;
+        } else if (event === 'error') {
+          throw new Error(data.detail);
+        }
+      }
+    }
+    throw new Error('Trouble stream ended before completion');
+  }
+
+  // Retry AI analysis of a trouble
+  async regenerateTrouble(troubleId: number): Promise<TroubleItem> {
+    try {
+      const response = await api.post(`/troubles/${troubleId}/regenerate`);
+      return response.data;
+    } catch (error) {
+      console.error('Failed to regenerate trouble:', error);
+      throw error;
+    }
+  }
+
   // Update trouble
   async updateTrouble(troubleId: number, troubleData: UpdateTroubleRequest): Promise<TroubleItem> {
     try {
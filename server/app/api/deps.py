@@ -2,19 +2,35 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.infra.database.session import get_db
+from app.infra.database.async_session import get_async_db
+from app.infra.database.routing import read_from_primary
 from app.services.project import ProjectService
 from app.services.user import UserService
 from app.services.pipeline import PipelineService
 from app.services.log import LogService
 from app.services.trouble import TroubleService
-from app.core.utils.auth import verify_token
+from app.services.async_project import AsyncProjectService
+from app.services.async_trouble import AsyncTroubleService
+from app.core.utils.auth import decode_token
 from app.models.user import User
+from app.schemas.project import ProjectContext
+from app.schemas.trouble import TroubleCreate
+from app.schemas.user import CurrentUser
 
 
 security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
+def use_primary_reads(db: Session = Depends(get_db)) -> None:
+    """라우트 의존성: 이 요청의 읽기를 복제본 대신 primary로 보냄 (직전 요청의 쓰기를 바로 읽는 경로)"""
+    read_from_primary(db)
+
+async def use_primary_reads_async(db: AsyncSession = Depends(get_async_db)) -> None:
+    """use_primary_reads의 비동기 라우트용 버전"""
+    read_from_primary(db)
+
 def get_user_service(
     db: Session = Depends(get_db),
 ) -> UserService:
@@ -40,16 +56,59 @@ def get_trouble_service(
 ) -> TroubleService:
     return TroubleService(db)
 
-def get_current_username(
+def get_async_project_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncProjectService:
+    return AsyncProjectService(db)
+
+def get_async_trouble_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncTroubleService:
+    return AsyncTroubleService(db)
+
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> str:
-    """JWT 토큰에서 현재 사용자 username을 추출"""
+) -> CurrentUser:
+    """JWT 토큰 클레임에서 현재 사용자 정보를 추출 (DB 조회 없음)"""
     token = credentials.credentials
-    username = verify_token(token)
-    if username is None:
+    payload = decode_token(token)
+    # 사용자 id가 없는 이전 형식의 토큰은 다시 로그인하도록 거부
+    if payload is None or payload.get("sub") is None or payload.get("uid") is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 토큰입니다",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return username
\ No newline at end of file
+    return CurrentUser(
+        user_id=payload["uid"],
+        username=payload["sub"],
+        token_version=payload.get("ver", 0),
+        memberships=payload.get("prj", {}),
+    )
+
+
+def get_project_context(
+    project_id: int,
+    user: CurrentUser = Depends(get_current_user),
+    service: ProjectService = Depends(get_project_service),
+) -> ProjectContext:
+    """요청자의 프로젝트 멤버십(사용자 id, 역할)을 요청당 한 번 확인 (멤버가 아니면 403)"""
+    return service.get_project_context(project_id=project_id, user=user)
+
+
+def get_trouble_create_context(
+    create_trouble_dto: TroubleCreate,
+    user: CurrentUser = Depends(get_current_user),
+    service: ProjectService = Depends(get_project_service),
+) -> ProjectContext:
+    """trouble 생성 요청 본문의 프로젝트에 대한 get_project_context"""
+    return service.get_project_context(project_id=create_trouble_dto.project_id, user=user)
+
+
+async def get_async_project_context(
+    project_id: int,
+    user: CurrentUser = Depends(get_current_user),
+    service: AsyncProjectService = Depends(get_async_project_service),
+) -> ProjectContext:
+    """get_project_context의 비동기 버전 (비동기 라우트에서 스레드풀을 거치지 않음)"""
+    return await service.get_project_context(project_id=project_id, user=user)
@@ -1,10 +1,25 @@
+import json
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from datetime import datetime
 
 from app.core.enums.log_filter import LogLevelFilter, LogTimeFilter
-from app.api.deps import get_log_service, get_current_username
+from app.core.enums.search_mode import SearchMode
+from app.core.enums.export_format import ExportFormat
+from app.api.deps import get_log_service, get_current_user, get_project_context
 from app.services.log import LogService
+from app.schemas.log import LogDashboard, RecentLogsPage, LogCacheStats
+from app.schemas.project import ProjectContext
+from app.schemas.user import CurrentUser
+from app.core.utils.embedding_cache import embedding_cache
+from app.core.utils.result_cache import result_cache
+from app.core.utils.http_cache import etag_matches
+from app.core.utils.export_utils import EXPORT_MEDIA_TYPES
+from app.core.config.settings import get_settings
+
+settings = get_settings()
 
 router = APIRouter()
 
@@ -12,57 +27,123 @@ router = APIRouter()
 # 메인보드 로그 그래프 조회
 @router.get("/logs/mainboard")
 def get_log(
-    project_id: int,
     log_time: LogTimeFilter = LogTimeFilter.DAY,
     size: int = Query(100, description="검색 결과 최대 개수"),
     service: LogService = Depends(get_log_service),
-    username: str = Depends(get_current_username),
+    context: ProjectContext = Depends(get_project_context),
 ):
-    return service.get_logs(username, project_id, log_time, size)
+    return service.get_logs(context.project_id, log_time, size)
 
 
-@router.get("/logs/recent")
+# 메인보드 대시보드 집계 조회
+@router.get("/logs/dashboard", response_model=LogDashboard)
+def get_log_dashboard(
+    log_time: LogTimeFilter = LogTimeFilter.DAY,
+    service: LogService = Depends(get_log_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    return service.get_dashboard(context.project_id, log_time)
+
+
+@router.get("/logs/recent", response_model=RecentLogsPage)
 def get_recent_logs(
-    project_id: int,
-    username: str = Depends(get_current_username),
-    count: int = Query(..., description="무한 스크롤 조회 횟수, 1부터 시작"),
-    size: int = Query(100, description="검색 결과 최대 개수"),
+    context: ProjectContext = Depends(get_project_context),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor, 첫 페이지는 생략"),
+    size: int = Query(100, ge=1, le=1000, description="페이지 크기"),
     service: LogService = Depends(get_log_service),
 ):
     return service.get_recent_logs(
-        username=username,
-        project_id=project_id,
-        count=count,
+        project_id=context.project_id,
+        cursor=cursor,
         size=size,
     )
     
 
 @router.get("/logs/search")
 def get_logs_by_search(
-    project_id: int,
+    response: Response,
     query: str,
     keyword: str = None,
     log_level: LogLevelFilter = None,
     start_time: str = None,
     end_time: str = None,
     k: int = 50,
-    service: LogService = Depends(get_log_service)
+    mode: SearchMode = Query(SearchMode.VECTOR, description="검색 방식 (vector: kNN, hybrid: BM25 + kNN)"),
+    service: LogService = Depends(get_log_service),
+    context: ProjectContext = Depends(get_project_context),
 ):
-    return service.get_retrieve_logs(
-        project_id=project_id,
+    logs, latency_ms = service.get_retrieve_logs(
+        project_id=context.project_id,
         query=query,
         keyword=keyword,
         log_level=log_level,
         start_time=start_time,
         end_time=end_time,
         k=k,
+        mode=mode,
+    )
+    # 단계별 지연(embedding, bm25, knn, hybrid, cache)은 응답 본문 대신 Server-Timing 헤더로 전달
+    response.headers["Server-Timing"] = ", ".join(
+        f"{name};dur={duration:.1f}" for name, duration in latency_ms.items()
+    )
+    return logs
+
+
+# 기간 내 로그 전체 내보내기 (스트리밍)
+@router.get("/logs/export")
+def export_logs(
+    start_time: str = Query(..., description="시작 시각 (ISO 형식)"),
+    end_time: str = Query(..., description="끝 시각 (ISO 형식)"),
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="파일 형식"),
+    keyword: str = None,
+    log_level: LogLevelFilter = None,
+    fields: Optional[List[str]] = Query(None, description="내보낼 필드 (CSV/Parquet 열, 생략 시 기본 열)"),
+    service: LogService = Depends(get_log_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    content = service.export_logs(
+        project_id=context.project_id,
+        start_time=start_time,
+        end_time=end_time,
+        export_format=format,
+        keyword=keyword,
+        log_level=log_level,
+        fields=fields,
+    )
+    filename = f"logs-{context.project_id}-{datetime.now():%Y%m%d%H%M%S}.{format.value}"
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
 @router.get("/logs/detail", response_model=List[dict])
 def get_log_detail(
-    project_id: int = Query(..., description="프로젝트 ID"),
+    request: Request,
     log_ids: Optional[List[str]] = Query(..., description="로그 ID 리스트"),
+    fields: Optional[List[str]] = Query(None, description="반환할 _source 필드 (생략 시 vector 제외 전체)"),
     service: LogService = Depends(get_log_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    # 로그는 코멘트/보존 정책으로 바뀔 수 있으므로 짧게 캐시하고 ETag(문서 버전)로 재검증
+    cache_control = f"private, max-age={settings.LOG_DETAIL_CACHE_MAX_AGE}, must-revalidate"
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # 재검증 요청만 본문 없이 버전을 먼저 조회
+        etag = service.get_log_detail_etag(context.project_id, log_ids, fields)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+    logs, etag = service.get_log_detail_with_etag(context.project_id, log_ids, fields)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    body = json.dumps(jsonable_encoder(logs), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# 검색 캐시 적중률 조회
+@router.get("/logs/cache-stats", response_model=LogCacheStats)
+def get_log_cache_stats(
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return service.get_log_detail(project_id, log_ids)
+    return {"embedding": embedding_cache.stats(), "results": result_cache.stats()}
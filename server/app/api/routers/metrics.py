@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_user
+from app.infra.database.session import engine, replicas
+from app.schemas.metrics import DbPoolStats
+from app.schemas.user import CurrentUser
+
+router = APIRouter()
+
+
+# DB 연결 풀 사용량 조회
+@router.get("/metrics/db-pool", response_model=DbPoolStats)
+def get_db_pool_stats(
+    user: CurrentUser = Depends(get_current_user),
+):
+    return engine.pool.stats()
+
+
+# 읽기 복제본 연결 풀 사용량 조회 (MYSQL_REPLICA_HOSTS 순서)
+@router.get("/metrics/db-pool/replicas", response_model=list[DbPoolStats])
+def get_db_replica_pool_stats(
+    user: CurrentUser = Depends(get_current_user),
+):
+    return [replica.pool.stats() for replica in replicas.engines]
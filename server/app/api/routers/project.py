@@ -6,11 +6,24 @@ from app.schemas.project import (
     ProjectKeywordsBase,
     ProjectInvite,
     ProjectMembers,
+    ProjectIngestFields,
+    IngestSizeReport,
+    ProjectRetention,
+    RetentionRun,
+    RetentionTaskStatus,
     RoleChange,
+    ProjectContext,
 )
 
-from app.api.deps import get_project_service, get_current_username
+from app.schemas.user import CurrentUser
+from app.api.deps import (
+    get_project_service,
+    get_async_project_service,
+    get_current_user,
+    get_project_context,
+)
 from app.services.project import ProjectService
+from app.services.async_project import AsyncProjectService
 
 router = APIRouter()
 
@@ -19,26 +32,26 @@ router = APIRouter()
 def create_projects(
     project_dto: ProjectCreate,
     service: ProjectService = Depends(get_project_service),
-    username: str = Depends(get_current_username),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return service.create_project(project_dto=project_dto, username=username)
+    return service.create_project(project_dto=project_dto, user_id=user.user_id)
 
 
 @router.post("/projects/invite")
 def join_project_by_invite(
     invite_dto: ProjectInvite,
     service: ProjectService = Depends(get_project_service),
-    username: str = Depends(get_current_username),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return service.join_project_by_invite(invite_dto=invite_dto, username=username)
+    return service.join_project_by_invite(invite_dto=invite_dto, user_id=user.user_id)
 
 
 @router.get("/projects", response_model=list[Project])
-def get_project(
-    service: ProjectService = Depends(get_project_service),
-    username: str = Depends(get_current_username),
+async def get_project(
+    service: AsyncProjectService = Depends(get_async_project_service),
+    user: CurrentUser = Depends(get_current_user),
 ):
-    return service.get_projects_by_user(username=username)
+    return await service.get_projects_by_user(user_id=user.user_id)
 
 
 @router.get("/projects/{project_id}/keywords", response_model=ProjectKeywordsBase)
@@ -61,42 +74,105 @@ def update_project_keyword(
     return updated_project
 
 
+@router.get("/projects/{project_id}/ingest-fields", response_model=ProjectIngestFields)
+def get_project_ingest_fields(
+    service: ProjectService = Depends(get_project_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    return service.get_project_ingest_fields(context=context)
+
+
+@router.patch("/projects/{project_id}/ingest-fields", response_model=ProjectIngestFields)
+def update_project_ingest_fields(
+    ingest_fields: ProjectIngestFields,
+    service: ProjectService = Depends(get_project_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    return service.update_project_ingest_fields(
+        context=context, ingest_fields=ingest_fields
+    )
+
+
+@router.post("/projects/{project_id}/ingest-fields/report", response_model=IngestSizeReport)
+def get_ingest_size_report(
+    sample: dict,
+    service: ProjectService = Depends(get_project_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    """샘플 로그 기준 필드 필터 적용 전후 문서 크기 비교"""
+    return service.get_ingest_size_report(context=context, sample=sample)
+
+
+@router.get("/projects/{project_id}/retention", response_model=ProjectRetention)
+def get_project_retention(
+    service: ProjectService = Depends(get_project_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    return service.get_project_retention(context=context)
+
+
+@router.patch("/projects/{project_id}/retention", response_model=ProjectRetention)
+def update_project_retention(
+    retention: ProjectRetention,
+    service: ProjectService = Depends(get_project_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    return service.update_project_retention(context=context, retention=retention)
+
+
+@router.post(
+    "/projects/{project_id}/retention/run", response_model=RetentionRun, status_code=202
+)
+def run_project_retention(
+    service: ProjectService = Depends(get_project_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    """보존 정책 즉시 실행 (삭제 작업을 시작만 하고 task id 반환)"""
+    return service.run_project_retention(context=context)
+
+
+@router.get(
+    "/projects/{project_id}/retention/tasks/{task_id}", response_model=RetentionTaskStatus
+)
+def get_project_retention_task(
+    task_id: str,
+    service: ProjectService = Depends(get_project_service),
+    context: ProjectContext = Depends(get_project_context),
+):
+    """보존 정책 삭제 작업 진행 상태 조회"""
+    return service.get_project_retention_task(context=context, task_id=task_id)
+
+
 @router.delete("/projects/{project_id}")
 def delete_project(
-    project_id: int,
     service: ProjectService = Depends(get_project_service),
-    username: str = Depends(get_current_username)
+    context: ProjectContext = Depends(get_project_context),
 ):
-    return service.delete_project(project_id=project_id, username=username)
+    return service.delete_project(context=context)
 
 
 @router.get("/projects/{project_id}/invite-code")
 def get_project_invite_code(
-    project_id: int,
     service: ProjectService = Depends(get_project_service),
-    username: str = Depends(get_current_username)
+    context: ProjectContext = Depends(get_project_context),
 ):
-    return service.get_project_invite_code(project_id=project_id, username=username)
+    return service.get_project_invite_code(context=context)
 
 
 @router.get("/projects/{project_id}/members", response_model=list[ProjectMembers])
 def get_project_members(
-    project_id: int,
     service: ProjectService = Depends(get_project_service),
-    username: str = Depends(get_current_username),
+    context: ProjectContext = Depends(get_project_context),
 ):
-    return service.get_project_members(project_id=project_id, username=username)
+    return service.get_project_members(context=context)
 
 
 @router.patch("/projects/{project_id}/role")
 def change_user_role(
-    project_id: int,
     role_change: RoleChange,
     service: ProjectService = Depends(get_project_service),
-    username: str = Depends(get_current_username),
+    context: ProjectContext = Depends(get_project_context),
 ):
-    return service.change_user_role(
-        project_id=project_id, role_change=role_change, username=username
-    )
+    return service.change_user_role(context=context, role_change=role_change)
 
 
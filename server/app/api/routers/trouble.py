@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from app.schemas.trouble import (
     TroubleCreate, 
     Trouble, 
@@ -8,29 +9,108 @@ from app.schemas.trouble import (
     TroubleWithLogs
 )
 from app.services.trouble import TroubleService
-from app.api.deps import get_trouble_service, get_current_username
+from app.services.async_trouble import AsyncTroubleService
+from app.api.deps import (
+    get_trouble_service,
+    get_async_trouble_service,
+    use_primary_reads,
+    get_current_user,
+    get_async_project_context,
+    get_trouble_create_context,
+    use_primary_reads_async,
+)
+from app.schemas.project import ProjectContext
+from app.schemas.user import CurrentUser
+from app.core.config.settings import get_settings
+from app.infra.database.session import SessionLocal
+from app.tasks.trouble import submit_trouble_generation
 
 router = APIRouter()
+settings = get_settings()
 
 
-@router.post("/troubles", response_model=Trouble)
+@router.post(
+    "/troubles", response_model=Trouble, status_code=status.HTTP_202_ACCEPTED
+)
 def create_trouble(
     create_trouble_dto: TroubleCreate, 
+    stream: bool = Query(False, description="GET /troubles/{trouble_id}/stream으로 분석 내용을 받을지 여부"),
     service: TroubleService = Depends(get_trouble_service),
-    username: str = Depends(get_current_username)
+    context: ProjectContext = Depends(get_trouble_create_context),
 ):
-    """새로운 trouble을 생성합니다."""
-    return service.create_trouble(create_trouble_dto, username)
+    """
+    새로운 trouble을 pending 상태로 생성하고 AI 분석을 백그라운드 작업으로 등록합니다.
+    분석 진행 상태는 GET /troubles/{trouble_id}의 status로 확인합니다.
+    stream=true이면 SSE 연결을 기다렸다가, 연결이 없으면 백그라운드 작업이 분석합니다.
+    """
+    trouble = service.create_trouble(create_trouble_dto, context)
+    submit_trouble_generation(
+        trouble.id, settings.TROUBLE_STREAM_CLAIM_SECONDS if stream else 0
+    )
+    return trouble
 
 
-@router.get("/troubles/{trouble_id}", response_model=TroubleWithLogs)
-def get_trouble(
-    trouble_id: int, 
+@router.post(
+    "/troubles/{trouble_id}/regenerate",
+    response_model=Trouble,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def regenerate_trouble(
+    trouble_id: int,
+    service: TroubleService = Depends(get_trouble_service),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """AI 분석이 실패했거나 완료된 trouble을 다시 분석하도록 작업을 등록합니다."""
+    trouble = service.regenerate_trouble(trouble_id, user.user_id)
+    submit_trouble_generation(trouble.id)
+    return trouble
+
+
+async def _trouble_stream_events(trouble_id: int):
+    # 스트리밍 응답은 요청 의존성이 정리된 뒤에도 이어지므로 별도 세션 사용
+    db = SessionLocal()
+    try:
+        async for event in TroubleService(db).astream_trouble_events(trouble_id):
+            yield event
+    finally:
+        db.close()
+        # 스트림이 실패하거나 끊겨 대기 상태로 돌아갔으면 백그라운드 작업이 이어서 생성
+        # (완료된 경우에는 선점할 대기 trouble이 없어 바로 끝남)
+        submit_trouble_generation(trouble_id)
+
+
+# 생성 직후 바로 연결하는 경로라 primary에서 읽음
+@router.get("/troubles/{trouble_id}/stream", dependencies=[Depends(use_primary_reads)])
+def stream_trouble(
+    trouble_id: int,
     service: TroubleService = Depends(get_trouble_service),
-    username: str = Depends(get_current_username)
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    trouble의 AI 분석 내용을 Server-Sent Events로 토큰 단위 스트리밍합니다.
+    token 이벤트로 텍스트 조각을, done 이벤트로 저장된 trouble을 보냅니다.
+    """
+    service.check_trouble_stream(trouble_id, user.user_id)
+    return StreamingResponse(
+        _trouble_stream_events(trouble_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# 생성 직후 status를 폴링하는 경로라 복제 지연으로 404/이전 상태가 보이지 않도록 primary에서 읽음
+@router.get(
+    "/troubles/{trouble_id}",
+    response_model=TroubleWithLogs,
+    dependencies=[Depends(use_primary_reads_async)],
+)
+async def get_trouble(
+    trouble_id: int, 
+    service: AsyncTroubleService = Depends(get_async_trouble_service),
+    user: CurrentUser = Depends(get_current_user)
 ):
-    """특정 trouble을 조회합니다."""
-    return service.get_trouble_by_id(trouble_id, username)
+    """특정 trouble을 조회합니다. (비동기 DB 경로)"""
+    return await service.get_trouble_by_id(trouble_id, user.user_id)
 
 
 @router.put("/troubles/{trouble_id}", response_model=Trouble)
@@ -38,29 +118,28 @@ def update_trouble(
     trouble_id: int, 
     trouble_update_dto: TroubleUpdate, 
     service: TroubleService = Depends(get_trouble_service),
-    username: str = Depends(get_current_username)
+    user: CurrentUser = Depends(get_current_user)
 ):
     """기존 trouble을 업데이트합니다."""
-    return service.update_trouble(trouble_id, trouble_update_dto, username)
+    return service.update_trouble(trouble_id, trouble_update_dto, user.user_id)
 
 
 @router.delete("/troubles/{trouble_id}")
 def delete_trouble(
     trouble_id: int, 
     service: TroubleService = Depends(get_trouble_service),
-    username: str = Depends(get_current_username)
+    user: CurrentUser = Depends(get_current_user)
 ):
     """trouble을 삭제합니다."""
-    service.delete_trouble(trouble_id, username)
+    service.delete_trouble(trouble_id, user.user_id)
     return {"message": "Trouble deleted successfully"}
 
 
 @router.get("/troubles/list/{project_id}", response_model=TroubleListResponse)
-def get_trouble_list(
-    project_id: int,
+async def get_trouble_list(
     query_params: TroubleListQuery = Depends(),
-    service: TroubleService = Depends(get_trouble_service),
-    username: str = Depends(get_current_username)
+    service: AsyncTroubleService = Depends(get_async_trouble_service),
+    context: ProjectContext = Depends(get_async_project_context)
 ):
-    """프로젝트의 trouble 중 유저에게 권한이 있는 목록을 조회합니다."""
-    return service.get_project_troubles(project_id, query_params, username)
\ No newline at end of file
+    """프로젝트의 trouble 중 유저에게 권한이 있는 목록을 조회합니다. (비동기 DB 경로)"""
+    return await service.get_project_troubles(context, query_params)
\ No newline at end of file
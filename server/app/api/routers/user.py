@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends
 
-from app.schemas.user import UserRegister, UserLogin, Token, User
+from app.schemas.user import UserRegister, UserLogin, Token, User, CurrentUser
 from app.services.user import UserService
-from app.api.deps import get_user_service, get_current_username
+from app.api.deps import get_user_service, get_current_user
 from app.models.user import User as UserModel
 
 router = APIRouter()
@@ -21,7 +21,6 @@ def login(login_data: UserLogin, service: UserService = Depends(get_user_service
 
 
 @router.get("/auth/me", response_model=User)
-def get_current_user_info(
-    username: str = Depends(get_current_username), service: UserService = Depends(get_user_service)):
-    """현재 로그인한 사용자 정보 조회"""
-    return service.get_user_by_username(username)
+def get_current_user_info(user: CurrentUser = Depends(get_current_user)):
+    """현재 로그인한 사용자 정보 조회 (토큰 클레임 사용)"""
+    return User(id=user.user_id, username=user.username)
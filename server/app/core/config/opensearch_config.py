@@ -1,9 +1,111 @@
 from app.core.config.settings import get_settings
+from app.core.enums.mapping_profile import MappingProfile
 
-def get_opensearch_mappings() -> dict:
-    """동적 OpenSearch 매핑 생성 (임베딩 차원수 반영)"""
+# lean 프로필에서 적재 전에 항상 제거하는 필드 (message와 중복)
+LEAN_DEFAULT_DENY_FIELDS = ["event.original"]
+
+
+def get_opensearch_mappings(profile: MappingProfile = None) -> dict:
+    """동적 OpenSearch 매핑 생성 (임베딩 차원수, 매핑 프로필 반영)"""
     settings = get_settings()
-    
+    if profile is None:
+        profile = settings.OPENSEARCH_MAPPING_PROFILE
+
+    if profile == MappingProfile.LEAN:
+        mappings = _get_lean_mappings(settings.EMBEDDING_VECTOR_DIMS)
+    else:
+        mappings = _get_full_mappings(settings.EMBEDDING_VECTOR_DIMS)
+
+    # vector는 kNN 그래프에만 보관하고 저장된 _source에서는 제외
+    # (update/reindex 시 _source 기준으로 재색인되므로 vector가 함께 사라짐에 유의)
+    if settings.OPENSEARCH_EXCLUDE_VECTOR_SOURCE:
+        mappings["_source"] = {"excludes": ["vector"]}
+    return mappings
+
+
+def get_keyword_field(field: str, profile: MappingProfile) -> str:
+    """terms 집계/정렬에 사용할 keyword 필드 이름 (인덱스를 만든 매핑 프로필 기준)"""
+    if profile == MappingProfile.LEAN:
+        return field
+    return f"{field}.keyword"
+
+
+def get_ingest_denylist(denylist: list, profile: MappingProfile) -> list:
+    """인덱스 매핑 프로필 기본값과 프로젝트 설정을 합친 적재 제외 필드 목록"""
+    denylist = list(denylist) if isinstance(denylist, list) else []
+    if profile == MappingProfile.LEAN:
+        denylist = [*LEAN_DEFAULT_DENY_FIELDS, *denylist]
+    return denylist
+
+
+def get_opensearch_index_settings(profile: MappingProfile = None) -> dict:
+    """매핑 프로필에 필요한 인덱스 설정 생성"""
+    settings = get_settings()
+    if profile is None:
+        profile = settings.OPENSEARCH_MAPPING_PROFILE
+
+    if profile == MappingProfile.LEAN:
+        # keyword 필드의 term 필터가 대소문자를 구분하지 않도록 정규화
+        return {
+            "analysis": {
+                "normalizer": {
+                    "lowercase_normalizer": {"type": "custom", "filter": ["lowercase"]}
+                }
+            }
+        }
+    return {}
+
+
+def _get_lean_mappings(vector_dims: int) -> dict:
+    """검색에 사용하는 필드만 색인하는 경량 매핑
+
+    - 색인하지 않는 Beats 메타데이터(agent, ecs, input, event, container)는 _source에만 보관
+    - 전문 검색하지 않는 필드는 keyword 단일 타입으로 색인
+    - 점수 계산에 길이 정규화가 필요 없으므로 text 필드의 norms 비활성화
+    - 매핑에 없는 필드는 동적으로 색인하지 않음
+    """
+    keyword = {"type": "keyword", "ignore_above": 256, "normalizer": "lowercase_normalizer"}
+    not_indexed = {"type": "object", "enabled": False}
+
+    return {
+        "dynamic": False,
+        "properties": {
+            "@timestamp": {"type": "date"},
+            "@version": {"type": "keyword", "index": False, "doc_values": False},
+            "agent": not_indexed,
+            "container": not_indexed,
+            "ecs": not_indexed,
+            "event": not_indexed,
+            "input": not_indexed,
+            "host": {
+                "properties": {
+                    "hostname": keyword,
+                    "name": keyword,
+                    "os": not_indexed,
+                }
+            },
+            "log": {
+                "properties": {
+                    "file": {"properties": {"path": keyword}},
+                    "offset": {"type": "long", "index": False},
+                }
+            },
+            "message": {"type": "text", "norms": False},
+            "tags": keyword,
+            "comment": {"type": "text", "norms": False},
+            "keyword": keyword,
+            "message_timestamp": {"type": "date"},
+            "log_level": keyword,
+            "vector": {
+                "type": "knn_vector",
+                "dimension": vector_dims,
+            },
+        },
+    }
+
+
+def _get_full_mappings(vector_dims: int) -> dict:
+    """Beats 메타데이터 전체를 색인하는 기본 매핑"""
     return {
     "properties": {
         "@timestamp": {"type": "date"},
@@ -179,7 +281,7 @@ def get_opensearch_mappings() -> dict:
         },
         "vector": {
             "type": "knn_vector",
-            "dimension": settings.EMBEDDING_VECTOR_DIMS,
+            "dimension": vector_dims,
         }
     }
 }
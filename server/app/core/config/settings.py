@@ -1,7 +1,11 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import Optional
 
 from app.core.enums.LLMProvider import LLMProvider
+from app.core.enums.mapping_profile import MappingProfile
+from app.core.enums.search_mode import HybridSearchMode
+from app.core.enums.trouble_context_mode import TroubleContextMode
 
 
 class Settings(BaseSettings):
@@ -20,6 +24,10 @@ class Settings(BaseSettings):
     # 임베딩 모델 설정
     EMBEDDING_MODEL_NAME: str = "text-embedding-3-small"
     EMBEDDING_VECTOR_DIMS: int = 1536  # 임베딩 벡터 차원수 (모델별로 설정 필요)
+    EMBEDDING_CACHE_ENABLED: bool = True  # 검색어 임베딩 캐시 사용
+    EMBEDDING_CACHE_SIZE: int = 1024  # 캐시할 최대 검색어 수 (LRU)
+    EMBEDDING_CACHE_TTL_SECONDS: int = 3600
+    EMBEDDING_CACHE_PATH: Optional[str] = None  # 지정하면 종료 시 저장, 시작 시 불러옴
     
     # OpenAI 설정
     OPENAI_API_KEY: str = ""
@@ -38,6 +46,52 @@ class Settings(BaseSettings):
     OPENSEARCH_HOST: str
     OPENSEARCH_USERNAME: str
     OPENSEARCH_PASSWORD: str
+    OPENSEARCH_MAPPING_PROFILE: MappingProfile = MappingProfile.FULL  # 신규 인덱스 매핑 프로필
+    OPENSEARCH_EXCLUDE_VECTOR_SOURCE: bool = True  # vector를 _source에 저장하지 않음 (kNN 구조에만 보관)
+    OPENSEARCH_PIT_KEEP_ALIVE: str = "5m"  # 최근 로그 커서(point in time) 유지 시간
+    OPENSEARCH_MAX_OPEN_PITS: int = 100  # 프로세스당 최근 로그 커서용으로 열어 둘 point in time 수 (넘으면 오래된 것부터 해제)
+    OPENSEARCH_HYBRID_MODE: HybridSearchMode = HybridSearchMode.PIPELINE  # 하이브리드 검색 점수 결합 방식
+    OPENSEARCH_HYBRID_PIPELINE: str = "lognlook-hybrid"  # 하이브리드 검색용 search pipeline 이름
+    OPENSEARCH_HYBRID_BM25_WEIGHT: float = 0.3  # 정규화 후 BM25 점수 가중치 (kNN은 1 - 값)
+    
+    # 로그 보존 정책 설정
+    RETENTION_ENABLED: bool = True
+    RETENTION_INTERVAL_MINUTES: int = 60  # 보존 정책 실행 주기
+    RETENTION_REQUESTS_PER_SECOND: float = 500  # delete-by-query 스로틀링 (초당 문서 수)
+    RETENTION_TASK_POLL_SECONDS: int = 10  # 스케줄러가 삭제 작업 완료를 확인하는 주기
+    
+    # 로그 집계(rollup) 설정
+    ROLLUP_ENABLED: bool = True  # 대시보드를 집계 테이블로 조회
+    ROLLUP_FLUSH_INTERVAL_SECONDS: int = 30  # 메모리 버퍼 저장 주기
+    ROLLUP_COMPACT_INTERVAL_MINUTES: int = 10  # 상위 단위 합치기 주기
+    ROLLUP_WRITER_TIMEOUT_SECONDS: int = 120  # 이 시간 동안 저장 기록이 없는 프로세스는 비정상 종료로 판단
+    
+    # 로그 조회 결과 캐시 설정
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_MB: int = 64  # 캐시 최대 메모리
+    RESULT_CACHE_TTL_SECONDS: int = 300
+    RESULT_CACHE_INGEST_GRACE_SECONDS: float = 2.0  # 적재 후 검색 반영(refresh)까지의 여유 시간
+    RESULT_CACHE_WATERMARK_SYNC_SECONDS: float = 1.0  # 적재 워터마크를 DB로 다른 프로세스와 공유하는 주기
+    
+    # 로그 상세 조회 설정
+    LOG_DETAIL_MGET_CHUNK_SIZE: int = 500  # _mget 한 번에 요청할 최대 id 수
+    LOG_DETAIL_CACHE_MAX_AGE: int = 60  # 브라우저 캐시 시간 (이후 ETag로 재검증)
+    
+    # 로그 내보내기 설정
+    EXPORT_BATCH_SIZE: int = 1000  # search_after 한 페이지 크기
+    EXPORT_SLICES: int = 4  # 병렬로 조회할 point in time slice 수 (샤드 수 이하 권장)
+    
+    # 트러블슈팅 리포트 생성 작업 설정
+    TROUBLE_JOB_WORKERS: int = 4  # AI 리포트를 생성하는 백그라운드 워커 수
+    TROUBLE_JOB_MAX_ATTEMPTS: int = 3  # 리포트 하나당 최대 AI 생성 시도 횟수
+    TROUBLE_JOB_RETRY_BACKOFF_SECONDS: float = 5.0  # 재시도 대기 시간 (시도마다 2배 증가)
+    TROUBLE_JOB_CLAIM_TIMEOUT_SECONDS: int = 900  # 이 시간이 지나도 생성 중이면 중단된 작업으로 보고 재등록
+    TROUBLE_STREAM_CLAIM_SECONDS: float = 15.0  # 스트리밍 생성 요청 후 SSE 연결을 기다리는 시간 (지나면 백그라운드 작업이 생성)
+    TROUBLE_CONTEXT_MODE: TroubleContextMode = TroubleContextMode.TEMPLATE  # 연관 로그를 프롬프트에 넣는 방식
+    TROUBLE_CONTEXT_TOKEN_BUDGET: int = 0  # 프롬프트의 로그 부분 토큰 예산 (0이면 LLM_PROVIDER별 기본값, 넘으면 묶음별로 먼저 요약)
+    TROUBLE_CONTEXT_MAP_CONCURRENCY: int = 4  # 로그 묶음 요약을 동시에 요청하는 수
+    TROUBLE_COUNT_CACHE_SIZE: int = 10000  # 캐시할 최대 목록 조건(프로젝트, 사용자, 필터) 수
+    TROUBLE_COUNT_CACHE_TTL_SECONDS: int = 60  # 목록 전체 개수를 백그라운드에서 다시 세는 주기 (그 사이에는 이전 값 사용)
     
     # 데이터베이스 설정
     MYSQL_USER: str
@@ -45,12 +99,23 @@ class Settings(BaseSettings):
     MYSQL_HOST: str
     MYSQL_PORT: str
     MYSQL_SCHEMA: str
+    MYSQL_REPLICA_HOSTS: str = ""  # 읽기 복제본 "host" 또는 "host:port" 쉼표 구분 (계정/스키마는 primary와 같음, 비우면 primary만 사용)
+    DB_POOL_SIZE: int = 20  # 유지할 연결 수 (FastAPI 스레드풀이 동기 라우트를 최대 40개 동시 실행)
+    DB_MAX_OVERFLOW: int = 20  # pool_size를 넘어 잠시 열 수 있는 추가 연결 수
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0  # 풀이 가득 찼을 때 연결을 기다리는 최대 시간
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # MySQL wait_timeout보다 짧게 유지해 오래된 연결 재사용 방지
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 연결 확인 (유휴 후 끊긴 연결로 인한 오류 방지)
+    DB_MIGRATE_ON_STARTUP: bool = True  # 앱 시작 시 스키마 마이그레이션 (끄면 python -m app.infra.database.migrations로 실행)
     
     # JWT 설정
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 30
     
+    # 프로젝트 권한 확인 캐시 설정
+    MEMBERSHIP_CACHE_SIZE: int = 10000  # 캐시할 최대 (사용자, 프로젝트) 멤버십 수
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 30  # 다른 워커 프로세스의 역할 변경이 반영되기까지 최대 지연
+    
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
     
     def validate_llm_config(self) -> bool:
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """로그 내보내기 파일 형식"""
+
+    NDJSON = "ndjson"  # 한 줄에 로그 하나 (전체 _source 유지)
+    CSV = "csv"  # 지정한 필드만 열로 저장
+    PARQUET = "parquet"  # 지정한 필드만 열로 저장 (pyarrow 필요)
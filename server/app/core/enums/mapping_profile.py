@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class MappingProfile(str, Enum):
+    """OpenSearch 인덱스 매핑 프로필"""
+
+    FULL = "full"  # Beats 메타데이터 전체를 text + keyword로 색인
+    LEAN = "lean"  # 검색에 쓰는 필드만 색인, 나머지는 _source에만 보관
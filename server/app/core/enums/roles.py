@@ -17,3 +17,4 @@ class Permission(str, Enum):
     KICK_MEMBER = "kick_member"
     CHANGE_ROLE = "change_role"
     VIEW_PROJECT = "view_project"
+    MANAGE_SETTINGS = "manage_settings"
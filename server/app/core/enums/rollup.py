@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class RollupGranularity(str, Enum):
+    """로그 집계(rollup) 단위"""
+
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
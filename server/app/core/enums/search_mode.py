@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class SearchMode(str, Enum):
+    """로그 검색 방식"""
+
+    VECTOR = "vector"  # 코멘트 임베딩 kNN 검색
+    HYBRID = "hybrid"  # BM25(message, comment) + kNN 점수 결합
+
+
+class HybridSearchMode(str, Enum):
+    """하이브리드 검색 점수 결합 방식"""
+
+    PIPELINE = "pipeline"  # hybrid 쿼리 + 정규화 search pipeline (서버 측 결합, 1회 요청)
+    MSEARCH = "msearch"  # msearch 1회 요청 + 클라이언트 측 RRF
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class TroubleContextMode(str, Enum):
+    """트러블슈팅 프롬프트에 연관 로그를 넣는 방식"""
+
+    RAW = "raw"  # 로그마다 메시지 원문 한 줄
+    COMMENT = "comment"  # 적재 시 생성한 코멘트 (같은 코멘트는 한 줄로 묶음)
+    TEMPLATE = "template"  # 숫자/id/시각을 가린 메시지 템플릿별로 한 줄 (반복 횟수, 시간 범위, 예시, 코멘트)
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class TroubleStatus(str, Enum):
+    """트러블슈팅 리포트 AI 생성 상태"""
+
+    PENDING = "pending"  # 생성 대기 (작업 큐에 등록됨)
+    RUNNING = "running"  # AI 분석 중
+    COMPLETED = "completed"  # 분석 완료
+    FAILED = "failed"  # 재시도 횟수 초과로 실패
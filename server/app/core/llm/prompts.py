@@ -33,6 +33,33 @@ The content should be in the selected language.
 <log_contents>{log_contents}</log_contents>
 """
 
+# 스트리밍용 트러블슈팅 프롬프트 (구조화 출력 대신 첫 줄 제목 + 본문 텍스트)
+TROUBLESHOOTING_STREAM_TEMPLATE = """
+You are a troubleshooting content generator.
+Write a title for the troubleshooting on the first line, starting with "# ".
+Then leave one blank line and write the content in the following format:
+1. What happened
+2. Why it happened
+3. How to fix it
+The title and content should be in the selected language.
+Do not write anything before the title.
+<language>{language}</language>
+<user_query>{user_query}</user_query>
+<log_contents>{log_contents}</log_contents>
+"""
+
+# 연관 로그가 토큰 예산을 넘을 때 묶음별로 먼저 요약하는 프롬프트 (map 단계)
+TROUBLE_LOG_SUMMARY_TEMPLATE = """
+You are a log analyst preparing evidence for a troubleshooting report.
+Summarize the following log excerpt as it relates to the user query.
+Keep error messages, exception names, hosts, time ranges and repetition counts exactly.
+Drop routine logs that are unrelated to the query.
+Write at most 10 short bullet points in the selected language.
+<language>{language}</language>
+<user_query>{user_query}</user_query>
+<log_contents>{log_contents}</log_contents>
+"""
+
 # 프롬프트용 데이터 모델
 class AIMessage(BaseModel):
     """
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, timezone
-from typing import Union
+from typing import Dict, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config.settings import get_settings
@@ -33,13 +33,32 @@ def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None
     return encoded_jwt
 
 
-def verify_token(token: str) -> Union[str, None]:
-    """JWT 토큰을 검증하고 username을 반환"""
+def create_user_token(
+    username: str, user_id: int, token_version: int, memberships: Dict[int, str]
+) -> str:
+    """사용자 id, 토큰 버전, 프로젝트별 역할을 클레임에 담은 액세스 토큰 생성"""
+    return create_access_token(
+        data={
+            "sub": username,
+            "uid": user_id,
+            "ver": token_version,
+            # JSON 객체 키는 문자열이므로 project_id를 문자열로 저장
+            "prj": {str(project_id): role for project_id, role in memberships.items()},
+        }
+    )
+
+
+def decode_token(token: str) -> Union[dict, None]:
+    """JWT 토큰을 검증하고 클레임을 반환"""
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return username
+        return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+
+def verify_token(token: str) -> Union[str, None]:
+    """JWT 토큰을 검증하고 username을 반환"""
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return payload.get("sub")
\ No newline at end of file
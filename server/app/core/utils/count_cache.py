@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from app.core.config.settings import get_settings
+
+settings = get_settings()
+
+
+class CountCache:
+    """
+    목록 전체 개수 캐시 (프로세스 단위, 키의 첫 번째 값은 project_id)
+    TTL이 지나도 이전 값을 그대로 돌려주고, 호출자가 백그라운드에서 한 번만 다시 세도록 알려줌
+    프로젝트별 세대 번호로 무효화 전에 시작한 개수 세기 결과가 무효화 뒤에 저장되지 않도록 함
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: int = 60):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (개수, 다시 셀 시각)
+        self._entries: "OrderedDict[Hashable, Tuple[int, float]]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        # project_id -> 세대 번호 (무효화할 때마다 증가)
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, project_id: int) -> int:
+        """프로젝트의 현재 세대 번호 (개수를 세기 전에 읽어 put에 넘김)"""
+        with self._lock:
+            return self._generations.get(project_id, 0)
+
+    def get(self, key: Tuple) -> Tuple[Optional[int], bool]:
+        """
+        (개수, 다시 세야 하는지) 반환
+        - 없으면 (None, True): 호출자가 바로 세서 put
+        - TTL이 지났으면 (이전 값, True): 다른 요청이 이미 다시 세는 중이면 (이전 값, False)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, True
+            self._entries.move_to_end(key)
+            count, refresh_at = entry
+            if refresh_at > time.monotonic() or key in self._refreshing:
+                return count, False
+            self._refreshing.add(key)
+            return count, True
+
+    def put(self, key: Tuple, count: int, generation: Optional[int] = None) -> None:
+        """센 개수를 저장 (세기 시작한 뒤 프로젝트가 무효화되었으면 버림)"""
+        with self._lock:
+            self._refreshing.discard(key)
+            if self.ttl_seconds <= 0:
+                return
+            if generation is not None and generation != self._generations.get(key[0], 0):
+                return
+            self._entries[key] = (count, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def release(self, key: Tuple) -> None:
+        """다시 세기에 실패했을 때 다음 요청이 다시 시도하도록 표시 해제"""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate_project(self, project_id: int) -> None:
+        """프로젝트의 개수를 모두 제거 (이 프로세스에서 생성/삭제/수정한 직후 바로 반영)"""
+        with self._lock:
+            self._generations[project_id] = self._generations.get(project_id, 0) + 1
+            for key in [key for key in self._entries if key[0] == project_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._refreshing.clear()
+            self._generations.clear()
+
+
+trouble_count_cache = CountCache(
+    max_size=settings.TROUBLE_COUNT_CACHE_SIZE,
+    ttl_seconds=settings.TROUBLE_COUNT_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,163 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, List, Tuple
+
+from app.core.config.settings import get_settings
+
+settings = get_settings()
+
+# 최근 로그 커서 서명 키 용도 구분 (JWT 서명과 같은 비밀값에서 파생)
+_CURSOR_KEY_CONTEXT = b"lognlook:recent-logs-cursor:"
+
+_TIME_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _cursor_signature(payload: bytes) -> str:
+    key = hashlib.sha256(_CURSOR_KEY_CONTEXT + settings.JWT_SECRET.encode("utf-8")).digest()
+    digest = hmac.new(key, payload, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode((value + "=" * (-len(value) % 4)).encode("ascii"))
+
+
+def encode_cursor(project_id: int, pit_id: str, sort_values: List[Any]) -> str:
+    """
+    point in time와 마지막 문서의 정렬 값을 프로젝트에 묶인 서명된 커서 문자열로 만듭니다.
+
+    Args:
+        project_id (int): 커서를 발급한 프로젝트 ID (다른 프로젝트 요청에는 쓸 수 없음)
+        pit_id (str): OpenSearch point in time ID
+        sort_values (List[Any]): 페이지 마지막 문서의 sort 값 (search_after에 그대로 사용)
+
+    Returns:
+        str: URL에 그대로 쓸 수 있는 "base64url 본문.서명" 커서
+    """
+    payload = json.dumps(
+        {"project": project_id, "pit": pit_id, "after": sort_values}, separators=(",", ":")
+    ).encode("utf-8")
+    body = base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+    return f"{body}.{_cursor_signature(payload)}"
+
+
+def decode_cursor(cursor: str, project_id: int) -> Tuple[str, List[Any]]:
+    """
+    커서 문자열의 서명과 프로젝트를 확인하고 point in time ID와 search_after 값으로 되돌립니다.
+
+    Args:
+        cursor (str): encode_cursor로 만든 커서
+        project_id (int): 요청한 프로젝트 ID
+
+    Returns:
+        Tuple[str, List[Any]]: (pit_id, search_after 값)
+
+    Raises:
+        ValueError: 커서 형식이나 서명이 올바르지 않거나 다른 프로젝트의 커서인 경우
+    """
+    body, _, signature = cursor.partition(".")
+    try:
+        payload = _b64decode(body)
+        valid = hmac.compare_digest(signature, _cursor_signature(payload))
+        data = json.loads(payload) if valid else None
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get("pit"), str)
+        or not isinstance(data.get("after"), list)
+        or not data["after"]
+    ):
+        raise ValueError("Invalid cursor")
+    if data.get("project") != project_id:
+        raise ValueError("Cursor does not belong to this project")
+    return data["pit"], data["after"]
+
+
+def parse_keep_alive(keep_alive: str) -> float:
+    """OpenSearch 시간 값("30s", "5m" 등)을 초로 변환 (단위가 없으면 ms)"""
+    match = re.fullmatch(r"(\d+)(ms|s|m|h|d)?", keep_alive.strip())
+    if not match:
+        raise ValueError(f"Invalid keep_alive: {keep_alive}")
+    return int(match.group(1)) * _TIME_UNITS[match.group(2) or "ms"]
+
+
+class OpenPitRegistry:
+    """
+    최근 로그 커서용으로 연 point in time 목록 (프로세스 단위)
+    첫 페이지만 보고 떠난 클라이언트의 PIT가 keep_alive 동안 쌓여 클러스터의 열린 PIT 한도
+    (search.max_open_pit_context)에 닿지 않도록, 한도를 넘으면 가장 오래 쓰지 않은 PIT부터 해제합니다.
+    """
+
+    def __init__(self, max_open: int):
+        self.max_open = max_open
+        # pit_id -> 만료 시각(monotonic), 오래 쓰지 않은 순
+        self._pits: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def touch(self, pit_id: str, keep_alive_seconds: float) -> List[str]:
+        """PIT를 연(또는 다시 쓴) 것으로 기록 (keep_alive 연장)하고 해제해야 할 오래된 PIT 목록을 반환"""
+        now = time.monotonic()
+        with self._lock:
+            # 이미 만료된 PIT는 클러스터에서도 사라졌으므로 목록에서만 뺌
+            for expired in [pit for pit, expires in self._pits.items() if expires <= now]:
+                del self._pits[expired]
+            self._pits[pit_id] = now + keep_alive_seconds
+            self._pits.move_to_end(pit_id)
+            evicted = []
+            while len(self._pits) > self.max_open:
+                evicted.append(self._pits.popitem(last=False)[0])
+        return evicted
+
+    def close(self, pit_id: str) -> None:
+        with self._lock:
+            self._pits.pop(pit_id, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pits)
+
+
+recent_log_pits = OpenPitRegistry(settings.OPENSEARCH_MAX_OPEN_PITS)
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    DB 목록 마지막 행의 정렬 키 (created_at, id)를 불투명한 커서 문자열로 만듭니다.
+
+    Args:
+        created_at (datetime): 페이지 마지막 행의 생성 시각
+        row_id (int): 페이지 마지막 행의 ID
+
+    Returns:
+        str: URL에 그대로 쓸 수 있는 base64url 커서
+    """
+    payload = json.dumps({"after": [created_at.isoformat(), row_id]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    encode_keyset_cursor로 만든 커서를 (created_at, id)로 되돌립니다.
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at, row_id = payload["after"]
+        if not isinstance(row_id, int) or isinstance(row_id, bool):
+            raise ValueError("Invalid cursor")
+        return datetime.fromisoformat(created_at), row_id
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,166 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config.settings import get_settings
+
+settings = get_settings()
+
+# (모델 이름, 벡터 차원수, 정규화된 검색어)
+EmbeddingKey = Tuple[str, int, str]
+
+
+def normalize_query(query: str) -> str:
+    """공백 차이만 있는 검색어가 같은 키를 쓰도록 정규화"""
+    return " ".join(query.split())
+
+
+class EmbeddingCache:
+    """검색어 → 임베딩 벡터 LRU + TTL 캐시 (프로세스 단위)"""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: int = 3600,
+        persist_path: Optional[str] = None,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persist_path = persist_path
+        # key -> (vector, 만료 시각)
+        self._entries: "OrderedDict[EmbeddingKey, Tuple[List[float], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._miss_seconds = 0.0
+
+    def _get(self, key: EmbeddingKey) -> Optional[List[float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            vector, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return vector
+
+    def _put(self, key: EmbeddingKey, vector: List[float], expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (vector, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(
+        self,
+        query: str,
+        compute: Callable[[str], List[float]],
+        model_name: str = None,
+        dims: int = None,
+    ) -> List[float]:
+        """
+        캐시에 있으면 벡터를 바로 반환하고, 없으면 임베딩을 계산해 저장합니다.
+
+        Args:
+            query (str): 검색어
+            compute (Callable[[str], List[float]]): 캐시 미스 시 호출할 임베딩 함수
+            model_name (str): 임베딩 모델 이름 (기본값: settings.EMBEDDING_MODEL_NAME)
+            dims (int): 벡터 차원수 (기본값: settings.EMBEDDING_VECTOR_DIMS)
+
+        Returns:
+            List[float]: 검색어 임베딩 벡터
+        """
+        key = (
+            model_name or settings.EMBEDDING_MODEL_NAME,
+            dims or settings.EMBEDDING_VECTOR_DIMS,
+            normalize_query(query),
+        )
+        vector = self._get(key)
+        if vector is not None:
+            with self._lock:
+                self.hits += 1
+            return vector
+
+        started = time.perf_counter()
+        vector = compute(query)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.misses += 1
+            self._miss_seconds += elapsed
+        self._put(key, vector, time.time() + self.ttl_seconds)
+        return vector
+
+    def stats(self) -> Dict[str, float]:
+        """적중률과 캐시로 절약한 임베딩 호출 시간 (평균 미스 지연 × 적중 수)"""
+        with self._lock:
+            requests = self.hits + self.misses
+            avg_miss_ms = self._miss_seconds * 1000 / self.misses if self.misses else 0.0
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "avg_miss_latency_ms": avg_miss_ms,
+                "saved_latency_ms": avg_miss_ms * self.hits,
+            }
+
+    def clear(self) -> None:
+        """캐시와 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self._miss_seconds = 0.0
+
+    def save(self) -> int:
+        """만료되지 않은 항목을 디스크에 저장하고 저장한 개수를 반환 (persist_path가 없으면 무시)"""
+        if not self.persist_path:
+            return 0
+        now = time.time()
+        with self._lock:
+            entries = [
+                [list(key), vector, expires_at]
+                for key, (vector, expires_at) in self._entries.items()
+                if expires_at > now
+            ]
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 저장 도중 종료되어도 기존 파일이 깨지지 않도록 임시 파일로 쓴 뒤 교체
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.persist_path)
+        return len(entries)
+
+    def load(self) -> int:
+        """디스크에 저장된 항목 중 만료되지 않은 것을 불러오고 개수를 반환"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return 0
+        try:
+            with open(self.persist_path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return 0
+
+        now = time.time()
+        loaded = 0
+        # 파일은 오래된 순서로 저장되어 있으므로 그대로 넣으면 LRU 순서가 유지됨
+        for key, vector, expires_at in entries:
+            if expires_at > now:
+                self._put(tuple(key), vector, expires_at)
+                loaded += 1
+        return loaded
+
+
+embedding_cache = EmbeddingCache(
+    max_size=settings.EMBEDDING_CACHE_SIZE,
+    ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+    persist_path=settings.EMBEDDING_CACHE_PATH,
+)
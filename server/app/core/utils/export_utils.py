@@ -0,0 +1,170 @@
+import csv
+import io
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, List
+
+from app.core.enums.export_format import ExportFormat
+
+# CSV/Parquet 내보내기 기본 열 (점 표기 경로)
+EXPORT_COLUMNS = [
+    "@timestamp",
+    "message_timestamp",
+    "log_level",
+    "keyword",
+    "host.name",
+    "message",
+    "comment",
+]
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+Batch = List[Dict[str, Any]]
+
+
+def _get_value(data: Dict[str, Any], path: List[str]) -> Any:
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def _to_row(hit: Dict[str, Any], columns: List[str]) -> List[Any]:
+    """hit 하나를 열 순서에 맞는 값 목록으로 변환 (중첩 값은 JSON 문자열)"""
+    row = [hit["_id"]]
+    for column in columns:
+        value = _get_value(hit.get("_source", {}), column.split("."))
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, ensure_ascii=False)
+        row.append(value)
+    return row
+
+
+def write_ndjson(batches: Iterable[Batch]) -> Iterator[bytes]:
+    """배치 단위로 NDJSON 줄을 만들어 반환"""
+    for batch in batches:
+        lines = [
+            json.dumps({"_id": hit["_id"], **hit.get("_source", {})}, ensure_ascii=False)
+            for hit in batch
+        ]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def write_csv(batches: Iterable[Batch], columns: List[str]) -> Iterator[bytes]:
+    """헤더를 먼저 보내고 배치 단위로 CSV 행을 만들어 반환"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Excel에서 한글이 깨지지 않도록 BOM 추가
+    writer.writerow(["_id", *columns])
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_to_row(hit, columns) for hit in batch)
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+
+class _StreamSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모았다가 꺼내는 쓰기 전용 스트림"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def write_parquet(batches: Iterable[Batch], columns: List[str]) -> Iterator[bytes]:
+    """배치 하나를 row group 하나로 써서 완성된 바이트부터 반환 (모든 열은 문자열)"""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    names = ["_id", *columns]
+    schema = pa.schema([(name, pa.string()) for name in names])
+    sink = _StreamSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for batch in batches:
+            if not batch:
+                continue
+            frame = pd.DataFrame(
+                [
+                    [None if value is None else str(value) for value in _to_row(hit, columns)]
+                    for hit in batch
+                ],
+                columns=names,
+            )
+            writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def _csv_error_row(detail: str) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(["#export_error", detail])
+    return buffer.getvalue().encode("utf-8")
+
+
+# 스트리밍 도중 실패했을 때 마지막 줄로 보내는 오류 표시 (Parquet은 footer가 없어 파일 자체가 열리지 않음)
+EXPORT_ERROR_TRAILERS = {
+    ExportFormat.NDJSON: lambda detail: (
+        json.dumps({"_export_error": detail}, ensure_ascii=False) + "\n"
+    ).encode("utf-8"),
+    ExportFormat.CSV: _csv_error_row,
+}
+
+
+def with_error_trailer(chunks: Iterable[bytes], export_format: ExportFormat) -> Iterator[bytes]:
+    """
+    응답이 시작된 뒤 실패하면 오류 줄을 마지막으로 보내고 예외를 다시 발생시켜 연결을 끊음
+    (상태 코드를 바꿀 수 없으므로 잘린 파일이 정상 파일처럼 보이지 않도록 함)
+    """
+    try:
+        yield from chunks
+    except Exception as e:
+        detail = getattr(e, "detail", None) or str(e)
+        logging.error(f"Log export failed mid-stream: {detail}")
+        trailer = EXPORT_ERROR_TRAILERS.get(export_format)
+        if trailer:
+            yield trailer(detail)
+        raise
+
+
+def is_format_available(export_format: ExportFormat) -> bool:
+    """형식에 필요한 선택 의존성이 설치되어 있는지 확인"""
+    if export_format != ExportFormat.PARQUET:
+        return True
+    try:
+        import pandas  # noqa: F401
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
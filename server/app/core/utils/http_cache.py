@@ -0,0 +1,33 @@
+import hashlib
+from typing import Optional
+
+
+def make_etag(body: bytes) -> str:
+    """
+    응답 본문으로 strong ETag를 만듭니다. (본문이 바이트 단위로 같을 때만 같은 값)
+
+    Args:
+        body (bytes): 직렬화된 응답 본문
+
+    Returns:
+        str: 따옴표로 감싼 ETag 값
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다. (304 응답 여부)
+
+    Args:
+        if_none_match (Optional[str]): 요청의 If-None-Match 헤더 값
+        etag (str): 현재 응답의 ETag
+
+    Returns:
+        bool: 일치하는 ETag가 있거나 "*"이면 True
+    """
+    if not if_none_match:
+        return False
+    # If-None-Match는 weak 비교를 사용 (W/ 접두사 무시)
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
@@ -0,0 +1,140 @@
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+from app.core.enums.trouble_context_mode import TroubleContextMode
+
+# 트러블슈팅 프롬프트에 필요한 로그 필드 (Beats 메타데이터, vector는 조회하지 않음)
+TROUBLE_LOG_FIELDS = ["message", "message_timestamp", "log_level", "keyword", "comment", "host.name"]
+
+# 로그 한 줄의 최대 토큰 수 (스택 트레이스 등 긴 메시지 하나가 예산을 다 쓰지 않도록)
+MAX_LINE_TOKENS = 400
+
+# 템플릿 비교 전에 가리는 가변 값 (앞에서부터 순서대로 적용)
+_VARIABLE_PATTERNS = [
+    re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"),
+    re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"),
+    re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"),
+    re.compile(r"\b0x[0-9a-fA-F]+\b|\b(?=[0-9a-fA-F]*\d)(?=[0-9a-fA-F]*[a-fA-F])[0-9a-fA-F]{6,}\b"),
+    re.compile(r"\d+"),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 어림합니다. (UTF-8 4 byte ≈ 1 토큰)
+    제공업체마다 토크나이저가 달라 정확하지 않으며, 영문은 거의 맞고 한국어는 조금 적게 셉니다.
+    """
+    return math.ceil(len(text.encode("utf-8")) / 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """어림한 토큰 수가 max_tokens를 넘지 않도록 뒤를 자릅니다."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    encoded = text.encode("utf-8")[: max(max_tokens * 4 - 3, 0)]
+    return encoded.decode("utf-8", errors="ignore") + "..."
+
+
+def log_template(message: str) -> str:
+    """메시지의 시각, id, IP, 숫자를 <*>로 가려 같은 종류의 로그를 하나로 묶는 키를 만듭니다."""
+    for pattern in _VARIABLE_PATTERNS:
+        message = pattern.sub("<*>", message)
+    return " ".join(message.split())
+
+
+def _source(hit: Dict[str, Any]) -> Dict[str, Any]:
+    return hit.get("_source", {})
+
+
+def _header(source: Dict[str, Any]) -> str:
+    host = source.get("host")
+    parts = [
+        source.get("log_level"),
+        f"[{source['keyword']}]" if source.get("keyword") else None,
+        f"host={host['name']}" if isinstance(host, dict) and host.get("name") else None,
+    ]
+    return " ".join(part for part in parts if part)
+
+
+def _time_range(first: Optional[str], last: Optional[str]) -> str:
+    if not first:
+        return ""
+    return first if not last or last == first else f"{first} ~ {last}"
+
+
+def format_log_lines(hits: List[Dict[str, Any]], mode: TroubleContextMode) -> List[str]:
+    """
+    조회한 로그 문서를 프롬프트용 줄 목록으로 만듭니다. (입력 순서 유지)
+
+    Args:
+        hits (List[Dict[str, Any]]): get_logs_by_ids 결과 (_id, _source)
+        mode (TroubleContextMode): 로그를 줄로 만드는 방식
+
+    Returns:
+        List[str]: 한 줄씩 MAX_LINE_TOKENS 이하로 자른 로그 줄
+    """
+    if mode == TroubleContextMode.RAW:
+        lines = [
+            " ".join(
+                part
+                for part in (
+                    _source(hit).get("message_timestamp"),
+                    _header(_source(hit)),
+                    _source(hit).get("message", ""),
+                )
+                if part
+            )
+            for hit in hits
+        ]
+        return [truncate_to_tokens(line, MAX_LINE_TOKENS) for line in lines]
+
+    # 같은 키의 로그를 하나로 묶어 첫 로그, 개수, 시간 범위만 남김
+    groups: Dict[str, list] = {}
+    for hit in hits:
+        source = _source(hit)
+        message = source.get("message", "")
+        if mode == TroubleContextMode.COMMENT:
+            key = source.get("comment") or log_template(message)
+        else:
+            key = log_template(message)
+        timestamp = source.get("message_timestamp")
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [source, 1, timestamp, timestamp]
+            continue
+        group[1] += 1
+        if timestamp:
+            group[2] = min(group[2] or timestamp, timestamp)
+            group[3] = max(group[3] or timestamp, timestamp)
+
+    lines = []
+    for source, count, first, last in groups.values():
+        prefix = " ".join(
+            part for part in (f"(x{count})", _time_range(first, last), _header(source)) if part
+        )
+        if mode == TroubleContextMode.COMMENT:
+            body = source.get("comment") or source.get("message", "")
+        else:
+            body = source.get("message", "")
+            if source.get("comment"):
+                body = f"{body} // {source['comment']}"
+        lines.append(truncate_to_tokens(f"{prefix} {body}", MAX_LINE_TOKENS))
+    return lines
+
+
+def pack_lines(lines: List[str], max_tokens: int) -> List[List[str]]:
+    """줄 순서를 유지하며 묶음마다 어림 토큰 수가 max_tokens 이하가 되도록 나눕니다."""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for line in lines:
+        line_tokens = estimate_tokens(line) + 1  # 줄바꿈
+        if current and current_tokens + line_tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(line)
+        current_tokens += line_tokens
+    if current:
+        chunks.append(current)
+    return chunks
@@ -1,8 +1,14 @@
+import json
 import re
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
+# 엔드포인트별로 OpenSearch에서 받아올 _source 필드
+BASIC_LOG_FIELDS = ["message_timestamp", "log_level", "keyword"]
+FULL_LOG_FIELDS = [*BASIC_LOG_FIELDS, "message", "host.name"]
+
+
 def extract_timestamp_from_message(message: str) -> Optional[str]:
     """
     로그 메시지에서 타임스탬프를 추출하고 ISO 형식으로 변환합니다.
@@ -110,18 +116,101 @@ def extract_full_logs(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return processed_logs
 
 
-def remove_vector_from_logs(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# allowlist와 관계없이 항상 보존하는 필드
+REQUIRED_LOG_FIELDS = ["message", "@timestamp"]
+
+
+def _get_path(data: Dict[str, Any], path: List[str]) -> Any:
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def _set_path(data: Dict[str, Any], path: List[str], value: Any) -> None:
+    for key in path[:-1]:
+        data = data.setdefault(key, {})
+    data[path[-1]] = value
+
+
+def _delete_path(data: Dict[str, Any], path: List[str]) -> None:
+    parent = _get_path(data, path[:-1]) if len(path) > 1 else data
+    if isinstance(parent, dict):
+        parent.pop(path[-1], None)
+        # 비어버린 상위 객체 정리
+        if len(path) > 1 and not parent:
+            _delete_path(data, path[:-1])
+
+
+def filter_log_fields(
+    log_data: Dict[str, Any],
+    allowlist: Optional[List[str]] = None,
+    denylist: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
-    로그 목록에서 vector 필드를 제거합니다.
+    적재 전에 로그 필드를 allowlist/denylist로 걸러냅니다.
 
     Args:
-        logs (List[Dict[str, Any]]): 처리할 로그 목록
+        log_data (Dict[str, Any]): 수집된 원본 로그
+        allowlist (Optional[List[str]]): 남길 필드의 점 표기 경로 (비어있으면 전체 허용)
+        denylist (Optional[List[str]]): 제거할 필드의 점 표기 경로
+
+    Returns:
+        Dict[str, Any]: 필터링된 로그
+    """
+    # JSON 컬럼 값이 리스트가 아닌 경우 필터를 적용하지 않음
+    if not isinstance(allowlist, list):
+        allowlist = []
+    if not isinstance(denylist, list):
+        denylist = []
+
+    if allowlist:
+        filtered = {}
+        for field in [*REQUIRED_LOG_FIELDS, *allowlist]:
+            path = field.split(".")
+            value = _get_path(log_data, path)
+            if value is not None:
+                _set_path(filtered, path, value)
+        log_data = filtered
+
+    for field in denylist:
+        if field in REQUIRED_LOG_FIELDS:
+            continue
+        _delete_path(log_data, field.split("."))
+
+    return log_data
+
+
+def get_field_paths(data: Dict[str, Any], prefix: str = "") -> List[str]:
+    """
+    중첩된 로그의 말단 필드 경로를 점 표기로 나열합니다.
+
+    Args:
+        data (Dict[str, Any]): 로그 데이터
+        prefix (str): 상위 경로
+
+    Returns:
+        List[str]: 말단 필드 경로 목록
+    """
+    paths = []
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            paths.extend(get_field_paths(value, f"{path}."))
+        else:
+            paths.append(path)
+    return paths
+
+
+def get_document_size(document: Dict[str, Any]) -> int:
+    """
+    문서를 JSON으로 직렬화했을 때의 크기(byte)를 반환합니다.
+
+    Args:
+        document (Dict[str, Any]): 로그 문서
 
     Returns:
-        List[Dict[str, Any]]: vector이 제거된 로그 목록
+        int: UTF-8 기준 byte 수
     """
-    if isinstance(logs, list):
-        for log in logs:
-            if isinstance(log, dict) and "vector" in log["_source"]:
-                del log["_source"]["vector"]
-    return logs
+    return len(json.dumps(document, ensure_ascii=False).encode("utf-8"))
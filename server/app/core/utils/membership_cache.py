@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from app.core.config.settings import get_settings
+from app.schemas.project import ProjectContext
+
+settings = get_settings()
+
+# (user_id, project_id)
+MembershipKey = Tuple[int, int]
+
+
+class MembershipCache:
+    """(user_id, project_id) → 프로젝트 멤버십 LRU + TTL 캐시 (프로세스 단위)"""
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: int = 30):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (context, 만료 시각)
+        self._entries: "OrderedDict[MembershipKey, Tuple[ProjectContext, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, project_id: int) -> Optional[ProjectContext]:
+        """만료되지 않은 멤버십을 반환 (없으면 None)"""
+        key = (user_id, project_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            context, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return context
+
+    def put(self, context: ProjectContext) -> None:
+        """확인된 멤버십을 저장 (멤버가 아닌 경우는 저장하지 않음)"""
+        if self.ttl_seconds <= 0:
+            return
+        key = (context.user_id, context.project_id)
+        with self._lock:
+            self._entries[key] = (context, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, project_id: int, user_id: Optional[int] = None) -> None:
+        """프로젝트의 멤버십을 무효화 (user_id가 없으면 프로젝트의 모든 멤버)"""
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[1] == project_id and (user_id is None or key[0] == user_id)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        with self._lock:
+            self._entries.clear()
+
+
+class TokenVersionCache:
+    """user_id → 현재 토큰 버전 TTL 캐시 (토큰의 멤버십 클레임이 최신인지 확인용, 프로세스 단위)"""
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: int = 30):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # user_id -> (버전, 만료 시각)
+        self._entries: "OrderedDict[int, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[int]:
+        """만료되지 않은 버전을 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            version, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return version
+
+    def put(self, user_id: int, version: int) -> None:
+        """DB에서 읽은 버전을 저장"""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (version, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        """버전이 바뀐 사용자를 제거 (다음 요청에서 DB로 다시 확인)"""
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        with self._lock:
+            self._entries.clear()
+
+
+membership_cache = MembershipCache(
+    max_size=settings.MEMBERSHIP_CACHE_SIZE,
+    ttl_seconds=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
+token_version_cache = TokenVersionCache(
+    max_size=settings.MEMBERSHIP_CACHE_SIZE,
+    ttl_seconds=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
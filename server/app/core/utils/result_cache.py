@@ -0,0 +1,287 @@
+import json
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from app.core.config.settings import get_settings
+from app.core.utils.time_utils import floor_datetime
+
+settings = get_settings()
+
+WATERMARK_STEP = timedelta(hours=1)
+# 모든 기간에 영향을 주는 적재 기록의 버킷 시작 값 (DB의 NOT NULL 컬럼에 저장하기 위한 대표값)
+PROJECT_WIDE_BUCKET = datetime(1970, 1, 1)
+
+
+def parse_query_time(value: Optional[str]) -> Optional[datetime]:
+    """
+    검색 시간 문자열을 OpenSearch와 같은 기준(시간대 없는 값은 UTC)의 naive datetime으로 변환합니다.
+
+    Args:
+        value (Optional[str]): ISO 형식 시간 문자열
+
+    Returns:
+        Optional[datetime]: 변환된 시각, 값이 없거나 형식이 잘못되면 None
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def round_time_range(
+    start_time: Optional[str], end_time: Optional[str], step: timedelta = timedelta(minutes=1)
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    캐시 키가 매 요청마다 달라지지 않도록 검색 기간을 step 경계로 넓힙니다.
+    (시작은 내림, 끝은 올림 / 형식이 잘못된 값은 그대로 둠)
+    """
+    start = parse_query_time(start_time)
+    end = parse_query_time(end_time)
+    if start is not None:
+        start_time = floor_datetime(start, step).isoformat()
+    if end is not None:
+        floored = floor_datetime(end, step)
+        end_time = (floored if floored == end else floored + step).isoformat()
+    return start_time, end_time
+
+
+class IngestWatermark:
+    """
+    프로젝트별로 어느 시간대에 마지막으로 로그가 적재되었는지 기록.
+    적재 시각은 여러 프로세스가 같은 기준으로 비교할 수 있도록 epoch 초(time.time)로 기록하고,
+    아직 저장하지 않은 기록은 drain으로 꺼내 DB에 저장, 다른 프로세스의 기록은 merge로 반영합니다.
+    """
+
+    def __init__(self, max_buckets_per_project: int = 2000):
+        self.max_buckets_per_project = max_buckets_per_project
+        # project_id -> {시간 버킷 시작: 마지막 적재 시각(epoch 초)}
+        self._buckets: Dict[int, Dict[datetime, float]] = defaultdict(dict)
+        # 모든 기간에 영향을 주는 적재 (시간 정보 없는 로그, 버킷 정리, 보존 정책 삭제)
+        self._project_wide: Dict[int, float] = {}
+        # 기간과 관계없이 프로젝트의 마지막 적재 시각
+        self._latest: Dict[int, float] = {}
+        # 아직 DB에 저장하지 않은 기록 (project_id, 버킷 시작) -> 적재 시각
+        self._pending: Dict[Tuple[int, datetime], float] = {}
+        self._lock = threading.Lock()
+
+    def _apply(self, project_id: int, bucket_start: datetime, ingested_at: float) -> None:
+        """적재 기록 반영 (호출 측에서 잠금을 잡아야 함)"""
+        self._latest[project_id] = max(self._latest.get(project_id, 0.0), ingested_at)
+        if bucket_start == PROJECT_WIDE_BUCKET:
+            self._project_wide[project_id] = max(
+                self._project_wide.get(project_id, 0.0), ingested_at
+            )
+            return
+        buckets = self._buckets[project_id]
+        buckets[bucket_start] = max(buckets.get(bucket_start, 0.0), ingested_at)
+        if len(buckets) > self.max_buckets_per_project:
+            # 정리된 버킷의 적재는 모든 기간에 적용해 안전하게 무효화
+            oldest = min(buckets)
+            self._project_wide[project_id] = max(
+                self._project_wide.get(project_id, 0.0), buckets.pop(oldest)
+            )
+
+    def _record(self, project_id: int, bucket_start: datetime) -> None:
+        now = time.time()
+        with self._lock:
+            self._apply(project_id, bucket_start, now)
+            key = (project_id, bucket_start)
+            self._pending[key] = max(self._pending.get(key, 0.0), now)
+
+    def mark(self, project_id: int, timestamp: Optional[datetime] = None) -> None:
+        """로그 적재를 기록 (timestamp는 로그의 message_timestamp)"""
+        if timestamp is None:
+            self._record(project_id, PROJECT_WIDE_BUCKET)
+            return
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        self._record(project_id, floor_datetime(timestamp, WATERMARK_STEP))
+
+    def invalidate(self, project_id: int) -> None:
+        """프로젝트의 모든 캐시 결과를 무효화 (보존 정책 삭제 등)"""
+        self._record(project_id, PROJECT_WIDE_BUCKET)
+
+    def drain(self) -> Dict[Tuple[int, datetime], float]:
+        """아직 저장하지 않은 기록을 꺼내고 비움"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def restore(self, pending: Dict[Tuple[int, datetime], float]) -> None:
+        """저장에 실패한 기록을 다음 저장 때 다시 시도하도록 되돌림"""
+        with self._lock:
+            for key, ingested_at in pending.items():
+                self._pending[key] = max(self._pending.get(key, 0.0), ingested_at)
+
+    def merge(self, rows: Iterable[Tuple[int, datetime, float]]) -> None:
+        """다른 프로세스가 저장한 기록 (project_id, 버킷 시작, 적재 시각) 반영"""
+        with self._lock:
+            for project_id, bucket_start, ingested_at in rows:
+                self._apply(project_id, bucket_start, ingested_at)
+
+    def last_ingest_at(
+        self, project_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> float:
+        """
+        [start, end) 기간에 마지막으로 로그가 적재된 시각을 반환합니다.
+        기간이 열려 있으면 (start 또는 end가 None) 프로젝트 전체 기준.
+        """
+        with self._lock:
+            if start is None or end is None:
+                return self._latest.get(project_id, 0.0)
+            last = self._project_wide.get(project_id, 0.0)
+            for bucket_start, ingested_at in self._buckets.get(project_id, {}).items():
+                if bucket_start < end and bucket_start + WATERMARK_STEP > start:
+                    last = max(last, ingested_at)
+            return last
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    endpoint: str
+    project_id: int
+    start: Optional[datetime]
+    end: Optional[datetime]
+    computed_at: float
+    expires_at: float
+
+
+class ResultCache:
+    """
+    로그 조회 결과 캐시 (메모리 용량 기준 LRU + TTL, 프로세스 단위).
+    조회 기간에 새 로그가 적재되면 해당 항목은 더 이상 사용하지 않음.
+    (다른 프로세스의 적재는 워터마크 동기화 주기만큼 늦게 반영됨)
+    """
+
+    def __init__(
+        self,
+        watermark: IngestWatermark,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: int = 300,
+        grace_seconds: float = 2.0,
+    ):
+        self.watermark = watermark
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # 적재 직후 아직 검색에 반영되지 않은(refresh 전) 로그를 고려한 여유 시간
+        self.grace_seconds = grace_seconds
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "invalidated": 0}
+        )
+
+    def _is_fresh(self, entry: _Entry) -> bool:
+        last_ingest = self.watermark.last_ingest_at(entry.project_id, entry.start, entry.end)
+        return last_ingest + self.grace_seconds <= entry.computed_at
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        project_id: int,
+        key: Tuple,
+        compute: Callable[[], Any],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Any:
+        """
+        캐시된 결과가 있고 조회 기간에 새 로그가 없으면 재사용하고, 아니면 계산해 저장합니다.
+
+        Args:
+            endpoint (str): 통계를 구분할 엔드포인트 이름
+            project_id (int): 프로젝트 ID
+            key (Tuple): 검색어, 필터, k, 기간 등 결과를 결정하는 값
+            compute (Callable[[], Any]): 캐시 미스 시 실행할 조회 함수
+            start (Optional[datetime]): 조회 기간 시작 (없으면 프로젝트 전체 적재 기준으로 무효화)
+            end (Optional[datetime]): 조회 기간 끝
+
+        Returns:
+            Any: 조회 결과
+        """
+        cache_key = (endpoint, project_id, key)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            stats = self._stats[endpoint]
+            if entry is not None:
+                if entry.expires_at > now and self._is_fresh(entry):
+                    self._entries.move_to_end(cache_key)
+                    stats["hits"] += 1
+                    return entry.value
+                self._remove(cache_key)
+                stats["invalidated"] += 1
+            stats["misses"] += 1
+
+        # 조회 시작 전 시각을 기록해 조회 도중 적재된 로그도 무효화 대상이 되도록 함
+        computed_at = time.time()
+        value = compute()
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            if cache_key in self._entries:
+                self._remove(cache_key)
+            self._entries[cache_key] = _Entry(
+                value=value,
+                size=size,
+                endpoint=endpoint,
+                project_id=project_id,
+                start=start,
+                end=end,
+                computed_at=computed_at,
+                expires_at=computed_at + self.ttl_seconds,
+            )
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 용량과 엔드포인트별 적중률"""
+        with self._lock:
+            endpoints = {}
+            for endpoint, counts in self._stats.items():
+                requests = counts["hits"] + counts["misses"]
+                endpoints[endpoint] = {
+                    **counts,
+                    "hit_rate": counts["hits"] / requests if requests else 0.0,
+                }
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "endpoints": endpoints,
+            }
+
+    def clear(self) -> None:
+        """캐시와 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats.clear()
+
+
+ingest_watermark = IngestWatermark()
+result_cache = ResultCache(
+    ingest_watermark,
+    max_bytes=settings.RESULT_CACHE_MAX_MB * 1024 * 1024,
+    ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+    grace_seconds=settings.RESULT_CACHE_INGEST_GRACE_SECONDS,
+)
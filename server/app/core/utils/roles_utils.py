@@ -9,11 +9,13 @@ ROLE_PERMISSIONS: Dict[ProjectRole, List[Permission]] = {
         Permission.KICK_MEMBER,
         Permission.CHANGE_ROLE,
         Permission.VIEW_PROJECT,
+        Permission.MANAGE_SETTINGS,
     ],
     ProjectRole.MANAGER: [
         Permission.KICK_MEMBER,
         Permission.CHANGE_ROLE,
         Permission.VIEW_PROJECT,
+        Permission.MANAGE_SETTINGS,
     ],
     ProjectRole.MODERATOR: [
         Permission.KICK_MEMBER,
@@ -0,0 +1,68 @@
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from app.core.enums.rollup import RollupGranularity
+from app.core.utils.time_utils import floor_datetime
+
+# (project_id, bucket_start, log_level, keyword, host)
+RollupKey = Tuple[int, datetime, str, str, str]
+
+ROLLUP_STEPS: Dict[RollupGranularity, timedelta] = {
+    RollupGranularity.MINUTE: timedelta(minutes=1),
+    RollupGranularity.HOUR: timedelta(hours=1),
+    RollupGranularity.DAY: timedelta(days=1),
+}
+
+
+class RollupBuffer:
+    """적재 시점의 분 단위 로그 건수를 메모리에 누적하는 버퍼 (프로세스 단위)"""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        # 이 프로세스가 적재 건수를 세기 시작한 시각 (이후 분 경계부터 빠짐없이 집계)
+        self.started_at = datetime.now()
+        # 집계 프로세스 등록/저장 기록(rollup_writers)에 쓰는 이 버퍼의 식별자
+        self.writer_id = uuid.uuid4().hex
+
+    def covered_since(self) -> datetime:
+        """이 버퍼가 모든 적재를 센 첫 분 버킷 시작 (세기 시작한 분은 일부만 세었으므로 다음 분)"""
+        step = ROLLUP_STEPS[RollupGranularity.MINUTE]
+        floored = floor_datetime(self.started_at, step)
+        return floored if floored == self.started_at else floored + step
+
+    def add(
+        self,
+        project_id: int,
+        timestamp: datetime,
+        log_level: Optional[str] = None,
+        keyword: Optional[str] = None,
+        host: Optional[str] = None,
+    ) -> None:
+        """로그 한 건을 분 단위 버킷에 누적"""
+        key = (
+            project_id,
+            floor_datetime(timestamp, ROLLUP_STEPS[RollupGranularity.MINUTE]),
+            (log_level or "").upper()[:20],
+            (keyword or "")[:100],
+            (host or "")[:255],
+        )
+        with self._lock:
+            self._counts[key] += 1
+
+    def drain(self) -> Dict[RollupKey, int]:
+        """누적된 건수를 꺼내고 버퍼를 비움"""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        return dict(counts)
+
+    def restore(self, counts: Dict[RollupKey, int]) -> None:
+        """저장에 실패한 건수를 버퍼에 되돌림"""
+        with self._lock:
+            self._counts.update(counts)
+
+
+rollup_buffer = RollupBuffer()
@@ -0,0 +1,16 @@
+import json
+from typing import Any
+
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    Server-Sent Events 메시지 하나를 만듭니다.
+
+    Args:
+        event (str): 이벤트 이름 (클라이언트의 event 필드)
+        data (Any): JSON으로 직렬화할 데이터
+
+    Returns:
+        str: 빈 줄로 끝나는 SSE 메시지
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -26,17 +26,57 @@ def get_start_time(time_filter: LogTimeFilter) -> Tuple[str, str]:
     return start_time.isoformat(), now.isoformat()
 
 
-def get_log_time_by_count(count: int) -> Tuple[str, str]:
-    """최근 로그 시간 조회 함수
+def get_retention_cutoff(retention_days: int) -> datetime:
+    """보존 기간에 따른 만료 기준 시각을 반환하는 함수
 
     Args:
-        count (int): 조회할 로그 개수
+        retention_days (int): 보존 기간 (일)
 
     Returns:
-        Tuple[str, str]: (시작 시간, 현재 시간) ISO 형식의 시간 문자열 튜플
+        datetime: 이 시각 이전의 로그는 만료 대상
     """
-    now = datetime.now()
-    start_time = now - timedelta(days=count * 3)
-    end_time = now - timedelta(days=(count - 1) * 3)
+    return datetime.now() - timedelta(days=retention_days)
+
+
+def floor_datetime(value: datetime, step: timedelta) -> datetime:
+    """시각을 step 단위 경계로 내림하는 함수 (epoch 기준 정렬)
+
+    Args:
+        value (datetime): 기준 시각
+        step (timedelta): 버킷 길이
+
+    Returns:
+        datetime: value가 속한 버킷의 시작 시각
+    """
+    epoch = datetime(1970, 1, 1)
+    return epoch + ((value - epoch) // step) * step
+
+
+# 대시보드 시간 필터별 (버킷 간격, 버킷 길이, 조회 기간)
+DASHBOARD_INTERVALS = {
+    LogTimeFilter.DAY: ("1h", timedelta(hours=1), timedelta(days=1)),
+    LogTimeFilter.WEEK: ("1d", timedelta(days=1), timedelta(days=7)),
+    LogTimeFilter.MONTH: ("1d", timedelta(days=1), timedelta(days=30)),
+}
+
+
+def get_dashboard_range(time_filter: LogTimeFilter) -> Tuple[str, str, str]:
+    """대시보드 집계 구간과 버킷 간격을 반환하는 함수
+
+    끝 시각을 버킷 경계로 올림해서 같은 버킷 안의 요청은 동일한 쿼리가 되도록 합니다.
+    (OpenSearch shard request cache 적중)
+
+    Args:
+        time_filter (LogTimeFilter): 시간 필터 타입
+
+    Returns:
+        Tuple[str, str, str]: (시작 시간, 끝 시간, 버킷 간격) 시작/끝은 ISO 형식
+    """
+    if time_filter not in DASHBOARD_INTERVALS:
+        raise ValueError(f"Invalid time filter: {time_filter}")
+
+    interval, step, span = DASHBOARD_INTERVALS[time_filter]
+    end_time = floor_datetime(datetime.now(), step) + step
+    start_time = end_time - span
 
-    return start_time.isoformat(), end_time.isoformat()
+    return start_time.isoformat(), end_time.isoformat(), interval
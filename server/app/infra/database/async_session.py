@@ -0,0 +1,74 @@
+from functools import lru_cache
+from typing import AsyncIterator
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from app.core.config.settings import get_settings
+from app.infra.database.routing import USE_REPLICAS, ReplicaSet, RoutingSession
+from app.infra.database.session import READ_METHODS, build_database_url, replica_addresses
+
+settings = get_settings()
+
+async_database_URL = build_database_url("aiomysql", settings.MYSQL_HOST, settings.MYSQL_PORT)
+
+
+def _create_async_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """
+    비동기 라우트용 엔진 (동기 engine과 별도 풀, 첫 사용 시 생성)
+    비동기 라우트는 스레드풀을 거치지 않으므로 동시 요청 수가 이 풀 크기로만 제한됨
+    """
+    return _create_async_engine(async_database_URL)
+
+
+@lru_cache
+def get_async_replica_engines() -> tuple[AsyncEngine, ...]:
+    """비동기 라우트용 읽기 복제본 엔진 (MYSQL_REPLICA_HOSTS, 첫 사용 시 생성)"""
+    return tuple(
+        _create_async_engine(build_database_url("aiomysql", host, port))
+        for host, port in replica_addresses()
+    )
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    # 커밋 후 속성 접근이 지연 로딩(await 없는 I/O)을 일으키지 않도록 만료하지 않음
+    # 복제본 라우팅은 내부 동기 세션(RoutingSession)의 get_bind에서 처리
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        sync_session_class=RoutingSession,
+        replicas=ReplicaSet(engine.sync_engine for engine in get_async_replica_engines()),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db(request: Request) -> AsyncIterator[AsyncSession]:
+    async with get_async_sessionmaker()() as db:
+        db.info[USE_REPLICAS] = request.method in READ_METHODS
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """종료 시 비동기 풀 연결 정리 (엔진을 만든 적이 없으면 아무것도 하지 않음)"""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_async_replica_engines.cache_info().currsize:
+        for engine in get_async_replica_engines():
+            await engine.dispose()
@@ -0,0 +1,47 @@
+from sqlalchemy import Float, case, literal, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# MySQL ngram 파서의 기본 토큰 길이 (ngram_token_size) - 이보다 짧은 검색어는 전문 검색 인덱스로 찾을 수 없음
+NGRAM_TOKEN_SIZE = 2
+
+# FULLTEXT 인덱스를 만들 때 InnoDB 기본 불용어 목록을 쓰지 않도록 하는 세션 설정
+# (ngram 파서는 불용어가 들어간 토큰을 모두 버리므로 "a", "i" 등이 들어간 영문 2글자 토큰이 색인되지 않음)
+DISABLE_STOPWORDS_SQL = "SET SESSION innodb_ft_enable_stopword = OFF"
+
+
+def boolean_phrase(term: str) -> str:
+    """검색어를 BOOLEAN MODE 구문 검색식("...")으로 변환 (구문 안의 큰따옴표는 공백으로 바꿈)"""
+    return '"%s"' % " ".join(term.replace('"', " ").split())
+
+
+class text_match(FunctionElement):
+    """
+    여러 문자열 컬럼에 대한 전문 검색 관련도 점수 (0이면 일치하지 않음)
+    - MySQL: MATCH(...) AGAINST('"검색어"' IN BOOLEAN MODE) → FULLTEXT(ngram) 인덱스 사용
+      (구문 검색이라 검색어의 ngram이 모두 연속으로 있어야 일치 - 부분 일치와 같은 결과)
+    - 그 외(테스트용 SQLite): 컬럼 중 하나라도 검색어를 포함하면 1, 아니면 0
+    """
+
+    type = Float()
+    inherit_cache = True
+    name = "text_match"
+
+    def __init__(self, *columns, against: str):
+        super().__init__(*columns, literal(against), literal(boolean_phrase(against)))
+
+
+@compiles(text_match, "mysql")
+def _compile_mysql_match(element: text_match, compiler, **kw) -> str:
+    *columns, _, phrase = element.clauses
+    return "MATCH (%s) AGAINST (%s IN BOOLEAN MODE)" % (
+        ", ".join(compiler.process(column, **kw) for column in columns),
+        compiler.process(phrase, **kw),
+    )
+
+
+@compiles(text_match)
+def _compile_like_match(element: text_match, compiler, **kw) -> str:
+    *columns, against, _ = element.clauses
+    contains = or_(*(column.contains(against, autoescape=False) for column in columns))
+    return compiler.process(case((contains, 1.0), else_=0.0), **kw)
@@ -0,0 +1,4 @@
+from app.infra.database.migrations.runner import Migration, run_migrations
+from app.infra.database.migrations.versions import MIGRATIONS
+
+__all__ = ["MIGRATIONS", "Migration", "run_migrations"]
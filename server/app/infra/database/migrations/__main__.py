@@ -0,0 +1,7 @@
+# 배포 시 앱 시작 전에 실행: python -m app.infra.database.migrations
+from app.infra.database.migrations import MIGRATIONS, run_migrations
+from app.infra.database.session import engine
+
+if __name__ == "__main__":
+    applied = run_migrations(engine, MIGRATIONS)
+    print(f"Applied migrations: {applied}" if applied else "Schema is up to date")
@@ -0,0 +1,105 @@
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, List, NamedTuple, Sequence
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection
+
+import app.models  # noqa: F401 (Base.metadata에 모든 모델 테이블 등록)
+from app.infra.database.fulltext import DISABLE_STOPWORDS_SQL
+from app.infra.database.session import Base
+
+# 여러 워커 프로세스가 동시에 시작해도 마이그레이션은 한 프로세스만 실행
+MIGRATION_LOCK_NAME = "lognlook_schema_migrations"
+MIGRATION_LOCK_TIMEOUT_SECONDS = 300
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class Migration(NamedTuple):
+    """기존 테이블을 바꾸는 스키마 변경 한 단계 (version 순서로 한 번만 실행)"""
+
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+@contextmanager
+def _migration_lock(connection: Connection):
+    """MySQL named lock으로 마이그레이션 직렬화 (다른 DB는 잠금 없이 실행)"""
+    if connection.dialect.name != "mysql":
+        yield
+        return
+    acquired = connection.execute(
+        text("SELECT GET_LOCK(:name, :timeout)"),
+        {"name": MIGRATION_LOCK_NAME, "timeout": MIGRATION_LOCK_TIMEOUT_SECONDS},
+    ).scalar()
+    if acquired != 1:
+        raise RuntimeError("Timed out waiting for the schema migration lock")
+    try:
+        yield
+    finally:
+        connection.execute(
+            text("SELECT RELEASE_LOCK(:name)"), {"name": MIGRATION_LOCK_NAME}
+        )
+
+
+def _record(connection: Connection, migration: Migration) -> None:
+    connection.execute(
+        schema_migrations.insert().values(
+            version=migration.version, name=migration.name, applied_at=datetime.now()
+        )
+    )
+
+
+def run_migrations(engine: Engine, migrations: Sequence[Migration]) -> List[int]:
+    """
+    스키마를 최신 상태로 맞추고 이번에 적용한 마이그레이션 버전 목록을 반환
+    - 없는 테이블은 모델 정의(인덱스 포함)로 생성
+    - 빈 DB는 모델로 전체 스키마를 만들었으므로 모든 마이그레이션을 적용된 것으로 기록
+    - 기존 DB는 아직 적용하지 않은 마이그레이션을 버전 순서대로 실행 (각각 별도 트랜잭션)
+    """
+    applied_now = []
+    with engine.connect() as connection:
+        with _migration_lock(connection):
+            if connection.dialect.name == "mysql":
+                # 이 연결에서 만드는 FULLTEXT 인덱스는 불용어 없이 색인
+                connection.execute(text(DISABLE_STOPWORDS_SQL))
+            existing_tables = set(inspect(connection).get_table_names())
+            fresh = not existing_tables & set(Base.metadata.tables)
+
+            schema_migrations.create(connection, checkfirst=True)
+            Base.metadata.create_all(connection)
+            connection.commit()
+
+            applied = set(connection.execute(select(schema_migrations.c.version)).scalars())
+            for migration in sorted(migrations, key=lambda m: m.version):
+                if migration.version in applied:
+                    continue
+                if not fresh:
+                    logging.info(
+                        f"Applying schema migration {migration.version}: {migration.name}"
+                    )
+                    migration.upgrade(connection)
+                _record(connection, migration)
+                connection.commit()
+                applied_now.append(migration.version)
+    return applied_now
@@ -0,0 +1,194 @@
+import logging
+from typing import List, Optional
+
+from sqlalchemy import DefaultClause, Index, MetaData, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+
+from app.core.enums.mapping_profile import MappingProfile
+from app.core.enums.trouble_status import TroubleStatus
+from app.infra.database.migrations.runner import Migration
+from app.infra.database.session import Base
+
+
+def _existing_index_names(connection: Connection, table_name: str) -> set:
+    inspector = inspect(connection)
+    names = {index["name"] for index in inspector.get_indexes(table_name)}
+    names |= {
+        constraint["name"] for constraint in inspector.get_unique_constraints(table_name)
+    }
+    return names
+
+
+def _create_index(
+    connection: Connection,
+    table_name: str,
+    name: str,
+    columns: List[str],
+    unique: bool = False,
+    **dialect_kwargs,
+) -> None:
+    """인덱스가 없을 때만 생성 (모델 정의로 새로 만든 테이블에는 이미 있음)"""
+    if name in _existing_index_names(connection, table_name):
+        return
+    # Index는 생성 시 테이블에 붙으므로 모델 메타데이터가 아닌 복사본 테이블로 만듦
+    table = Base.metadata.tables[table_name].to_metadata(MetaData())
+    Index(
+        name, *(table.c[column] for column in columns), unique=unique, **dialect_kwargs
+    ).create(connection)
+
+
+def _add_column(
+    connection: Connection, table_name: str, name: str, server_default: Optional[str] = None
+) -> None:
+    """
+    모델에 정의된 컬럼이 테이블에 없을 때만 추가
+    - nullable 컬럼은 기존 행이 NULL
+    - NOT NULL 컬럼은 server_default(SQL 식)로 기존 행을 채우며, 없으면 모델의 server_default 사용
+    """
+    if name in {column["name"] for column in inspect(connection).get_columns(table_name)}:
+        return
+    # server_default를 바꿔도 모델 메타데이터에 남지 않도록 복사본 테이블의 컬럼 사용
+    column = Base.metadata.tables[table_name].to_metadata(MetaData()).c[name]
+    if server_default is not None:
+        column.server_default = DefaultClause(text(server_default))
+    if not column.nullable and column.server_default is None:
+        raise ValueError(f"NOT NULL column {table_name}.{name} needs a server default")
+    ddl = CreateColumn(column).compile(dialect=connection.dialect)
+    connection.execute(
+        text(f"ALTER TABLE {connection.dialect.identifier_preparer.quote(table_name)} ADD COLUMN {ddl}")
+    )
+
+
+def _empty_json_array(connection: Connection) -> str:
+    """JSON 컬럼 기본값 [] (MySQL JSON 컬럼은 리터럴 기본값을 받지 않아 식으로 지정, 8.0.13 이상)"""
+    return "(JSON_ARRAY())" if connection.dialect.name == "mysql" else "'[]'"
+
+
+def _delete_duplicate_user_projects(connection: Connection) -> None:
+    """같은 (user_id, project_id) 멤버십이 여러 행이면 가장 먼저 만든 행만 남김"""
+    user_project = Base.metadata.tables["user_project"]
+    kept = {}
+    duplicates = []
+    rows = connection.execute(
+        select(user_project.c.id, user_project.c.user_id, user_project.c.project_id)
+        .order_by(user_project.c.id)
+    )
+    for row_id, user_id, project_id in rows:
+        if (user_id, project_id) in kept:
+            duplicates.append(row_id)
+        else:
+            kept[(user_id, project_id)] = row_id
+    if duplicates:
+        logging.warning(f"Removing {len(duplicates)} duplicate user_project rows")
+        connection.execute(user_project.delete().where(user_project.c.id.in_(duplicates)))
+
+
+def hot_lookup_indexes(connection: Connection) -> None:
+    """요청마다 실행되는 조회 조건에 보조 인덱스와 유니크 제약 추가"""
+    _delete_duplicate_user_projects(connection)
+    _create_index(connection, "project", "uq_project_api_key", ["api_key"], unique=True)
+    _create_index(
+        connection, "project", "uq_project_invite_code", ["invite_code"], unique=True
+    )
+    _create_index(
+        connection,
+        "user_project",
+        "uq_user_project_user_project",
+        ["user_id", "project_id"],
+        unique=True,
+    )
+    _create_index(connection, "trouble_logs", "ix_trouble_logs_trouble_id", ["trouble_id"])
+    _create_index(
+        connection, "troubles", "ix_troubles_project_created", ["project_id", "created_at"]
+    )
+
+
+def trouble_fulltext_index(connection: Connection) -> None:
+    """trouble 목록 검색용 FULLTEXT(ngram) 인덱스 추가 (MySQL 전용, 다른 DB는 부분 일치 검색 유지)"""
+    if connection.dialect.name != "mysql":
+        return
+    # 기존 행 전체를 색인하므로 trouble 수에 비례해 오래 걸리고, InnoDB는 그동안 테이블 쓰기를 막음
+    _create_index(
+        connection,
+        "troubles",
+        "ft_troubles_text",
+        ["report_name", "user_query", "content"],
+        mysql_prefix="FULLTEXT",
+        mysql_with_parser="ngram",
+    )
+
+
+def trouble_generation_usage(connection: Connection) -> None:
+    """trouble별 AI 분석 입력 토큰 수와 소요 시간 컬럼 추가"""
+    _add_column(connection, "troubles", "prompt_tokens")
+    _add_column(connection, "troubles", "generation_ms")
+
+
+def project_setting_retention(connection: Connection) -> None:
+    """프로젝트별 로그/벡터 보존 기간 컬럼 추가 (기존 프로젝트는 무기한 보존)"""
+    _add_column(connection, "project_settings", "log_retention_days")
+    _add_column(connection, "project_settings", "vector_retention_days")
+
+
+def project_setting_ingest_field_filters(connection: Connection) -> None:
+    """적재 전 필드 allowlist/denylist 컬럼 추가 (기존 프로젝트는 빈 목록 = 전체 허용)"""
+    default = _empty_json_array(connection)
+    _add_column(connection, "project_settings", "ingest_field_allowlist", default)
+    _add_column(connection, "project_settings", "ingest_field_denylist", default)
+
+
+def trouble_generation_status(connection: Connection) -> None:
+    """trouble AI 생성 상태 컬럼 추가 (기존 trouble은 동기로 생성이 끝난 리포트이므로 COMPLETED)"""
+    _add_column(connection, "troubles", "status", f"'{TroubleStatus.COMPLETED.name}'")
+    _add_column(connection, "troubles", "attempts", "0")
+    _add_column(connection, "troubles", "error_message")
+    _add_column(connection, "troubles", "completed_at")
+
+
+def user_token_version(connection: Connection) -> None:
+    """사용자 토큰 버전 컬럼 추가 (모델의 server_default 0)"""
+    _add_column(connection, "users", "token_version")
+
+
+def trouble_fulltext_index_without_stopwords(connection: Connection) -> None:
+    """
+    ft_troubles_text를 불용어 없이 다시 만듦 (MySQL 전용)
+    기본 불용어 목록으로 만든 인덱스는 "a", "i" 등이 들어간 ngram 토큰이 빠져 영문 검색어를 찾지 못함
+    """
+    if connection.dialect.name != "mysql":
+        return
+    if "ft_troubles_text" in _existing_index_names(connection, "troubles"):
+        connection.execute(text("ALTER TABLE troubles DROP INDEX ft_troubles_text"))
+    trouble_fulltext_index(connection)
+
+
+def project_setting_rollup_since(connection: Connection) -> None:
+    """집계 테이블이 로그를 빠짐없이 담기 시작한 시각 컬럼 추가 (기존 프로젝트는 다음 집계 저장 때 기록)"""
+    _add_column(connection, "project_settings", "rollup_since")
+
+
+def trouble_generation_claimed_at(connection: Connection) -> None:
+    """AI 생성 선점 시각 컬럼 추가 (기존 생성 중 trouble은 선점 시각이 없어 바로 재등록 대상)"""
+    _add_column(connection, "troubles", "claimed_at")
+
+
+def project_setting_mapping_profile(connection: Connection) -> None:
+    """인덱스 매핑 프로필 컬럼 추가 (매핑 프로필 도입 전에 만든 인덱스는 모두 FULL 매핑)"""
+    _add_column(connection, "project_settings", "mapping_profile", f"'{MappingProfile.FULL.name}'")
+
+
+# 새 마이그레이션은 마지막 버전 다음 번호로 뒤에 추가
+MIGRATIONS = [
+    Migration(1, "hot_lookup_indexes", hot_lookup_indexes),
+    Migration(2, "trouble_fulltext_index", trouble_fulltext_index),
+    Migration(3, "trouble_generation_usage", trouble_generation_usage),
+    Migration(4, "project_setting_retention", project_setting_retention),
+    Migration(5, "project_setting_ingest_field_filters", project_setting_ingest_field_filters),
+    Migration(6, "trouble_generation_status", trouble_generation_status),
+    Migration(7, "user_token_version", user_token_version),
+    Migration(8, "trouble_fulltext_index_without_stopwords", trouble_fulltext_index_without_stopwords),
+    Migration(9, "project_setting_rollup_since", project_setting_rollup_since),
+    Migration(10, "trouble_generation_claimed_at", trouble_generation_claimed_at),
+    Migration(11, "project_setting_mapping_profile", project_setting_mapping_profile),
+]
@@ -1,14 +1,34 @@
 from opensearchpy import OpenSearch
+from opensearchpy.exceptions import RequestError, TransportError
 
+import logging
+import re
+import time
+import numpy as np
 from typing import List, Dict, Any
-from collections import defaultdict
 
 from app.core.config.settings import get_settings
+from app.core.enums.search_mode import HybridSearchMode
 from app.core.llm.base import LLMFactory
+from app.core.utils.embedding_cache import embedding_cache
 
 
 settings = get_settings()
 
+# hybrid 쿼리를 처리할 수 없다는 오류 (neural-search 플러그인 없음) - 이때만 msearch 방식으로 전환
+_HYBRID_UNSUPPORTED = re.compile(
+    r"unknown query \[hybrid\]|no \[query\] registered for \[hybrid\]", re.IGNORECASE
+)
+# search pipeline이 없다는 오류 (다른 곳에서 삭제됨) - 다음 요청에서 다시 등록
+_PIPELINE_MISSING = re.compile(r"pipeline .*(is not defined|not found|does not exist)", re.IGNORECASE)
+# search pipeline API나 normalization processor가 없는 클러스터의 응답 상태
+_PIPELINE_UNSUPPORTED_STATUS = (400, 404, 405)
+
+
+def _error_text(error: TransportError) -> str:
+    return f"{error.error} {error.info}"
+
+
 class OpenSearchClient:
     """OpenSearch 클라이언트 클래스"""
     
@@ -23,15 +43,29 @@ class OpenSearchClient:
             use_ssl=False,
         )
         self.embedding_model = LLMFactory.create_embedding_model()
+        self._hybrid_mode = settings.OPENSEARCH_HYBRID_MODE
+        self._hybrid_pipeline_ready = False
         
     def _generate_embeddings(self, text: str) -> List[float]:
-        """ 텍스트를 벡터로 변환 """
+        """ 텍스트를 벡터로 변환 (같은 검색어는 캐시된 벡터 재사용) """
+        if settings.EMBEDDING_CACHE_ENABLED:
+            return embedding_cache.get_or_compute(text, self.embedding_model.embed_query)
         return self.embedding_model.embed_query(text)
     
-    def _execute_search(self, index: str, body: Dict[str, Any], size: int = 100) -> List[Dict[str, Any]]:
+    def _build_source_filter(self, includes: List[str] = None, excludes: List[str] = None) -> Dict[str, Any]:
+        """ _source 필터 생성 (vector는 항상 제외) """
+        source_filter = {"excludes": ["vector", *(excludes or [])]}
+        if includes:
+            source_filter["includes"] = includes
+        return source_filter
+
+    def _execute_search(self, index: str, body: Dict[str, Any], size: int = 100, source_includes: List[str] = None, source_excludes: List[str] = None) -> List[Dict[str, Any]]:
         """ Elasticsearch 검색 실행 공통 함수 """
         if "size" not in body:
             body["size"] = size
+        # 필요한 필드만 응답받도록 서버 측에서 _source 필터링
+        if "_source" not in body:
+            body["_source"] = self._build_source_filter(source_includes, source_excludes)
         return self.client.search(index=index, body=body)["hits"]["hits"]
     
     def save_document(self, index: str, document: Dict[str, Any]) -> None:
@@ -63,10 +97,13 @@ class OpenSearchClient:
             
         return filter_conditions
     
-    def create_index(self, index: str, mappings: Dict[str, Any]) -> None:
+    def create_index(self, index: str, mappings: Dict[str, Any], index_settings: Dict[str, Any] = None) -> None:
         """ 인덱스를 생성하는 함수 """
         if not self.client.indices.exists(index=index):
-            self.client.indices.create(index=index, body={"mappings": mappings})
+            body = {"mappings": mappings}
+            if index_settings:
+                body["settings"] = index_settings
+            self.client.indices.create(index=index, body=body)
         else:
             raise ValueError(f"Index {index} already exists")
 
@@ -77,52 +114,269 @@ class OpenSearchClient:
         else:
             raise ValueError(f"Index {index} does not exist")
 
-    def search_by_id(self, index: str, ids: List[str]) -> List[Any]:
+    def get_store_size(self, index: str) -> int:
+        """ 인덱스의 저장 용량(byte)을 조회하는 함수 """
+        stats = self.client.indices.stats(index=index, metric="store")
+        return stats["_all"]["primaries"]["store"]["size_in_bytes"]
+
+    def count_documents(self, index: str, query: Dict[str, Any] = None) -> int:
+        """ 조건에 맞는 문서 수를 조회하는 함수 """
+        body = {"query": query} if query else None
+        return self.client.count(index=index, body=body)["count"]
+
+    def delete_by_query(self, index: str, query: Dict[str, Any], requests_per_second: float = -1) -> str:
+        """ 쿼리 조건에 맞는 문서를 삭제하는 작업을 시작하고 task id를 반환하는 함수 (스로틀링 적용) """
+        result = self.client.delete_by_query(
+            index=index,
+            body={"query": query},
+            conflicts="proceed",
+            requests_per_second=requests_per_second,
+            refresh=True,
+            wait_for_completion=False,
+        )
+        return result["task"]
+
+    def update_by_query(self, index: str, query: Dict[str, Any], script: str, requests_per_second: float = -1) -> str:
+        """ 쿼리 조건에 맞는 문서에 스크립트를 적용하는 작업을 시작하고 task id를 반환하는 함수 (스로틀링 적용) """
+        result = self.client.update_by_query(
+            index=index,
+            body={"query": query, "script": {"source": script, "lang": "painless"}},
+            conflicts="proceed",
+            requests_per_second=requests_per_second,
+            refresh=True,
+            wait_for_completion=False,
+        )
+        return result["task"]
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        """ 백그라운드 작업(delete-by-query 등)의 진행 상태를 조회하는 함수 """
+        return self.client.tasks.get(task_id=task_id)
+
+    def expunge_deletes(self, index: str) -> None:
+        """ 삭제된 문서가 차지하는 세그먼트 공간을 회수하는 함수 """
+        self.client.indices.forcemerge(index=index, only_expunge_deletes=True)
+
+    def aggregate(self, index: str, query: Dict[str, Any], aggs: Dict[str, Any]) -> Dict[str, Any]:
+        """ 집계 전용 검색 (문서 없이 전체 건수와 집계 결과만 반환, shard request cache 사용) """
+        body = {"size": 0, "track_total_hits": True, "query": query, "aggs": aggs}
+        response = self.client.search(index=index, body=body, request_cache=True)
+        return {
+            "total": response["hits"]["total"]["value"],
+            "aggregations": response.get("aggregations", {}),
+        }
+
+    def create_pit(self, index: str, keep_alive: str) -> str:
+        """ 인덱스의 point in time을 생성하고 pit_id를 반환하는 함수 """
+        return self.client.create_pit(index=index, keep_alive=keep_alive)["pit_id"]
+
+    def delete_pit(self, pit_id: str) -> None:
+        """ point in time을 해제하는 함수 """
+        self.client.delete_pit(body={"pit_id": [pit_id]})
+
+    def search_after(self, pit_id: str, keep_alive: str, sort: List[Dict[str, Any]], size: int = 100, search_after: List[Any] = None, query: Dict[str, Any] = None, source_includes: List[str] = None, slice_id: int = None, max_slices: int = None) -> List[Dict[str, Any]]:
+        """ point in time 안에서 search_after로 정렬된 다음 페이지를 조회하는 함수 (index 지정 불가, slice 지정 시 해당 조각만) """
+        body = {
+            "size": size,
+            "pit": {"id": pit_id, "keep_alive": keep_alive},
+            "sort": sort,
+            "track_total_hits": False,
+            "_source": self._build_source_filter(source_includes),
+        }
+        if query:
+            body["query"] = query
+        if search_after:
+            body["search_after"] = search_after
+        if max_slices and max_slices > 1:
+            body["slice"] = {"id": slice_id, "max": max_slices}
+        return self.client.search(body=body)["hits"]["hits"]
+
+    def get_by_ids(self, index: str, ids: List[str], source_includes: List[str] = None, chunk_size: int = 500) -> List[Dict[str, Any]]:
+        """ _mget으로 id 목록의 문서를 조회하는 함수 (요청 순서 유지, 없는 문서 제외, chunk 단위 요청, 문서 _version 포함) """
+        unique_ids = list(dict.fromkeys(ids))
+        params = {"_source_excludes": "vector"}
+        if source_includes:
+            params["_source_includes"] = ",".join(source_includes)
+
+        documents = []
+        for i in range(0, len(unique_ids), chunk_size):
+            response = self.client.mget(index=index, body={"ids": unique_ids[i:i + chunk_size]}, params=params)
+            documents.extend(
+                {
+                    "_index": doc["_index"],
+                    "_id": doc["_id"],
+                    "_version": doc.get("_version"),
+                    "_source": doc.get("_source", {}),
+                }
+                for doc in response["docs"]
+                if doc.get("found")
+            )
+        return documents
+
+    def get_versions(self, index: str, ids: List[str], chunk_size: int = 500) -> List[List[Any]]:
+        """ _source 없이 _mget으로 문서별 [_id, _version]을 조회하는 함수 (요청 순서 유지, 없는 문서 제외) """
+        unique_ids = list(dict.fromkeys(ids))
+        versions = []
+        for i in range(0, len(unique_ids), chunk_size):
+            response = self.client.mget(
+                index=index, body={"ids": unique_ids[i:i + chunk_size]}, params={"_source": "false"}
+            )
+            versions.extend(
+                [doc["_id"], doc.get("_version")]
+                for doc in response["docs"]
+                if doc.get("found")
+            )
+        return versions
+
+    def search_by_id(self, index: str, ids: List[str], source_includes: List[str] = None) -> List[Any]:
         """ id로 검색하는 함수 """
         query = {"query": {"ids": {"values": ids}}}
-        return self._execute_search(index, query)
+        return self._execute_search(index, query, size=len(ids), source_includes=source_includes)
     
-    def search_by_datetime(self, index: str, time_filter: Dict[str, Any], size: int = 100) -> List[Any]:
+    def search_by_datetime(self, index: str, time_filter: Dict[str, Any], size: int = 100, source_includes: List[str] = None) -> List[Any]:
         """ 시간 범위로 검색하는 함수 """
         query = {"query": {"range": time_filter}, "size": size}
-        return self._execute_search(index, query, size=size)
+        return self._execute_search(index, query, size=size, source_includes=source_includes)
 
-    def search_by_terms(self, index: str, term_field: str, term_values: List[Any]) -> List[Dict[str, Any]]:
+    def search_by_terms(self, index: str, term_field: str, term_values: List[Any], source_includes: List[str] = None) -> List[Dict[str, Any]]:
         """ terms 기반 검색 공통 함수 """
         query = {"query": {"terms": {term_field: term_values}}}
-        return self._execute_search(index, query)   
+        return self._execute_search(index, query, source_includes=source_includes)
 
-    def search_by_bm25(self, index: str, query: str, field: str = "name", k: int = 5) -> List[Dict[str, Any]]:
+    def search_by_bm25(self, index: str, query: str, field: str = "name", k: int = 5, source_includes: List[str] = None) -> List[Dict[str, Any]]:
         """ BM25 기반 검색 공통 함수 """
         query_body = {"query": {"match": {field: query}}}
-        return self._execute_search(index, query_body)[:k]
+        return self._execute_search(index, query_body, size=k, source_includes=source_includes)
+
+    def _knn_query(self, query_vector: List[float], vector_field: str = "vector", k: int = 50, filters: Dict[str, Any] = None) -> Dict[str, Any]:
+        """ OpenSearch kNN 쿼리 생성 """
+        knn = {"vector": query_vector, "k": k}
+        if filters:
+            knn["filter"] = filters
+        return {"knn": {vector_field: knn}}
 
-    def search_by_vector(self, index: str, query: str, vector_field: str = "vector", filters: Dict[str, Any] = None, k: int = 50, num_candidates: int = 200) -> List[Dict[str, Any]]:
+    def _bm25_query(self, query: str, fields: List[str], filters: Dict[str, Any] = None) -> Dict[str, Any]:
+        """ 여러 텍스트 필드 대상 BM25 쿼리 생성 """
+        bool_query = {"must": [{"multi_match": {"query": query, "fields": fields}}]}
+        if filters:
+            bool_query["filter"] = [filters]
+        return {"bool": bool_query}
+
+    def search_by_vector(self, index: str, query: str, vector_field: str = "vector", filters: Dict[str, Any] = None, k: int = 50, source_includes: List[str] = None) -> List[Dict[str, Any]]:
         """ 벡터 검색 (OpenSearch kNN) """
         query_vector = self._generate_embeddings(query)
-        query_body = {
-            "knn": {
-                "field": vector_field,
-                "query_vector": query_vector,
-                "k": k,
-                "num_candidates": num_candidates,
-            },
+        query_body = {"query": self._knn_query(query_vector, vector_field, k, filters)}
+        return self._execute_search(index, query_body, size=k, source_includes=source_includes)
+
+    def put_hybrid_pipeline(self, name: str, bm25_weight: float) -> None:
+        """ BM25/kNN 점수를 min-max 정규화 후 가중 평균하는 search pipeline 생성 """
+        body = {
+            "description": "Normalize and combine BM25 and kNN scores for hybrid log search",
+            "phase_results_processors": [
+                {
+                    "normalization-processor": {
+                        "normalization": {"technique": "min_max"},
+                        "combination": {
+                            "technique": "arithmetic_mean",
+                            "parameters": {"weights": [bm25_weight, 1 - bm25_weight]},
+                        },
+                    }
+                }
+            ],
         }
-        if filters:
-            query_body["knn"]["filter"] = filters
-        return self._execute_search(index, query_body)
-    
-    def search_by_hybrid(self, index: str, query: str, k: int = 5) -> List[Dict[str, Any]]:
-        """ 하이브리드 검색 """
-        bm25_results = self.search_by_bm25(index, query, field="notice_content", k=k)
-        vector_results = self.search_by_vector(index, query, k=k)
-        return self.reciprocal_rank_fusion([bm25_results, vector_results], k)
-
-    def reciprocal_rank_fusion(self, rankings: List[List[str]], k: int = 5) -> List[Dict[str, Any]]:
-        """ RRF (Reciprocal Rank Fusion) 알고리즘 """
-        rrf = defaultdict(float)
+        self.client.search_pipeline.put(id=name, body=body)
+
+    def _ensure_hybrid_pipeline(self) -> bool:
+        """
+        프로세스당 한 번 search pipeline을 등록하고 pipeline 방식을 쓸 수 있는지 반환
+        - 클러스터가 search pipeline을 지원하지 않으면 msearch 방식으로 전환
+        - 연결 오류 등 일시적인 실패는 이번 요청만 msearch로 처리하고 다음 요청에서 다시 등록
+        """
+        if self._hybrid_mode != HybridSearchMode.PIPELINE:
+            return False
+        if self._hybrid_pipeline_ready:
+            return True
+        try:
+            self.put_hybrid_pipeline(settings.OPENSEARCH_HYBRID_PIPELINE, settings.OPENSEARCH_HYBRID_BM25_WEIGHT)
+        except TransportError as e:
+            if e.status_code in _PIPELINE_UNSUPPORTED_STATUS:
+                # neural-search 플러그인이 없는 클러스터
+                logging.warning(f"Hybrid search pipeline unavailable, falling back to msearch: {e}")
+                self._hybrid_mode = HybridSearchMode.MSEARCH
+            else:
+                logging.warning(f"Failed to register hybrid search pipeline, using msearch for this request: {e}")
+            return False
+        self._hybrid_pipeline_ready = True
+        return True
+
+    def search_by_hybrid(self, index: str, query: str, fields: List[str] = None, vector_field: str = "vector", filters: Dict[str, Any] = None, k: int = 50, source_includes: List[str] = None) -> Dict[str, Any]:
+        """ 하이브리드 검색 (BM25 + kNN 한 번의 요청, 전체 hit와 단계별 지연(ms) 반환) """
+        fields = fields or ["message", "comment"]
+        started = time.perf_counter()
+        query_vector = self._generate_embeddings(query)
+        latency_ms = {"embedding": (time.perf_counter() - started) * 1000}
+
+        bm25_query = self._bm25_query(query, fields, filters)
+        knn_query = self._knn_query(query_vector, vector_field, k, filters)
+        source = self._build_source_filter(source_includes)
+
+        if self._ensure_hybrid_pipeline():
+            body = {
+                "size": k,
+                "query": {"hybrid": {"queries": [bm25_query, knn_query]}},
+                "_source": source,
+            }
+            try:
+                response = self.client.search(
+                    index=index, body=body, search_pipeline=settings.OPENSEARCH_HYBRID_PIPELINE
+                )
+                latency_ms["hybrid"] = response["took"]
+                return {"hits": response["hits"]["hits"], "latency_ms": latency_ms}
+            except RequestError as e:
+                # 잘못된 검색 조건 등 다른 오류는 그대로 전달 (방식 전환 없음)
+                if _HYBRID_UNSUPPORTED.search(_error_text(e)):
+                    logging.warning(f"Hybrid query unsupported, falling back to msearch: {e}")
+                    self._hybrid_mode = HybridSearchMode.MSEARCH
+                elif _PIPELINE_MISSING.search(_error_text(e)):
+                    logging.warning(f"Hybrid search pipeline missing, re-registering on next search: {e}")
+                    self._hybrid_pipeline_ready = False
+                else:
+                    raise
+
+        body = [
+            {"index": index},
+            {"size": k, "query": bm25_query, "_source": source},
+            {"index": index},
+            {"size": k, "query": knn_query, "_source": source},
+        ]
+        bm25_response, knn_response = self.client.msearch(body=body)["responses"]
+        for response in (bm25_response, knn_response):
+            if "error" in response:
+                raise RequestError(response.get("status", 400), "msearch_failed", response["error"])
+        latency_ms["bm25"] = bm25_response["took"]
+        latency_ms["knn"] = knn_response["took"]
+        hits = self.reciprocal_rank_fusion(
+            [bm25_response["hits"]["hits"], knn_response["hits"]["hits"]], size=k
+        )
+        return {"hits": hits, "latency_ms": latency_ms}
+
+    def reciprocal_rank_fusion(self, rankings: List[List[Dict[str, Any]]], size: int = 50, rank_constant: int = 60) -> List[Dict[str, Any]]:
+        """ RRF (Reciprocal Rank Fusion) - 순위별 1/(rank_constant + rank) 합으로 hit 재정렬 """
+        hits_by_id = {}
+        ids, ranks = [], []
         for ranking in rankings:
-            for i, r in enumerate(ranking):
-                rrf[r["_id"]] += 1.0 / (k + i)
+            for rank, hit in enumerate(ranking, start=1):
+                hits_by_id.setdefault(hit["_id"], hit)
+                ids.append(hit["_id"])
+                ranks.append(rank)
+        if not ids:
+            return []
 
-        return [{"id": doc_id, "score": score} for doc_id, score in sorted(rrf.items(), key=lambda x: x[1], reverse=True)]
\ No newline at end of file
+        unique_ids, positions = np.unique(np.array(ids, dtype=object), return_inverse=True)
+        scores = np.zeros(len(unique_ids))
+        np.add.at(scores, positions, 1.0 / (rank_constant + np.array(ranks)))
+        # 점수 내림차순, 같은 점수는 id 순서로 고정
+        order = np.lexsort((unique_ids.astype(str), -scores))[:size]
+        return [
+            {**hits_by_id[unique_ids[i]], "_score": float(scores[i])}
+            for i in order
+        ]
@@ -0,0 +1,85 @@
+import logging
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """체크아웃 대기 시간, 오버플로 연결, 타임아웃을 기록하는 QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_metrics()
+
+    def _init_metrics(self) -> None:
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._timeouts = 0
+        self._overflow_opened = 0
+        self._invalidated = 0
+        self._peak_checked_out = 0
+        event.listen(self, "connect", self._on_connect)
+        event.listen(self, "invalidate", self._on_invalidate)
+
+    def connect(self):
+        """연결 체크아웃 (대기 시간 측정, pre_ping 왕복 포함)"""
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self._timeouts += 1
+            logging.warning(
+                f"DB pool checkout timed out: {self.checkedout()} checked out, "
+                f"pool_size {self.size()}, max_overflow {self._max_overflow}"
+            )
+            raise
+        elapsed = time.perf_counter() - started
+        checked_out = self.checkedout()
+        with self._metrics_lock:
+            self._checkouts += 1
+            self._wait_seconds += elapsed
+            self._max_wait_seconds = max(self._max_wait_seconds, elapsed)
+            # 1ms 이상이면 풀이 비어 기다렸거나 새 연결을 연 경우
+            if elapsed >= 0.001:
+                self._waited += 1
+            self._peak_checked_out = max(self._peak_checked_out, checked_out)
+        return connection
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        # 새 DBAPI 연결은 overflow 카운터를 올린 뒤 만들어지므로 0보다 크면 pool_size를 넘은 연결
+        if self._overflow > 0:
+            with self._metrics_lock:
+                self._overflow_opened += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        # pre_ping에서 끊어진 연결을 발견하거나 연결 오류로 버려진 경우
+        with self._metrics_lock:
+            self._invalidated += 1
+
+    def stats(self) -> Dict[str, float]:
+        """풀 상태와 누적 체크아웃 통계"""
+        with self._metrics_lock:
+            return {
+                "pool_size": self.size(),
+                "max_overflow": self._max_overflow,
+                "checked_out": self.checkedout(),
+                "idle": self.checkedin(),
+                "overflow": max(self.overflow(), 0),
+                "peak_checked_out": self._peak_checked_out,
+                "checkouts": self._checkouts,
+                "waited": self._waited,
+                "avg_wait_ms": (
+                    self._wait_seconds * 1000 / self._checkouts if self._checkouts else 0.0
+                ),
+                "max_wait_ms": self._max_wait_seconds * 1000,
+                "timeouts": self._timeouts,
+                "overflow_opened": self._overflow_opened,
+                "invalidated": self._invalidated,
+            }
@@ -0,0 +1,69 @@
+import itertools
+from typing import Optional, Sequence
+
+from sqlalchemy import Engine, Select
+from sqlalchemy.orm import Session
+
+# session.info 키
+USE_REPLICAS = "use_replicas"  # 요청 세션에서만 켜짐 (백그라운드 작업, 스트리밍 세션은 항상 primary)
+WROTE = "wrote"  # 이 세션에서 쓰기가 있었으면 이후 읽기도 primary (read-after-write)
+
+# 쿼리 단위로 primary를 강제하는 execution option (복제 지연이 권한 확인 등에 영향을 주는 쿼리)
+USE_PRIMARY = "use_primary"
+
+
+class ReplicaSet:
+    """읽기 복제본 엔진 목록 (세션마다 라운드 로빈으로 하나를 배정)"""
+
+    def __init__(self, engines: Sequence[Engine] = ()):
+        self.engines = list(engines)
+        self._counter = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def next(self) -> Engine:
+        return self.engines[next(self._counter) % len(self.engines)]
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용 SELECT를 복제본으로 보내는 Session
+    쓰기(flush, UPDATE/DELETE), 잠금 조회(FOR UPDATE), 쓰기 이후의 읽기는 primary(bind)로 보냄
+    복제본은 세션의 첫 복제본 읽기에서 하나를 골라 세션이 닫힐 때까지 계속 사용
+    (한 요청이 복제본 연결을 여러 개 잡거나 복제 지연이 다른 스냅샷을 섞어 읽지 않도록)
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas or ReplicaSet()
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or (clause is not None and clause.is_dml):
+            self.info[WROTE] = True
+        elif self._reads_from_replica(clause):
+            if self._replica is None:
+                self._replica = self.replicas.next()
+            return self._replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        # 닫은 세션을 다시 쓰면 새 요청처럼 복제본을 다시 배정
+        self._replica = None
+
+    def _reads_from_replica(self, clause) -> bool:
+        return (
+            bool(self.replicas)
+            and self.info.get(USE_REPLICAS, False)
+            and not self.info.get(WROTE, False)
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and not clause.get_execution_options().get(USE_PRIMARY, False)
+        )
+
+
+def read_from_primary(db: Session) -> None:
+    """이 세션의 읽기를 모두 primary로 보냄 (직전 요청의 쓰기를 바로 읽어야 하는 경로)"""
+    db.info[USE_REPLICAS] = False
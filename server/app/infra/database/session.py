@@ -1,17 +1,61 @@
+from typing import List, Tuple
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config.settings import get_settings
+from app.infra.database.pool import InstrumentedQueuePool
+from app.infra.database.routing import USE_REPLICAS, ReplicaSet, RoutingSession
 
 settings = get_settings()
 
-database_URL = f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_SCHEMA}"
-engine = create_engine(database_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def build_database_url(driver: str, host: str, port: str) -> str:
+    return f"mysql+{driver}://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{host}:{port}/{settings.MYSQL_SCHEMA}"
+
+
+def replica_addresses() -> List[Tuple[str, str]]:
+    """MYSQL_REPLICA_HOSTS("host" 또는 "host:port", 쉼표 구분)를 (host, port) 목록으로 변환"""
+    addresses = []
+    for entry in settings.MYSQL_REPLICA_HOSTS.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        host, _, port = entry.partition(":")
+        addresses.append((host, port or settings.MYSQL_PORT))
+    return addresses
+
+
+def _create_engine(url: str):
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+database_URL = build_database_url("pymysql", settings.MYSQL_HOST, settings.MYSQL_PORT)
+engine = _create_engine(database_URL)
+# 읽기 복제본 (설정하지 않으면 모든 쿼리가 primary로 감)
+replicas = ReplicaSet(
+    [_create_engine(build_database_url("pymysql", host, port)) for host, port in replica_addresses()]
+)
+# 직접 만든 세션(백그라운드 작업 등)은 primary만 사용하고, 요청 세션(get_db)만 복제본 읽기를 켬
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=engine, replicas=replicas
+)
 Base = declarative_base()
 
-def get_db():
+READ_METHODS = ("GET", "HEAD")
+
+def get_db(request: Request):
     db = SessionLocal()
+    # 조회 요청만 복제본에서 읽음 (쓰기 요청은 권한 확인 등 쓰기 전 읽기도 primary에서)
+    db.info[USE_REPLICAS] = request.method in READ_METHODS
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
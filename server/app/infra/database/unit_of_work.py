@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+# 현재 unit_of_work 블록의 세션 (요청 스레드/태스크 단위)
+_active_session: ContextVar[Optional[Session]] = ContextVar("unit_of_work_session", default=None)
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    여러 저장소 쓰기를 한 트랜잭션으로 묶음
+    - 블록 안의 저장소 commit은 flush로 바뀌고, 블록이 끝날 때 한 번만 commit
+    - 블록에서 예외가 나면 블록 안의 쓰기를 모두 rollback
+    - 이미 같은 세션의 블록 안이면 바깥 블록의 트랜잭션에 합류
+    """
+    if _active_session.get() is db:
+        yield db
+        return
+
+    token = _active_session.set(db)
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        _active_session.reset(token)
+
+
+def in_unit_of_work(db: Session) -> bool:
+    """세션이 unit_of_work 블록 안에서 쓰이고 있는지 여부"""
+    return _active_session.get() is db
+
+
+def commit_or_flush(db: Session, *refresh) -> None:
+    """
+    저장소 쓰기 마무리 - unit_of_work 안이면 flush만 (id 등 확정, commit은 블록 끝에서),
+    밖이면 바로 commit 후 refresh로 넘긴 객체를 다시 읽음
+    """
+    if in_unit_of_work(db):
+        db.flush()
+        return
+    db.commit()
+    for instance in refresh:
+        db.refresh(instance)
@@ -9,14 +9,78 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
-from app.infra.database.session import engine, Base
+from app.infra.database.session import engine
+from app.infra.database.migrations import MIGRATIONS, run_migrations
+from app.infra.database.async_session import dispose_async_engine
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routers import user, project, pipeline, log, trouble
+from app.api.routers import user, project, pipeline, log, trouble, metrics
+from app.core.config.settings import get_settings
+from app.tasks.retention import retention_scheduler
+from app.tasks.rollup import (
+    rollup_scheduler,
+    start_rollup_writer,
+    stop_rollup_counting,
+    stop_rollup_writer,
+)
+from app.tasks.ingest_watermark import watermark_scheduler, run_watermark_sync_once
+from app.tasks.trouble import (
+    resume_trouble_generations,
+    shutdown_trouble_workers,
+    trouble_requeue_scheduler,
+)
+from app.core.utils.embedding_cache import embedding_cache
+
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마 마이그레이션 (없는 테이블 생성 + 기존 테이블 변경, 워커 간 잠금으로 한 번만 실행)
+    if settings.DB_MIGRATE_ON_STARTUP:
+        await asyncio.to_thread(run_migrations, engine, MIGRATIONS)
+    # 이전 실행에서 저장한 검색어 임베딩 캐시 불러오기
+    await asyncio.to_thread(embedding_cache.load)
+    # 이전 실행에서 끝나지 못한 트러블슈팅 리포트 생성 작업 재등록
+    await asyncio.to_thread(resume_trouble_generations)
+    # 다른 인스턴스가 중단되어 생성 중으로 남은 작업 재등록
+    requeue_task = asyncio.create_task(trouble_requeue_scheduler())
+    # 로그 보존 정책 백그라운드 태스크
+    retention_task = None
+    if settings.RETENTION_ENABLED:
+        retention_task = asyncio.create_task(retention_scheduler())
+    # 로그 집계 버퍼 저장/합치기 백그라운드 태스크
+    rollup_task = None
+    if settings.ROLLUP_ENABLED:
+        await asyncio.to_thread(start_rollup_writer)
+        rollup_task = asyncio.create_task(rollup_scheduler())
+    else:
+        await asyncio.to_thread(stop_rollup_counting)
+    # 조회 결과 캐시의 적재 워터마크를 다른 프로세스와 공유하는 백그라운드 태스크
+    watermark_task = None
+    if settings.RESULT_CACHE_ENABLED:
+        watermark_task = asyncio.create_task(watermark_scheduler())
+    yield
+    requeue_task.cancel()
+    if retention_task:
+        retention_task.cancel()
+    if rollup_task:
+        rollup_task.cancel()
+        # 종료 전에 남은 집계 건수 저장
+        await asyncio.to_thread(stop_rollup_writer)
+    if watermark_task:
+        watermark_task.cancel()
+        # 종료 전에 남은 적재 기록 저장
+        await asyncio.to_thread(run_watermark_sync_once)
+    shutdown_trouble_workers()
+    await asyncio.to_thread(embedding_cache.save)
+    await dispose_async_engine()
+
 
-Base.metadata.create_all(bind=engine)
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # CORS 설정
 origins = [
@@ -42,6 +106,7 @@ app.include_router(project.router, prefix="/api", tags=["projects"])
 app.include_router(pipeline.router, prefix="/api", tags=["pipeline"])
 app.include_router(log.router, prefix="/api", tags=["logs"])
 app.include_router(trouble.router, prefix="/api", tags=["troubles"])
+app.include_router(metrics.router, prefix="/api", tags=["metrics"])
 
 
 @app.get("/")
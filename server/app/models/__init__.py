@@ -5,3 +5,6 @@ from .trouble import Trouble
 from .trouble_log import TroubleLog
 from .project_setting import ProjectSetting
 from .notification import Notification
+from .log_rollup import LogRollup
+from .log_ingest_watermark import LogIngestWatermark
+from .rollup_writer import RollupWriter
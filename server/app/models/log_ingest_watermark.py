@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, UniqueConstraint
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import relationship
+from app.infra.database.session import Base
+
+
+class LogIngestWatermark(Base):
+    __tablename__ = "log_ingest_watermarks"
+    __table_args__ = (
+        UniqueConstraint("project_id", "bucket_start", name="uq_log_ingest_watermarks_bucket"),
+        Index("ix_log_ingest_watermarks_ingested_at", "ingested_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(
+        Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=False
+    )
+    bucket_start = Column(DateTime, nullable=False)  # 1시간 버킷 시작 (1970-01-01이면 모든 기간)
+    # 마지막 적재 시각 (UTC, 결과 캐시 유예 시간보다 정밀하도록 마이크로초까지 저장)
+    ingested_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"), nullable=False
+    )
+
+    # Relationships
+    project = relationship("Project", passive_deletes=True)
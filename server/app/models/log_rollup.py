@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from app.infra.database.session import Base
+
+
+class LogRollup(Base):
+    __tablename__ = "log_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id",
+            "granularity",
+            "bucket_start",
+            "log_level",
+            "keyword",
+            "host",
+            name="uq_log_rollups_bucket",
+        ),
+        Index("ix_log_rollups_project_bucket", "project_id", "bucket_start"),
+        Index("ix_log_rollups_granularity_bucket", "granularity", "bucket_start"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(
+        Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=False
+    )
+    granularity = Column(String(10), nullable=False)  # minute, hour, day
+    bucket_start = Column(DateTime, nullable=False)
+    log_level = Column(String(20), nullable=False, default="")
+    keyword = Column(String(100), nullable=False, default="")
+    host = Column(String(255), nullable=False, default="")
+    log_count = Column(Integer, nullable=False, default=0)
+
+    # Relationships
+    project = relationship("Project", passive_deletes=True)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import UUID, Column, Integer, String, DateTime
+from sqlalchemy import UUID, Column, Integer, String, DateTime, UniqueConstraint
 from app.core.enums.language import Language
 from app.infra.database.session import Base
 from sqlalchemy.orm import relationship
@@ -8,6 +8,11 @@ from sqlalchemy import Enum as SqlEnum
 
 class Project(Base):
     __tablename__ = "project"
+    __table_args__ = (
+        # 로그 수집마다 api_key로, 초대 참여 시 invite_code로 조회
+        UniqueConstraint("api_key", name="uq_project_api_key"),
+        UniqueConstraint("invite_code", name="uq_project_invite_code"),
+    )
     id: int | None = Column(Integer, primary_key=True, index=True)
     name: str = Column(String(20), nullable=False)
     description: str = Column(String(50))
@@ -21,18 +26,20 @@ class Project(Base):
     create_by: int = Column(Integer)
     create_at: DateTime = Column(DateTime, default=datetime.now)
 
+    # 관계는 기본적으로 로딩하지 않음 (lazy="raise")
+    # 필요한 조회에서만 joinedload/selectinload 옵션으로 명시적으로 로딩
     user_projects = relationship(
         "UserProject",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="raise",
         passive_deletes=True,
     )
     troubles = relationship(
         "Trouble",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="raise",
         passive_deletes=True,
     )
     setting = relationship(
@@ -40,14 +47,14 @@ class Project(Base):
         back_populates="project",
         uselist=False,
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="raise",
         passive_deletes=True,
     )
     notifications = relationship(
         "Notification",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="raise",
         passive_deletes=True,
     )
 
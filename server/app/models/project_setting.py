@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, JSON, DateTime, Enum as SqlEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from app.core.enums.mapping_profile import MappingProfile
 from app.infra.database.session import Base
 
 
@@ -13,6 +14,18 @@ class ProjectSetting(Base):
     )
     logstash_config: JSON | None = Column(JSON, nullable=False, default=list)
     log_keywords: JSON | None = Column(JSON, nullable=False, default=list)
+    # 적재 전 필드 필터 (점 표기 경로, allowlist가 비어있으면 전체 허용)
+    ingest_field_allowlist: JSON | None = Column(JSON, nullable=False, default=list)
+    ingest_field_denylist: JSON | None = Column(JSON, nullable=False, default=list)
+    # 보존 기간 (일 단위, None이면 무기한 보존)
+    log_retention_days: int | None = Column(Integer, nullable=True)
+    vector_retention_days: int | None = Column(Integer, nullable=True)
+    # 이 시각 이후 적재된 로그는 집계 테이블(log_rollups)에 빠짐없이 있음 (None이면 아직 집계 시작 전)
+    rollup_since: DateTime | None = Column(DateTime, nullable=True)
+    # 인덱스를 만들 때 사용한 매핑 프로필 (설정이 바뀌어도 기존 인덱스의 매핑은 그대로이므로 인덱스별로 기록)
+    mapping_profile: MappingProfile = Column(
+        SqlEnum(MappingProfile), nullable=False, default=MappingProfile.FULL
+    )
     updated_at: DateTime = Column(
         DateTime, default=datetime.now, onupdate=datetime.now, nullable=False
     )
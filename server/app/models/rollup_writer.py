@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from app.infra.database.session import Base
+
+
+class RollupWriter(Base):
+    __tablename__ = "rollup_writers"
+
+    # 집계 건수를 메모리에 누적하는 프로세스 (정상 종료 시 삭제, 저장 기록이 끊기면 비정상 종료로 판단)
+    id = Column(String(32), primary_key=True)
+    started_at = Column(DateTime, nullable=False)
+    heartbeat_at = Column(DateTime, nullable=False, index=True)
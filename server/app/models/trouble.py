@@ -1,11 +1,26 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index
+from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from app.core.enums.trouble_status import TroubleStatus
 from app.infra.database.session import Base
 
 
 class Trouble(Base):
     __tablename__ = "troubles"
+    __table_args__ = (
+        # 프로젝트별 최신순 목록 (InnoDB 보조 인덱스에 id가 붙어 created_at, id 정렬까지 인덱스로 처리)
+        Index("ix_troubles_project_created", "project_id", "created_at"),
+        # 목록 검색어 전문 검색 (ngram 파서로 띄어쓰기 없는 한국어도 2글자 단위로 색인, MySQL 전용)
+        Index(
+            "ft_troubles_text",
+            "report_name",
+            "user_query",
+            "content",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(
@@ -19,6 +34,15 @@ class Trouble(Base):
     is_shared = Column(Boolean, default=False, nullable=False)
     user_query = Column(String(1000), nullable=False)
     content = Column(String(10000), nullable=False)
+    status = Column(
+        SqlEnum(TroubleStatus), nullable=False, default=TroubleStatus.PENDING
+    )
+    attempts = Column(Integer, default=0, nullable=False)  # AI 생성 시도 횟수
+    error_message = Column(String(1000), nullable=True)  # 마지막 실패 사유
+    completed_at = Column(DateTime, nullable=True)
+    claimed_at = Column(DateTime, nullable=True)  # AI 생성 선점 시각 (오래된 선점은 중단된 작업으로 보고 재등록)
+    prompt_tokens = Column(Integer, nullable=True)  # AI 분석 입력 토큰 수 (로그 요약 호출 포함)
+    generation_ms = Column(Integer, nullable=True)  # AI 분석 소요 시간
 
     # Relationships
     project = relationship("Project", back_populates="troubles", passive_deletes=True)
@@ -26,7 +50,7 @@ class Trouble(Base):
     logs = relationship(
         "TroubleLog",
         back_populates="trouble",
-        lazy="joined",
+        lazy="selectin",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, ForeignKey, String
+from sqlalchemy import Column, Integer, ForeignKey, String, Index
 from sqlalchemy.orm import relationship
 from app.infra.database.session import Base
 
 
 class TroubleLog(Base):
     __tablename__ = "trouble_logs"
+    __table_args__ = (
+        Index("ix_trouble_logs_trouble_id", "trouble_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     trouble_id = Column(Integer, ForeignKey("troubles.id"), nullable=False)
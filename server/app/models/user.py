@@ -10,18 +10,21 @@ class User(Base):
     username: str = Column(String(50), nullable=False, unique=True)
     password: str = Column(String(255), nullable=False)
     create_at: DateTime = Column(DateTime, default=datetime.now)
+    # 멤버십이 바뀌면 증가 (이전 버전 토큰의 멤버십 클레임은 DB로 다시 확인)
+    token_version: int = Column(Integer, nullable=False, default=0, server_default="0")
 
+    # 인증마다 조회되므로 관계는 기본적으로 로딩하지 않음 (lazy="raise")
     user_projects = relationship(
         "UserProject",
         back_populates="user",
-        lazy="joined",
+        lazy="raise",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
     troubles = relationship(
         "Trouble",
         back_populates="creator",
-        lazy="joined",
+        lazy="raise",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -1,11 +1,15 @@
 from datetime import datetime
-from sqlalchemy import Column, ForeignKey, Integer, String, Boolean
+from sqlalchemy import Column, ForeignKey, Integer, String, Boolean, UniqueConstraint
 from app.infra.database.session import Base
 from sqlalchemy.orm import relationship
 
 
 class UserProject(Base):
     __tablename__ = "user_project"
+    __table_args__ = (
+        # 요청마다 (사용자, 프로젝트) 멤버십을 조회, 같은 멤버십 중복 방지
+        UniqueConstraint("user_id", "project_id", name="uq_user_project_user_project"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
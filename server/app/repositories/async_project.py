@@ -0,0 +1,29 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from app.models.project import Project
+from app.repositories.project import member_context_statement, projects_by_user_statement
+
+
+async def get_project_by_user(db: AsyncSession, user_id: int) -> list[Project]:
+    result = await db.scalars(projects_by_user_statement(user_id))
+    return list(result.all())
+
+
+async def get_project_by_id(
+    db: AsyncSession, project_id: int, with_setting: bool = False
+) -> Project | None:
+    """프로젝트 조회 (with_setting이면 ProjectSetting을 같은 쿼리로 함께 로딩)"""
+    statement = select(Project).where(Project.id == project_id)
+    if with_setting:
+        statement = statement.options(joinedload(Project.setting))
+    return await db.scalar(statement)
+
+
+async def get_member_context(db: AsyncSession, user_id: int, project_id: int):
+    """
+    사용자 존재 여부, 프로젝트 존재 여부, 프로젝트 내 역할을 한 번의 쿼리로 조회
+    (사용자가 없으면 None, 프로젝트가 없으면 project_id가 None, 멤버가 아니면 role이 None)
+    """
+    result = await db.execute(member_context_statement(user_id, project_id))
+    return result.first()
@@ -0,0 +1,44 @@
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional, List, Tuple
+
+from app.models.trouble import Trouble
+from app.repositories.trouble import (
+    project_troubles_count_statement,
+    project_troubles_page_statement,
+)
+from app.schemas.trouble import TroubleListQuery
+
+
+async def get_trouble_by_id(db: AsyncSession, trouble_id: int) -> Optional[Trouble]:
+    """ID로 trouble을 조회합니다. (logs는 selectin 로딩으로 같은 await 안에서 함께 조회)"""
+    return await db.scalar(select(Trouble).where(Trouble.id == trouble_id))
+
+
+async def count_project_troubles(
+    db: AsyncSession,
+    project_id: int,
+    query_params: TroubleListQuery,
+    user_id: int
+) -> int:
+    """프로젝트 trouble 목록의 전체 개수를 조회합니다."""
+    return await db.scalar(
+        project_troubles_count_statement(project_id, query_params, user_id)
+    )
+
+
+async def get_project_troubles_page(
+    db: AsyncSession,
+    project_id: int,
+    query_params: TroubleListQuery,
+    user_id: int,
+    after: Optional[Tuple[datetime, int]] = None
+) -> List[Row]:
+    """프로젝트의 trouble 요약 목록 한 페이지를 조회합니다. (다음 페이지 확인용으로 한 행 더)"""
+    result = await db.execute(
+        project_troubles_page_statement(
+            project_id, query_params, user_id, after, limit=query_params.size + 1
+        )
+    )
+    return result.all()
@@ -0,0 +1,21 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infra.database.routing import USE_PRIMARY
+from app.models.user import User
+
+
+async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
+    return await db.scalar(select(User).where(User.username == username))
+
+
+async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
+    return await db.scalar(select(User).where(User.id == user_id))
+
+
+async def get_token_version(db: AsyncSession, user_id: int) -> int | None:
+    """사용자의 현재 토큰 버전 조회 (사용자가 없으면 None, primary에서 읽음)"""
+    return await db.scalar(
+        select(User.token_version)
+        .where(User.id == user_id)
+        .execution_options(**{USE_PRIMARY: True})
+    )
@@ -0,0 +1,49 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from datetime import datetime
+from typing import List
+
+from app.infra.database.unit_of_work import commit_or_flush
+from app.models.log_ingest_watermark import LogIngestWatermark
+
+
+def upsert_ingest_watermarks(db: Session, rows: List[dict]) -> None:
+    """
+    버킷별 마지막 적재 시각을 저장합니다. (이미 있으면 더 늦은 시각을 유지)
+    여러 프로세스가 같은 행을 갱신하므로 키 순서로 정렬해 잠금 순서를 맞춥니다.
+    """
+    if not rows:
+        return
+    rows = sorted(rows, key=lambda row: (row["project_id"], row["bucket_start"]))
+    stmt = mysql_insert(LogIngestWatermark).values(rows)
+    db.execute(
+        stmt.on_duplicate_key_update(
+            ingested_at=func.greatest(LogIngestWatermark.ingested_at, stmt.inserted.ingested_at)
+        )
+    )
+    commit_or_flush(db)
+
+
+def get_ingest_watermarks_since(db: Session, since: datetime) -> List[tuple]:
+    """특정 시각 이후의 적재 기록 (project_id, bucket_start, ingested_at)을 조회합니다."""
+    return (
+        db.query(
+            LogIngestWatermark.project_id,
+            LogIngestWatermark.bucket_start,
+            LogIngestWatermark.ingested_at,
+        )
+        .filter(LogIngestWatermark.ingested_at >= since)
+        .all()
+    )
+
+
+def delete_ingest_watermarks_before(db: Session, before: datetime) -> int:
+    """더 이상 어떤 캐시 항목도 무효화할 수 없는 오래된 적재 기록을 삭제합니다."""
+    deleted = (
+        db.query(LogIngestWatermark)
+        .filter(LogIngestWatermark.ingested_at < before)
+        .delete(synchronize_session=False)
+    )
+    commit_or_flush(db)
+    return deleted
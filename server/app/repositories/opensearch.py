@@ -1,19 +1,44 @@
 from fastapi import HTTPException
+from opensearchpy.exceptions import NotFoundError
 from app.infra.database.opensearch import OpenSearchClient
-from app.core.config.opensearch_config import get_opensearch_mappings
-from typing import List, Dict, Any
+from app.core.config.opensearch_config import (
+    get_opensearch_mappings,
+    get_opensearch_index_settings,
+    get_keyword_field,
+)
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from app.core.enums.log_filter import LogLevelFilter
+from app.core.enums.mapping_profile import MappingProfile
+from app.core.enums.search_mode import SearchMode
+from app.core.utils.time_utils import get_retention_cutoff
+from app.core.utils.cursor_utils import (
+    decode_cursor,
+    encode_cursor,
+    parse_keep_alive,
+    recent_log_pits,
+)
 
 client = OpenSearchClient()
 
 
-def create_project_index(index_name: str, mappings: dict = None) -> None:
-    """인덱스를 생성하는 함수"""
+def create_project_index(
+    index_name: str,
+    profile: MappingProfile = None,
+    mappings: dict = None,
+    index_settings: dict = None,
+) -> None:
+    """인덱스를 생성하는 함수 (profile이 없으면 설정의 매핑 프로필 사용)"""
     if mappings is None:
-        mappings = get_opensearch_mappings()
+        mappings = get_opensearch_mappings(profile)
+    if index_settings is None:
+        index_settings = get_opensearch_index_settings(profile)
     
     try:
-        client.create_index(index_name, mappings)
+        client.create_index(index_name, mappings, index_settings)
     except ValueError as e:
         # 인덱스가 이미 존재하는 경우
         raise HTTPException(status_code=400, detail=str(e))
@@ -39,16 +64,13 @@ def save_log(index_name: str, log_data: dict):
     """로그를 저장하는 함수"""
     client.save_document(index=index_name, document=log_data)
 
-def retrieve_logs(
-    index_name: str,
-    query: str,
+def build_log_filter(
     keyword: str = None,
     log_level: LogLevelFilter = None,
     start_time: str = None,
     end_time: str = None,
-    k: int = 50,
-):
-    """로그를 검색하는 함수"""
+) -> Dict[str, Any]:
+    """키워드, 로그 레벨, 시간 범위 조건으로 필터 쿼리를 만드는 함수"""
     keyword_filter = None
     if keyword:
         keyword_filter = {"keyword": keyword}
@@ -60,22 +82,49 @@ def retrieve_logs(
     time_filter = None
     if start_time and end_time:
         time_filter = {"message_timestamp": {"gte": start_time, "lte": end_time}}
-        
-    search_by_hybrid = client.search_by_vector(
-        index=index_name,
-        query=query,
-        filters=client.generate_filter(
-            term_filter=term_filter, range_filter=time_filter
-        ),
-        k=k,
-    )
-    return search_by_hybrid
-
-def get_logs_by_ids(index_name: str, ids: List[str]) -> List[Dict[str, Any]]:
-    """id로 로그를 검색하는 함수"""
+    return client.generate_filter(term_filter=term_filter, range_filter=time_filter)
+
+
+def retrieve_logs(
+    index_name: str,
+    query: str,
+    keyword: str = None,
+    log_level: LogLevelFilter = None,
+    start_time: str = None,
+    end_time: str = None,
+    k: int = 50,
+    fields: List[str] = None,
+    mode: SearchMode = SearchMode.VECTOR,
+) -> Dict[str, Any]:
+    """로그를 검색하는 함수 (검색 결과 hit와 단계별 지연(ms) 반환)"""
+    filters = build_log_filter(keyword, log_level, start_time, end_time)
+
     try:
-        results = client.search_by_id(index=index_name, ids=ids)
-        return results
+        if mode == SearchMode.HYBRID:
+            return client.search_by_hybrid(
+                index=index_name,
+                query=query,
+                filters=filters,
+                k=k,
+                source_includes=fields,
+            )
+
+        started = time.perf_counter()
+        hits = client.search_by_vector(
+            index=index_name,
+            query=query,
+            filters=filters,
+            k=k,
+            source_includes=fields,
+        )
+        return {"hits": hits, "latency_ms": {"vector": (time.perf_counter() - started) * 1000}}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to search logs: {str(e)}")
+
+def get_logs_by_ids(index_name: str, ids: List[str], fields: List[str] = None, chunk_size: int = 500) -> List[Dict[str, Any]]:
+    """id로 로그를 조회하는 함수 (_mget)"""
+    try:
+        return client.get_by_ids(index=index_name, ids=ids, source_includes=fields, chunk_size=chunk_size)
     except HTTPException:
         raise
     except Exception as e:
@@ -83,13 +132,361 @@ def get_logs_by_ids(index_name: str, ids: List[str]) -> List[Dict[str, Any]]:
             status_code=500, detail=f"Failed to retrieve logs by ID: {str(e)}"
         )
 
-def get_logs_by_datetime(index_name: str, start_time: str, end_time: str, size: int = 100):
+def get_log_versions(index_name: str, ids: List[str], chunk_size: int = 500) -> List[List[Any]]:
+    """로그 본문 없이 버전(_version)만 조회하는 함수 (ETag 재검증용)"""
+    try:
+        return client.get_versions(index=index_name, ids=ids, chunk_size=chunk_size)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve log versions by ID: {str(e)}"
+        )
+
+def get_logs_by_datetime(index_name: str, start_time: str, end_time: str, size: int = 100, fields: List[str] = None):
     """시간 범위로 로그를 검색하는 함수"""
     try:
         time_filter = {"message_timestamp": {"gte": start_time, "lte": end_time}}
-        results = client.search_by_datetime(index=index_name, time_filter=time_filter, size=size)
+        results = client.search_by_datetime(index=index_name, time_filter=time_filter, size=size, source_includes=fields)
         return results
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve logs by datetime: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve logs by datetime: {str(e)}")
+
+
+# 최신순 정렬 + 동일 시각 로그의 순서를 고정하는 tiebreaker
+RECENT_LOGS_SORT = [
+    {"message_timestamp": {"order": "desc", "missing": "_last"}},
+    # 같은 시각 문서 순서 고정 - PIT 안에서 샤드/문서 번호로 정렬 (_id와 달리 fielddata를 쓰지 않음)
+    {"_shard_doc": {"order": "desc"}},
+]
+
+
+def _release_pits(pit_ids: List[str]) -> None:
+    for pit_id in pit_ids:
+        recent_log_pits.close(pit_id)
+        try:
+            client.delete_pit(pit_id)
+        except Exception:
+            # 이미 만료된 PIT
+            pass
+
+
+def get_recent_logs_page(
+    index_name: str,
+    project_id: int,
+    size: int = 100,
+    cursor: str = None,
+    keep_alive: str = "5m",
+    fields: List[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    point in time + search_after로 최근 로그 한 페이지와 다음 커서를 조회하는 함수
+    커서는 발급한 프로젝트에 묶여 서명되며, 다른 프로젝트의 커서나 변조된 커서는 400
+    """
+    if cursor:
+        try:
+            pit_id, search_after = decode_cursor(cursor, project_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        pit_id, search_after = None, None
+
+    try:
+        if pit_id is None:
+            pit_id = client.create_pit(index=index_name, keep_alive=keep_alive)
+        results = client.search_after(
+            pit_id=pit_id,
+            keep_alive=keep_alive,
+            sort=RECENT_LOGS_SORT,
+            size=size,
+            search_after=search_after,
+            source_includes=fields,
+        )
+    except NotFoundError:
+        # keep_alive가 지났거나 열린 PIT 한도로 해제된 커서
+        recent_log_pits.close(pit_id)
+        raise HTTPException(status_code=410, detail="Cursor expired, reload from the first page")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve recent logs: {str(e)}")
+
+    if len(results) < size:
+        # 마지막 페이지이면 point in time을 바로 해제
+        _release_pits([pit_id])
+        return results, None
+
+    # 다음 페이지를 위해 남겨 두는 PIT 기록 (한도를 넘으면 가장 오래 쓰지 않은 PIT 해제)
+    _release_pits(recent_log_pits.touch(pit_id, parse_keep_alive(keep_alive)))
+    return results, encode_cursor(project_id, pit_id, results[-1]["sort"])
+
+
+# 내보내기는 slice 안에서만 정렬 (전체 순서는 보장하지 않음)
+EXPORT_SORT = [
+    {"message_timestamp": {"order": "asc", "missing": "_last"}},
+    {"_shard_doc": {"order": "asc"}},
+]
+
+
+def iter_logs_for_export(
+    index_name: str,
+    query: Dict[str, Any],
+    fields: List[str] = None,
+    batch_size: int = 1000,
+    slices: int = 1,
+    keep_alive: str = "5m",
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    조건에 맞는 모든 로그를 point in time + search_after로 배치 단위로 반환하는 이터레이터.
+    slice별 조회는 스레드로 병렬 실행하고, 크기가 제한된 큐로 메모리 사용량을 일정하게 유지.
+    (point in time은 호출 시점에 만들어 응답 시작 전에 오류를 알 수 있도록 함)
+    """
+    try:
+        pit_id = client.create_pit(index=index_name, keep_alive=keep_alive)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to export logs: {str(e)}")
+    return _scan_export_slices(pit_id, query, fields, batch_size, slices, keep_alive)
+
+
+def _scan_export_slices(
+    pit_id: str,
+    query: Dict[str, Any],
+    fields: List[str],
+    batch_size: int,
+    slices: int,
+    keep_alive: str,
+) -> Iterator[List[Dict[str, Any]]]:
+    batches: queue.Queue = queue.Queue(maxsize=slices * 2)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        # 소비자가 중단되면(다운로드 취소) 더 기다리지 않음
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan_slice(slice_id: int) -> None:
+        search_after = None
+        try:
+            while not stop.is_set():
+                hits = client.search_after(
+                    pit_id=pit_id,
+                    keep_alive=keep_alive,
+                    sort=EXPORT_SORT,
+                    size=batch_size,
+                    search_after=search_after,
+                    query=query,
+                    source_includes=fields,
+                    slice_id=slice_id,
+                    max_slices=slices,
+                )
+                if hits and not put(hits):
+                    return
+                if len(hits) < batch_size:
+                    break
+                search_after = hits[-1]["sort"]
+            put(done)
+        except Exception as e:
+            put(e)
+
+    executor = ThreadPoolExecutor(max_workers=slices)
+    try:
+        for slice_id in range(slices):
+            executor.submit(scan_slice, slice_id)
+        remaining = slices
+        while remaining:
+            item = batches.get()
+            if item is done:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise HTTPException(status_code=500, detail=f"Failed to export logs: {str(item)}")
+            else:
+                yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+        try:
+            client.delete_pit(pit_id)
+        except Exception:
+            pass
+
+
+def get_log_dashboard(
+    index_name: str,
+    start_time: str,
+    end_time: str,
+    interval: str,
+    profile: MappingProfile,
+    keyword_size: int = 20,
+) -> Dict[str, Any]:
+    """
+    시간대별 로그 레벨 분포와 키워드 분포를 한 번의 집계 요청으로 조회하는 함수
+    (profile은 인덱스를 만든 매핑 프로필 - keyword 필드 이름이 프로필마다 다름)
+    """
+    level_field = get_keyword_field("log_level", profile)
+    aggs = {
+        "timeline": {
+            "date_histogram": {
+                "field": "message_timestamp",
+                "fixed_interval": interval,
+                "format": "yyyy-MM-dd'T'HH:mm:ss",
+                "min_doc_count": 0,
+                "extended_bounds": {"min": start_time, "max": end_time},
+            },
+            "aggs": {"levels": {"terms": {"field": level_field, "size": 10}}},
+        },
+        "levels": {"terms": {"field": level_field, "size": 10}},
+        "keywords": {
+            "terms": {"field": get_keyword_field("keyword", profile), "size": keyword_size}
+        },
+    }
+    query = {"range": {"message_timestamp": {"gte": start_time, "lt": end_time}}}
+
+    try:
+        result = client.aggregate(index=index_name, query=query, aggs=aggs)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to aggregate logs: {str(e)}"
+        )
+
+    aggregations = result["aggregations"]
+    buckets = [
+        bucket
+        for bucket in aggregations.get("timeline", {}).get("buckets", [])
+        if bucket["key_as_string"] < end_time
+    ]
+    levels = {
+        bucket["key"].upper(): bucket["doc_count"]
+        for bucket in aggregations.get("levels", {}).get("buckets", [])
+    }
+    # 레벨별 시계열을 타임스탬프 배열과 같은 순서로 정렬
+    series = {level: [0] * len(buckets) for level in levels}
+    for i, bucket in enumerate(buckets):
+        for level_bucket in bucket["levels"]["buckets"]:
+            level = level_bucket["key"].upper()
+            series.setdefault(level, [0] * len(buckets))[i] = level_bucket["doc_count"]
+
+    return {
+        "start_time": start_time,
+        "end_time": end_time,
+        "interval": interval,
+        "total": result["total"],
+        "timestamps": [bucket["key_as_string"] for bucket in buckets],
+        "series": series,
+        "levels": levels,
+        "keywords": {
+            bucket["key"]: bucket["doc_count"]
+            for bucket in aggregations.get("keywords", {}).get("buckets", [])
+        },
+    }
+
+
+def expire_project_logs(
+    index_name: str,
+    log_retention_days: int = None,
+    vector_retention_days: int = None,
+    requests_per_second: float = -1,
+) -> Dict[str, Any]:
+    """보존 기간이 지난 로그와 벡터를 만료시키는 작업을 시작하는 함수
+
+    스로틀링된 delete-by-query / update-by-query를 OpenSearch 백그라운드 작업으로 실행하고
+    완료를 기다리지 않고 task id를 반환합니다. (진행 상태는 get_expiry_task로 조회)
+    """
+    run = {"index": index_name, "tasks": []}
+    try:
+        if not client.client.indices.exists(index=index_name):
+            return run
+
+        log_cutoff = get_retention_cutoff(log_retention_days) if log_retention_days else None
+        if log_cutoff:
+            run["tasks"].append({
+                "task_id": client.delete_by_query(
+                    index=index_name,
+                    query={"range": {"@timestamp": {"lt": log_cutoff.isoformat()}}},
+                    requests_per_second=requests_per_second,
+                ),
+                "action": "delete_logs",
+            })
+
+        if vector_retention_days:
+            vector_cutoff = get_retention_cutoff(vector_retention_days)
+            vector_range = {"lt": vector_cutoff.isoformat()}
+            if log_cutoff:
+                # 같은 실행에서 삭제될 문서는 건드리지 않음
+                vector_range["gte"] = log_cutoff.isoformat()
+            if not log_cutoff or log_cutoff < vector_cutoff:
+                run["tasks"].append({
+                    "task_id": client.update_by_query(
+                        index=index_name,
+                        query={
+                            "bool": {
+                                "filter": [
+                                    {"range": {"@timestamp": vector_range}},
+                                    {"exists": {"field": "vector"}},
+                                ]
+                            }
+                        },
+                        script="ctx._source.remove('vector')",
+                        requests_per_second=requests_per_second,
+                    ),
+                    "action": "remove_vectors",
+                })
+        return run
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to expire logs in {index_name}: {str(e)}"
+        )
+
+
+def get_expiry_task(index_name: str, task_id: str) -> Dict[str, Any]:
+    """로그 만료 작업의 진행 상태를 조회하는 함수 (다른 인덱스의 작업은 404)"""
+    try:
+        result = client.get_task(task_id)
+    except NotFoundError:
+        raise HTTPException(status_code=404, detail="Retention task not found")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get retention task {task_id}: {str(e)}"
+        )
+
+    task = result.get("task", {})
+    # task id는 클러스터 전체에서 조회되므로 이 프로젝트 인덱스에 대한 작업인지 확인
+    if f"[{index_name}]" not in task.get("description", ""):
+        raise HTTPException(status_code=404, detail="Retention task not found")
+
+    status = task.get("status", {})
+    failures = [str(failure) for failure in result.get("response", {}).get("failures", [])]
+    if "error" in result:
+        failures.append(result["error"].get("reason", str(result["error"])))
+    return {
+        "task_id": task_id,
+        "completed": result.get("completed", False),
+        "total": status.get("total", 0),
+        "deleted": status.get("deleted", 0),
+        "updated": status.get("updated", 0),
+        "failures": failures,
+    }
+
+
+def get_index_store_size(index_name: str) -> int:
+    """인덱스의 저장 용량(byte)을 조회하는 함수 (인덱스가 없으면 0)"""
+    if not client.client.indices.exists(index=index_name):
+        return 0
+    return client.get_store_size(index_name)
+
+
+def expunge_deleted_logs(index_name: str) -> None:
+    """삭제된 로그가 차지하는 세그먼트 공간을 회수하는 함수"""
+    try:
+        client.expunge_deletes(index_name)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to expunge deletes in {index_name}: {str(e)}"
+        )
@@ -1,67 +1,79 @@
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, select
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from app.core.enums.mapping_profile import MappingProfile
 from app.core.enums.roles import ProjectRole
+from app.infra.database.unit_of_work import commit_or_flush
+from app.infra.database.routing import USE_PRIMARY
 from app.models.project import Project
 from app.models.project_setting import ProjectSetting
 from app.models.user_project import UserProject
 from app.models.user import User
 from app.schemas.project import ProjectCreate
-from app.repositories.user import get_user_by_id
-from fastapi import HTTPException
 import uuid
 import secrets
 import logging
 
 
-def _create_uuid(db: Session, max_retries=5):
-    for _ in range(max_retries):
-        index = uuid.uuid4().hex
-        if not db.query(Project).filter_by(index=index).first():
-            return index
-    raise HTTPException(status_code=500, detail="이름 중복이 너무 많습니다.")
-
-
-def create_project(db: Session, project: ProjectCreate, user: int) -> Project:
+def create_project(
+    db: Session, project: ProjectCreate, user: int, mapping_profile: MappingProfile
+) -> Project:
+    """
+    프로젝트와 기본 설정, 생성자의 master 멤버십을 한 트랜잭션으로 생성
+    index/api_key는 uuid4라 중복 확인 조회 없이 만들고, 만에 하나 겹치면 유니크 제약으로 실패
+    """
     db_project = Project(
         name=project.name,
         description=project.description,
         create_by=user,
-        index=_create_uuid(db),
-        api_key=_create_uuid(db),
+        index=uuid.uuid4().hex,
+        api_key=uuid.uuid4().hex,
         invite_code=secrets.token_urlsafe(16),
     )
-    db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-
-    # ProjectSetting 생성
-    if not db.query(ProjectSetting).filter_by(project_id=db_project.id).first():
-        setting = ProjectSetting(project_id=db_project.id)
-        db.add(setting)
-        db.commit()
-
-    # UserProject 연결
-    if (
-        not db.query(UserProject)
-        .filter_by(user_id=user, project_id=db_project.id)
-        .first()
-    ):
-        user_project = UserProject(
-            user_id=user, project_id=db_project.id, role=ProjectRole.MASTER
-        )
-        db.add(user_project)
-        db.commit()
+    # 새 프로젝트라 설정/멤버십이 있을 수 없으므로 존재 확인 없이 함께 추가 (flush 한 번에 INSERT)
+    db_project.setting = ProjectSetting(mapping_profile=mapping_profile)
+    db.add_all(
+        [
+            db_project,
+            UserProject(user_id=user, project=db_project, role=ProjectRole.MASTER),
+        ]
+    )
+    commit_or_flush(db, db_project)
 
     return db_project
 
 
+def projects_by_user_statement(user_id: int) -> Select:
+    """사용자가 속한 프로젝트 목록 SELECT 문 (동기/비동기 저장소 공용)"""
+    return (
+        select(Project)
+        .join(UserProject, UserProject.project_id == Project.id)
+        .where(UserProject.user_id == user_id)
+    )
+
+
 def get_project_by_user(db: Session, user_id: int) -> list[Project]:
-    db_user = get_user_by_id(db, user_id)
-    return db_user.projects
+    return list(db.scalars(projects_by_user_statement(user_id)).all())
 
 
-def get_project_by_id(db: Session, project_id: int) -> Project | None:
-    return db.query(Project).filter(Project.id == project_id).first()
+def get_project_by_id(
+    db: Session, project_id: int, with_setting: bool = False
+) -> Project | None:
+    """프로젝트 조회 (with_setting이면 ProjectSetting을 같은 쿼리로 함께 로딩)"""
+    query = db.query(Project)
+    if with_setting:
+        query = query.options(joinedload(Project.setting))
+    return query.filter(Project.id == project_id).first()
+
+
+def get_project_by_api_key(db: Session, api_key: str) -> Project | None:
+    """API 키로 프로젝트 조회 (로그 수집마다 설정을 쓰므로 ProjectSetting을 같은 쿼리로 로딩)"""
+    return (
+        db.query(Project)
+        .options(joinedload(Project.setting))
+        .filter(Project.api_key == api_key)
+        .first()
+    )
 
 
 def get_project_by_invite_code(db: Session, invite_code: str) -> Project | None:
@@ -81,11 +93,61 @@ def update_project_keyword(
 ) -> Project | None:
 
     project.setting.log_keywords = keywords
-    db.commit()
-    db.refresh(project)
+    commit_or_flush(db, project)
+    return project
+
+
+def get_project_ingest_fields(db: Session, project: Project) -> dict:
+    return {
+        "allowlist": project.setting.ingest_field_allowlist or [],
+        "denylist": project.setting.ingest_field_denylist or [],
+    }
+
+
+def update_project_ingest_fields(
+    db: Session, project: Project, allowlist: List[str], denylist: List[str]
+) -> Project | None:
+
+    project.setting.ingest_field_allowlist = allowlist
+    project.setting.ingest_field_denylist = denylist
+    commit_or_flush(db, project)
+    return project
+
+
+def get_project_retention(db: Session, project: Project) -> dict:
+    return {
+        "log_retention_days": project.setting.log_retention_days,
+        "vector_retention_days": project.setting.vector_retention_days,
+    }
+
+
+def update_project_retention(
+    db: Session,
+    project: Project,
+    log_retention_days: int | None,
+    vector_retention_days: int | None,
+) -> Project | None:
+
+    project.setting.log_retention_days = log_retention_days
+    project.setting.vector_retention_days = vector_retention_days
+    commit_or_flush(db, project)
     return project
 
 
+def get_projects_with_retention(db: Session) -> List[tuple[Project, ProjectSetting]]:
+    """보존 정책이 설정된 프로젝트 목록 조회"""
+    return (
+        db.query(Project, ProjectSetting)
+        .join(ProjectSetting, ProjectSetting.project_id == Project.id)
+        .options(contains_eager(Project.setting))
+        .filter(
+            (ProjectSetting.log_retention_days.isnot(None))
+            | (ProjectSetting.vector_retention_days.isnot(None))
+        )
+        .all()
+    )
+
+
 def get_user_role_in_project(db: Session, user_id: int, project_id: int) -> str | None:
     """프로젝트에서 사용자의 역할 조회"""
     user_project = (
@@ -96,6 +158,56 @@ def get_user_role_in_project(db: Session, user_id: int, project_id: int) -> str
     return user_project.role if user_project else None
 
 
+def get_user_memberships(db: Session, user_id: int) -> dict[int, str]:
+    """사용자가 속한 프로젝트별 역할 (project_id -> role)"""
+    rows = (
+        db.query(UserProject.project_id, UserProject.role)
+        .filter(UserProject.user_id == user_id)
+        .all()
+    )
+    return {project_id: role for project_id, role in rows}
+
+
+def get_project_member_ids(db: Session, project_id: int) -> List[int]:
+    """프로젝트 멤버들의 사용자 id"""
+    rows = (
+        db.query(UserProject.user_id)
+        .filter(UserProject.project_id == project_id)
+        .all()
+    )
+    return [user_id for (user_id,) in rows]
+
+
+def member_context_statement(user_id: int, project_id: int) -> Select:
+    """
+    사용자 존재 여부, 프로젝트 존재 여부, 프로젝트 내 역할을 한 번에 조회하는 SELECT 문
+    (동기/비동기 저장소 공용, 결과가 멤버십 캐시에 TTL 동안 남으므로 복제 지연 없이 primary에서 조회)
+    """
+    return (
+        select(
+            User.id.label("user_id"),
+            Project.id.label("project_id"),
+            UserProject.role.label("role"),
+        )
+        .select_from(User)
+        .outerjoin(Project, Project.id == project_id)
+        .outerjoin(
+            UserProject,
+            and_(UserProject.user_id == User.id, UserProject.project_id == Project.id),
+        )
+        .where(User.id == user_id)
+        .execution_options(**{USE_PRIMARY: True})
+    )
+
+
+def get_member_context(db: Session, user_id: int, project_id: int):
+    """
+    사용자 존재 여부, 프로젝트 존재 여부, 프로젝트 내 역할을 한 번의 쿼리로 조회
+    (사용자가 없으면 None, 프로젝트가 없으면 project_id가 None, 멤버가 아니면 role이 None)
+    """
+    return db.execute(member_context_statement(user_id, project_id)).first()
+
+
 def get_project_members_count(db: Session, project_id: int) -> int:
     """프로젝트 멤버 수 조회"""
     return db.query(UserProject).filter(UserProject.project_id == project_id).count()
@@ -105,89 +217,73 @@ def add_user_to_project(
     db: Session, user_id: int, project_id: int, role: str = "member"
 ) -> bool:
     """프로젝트에 사용자 추가"""
-    try:
-        # 이미 프로젝트 멤버인지 확인
-        existing_user_project = (
-            db.query(UserProject)
-            .filter(
-                UserProject.user_id == user_id, UserProject.project_id == project_id
-            )
-            .first()
+    # 이미 프로젝트 멤버인지 확인
+    existing_user_project = (
+        db.query(UserProject)
+        .filter(
+            UserProject.user_id == user_id, UserProject.project_id == project_id
         )
+        .first()
+    )
 
-        if existing_user_project:
-            return False  # 이미 멤버임
+    if existing_user_project:
+        return False  # 이미 멤버임
 
-        user_project = UserProject(user_id=user_id, project_id=project_id, role=role)
-        db.add(user_project)
-        db.commit()
-        return True
-    except Exception as e:
-        db.rollback()
-        logging.error(f"Error adding user to project: {e}")
-        return False
+    user_project = UserProject(user_id=user_id, project_id=project_id, role=role)
+    db.add(user_project)
+    commit_or_flush(db)
+    return True
 
 
 def delete_user_project(db: Session, user_id: int, project_id: int) -> bool:
     """프로젝트에서 사용자 제거"""
-    try:
-        user_project = (
-            db.query(UserProject)
-            .filter(
-                UserProject.user_id == user_id, UserProject.project_id == project_id
-            )
-            .first()
+    user_project = (
+        db.query(UserProject)
+        .filter(
+            UserProject.user_id == user_id, UserProject.project_id == project_id
         )
+        .first()
+    )
 
-        if not user_project:
-            return False
-
-        db.delete(user_project)
-        db.commit()
-        return True
-    except Exception as e:
-        db.rollback()
-        logging.error(f"Error removing user from project: {e}")
+    if not user_project:
         return False
 
+    db.delete(user_project)
+    commit_or_flush(db)
+    return True
+
 
 def delete_project(db: Session, project_id: int, user_id: int) -> bool:
     """프로젝트 삭제"""
-    try:
-        # 프로젝트가 사용자에게 속해있는지 확인
-        user_project = (
-            db.query(UserProject)
-            .filter(
-                UserProject.user_id == user_id, UserProject.project_id == project_id
-            )
-            .first()
+    # 프로젝트가 사용자에게 속해있는지 확인
+    user_project = (
+        db.query(UserProject)
+        .filter(
+            UserProject.user_id == user_id, UserProject.project_id == project_id
         )
+        .first()
+    )
 
-        if not user_project:
-            return False
-
-        # 프로젝트 조회
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            return False
+    if not user_project:
+        return False
 
-        # 관련 데이터 삭제 (UserProject, ProjectSetting)
-        db.query(UserProject).filter(UserProject.project_id == project_id).delete()
+    # 프로젝트 조회
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        return False
 
-        db.query(ProjectSetting).filter(
-            ProjectSetting.project_id == project_id
-        ).delete()
+    # 관련 데이터 삭제 (UserProject, ProjectSetting)
+    db.query(UserProject).filter(UserProject.project_id == project_id).delete()
 
-        # 프로젝트 삭제
-        db.delete(project)
-        db.commit()
+    db.query(ProjectSetting).filter(
+        ProjectSetting.project_id == project_id
+    ).delete()
 
-        return True
+    # 프로젝트 삭제
+    db.delete(project)
+    commit_or_flush(db)
 
-    except Exception as e:
-        db.rollback()
-        logging.error(f"Error deleting project: {e}")
-        return False
+    return True
 
 
 def get_project_members(db: Session, project_id: int) -> List[dict]:
@@ -216,22 +312,17 @@ def update_user_role_in_project(
     db: Session, user_id: int, project_id: int, new_role: str
 ) -> bool:
     """프로젝트에서 사용자 역할 변경"""
-    try:
-        user_project = (
-            db.query(UserProject)
-            .filter(
-                UserProject.user_id == user_id, UserProject.project_id == project_id
-            )
-            .first()
+    user_project = (
+        db.query(UserProject)
+        .filter(
+            UserProject.user_id == user_id, UserProject.project_id == project_id
         )
+        .first()
+    )
 
-        if not user_project:
-            return False
-
-        user_project.role = new_role
-        db.commit()
-        return True
-    except Exception as e:
-        db.rollback()
-        logging.error(f"Error updating user role: {e}")
+    if not user_project:
         return False
+
+    user_project.role = new_role
+    commit_or_flush(db)
+    return True
@@ -0,0 +1,168 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from app.core.enums.rollup import RollupGranularity
+from app.infra.database.unit_of_work import commit_or_flush
+from app.models.log_rollup import LogRollup
+from app.models.rollup_writer import RollupWriter
+from app.models.project_setting import ProjectSetting
+
+
+def _upsert_statement(rows: List[dict]):
+    """같은 버킷이 이미 있으면 건수를 더하는 INSERT ... ON DUPLICATE KEY UPDATE"""
+    stmt = mysql_insert(LogRollup).values(rows)
+    return stmt.on_duplicate_key_update(
+        log_count=LogRollup.log_count + stmt.inserted.log_count
+    )
+
+
+def upsert_rollups(db: Session, rows: List[dict]) -> None:
+    """집계 건수를 누적 저장합니다."""
+    if not rows:
+        return
+    db.execute(_upsert_statement(rows))
+    commit_or_flush(db)
+
+
+def get_rollups_before(
+    db: Session, granularity: RollupGranularity, before: datetime
+) -> List[LogRollup]:
+    """
+    특정 시각 이전에 닫힌 버킷들을 잠그고 조회합니다. (SELECT ... FOR UPDATE)
+    동시에 실행된 다른 합치기는 이 트랜잭션이 끝날 때까지 기다린 뒤 옮겨지지 않은 행만 읽으므로
+    같은 버킷을 두 번 더하지 않습니다. 잠금은 move_rollups의 commit에서 풀립니다.
+    """
+    return (
+        db.query(LogRollup)
+        .filter(
+            LogRollup.granularity == granularity.value,
+            LogRollup.bucket_start < before,
+        )
+        .with_for_update()
+        .all()
+    )
+
+
+def move_rollups(db: Session, rows: List[dict], source_ids: List[int]) -> None:
+    """하위 단위 버킷을 상위 단위로 옮깁니다. (추가와 삭제를 한 트랜잭션으로 처리)"""
+    if rows:
+        db.execute(_upsert_statement(rows))
+    if source_ids:
+        db.query(LogRollup).filter(LogRollup.id.in_(source_ids)).delete(
+            synchronize_session=False
+        )
+    commit_or_flush(db)
+
+
+def get_project_rollups(
+    db: Session, project_id: int, start_time: datetime, end_time: datetime
+) -> List[tuple]:
+    """프로젝트의 기간 내 집계 행을 모든 단위에서 조회합니다."""
+    return (
+        db.query(
+            LogRollup.bucket_start,
+            LogRollup.log_level,
+            LogRollup.keyword,
+            LogRollup.log_count,
+        )
+        .filter(
+            LogRollup.project_id == project_id,
+            LogRollup.bucket_start >= start_time,
+            LogRollup.bucket_start < end_time,
+        )
+        .all()
+    )
+
+
+def get_rollup_since(db: Session, project_id: int) -> Optional[datetime]:
+    """프로젝트의 로그가 집계 테이블에 빠짐없이 있기 시작한 시각 (없으면 None)"""
+    return (
+        db.query(ProjectSetting.rollup_since)
+        .filter(ProjectSetting.project_id == project_id)
+        .scalar()
+    )
+
+
+def mark_rollup_since(db: Session, project_ids: Iterable[int], since: datetime) -> None:
+    """집계 시작 시각이 없는 프로젝트에만 기록합니다. (처음 기록한 시각 유지)"""
+    project_ids = list(project_ids)
+    if not project_ids:
+        return
+    db.query(ProjectSetting).filter(
+        ProjectSetting.project_id.in_(project_ids),
+        ProjectSetting.rollup_since.is_(None),
+    ).update({ProjectSetting.rollup_since: since}, synchronize_session=False)
+    commit_or_flush(db)
+
+
+def advance_rollup_since(
+    db: Session, since: datetime, project_ids: Optional[Iterable[int]] = None
+) -> int:
+    """
+    집계 시작 시각을 since로 앞당깁니다. (이미 집계 중이고 since보다 이른 프로젝트만)
+    since 이전 기간은 집계 테이블이 빠짐없다고 볼 수 없어 OpenSearch로 조회하게 됩니다.
+    """
+    query = db.query(ProjectSetting).filter(
+        ProjectSetting.rollup_since.is_not(None),
+        ProjectSetting.rollup_since < since,
+    )
+    if project_ids is not None:
+        query = query.filter(ProjectSetting.project_id.in_(list(project_ids)))
+    updated = query.update({ProjectSetting.rollup_since: since}, synchronize_session=False)
+    commit_or_flush(db)
+    return updated
+
+
+def clear_rollup_since(db: Session) -> int:
+    """모든 프로젝트의 집계 시작 시각을 지웁니다. (다음 집계 저장 때 다시 기록)"""
+    updated = (
+        db.query(ProjectSetting)
+        .filter(ProjectSetting.rollup_since.is_not(None))
+        .update({ProjectSetting.rollup_since: None}, synchronize_session=False)
+    )
+    commit_or_flush(db)
+    return updated
+
+
+def delete_project_rollups_before(db: Session, project_id: int, before: datetime) -> int:
+    """프로젝트의 특정 시각 이전 집계 행을 모든 단위에서 삭제합니다."""
+    deleted = (
+        db.query(LogRollup)
+        .filter(LogRollup.project_id == project_id, LogRollup.bucket_start < before)
+        .delete(synchronize_session=False)
+    )
+    commit_or_flush(db)
+    return deleted
+
+
+def touch_rollup_writer(db: Session, writer_id: str, now: datetime) -> None:
+    """집계 프로세스의 마지막 저장 시각을 기록합니다. (없으면 등록)"""
+    updated = (
+        db.query(RollupWriter)
+        .filter(RollupWriter.id == writer_id)
+        .update({RollupWriter.heartbeat_at: now}, synchronize_session=False)
+    )
+    if not updated:
+        db.add(RollupWriter(id=writer_id, started_at=now, heartbeat_at=now))
+    commit_or_flush(db)
+
+
+def delete_stale_rollup_writers(db: Session, before: datetime) -> int:
+    """특정 시각 이후 저장 기록이 없는 집계 프로세스를 삭제합니다."""
+    deleted = (
+        db.query(RollupWriter)
+        .filter(RollupWriter.heartbeat_at < before)
+        .delete(synchronize_session=False)
+    )
+    commit_or_flush(db)
+    return deleted
+
+
+def delete_rollup_writer(db: Session, writer_id: str) -> None:
+    """정상 종료한 집계 프로세스를 삭제합니다."""
+    db.query(RollupWriter).filter(RollupWriter.id == writer_id).delete(
+        synchronize_session=False
+    )
+    commit_or_flush(db)
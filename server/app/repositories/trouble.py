@@ -1,11 +1,13 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, or_, func, desc, insert, select, tuple_
 from typing import Optional, List, Tuple
 from datetime import datetime
 
+from app.core.enums.trouble_status import TroubleStatus
+from app.infra.database.fulltext import NGRAM_TOKEN_SIZE, text_match
+from app.infra.database.unit_of_work import commit_or_flush, unit_of_work
 from app.models.trouble import Trouble
 from app.models.trouble_log import TroubleLog
-from app.models.user_project import UserProject
 from app.models.user import User
 from app.schemas.trouble import TroubleCreate, TroubleUpdate, TroubleListQuery
 
@@ -18,11 +20,11 @@ def create_trouble(db: Session, trouble: TroubleCreate, created_by: int, report_
         report_name=report_name,
         content=content,
         is_shared=trouble.is_shared,
-        user_query=trouble.user_query
+        user_query=trouble.user_query,
+        status=TroubleStatus.PENDING,
     )
     db.add(db_trouble)
-    db.commit()
-    db.refresh(db_trouble)
+    commit_or_flush(db, db_trouble)
     return db_trouble
 
 
@@ -44,103 +46,295 @@ def update_trouble(db: Session, trouble: Trouble, update_data: TroubleUpdate) ->
     if update_data.is_shared is not None:
         trouble.is_shared = update_data.is_shared
     
+    commit_or_flush(db, trouble)
+    return trouble
+
+
+def claim_trouble_generation(db: Session, trouble_id: int) -> Optional[Trouble]:
+    """대기 중인 trouble의 AI 생성을 선점합니다. (이미 다른 작업이 선점했으면 None)"""
+    # 조건부 UPDATE로 상태를 바꿔 백그라운드 워커와 스트리밍 요청이 같은 trouble을 중복 생성하지 않도록 함
+    claimed = (
+        db.query(Trouble)
+        .filter(Trouble.id == trouble_id, Trouble.status == TroubleStatus.PENDING)
+        .update(
+            {
+                Trouble.status: TroubleStatus.RUNNING,
+                Trouble.attempts: Trouble.attempts + 1,
+                Trouble.claimed_at: datetime.now(),
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if not claimed:
+        return None
+    return get_trouble_by_id(db, trouble_id)
+
+
+def complete_trouble_generation(
+    db: Session,
+    trouble: Trouble,
+    report_name: str,
+    content: str,
+    prompt_tokens: Optional[int] = None,
+    generation_ms: Optional[int] = None
+) -> Trouble:
+    """AI 생성 결과와 사용량(입력 토큰 수, 소요 시간)을 저장하고 완료 상태로 변경합니다."""
+    trouble.report_name = report_name
+    trouble.content = content
+    trouble.prompt_tokens = prompt_tokens
+    trouble.generation_ms = generation_ms
+    trouble.status = TroubleStatus.COMPLETED
+    trouble.error_message = None
+    trouble.completed_at = datetime.now()
+    db.commit()
+    db.refresh(trouble)
+    return trouble
+
+
+def fail_trouble_generation(db: Session, trouble: Trouble, error_message: str, retry: bool) -> Trouble:
+    """AI 생성 실패를 기록합니다. 재시도할 경우 대기 상태로 되돌립니다."""
+    trouble.status = TroubleStatus.PENDING if retry else TroubleStatus.FAILED
+    trouble.error_message = error_message[:1000]
+    db.commit()
+    db.refresh(trouble)
+    return trouble
+
+
+def reset_trouble_generation(db: Session, trouble: Trouble) -> Trouble:
+    """AI 생성을 처음부터 다시 시도하도록 대기 상태로 초기화합니다."""
+    trouble.status = TroubleStatus.PENDING
+    trouble.attempts = 0
+    trouble.error_message = None
+    trouble.completed_at = None
     db.commit()
     db.refresh(trouble)
     return trouble
 
 
+def requeue_running_troubles(db: Session, claimed_before: datetime) -> List[int]:
+    """
+    claimed_before 이전에 선점된 채 생성 중 상태로 남은 trouble을 다시 대기 상태로 되돌립니다.
+    (다른 인스턴스에서 아직 생성 중인 trouble은 선점 시각이 최근이라 건드리지 않음)
+    """
+    stale = (Trouble.status == TroubleStatus.RUNNING) & (
+        Trouble.claimed_at.is_(None) | (Trouble.claimed_at < claimed_before)
+    )
+    trouble_ids = [row[0] for row in db.query(Trouble.id).filter(stale).all()]
+    if not trouble_ids:
+        return []
+    # 조회와 갱신 사이에 완료된 trouble은 조건부 UPDATE에서 제외됨
+    db.query(Trouble).filter(Trouble.id.in_(trouble_ids), stale).update(
+        {Trouble.status: TroubleStatus.PENDING}, synchronize_session=False
+    )
+    db.commit()
+    return trouble_ids
+
+
+def get_unfinished_trouble_ids(db: Session) -> List[int]:
+    """AI 생성을 기다리는 trouble ID 목록을 조회합니다."""
+    rows = (
+        db.query(Trouble.id)
+        .filter(Trouble.status == TroubleStatus.PENDING)
+        .order_by(Trouble.id)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
 def delete_trouble(db: Session, trouble: Trouble) -> None:
     """trouble을 삭제합니다."""
     # 연관된 trouble_logs도 함께 삭제됨 (cascade 설정 필요)
     db.delete(trouble)
-    db.commit()
+    commit_or_flush(db)
 
 
-def get_project_troubles_paginated(
-    db: Session, 
+def trouble_text_relevance(search: Optional[str]):
+    """
+    검색어의 trouble 본문 관련도 점수 식 (ft_troubles_text 전문 검색 인덱스 대상 컬럼)
+    검색어가 없거나 ngram 토큰보다 짧아 인덱스로 찾을 수 없으면 None
+    """
+    term = (search or "").strip()
+    # 구문 검색식에서 큰따옴표는 빠지므로 빼고 길이 확인
+    if len(term.replace('"', "").strip()) < NGRAM_TOKEN_SIZE:
+        return None
+    return text_match(Trouble.report_name, Trouble.user_query, Trouble.content, against=term)
+
+
+def _project_trouble_filters(
     project_id: int,
     query_params: TroubleListQuery,
     user_id: int
-) -> Tuple[List[Trouble], int]:
-    """프로젝트의 trouble 목록을 페이지네이션과 함께 조회합니다."""
+) -> list:
+    """프로젝트 trouble 목록의 조회 조건 (권한 + 검색/필터)"""
     
-    # 기본 쿼리 - 프로젝트별 + 접근 권한 확인
-    query = db.query(Trouble).filter(
-        and_(
-            Trouble.project_id == project_id,
+    # 기본 조건 - 프로젝트별 + 접근 권한 확인
+    filters = [
+        Trouble.project_id == project_id,
+        or_(
+            Trouble.created_by == user_id,  # 생성자
+            Trouble.is_shared == True       # 공유된 trouble
+        ),
+    ]
+    
+    # 검색어 필터 - 전문 검색 인덱스로 찾을 수 있으면 관련도(0이 아니면 일치), 너무 짧으면 부분 일치
+    relevance = trouble_text_relevance(query_params.search)
+    if relevance is not None:
+        filters.append(relevance)
+    elif query_params.search:
+        filters.append(
             or_(
-                Trouble.created_by == user_id,  # 생성자
-                Trouble.is_shared == True       # 공유된 trouble
+                Trouble.report_name.ilike(f"%{query_params.search}%"),
+                Trouble.user_query.ilike(f"%{query_params.search}%")
             )
         )
-    )
-    
-    # 검색어 필터
-    if query_params.search:
-        search_filter = or_(
-            Trouble.report_name.ilike(f"%{query_params.search}%"),
-            Trouble.user_query.ilike(f"%{query_params.search}%")
-        )
-        query = query.filter(search_filter)
     
     # 공유 여부 필터
     if query_params.is_shared is not None:
-        query = query.filter(Trouble.is_shared == query_params.is_shared)
+        filters.append(Trouble.is_shared == query_params.is_shared)
     
     # 생성자 필터
     if query_params.created_by is not None:
-        query = query.filter(Trouble.created_by == query_params.created_by)
+        filters.append(Trouble.created_by == query_params.created_by)
     
-    # 전체 개수 계산
-    total = query.count()
+    return filters
+
+
+def project_troubles_count_statement(
+    project_id: int,
+    query_params: TroubleListQuery,
+    user_id: int
+) -> Select:
+    """
+    프로젝트 trouble 전체 개수 SELECT 문 (조인 없이 troubles만 집계)
+    동기/비동기 저장소가 같은 쿼리를 쓰도록 세션 없이 문장만 구성합니다.
+    """
+    return select(func.count(Trouble.id)).where(
+        *_project_trouble_filters(project_id, query_params, user_id)
+    )
+
+
+def project_troubles_page_statement(
+    project_id: int,
+    query_params: TroubleListQuery,
+    user_id: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    limit: Optional[int] = None
+) -> Select:
+    """
+    프로젝트 trouble 요약 목록 한 페이지 SELECT 문 (created_at, id 최신순, 전문 검색이면 관련도순)
+    after가 있으면 그 (created_at, id) 다음부터 읽는 keyset 페이지, 없으면 page 번호로 OFFSET 페이지
+    """
     
-    # 페이지네이션 적용
-    offset = (query_params.page - 1) * query_params.size
-    troubles = (
-        query
-        .order_by(desc(Trouble.created_at))
-        .offset(offset)
-        .limit(query_params.size)
-        .all()
+    # trouble별 연관 로그 개수 - 페이지에 포함된 trouble마다 ix_trouble_logs_trouble_id로 세는 상관 서브쿼리
+    # (trouble_logs 전체를 GROUP BY로 집계한 뒤 조인하면 페이지 크기와 상관없이 테이블 전체를 읽음)
+    logs_count = (
+        select(func.count())
+        .select_from(TroubleLog)
+        .where(TroubleLog.trouble_id == Trouble.id)
+        .correlate(Trouble)
+        .scalar_subquery()
     )
     
-    return troubles, total
+    # 엔티티 대신 요약 컬럼만 조회하므로 관계 eager loading이 붙지 않음
+    statement = (
+        select(
+            Trouble.id,
+            Trouble.report_name,
+            Trouble.created_at,
+            Trouble.is_shared,
+            Trouble.status,
+            User.username.label("creator_username"),
+            logs_count.label("logs_count"),
+        )
+        .join(User, User.id == Trouble.created_by)
+        .where(*_project_trouble_filters(project_id, query_params, user_id))
+        .order_by(desc(Trouble.created_at), desc(Trouble.id))
+        .limit(limit or query_params.size)
+    )
+    
+    relevance = trouble_text_relevance(query_params.search)
+    if relevance is not None:
+        # 관련도가 높은 순 (같으면 최신순) - 검색 결과는 page 번호로만 페이지를 나눔
+        return (
+            statement.order_by(None)
+            .order_by(desc(relevance), desc(Trouble.created_at), desc(Trouble.id))
+            .offset((query_params.page - 1) * query_params.size)
+        )
+    
+    if after is not None:
+        # ix_troubles_project_created(project_id, created_at + id) 범위 조건이라 앞 페이지 수와 상관없이 일정
+        return statement.where(tuple_(Trouble.created_at, Trouble.id) < tuple_(*after))
+    
+    # 하위 호환용 page 번호 모드 - 건너뛰는 행을 모두 읽으므로 뒤 페이지일수록 느려짐
+    return statement.offset((query_params.page - 1) * query_params.size)
 
 
-def check_user_project_access(db: Session, project_id: int, user_id: int) -> bool:
-    """사용자가 프로젝트에 접근 권한이 있는지 확인합니다."""
-    user_project = (
-        db.query(UserProject)
-        .filter(
-            and_(
-                UserProject.project_id == project_id,
-                UserProject.user_id == user_id
-            )
+def count_project_troubles(
+    db: Session,
+    project_id: int,
+    query_params: TroubleListQuery,
+    user_id: int
+) -> int:
+    """프로젝트 trouble 목록의 전체 개수를 조회합니다."""
+    return db.execute(
+        project_troubles_count_statement(project_id, query_params, user_id)
+    ).scalar()
+
+
+def get_project_troubles_page(
+    db: Session,
+    project_id: int,
+    query_params: TroubleListQuery,
+    user_id: int,
+    after: Optional[Tuple[datetime, int]] = None
+) -> List[Row]:
+    """
+    프로젝트의 trouble 요약 목록 한 페이지를 조회합니다.
+    다음 페이지가 있는지 알 수 있도록 페이지 크기보다 한 행 더 가져옵니다.
+    """
+    return db.execute(
+        project_troubles_page_statement(
+            project_id, query_params, user_id, after, limit=query_params.size + 1
         )
-        .first()
-    )
-    return user_project is not None
+    ).all()
 
 
-def save_trouble_logs(db: Session, trouble_id: int, log_ids: List[str]) -> None:
-    """trouble과 연관된 로그 ID들을 저장합니다."""
-    # 기존 로그들 삭제
-    db.query(TroubleLog).filter(TroubleLog.trouble_id == trouble_id).delete()
-    
-    # 새로운 로그들 추가
-    for log_id in log_ids:
-        trouble_log = TroubleLog(trouble_id=trouble_id, log_id=log_id)
-        db.add(trouble_log)
+def get_project_troubles_paginated(
+    db: Session, 
+    project_id: int,
+    query_params: TroubleListQuery,
+    user_id: int
+) -> Tuple[List[Row], int]:
+    """
+    프로젝트의 trouble 요약 목록을 페이지네이션과 함께 조회합니다.
+    생성자 username과 연관 로그 개수를 한 번의 SELECT로 함께 가져옵니다. (전체 개수 조회 포함 쿼리 2번)
+    """
+    total = count_project_troubles(db, project_id, query_params, user_id)
+    troubles = db.execute(
+        project_troubles_page_statement(project_id, query_params, user_id)
+    ).all()
     
-    db.commit()
+    return troubles, total
 
 
-def get_creator_username(db: Session, trouble_id: int) -> Optional[str]:
-    """trouble 생성자의 username을 조회합니다."""
-    result = (
-        db.query(User.username)
-        .join(Trouble, Trouble.created_by == User.id)
-        .filter(Trouble.id == trouble_id)
-        .first()
+def add_trouble_logs(db: Session, trouble_id: int, log_ids: List[str]) -> None:
+    """trouble과 연관된 로그 ID들을 INSERT 한 번으로 추가합니다. (ORM 객체를 만들지 않음)"""
+    if not log_ids:
+        return
+    db.execute(
+        insert(TroubleLog).values(
+            [{"trouble_id": trouble_id, "log_id": log_id} for log_id in log_ids]
+        )
     )
-    return result[0] if result else None
+    commit_or_flush(db)
+
+
+def save_trouble_logs(db: Session, trouble_id: int, log_ids: List[str]) -> None:
+    """trouble과 연관된 로그 ID들을 저장합니다. (기존 연결을 바꿔 씀, 한 트랜잭션)"""
+    with unit_of_work(db):
+        # 기존 로그들 삭제
+        db.query(TroubleLog).filter(TroubleLog.trouble_id == trouble_id).delete()
+        
+        # 새로운 로그들 추가
+        add_trouble_logs(db, trouble_id, log_ids)
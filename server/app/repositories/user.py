@@ -1,4 +1,7 @@
+from typing import List
 from sqlalchemy.orm import Session
+from app.infra.database.routing import USE_PRIMARY
+from app.infra.database.unit_of_work import commit_or_flush
 from app.models.user import User
 from app.schemas.user import UserCreate
 
@@ -6,8 +9,7 @@ from app.schemas.user import UserCreate
 def create_user(db: Session, user: UserCreate) -> User:
     db_user = User(username=user.username, password=user.password)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    commit_or_flush(db, db_user)
     return db_user
 
 
@@ -18,3 +20,23 @@ def get_user_by_username(db: Session, username: str):
 def get_user_by_id(db: Session, user_id: int):
     db_user = db.query(User).filter(User.id == user_id).first()
     return db_user
+
+
+def get_token_version(db: Session, user_id: int) -> int | None:
+    """사용자의 현재 토큰 버전 조회 (사용자가 없으면 None, 복제 지연으로 취소된 멤버십을 놓치지 않도록 primary에서 읽음)"""
+    return (
+        db.query(User.token_version)
+        .filter(User.id == user_id)
+        .execution_options(**{USE_PRIMARY: True})
+        .scalar()
+    )
+
+
+def bump_token_versions(db: Session, user_ids: List[int]) -> None:
+    """사용자들의 토큰 버전을 올려 기존 토큰의 멤버십 클레임을 무효화"""
+    if not user_ids:
+        return
+    db.query(User).filter(User.id.in_(user_ids)).update(
+        {User.token_version: User.token_version + 1}, synchronize_session=False
+    )
+    commit_or_flush(db)
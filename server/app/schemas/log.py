@@ -0,0 +1,78 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class LogDashboard(BaseModel):
+    """대시보드 집계 응답 - 레벨별 시계열과 키워드 분포"""
+
+    start_time: str = Field(..., description="집계 시작 시각 (버킷 경계로 반올림)")
+    end_time: str = Field(..., description="집계 끝 시각 (버킷 경계로 반올림)")
+    interval: str = Field(..., description="버킷 간격")
+    total: int = Field(..., description="기간 내 전체 로그 수")
+    timestamps: List[str] = Field(..., description="버킷 시작 시각 목록")
+    series: Dict[str, List[int]] = Field(
+        ..., description="로그 레벨별 버킷 건수 (timestamps와 같은 순서)"
+    )
+    levels: Dict[str, int] = Field(..., description="로그 레벨별 전체 건수")
+    keywords: Dict[str, int] = Field(..., description="키워드별 전체 건수")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "start_time": "2024-01-01T10:00:00",
+                "end_time": "2024-01-02T10:00:00",
+                "interval": "1h",
+                "total": 42,
+                "timestamps": ["2024-01-01T10:00:00", "2024-01-01T11:00:00"],
+                "series": {"ERROR": [3, 0], "INFO": [20, 19]},
+                "levels": {"ERROR": 3, "INFO": 39},
+                "keywords": {"로그인": 12, "결제": 30},
+            }
+        }
+    }
+
+
+class RecentLogsPage(BaseModel):
+    """최근 로그 커서 페이지 응답"""
+
+    items: List[Dict[str, Any]] = Field(..., description="최신순으로 정렬된 로그 목록")
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 커서 (마지막 페이지이면 null)"
+    )
+
+
+class EmbeddingCacheStats(BaseModel):
+    """검색어 임베딩 캐시 통계"""
+
+    size: int = Field(..., description="현재 캐시된 검색어 수")
+    max_size: int = Field(..., description="최대 캐시 크기")
+    hits: int = Field(..., description="캐시 적중 수")
+    misses: int = Field(..., description="캐시 미스 수 (임베딩 API 호출 수)")
+    hit_rate: float = Field(..., description="적중률 (0~1)")
+    avg_miss_latency_ms: float = Field(..., description="임베딩 API 평균 지연 (ms)")
+    saved_latency_ms: float = Field(..., description="캐시로 절약한 누적 지연 추정치 (ms)")
+
+
+class EndpointCacheStats(BaseModel):
+    """엔드포인트별 조회 결과 캐시 통계"""
+
+    hits: int = Field(..., description="캐시 적중 수")
+    misses: int = Field(..., description="캐시 미스 수")
+    invalidated: int = Field(..., description="새 로그 적재나 TTL 만료로 버려진 항목 수")
+    hit_rate: float = Field(..., description="적중률 (0~1)")
+
+
+class ResultCacheStats(BaseModel):
+    """조회 결과 캐시 통계"""
+
+    size: int = Field(..., description="현재 캐시된 결과 수")
+    bytes: int = Field(..., description="캐시된 결과의 추정 메모리 (JSON 크기 기준)")
+    max_bytes: int = Field(..., description="최대 캐시 메모리")
+    endpoints: Dict[str, EndpointCacheStats] = Field(..., description="엔드포인트별 통계")
+
+
+class LogCacheStats(BaseModel):
+    """로그 검색 캐시 통계"""
+
+    embedding: EmbeddingCacheStats
+    results: ResultCacheStats
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+
+
+class DbPoolStats(BaseModel):
+    """DB 연결 풀 통계 (워커 프로세스 단위)"""
+
+    pool_size: int = Field(..., description="유지하는 연결 수")
+    max_overflow: int = Field(..., description="pool_size를 넘어 열 수 있는 추가 연결 수")
+    checked_out: int = Field(..., description="현재 사용 중인 연결 수")
+    idle: int = Field(..., description="풀에서 대기 중인 연결 수")
+    overflow: int = Field(..., description="현재 열려 있는 추가 연결 수")
+    peak_checked_out: int = Field(..., description="동시에 사용된 최대 연결 수")
+    checkouts: int = Field(..., description="누적 체크아웃 수")
+    waited: int = Field(..., description="1ms 이상 걸린 체크아웃 수 (풀 대기 또는 새 연결)")
+    avg_wait_ms: float = Field(..., description="평균 체크아웃 시간 (ms, pre_ping 포함)")
+    max_wait_ms: float = Field(..., description="최대 체크아웃 시간 (ms)")
+    timeouts: int = Field(..., description="pool_timeout 안에 연결을 얻지 못한 횟수")
+    overflow_opened: int = Field(..., description="pool_size를 넘어 새로 연 연결 수")
+    invalidated: int = Field(..., description="끊긴 연결로 판정되어 버려진 연결 수")
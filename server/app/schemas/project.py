@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
 
 from app.core.utils.roles_utils import ProjectRole
 
@@ -28,6 +28,15 @@ class UserProjectBase(BaseModel):
     project_id: int
 
 
+class ProjectContext(BaseModel):
+    """요청자의 프로젝트 멤버십 (요청마다 한 번 확인)"""
+
+    user_id: int
+    username: str
+    project_id: int
+    role: ProjectRole
+
+
 # ProjectSetting
 class ProjectKeywordsBase(BaseModel):
     keywords: List[str]
@@ -42,6 +51,63 @@ class ProjectKeywordsUpdate(ProjectKeywordsBase):
     }
 
 
+class ProjectRetention(BaseModel):
+    log_retention_days: Optional[int] = Field(
+        None, ge=1, description="원본 로그 보존 기간 (일, 미설정 시 무기한)"
+    )
+    vector_retention_days: Optional[int] = Field(
+        None, ge=1, description="임베딩 벡터 보존 기간 (일, 미설정 시 무기한)"
+    )
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
+            "example": {"log_retention_days": 30, "vector_retention_days": 7}
+        },
+    }
+
+
+class RetentionTask(BaseModel):
+    task_id: str
+    action: str = Field(..., description="delete_logs 또는 remove_vectors")
+
+
+class RetentionRun(BaseModel):
+    index: str
+    tasks: List[RetentionTask]
+
+
+class RetentionTaskStatus(BaseModel):
+    task_id: str
+    completed: bool
+    total: int
+    deleted: int
+    updated: int
+    failures: List[str]
+
+
+class ProjectIngestFields(BaseModel):
+    allowlist: List[str] = Field(
+        default_factory=list, description="적재할 필드 경로 (비어있으면 전체 허용)"
+    )
+    denylist: List[str] = Field(
+        default_factory=list, description="적재 전에 제거할 필드 경로"
+    )
+    model_config = {
+        "json_schema_extra": {
+            "example": {"allowlist": [], "denylist": ["agent", "ecs", "host.os"]}
+        },
+    }
+
+
+class IngestSizeReport(BaseModel):
+    original_bytes: int
+    filtered_bytes: int
+    reduction_bytes: int
+    reduction_ratio: float
+    removed_fields: List[str]
+    document: Dict[str, Any]
+
+
 # Project Invite
 class ProjectInvite(BaseModel):
     invite_code: str
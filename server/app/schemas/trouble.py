@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 
+from app.core.enums.trouble_status import TroubleStatus
+
 
 class TroubleBase(BaseModel):
     project_id: int
@@ -48,6 +50,12 @@ class Trouble(TroubleBase):
     is_shared: bool
     user_query: str
     content: str
+    status: TroubleStatus = Field(..., description="AI 분석 상태 (pending, running, completed, failed)")
+    attempts: int = Field(0, description="AI 분석 시도 횟수")
+    error_message: Optional[str] = Field(None, description="마지막 AI 분석 실패 사유")
+    completed_at: Optional[datetime] = Field(None, description="AI 분석 완료 일시")
+    prompt_tokens: Optional[int] = Field(None, description="AI 분석 입력 토큰 수 (로그 요약 호출 포함)")
+    generation_ms: Optional[int] = Field(None, description="AI 분석 소요 시간 (ms)")
 
     model_config = {
         "from_attributes": True,  # SQLAlchemy 객체 → Pydantic 모델 자동 변환
@@ -61,6 +69,12 @@ class Trouble(TroubleBase):
                 "is_shared": False,
                 "user_query": "왜 사용자들이 로그인에 계속 실패하고 있나요?",
                 "content": "분석 결과, 비밀번호 검증 로직에서 문제가 발생하고 있습니다.",
+                "status": "completed",
+                "attempts": 1,
+                "error_message": None,
+                "completed_at": "2024-01-01T10:00:30Z",
+                "prompt_tokens": 1830,
+                "generation_ms": 8200,
             }
         },
     }
@@ -80,6 +94,7 @@ class TroubleSummary(BaseModel):
     report_name: str
     created_at: datetime
     is_shared: bool
+    status: TroubleStatus = Field(..., description="AI 분석 상태")
     creator_username: Optional[str] = Field(None, description="생성자 아이디")
     logs_count: Optional[int] = Field(None, description="연관된 로그 개수")
 
@@ -91,6 +106,7 @@ class TroubleSummary(BaseModel):
                 "report_name": "로그인 오류 분석",
                 "created_at": "2024-01-01T10:00:00Z",
                 "is_shared": False,
+                "status": "completed",
                 "creator_username": "user123",
                 "logs_count": 5,
             }
@@ -101,10 +117,13 @@ class TroubleSummary(BaseModel):
 class TroubleListQuery(BaseModel):
     """목록 조회용 쿼리 파라미터"""
 
-    page: int = Field(1, ge=1, description="페이지 번호")
+    page: int = Field(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)")
     size: int = Field(10, ge=1, le=100, description="페이지 크기")
+    cursor: Optional[str] = Field(
+        None, description="이전 응답의 next_cursor (지정하면 page 대신 다음 페이지를 keyset으로 조회, 검색 시 사용 불가)"
+    )
     search: Optional[str] = Field(
-        None, description="검색어 (report_name, user_query 대상)"
+        None, description="검색어 (report_name, user_query, content 전문 검색 관련도순, 한 글자는 report_name, user_query 부분 일치)"
     )
     is_shared: Optional[bool] = Field(None, description="공유 여부 필터")
     created_by: Optional[int] = Field(None, description="생성자 ID 필터")
@@ -114,10 +133,13 @@ class TroubleListResponse(BaseModel):
     """페이지네이션된 목록 응답"""
 
     items: List[TroubleSummary]
-    total: int = Field(..., description="전체 아이템 수")
+    total: int = Field(..., description="전체 아이템 수 (최대 TROUBLE_COUNT_CACHE_TTL_SECONDS 전 값일 수 있음)")
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
     pages: int = Field(..., description="전체 페이지 수")
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 커서 (마지막 페이지이면 null)"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -128,6 +150,7 @@ class TroubleListResponse(BaseModel):
                         "report_name": "로그인 오류 분석",
                         "created_at": "2024-01-01T10:00:00Z",
                         "is_shared": False,
+                        "status": "completed",
                         "creator_username": "user123",
                         "logs_count": 5,
                     }
@@ -136,6 +159,7 @@ class TroubleListResponse(BaseModel):
                 "page": 1,
                 "size": 10,
                 "pages": 3,
+                "next_cursor": "eyJhZnRlciI6WyIyMDI0LTAxLTAxVDEwOjAwOjAwIiwxXX0",
             }
         }
     }
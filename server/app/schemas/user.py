@@ -1,5 +1,9 @@
+from typing import Dict
+
 from pydantic import BaseModel
 
+from app.core.enums.roles import ProjectRole
+
 class UserBase(BaseModel): 
     username: str
     
@@ -27,3 +31,11 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     username: str | None = None
+
+class CurrentUser(BaseModel):
+    """액세스 토큰 클레임으로 만든 요청자 정보 (DB 조회 없음)"""
+    user_id: int
+    username: str
+    token_version: int = 0
+    # 로그인 시점의 프로젝트별 역할 (project_id -> role)
+    memberships: Dict[int, ProjectRole] = {}
@@ -0,0 +1,57 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.utils.membership_cache import membership_cache, token_version_cache
+from app.repositories import async_project as ProjectRepository
+from app.repositories import async_user as UserRepository
+from app.schemas.project import ProjectContext
+from app.schemas.user import CurrentUser
+from app.services.project import member_context_from_row
+
+
+class AsyncProjectService:
+    """ProjectService의 조회 경로를 AsyncSession으로 처리하는 서비스 (비동기 라우트 전용)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_projects_by_user(self, user_id: int) -> list:
+        """사용자의 프로젝트 목록 조회 서비스"""
+        return await ProjectRepository.get_project_by_user(db=self.db, user_id=user_id)
+
+    async def get_project_context(
+        self, project_id: int, user: CurrentUser
+    ) -> ProjectContext:
+        """
+        요청자의 프로젝트 멤버십 확인
+        (ProjectService.get_project_context와 같은 순서, 같은 캐시 사용)
+        """
+        role = user.memberships.get(project_id)
+        if role and await self._is_token_current(user):
+            return ProjectContext(
+                user_id=user.user_id,
+                username=user.username,
+                project_id=project_id,
+                role=role,
+            )
+
+        context = membership_cache.get(user.user_id, project_id)
+        if context:
+            return context
+
+        row = await ProjectRepository.get_member_context(
+            db=self.db, user_id=user.user_id, project_id=project_id
+        )
+        context = member_context_from_row(row, user)
+        membership_cache.put(context)
+        return context
+
+    async def _is_token_current(self, user: CurrentUser) -> bool:
+        """토큰 발급 이후 멤버십이 바뀌지 않았는지 확인 (현재 버전은 짧게 캐시)"""
+        version = token_version_cache.get(user.user_id)
+        if version is None:
+            version = await UserRepository.get_token_version(
+                db=self.db, user_id=user.user_id
+            )
+            if version is None:
+                return False
+            token_version_cache.put(user.user_id, version)
+        return user.token_version == version
@@ -0,0 +1,86 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+
+from app.core.utils.count_cache import trouble_count_cache
+from app.repositories import async_trouble as trouble_repo
+from app.schemas.trouble import TroubleListQuery, TroubleListResponse, TroubleWithLogs
+from app.schemas.project import ProjectContext
+from app.services.trouble import TroubleService
+from app.tasks.trouble_count import submit_trouble_count_refresh
+
+
+class AsyncTroubleService:
+    """
+    TroubleService의 조회 경로를 AsyncSession으로 처리하는 서비스 (비동기 라우트 전용)
+    LLM을 쓰는 생성/분석 경로는 TroubleService에 남아 있음
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_trouble_by_id(self, trouble_id: int, user_id: int) -> TroubleWithLogs:
+        """
+        ID로 trouble을 조회합니다.
+
+        Args:
+            trouble_id: 조회할 trouble ID
+            user_id: 요청한 사용자 ID (권한 확인용)
+
+        Returns:
+            조회된 TroubleWithLogs 객체
+
+        Raises:
+            HTTPException: trouble이 존재하지 않거나 접근 권한이 없는 경우
+        """
+        # 1. trouble 존재 여부 확인
+        trouble = await trouble_repo.get_trouble_by_id(self.db, trouble_id)
+        if not trouble:
+            raise HTTPException(
+                status_code=404, detail="요청한 트러블슈팅을 찾을 수 없습니다"
+            )
+
+        # 2. 접근 권한 확인 (생성자이거나 공유된 trouble만 조회 가능)
+        if not TroubleService._check_trouble_access(trouble, user_id):
+            raise HTTPException(
+                status_code=403, detail="이 트러블슈팅에 접근할 권한이 없습니다"
+            )
+
+        # 3. 연관된 로그 ID와 함께 반환
+        return TroubleService._to_trouble_with_logs(trouble)
+
+    async def get_project_troubles(
+        self, context: ProjectContext, query_params: TroubleListQuery
+    ) -> TroubleListResponse:
+        """
+        프로젝트의 trouble 목록을 페이지네이션과 함께 조회합니다.
+
+        Args:
+            context: 요청자의 프로젝트 멤버십 (멤버 확인은 요청 의존성에서 완료)
+            query_params: 페이지네이션 및 필터 파라미터
+
+        Returns:
+            페이지네이션된 trouble 목록 (cursor가 있으면 keyset 페이지)
+        """
+        # 1. 한 페이지 조회 (다음 페이지 확인용으로 한 행 더)
+        troubles = await trouble_repo.get_project_troubles_page(
+            self.db,
+            context.project_id,
+            query_params,
+            context.user_id,
+            TroubleService._decode_cursor(query_params),
+        )
+
+        # 2. 전체 개수 (동기 경로와 같은 캐시, 없을 때만 바로 셈)
+        key = TroubleService._count_key(context, query_params)
+        total, refresh = trouble_count_cache.get(key)
+        if total is None:
+            generation = trouble_count_cache.generation(context.project_id)
+            total = await trouble_repo.count_project_troubles(
+                self.db, context.project_id, query_params, context.user_id
+            )
+            trouble_count_cache.put(key, total, generation)
+        elif refresh:
+            submit_trouble_count_refresh(key, context.project_id, query_params, context.user_id)
+
+        # 3. 응답 데이터 구성
+        return TroubleService._to_list_response(troubles, total, query_params)
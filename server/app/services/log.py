@@ -1,24 +1,88 @@
-from typing import List
+import itertools
+import json
+import logging
+import time
+from typing import Dict, Iterator, List, Tuple
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from app.core.utils.time_utils import get_start_time, get_log_time_by_count
-from app.core.utils.log_utils import extract_basic_logs, extract_full_logs, remove_vector_from_logs
+from app.core.utils.time_utils import (
+    get_start_time,
+    get_dashboard_range,
+)
+from app.core.utils.log_utils import (
+    BASIC_LOG_FIELDS,
+    FULL_LOG_FIELDS,
+    extract_basic_logs,
+    extract_full_logs,
+)
+from app.core.utils.embedding_cache import normalize_query
+from app.core.utils.http_cache import make_etag
+from app.core.utils.export_utils import (
+    EXPORT_COLUMNS,
+    is_format_available,
+    with_error_trailer,
+    write_csv,
+    write_ndjson,
+    write_parquet,
+)
+from app.core.utils.result_cache import (
+    result_cache,
+    parse_query_time,
+    round_time_range,
+)
+from app.core.config.settings import get_settings
 from app.services.project import ProjectService
-from app.repositories import user as UserRepository
+from app.services.rollup import RollupService
 from app.repositories import opensearch as OpenSearchRepository
-from app.core.enums.log_filter import LogLevelFilter
+from app.core.enums.log_filter import LogLevelFilter, LogTimeFilter
+from app.core.enums.search_mode import SearchMode
+from app.core.enums.export_format import ExportFormat
+
+settings = get_settings()
+
+
+def _validate_time_range(start_time: str = None, end_time: str = None) -> None:
+    """검색 기간 형식과 순서 확인 (잘못된 값이 OpenSearch 쿼리로 넘어가지 않도록)"""
+    start = parse_query_time(start_time)
+    end = parse_query_time(end_time)
+    if (start_time and start is None) or (end_time and end is None):
+        raise HTTPException(status_code=400, detail="start_time and end_time must be ISO 8601 datetimes")
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="start_time must not be after end_time")
+
+
+def _within_time_range(logs: list, start_time: str = None, end_time: str = None) -> list:
+    """
+    검색 기간 안의 로그만 남김 (검색 쿼리와 같은 gte/lte 기준)
+    캐시 키는 기간을 분 단위로 넓혀 만들므로, 같은 분 안의 다른 기간으로 캐시된 결과에서 요청 기간 밖의 로그를 뺌
+    """
+    start = parse_query_time(start_time)
+    end = parse_query_time(end_time)
+    if start is None or end is None:
+        return logs
+    return [
+        log
+        for log in logs
+        if (timestamp := parse_query_time(log.get("message_timestamp"))) is not None
+        and start <= timestamp <= end
+    ]
+
+
+def _log_detail_etag(index: str, fields: List[str], versions: List[list]) -> str:
+    """인덱스, 반환 필드, 문서별 [_id, _version]으로 로그 상세 ETag 생성"""
+    key = [index, fields or [], versions]
+    return make_etag(json.dumps(key, separators=(",", ":")).encode("utf-8"))
 
 
 class LogService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_logs(self, username: str, project_id: int, log_time: str, size: int = 100) -> list:
-        """로그 조회 서비스"""
+    def get_logs(self, project_id: int, log_time: str, size: int = 100) -> list:
+        """로그 조회 서비스 (멤버 확인은 요청 의존성에서 완료)"""
         project_service = ProjectService(self.db)
-
-        db_user = UserRepository.get_user_by_username(self.db, username=username)
         db_project = project_service.get_project_by_id(project_id=project_id)
 
         start_time, end_time = get_start_time(log_time)
@@ -27,54 +91,210 @@ class LogService:
             start_time=start_time,
             end_time=end_time,
             size=size,
+            fields=BASIC_LOG_FIELDS,
         )
 
         return extract_basic_logs(logs)
 
+    def get_dashboard(self, project_id: int, log_time: LogTimeFilter) -> dict:
+        """대시보드 집계 서비스 (레벨별 시계열, 키워드 분포)"""
+        project_service = ProjectService(self.db)
+        db_project = project_service.get_project_by_id(project_id=project_id, with_setting=True)
+        if not db_project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        start_time, end_time, interval = get_dashboard_range(log_time)
+
+        def aggregate() -> dict:
+            # 기간 전체가 집계 테이블에 있으면 원본 로그를 다시 집계하지 않음
+            # (집계 시작 전 기간이 섞이면 OpenSearch 집계로 조회)
+            rollups = RollupService(self.db)
+            if settings.ROLLUP_ENABLED and rollups.covers(
+                db_project.id, datetime.fromisoformat(start_time)
+            ):
+                return rollups.get_dashboard(db_project.id, log_time)
+            return OpenSearchRepository.get_log_dashboard(
+                index_name=db_project.index,
+                start_time=start_time,
+                end_time=end_time,
+                interval=interval,
+                profile=db_project.setting.mapping_profile,
+            )
+
+        if not settings.RESULT_CACHE_ENABLED:
+            return aggregate()
+        # 기간이 버킷 경계로 정렬되어 있어 같은 버킷 안의 반복 요청은 같은 키를 씀
+        return result_cache.get_or_compute(
+            "logs.dashboard",
+            db_project.id,
+            (log_time.value, start_time, end_time),
+            aggregate,
+            start=parse_query_time(start_time),
+            end=parse_query_time(end_time),
+        )
+
     def get_recent_logs(
         self,
-        username: str,
         project_id: int,
-        count: int,
+        cursor: str = None,
         size: int = 100,
-    ) -> list:
-        """날짜 범위 로그 조회 서비스"""
+    ) -> dict:
+        """최근 로그 커서 페이지 조회 서비스 (최신순, 깊이와 관계없이 페이지당 한 번의 정렬 쿼리)"""
         project_service = ProjectService(self.db)
-
-        db_user = UserRepository.get_user_by_username(self.db, username=username)
         db_project = project_service.get_project_by_id(project_id=project_id)
 
-        start_time, end_time = get_log_time_by_count(count)
-        logs = OpenSearchRepository.get_logs_by_datetime(
+        logs, next_cursor = OpenSearchRepository.get_recent_logs_page(
             index_name=db_project.index,
-            start_time=start_time,
-            end_time=end_time,
+            project_id=db_project.id,
             size=size,
+            cursor=cursor,
+            keep_alive=settings.OPENSEARCH_PIT_KEEP_ALIVE,
+            fields=FULL_LOG_FIELDS,
+        )
+
+        return {"items": extract_full_logs(logs), "next_cursor": next_cursor}
+
+    def export_logs(
+        self,
+        project_id: int,
+        start_time: str,
+        end_time: str,
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        keyword: str = None,
+        log_level: LogLevelFilter = None,
+        fields: List[str] = None,
+    ) -> Iterator[bytes]:
+        """기간 내 조건에 맞는 모든 로그를 파일 형식으로 스트리밍하는 서비스"""
+        project_service = ProjectService(self.db)
+        db_project = project_service.get_project_by_id(project_id=project_id)
+        if not db_project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if not is_format_available(export_format):
+            raise HTTPException(
+                status_code=400, detail="Parquet export requires pandas and pyarrow"
+            )
+        _validate_time_range(start_time, end_time)
+
+        # CSV/Parquet은 열이 고정되어야 하므로 기본 열 목록 사용
+        columns = fields or EXPORT_COLUMNS
+        batches = OpenSearchRepository.iter_logs_for_export(
+            index_name=db_project.index,
+            query=OpenSearchRepository.build_log_filter(keyword, log_level, start_time, end_time),
+            fields=fields if export_format == ExportFormat.NDJSON else columns,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+            slices=settings.EXPORT_SLICES,
+            keep_alive=settings.OPENSEARCH_PIT_KEEP_ALIVE,
         )
+        batches = self._log_export_throughput(batches, db_project.index)
+        # 첫 배치를 미리 조회해 쿼리 오류는 응답 시작 전에 상태 코드로 전달
+        first_batch = next(batches, None)
+        if first_batch is not None:
+            batches = itertools.chain([first_batch], batches)
+
+        if export_format == ExportFormat.CSV:
+            chunks = write_csv(batches, columns)
+        elif export_format == ExportFormat.PARQUET:
+            chunks = write_parquet(batches, columns)
+        else:
+            chunks = write_ndjson(batches)
+        return with_error_trailer(chunks, export_format)
 
-        return extract_full_logs(logs)
+    def _log_export_throughput(self, batches: Iterator[list], index: str) -> Iterator[list]:
+        """내보낸 문서 수와 처리량(docs/sec)을 기록"""
+        started = time.perf_counter()
+        count = 0
+        try:
+            for batch in batches:
+                count += len(batch)
+                yield batch
+        finally:
+            elapsed = time.perf_counter() - started
+            logging.info(
+                f"Exported {count} logs from {index} in {elapsed:.1f}s "
+                f"({count / elapsed if elapsed else 0:.0f} docs/sec)"
+            )
+
+    def get_log_detail(self, project_id: int, log_ids: List[str], fields: List[str] = None) -> list:
+        """로그 상세 조회 서비스 (_mget, 요청한 필드만 반환)"""
+        db_project = ProjectService.get_project_by_id(self, project_id=project_id)
+
+        # vector 필드는 OpenSearch에서 제외된 채로 반환됨
+        return OpenSearchRepository.get_logs_by_ids(
+            index_name=db_project.index,
+            ids=log_ids,
+            fields=fields,
+            chunk_size=settings.LOG_DETAIL_MGET_CHUNK_SIZE,
+        )
 
-    def get_log_detail(self, project_id: int, log_ids: List[int]) -> list:
+    def get_log_detail_with_etag(
+        self, project_id: int, log_ids: List[str], fields: List[str] = None
+    ) -> Tuple[list, str]:
+        """로그 상세와 ETag를 한 번의 _mget으로 조회 (조회한 문서의 _version으로 ETag 계산)"""
         db_project = ProjectService.get_project_by_id(self, project_id=project_id)
 
-        log_details = OpenSearchRepository.get_logs_by_ids(
+        logs = OpenSearchRepository.get_logs_by_ids(
             index_name=db_project.index,
             ids=log_ids,
+            fields=fields,
+            chunk_size=settings.LOG_DETAIL_MGET_CHUNK_SIZE,
         )
+        versions = [[log["_id"], log.get("_version")] for log in logs]
+        return logs, _log_detail_etag(db_project.index, fields, versions)
 
-        return remove_vector_from_logs(log_details)
+    def get_log_detail_etag(self, project_id: int, log_ids: List[str], fields: List[str] = None) -> str:
+        """
+        로그 상세 응답의 ETag 계산 (_source 없이 문서 버전만 조회 - If-None-Match 재검증 전용)
 
-    def get_retrieve_logs(self, project_id: int, query: str, keyword: str = None, log_level: LogLevelFilter = None, start_time: str = None, end_time: str = None, k: int = 10) -> list:
+        코멘트 추가, 벡터 만료 등으로 문서가 바뀌면 _version이 바뀌므로
+        본문을 읽지 않고도 304로 응답할 수 있음
+        """
         db_project = ProjectService.get_project_by_id(self, project_id=project_id)
 
-        logs = OpenSearchRepository.retrieve_logs(
+        versions = OpenSearchRepository.get_log_versions(
             index_name=db_project.index,
-            query=query,
-            keyword=keyword,
-            log_level=log_level,
-            start_time=start_time,
-            end_time=end_time,
-            k=k,
+            ids=log_ids,
+            chunk_size=settings.LOG_DETAIL_MGET_CHUNK_SIZE,
+        )
+        return _log_detail_etag(db_project.index, fields, versions)
+
+    def get_retrieve_logs(self, project_id: int, query: str, keyword: str = None, log_level: LogLevelFilter = None, start_time: str = None, end_time: str = None, k: int = 10, mode: SearchMode = SearchMode.VECTOR) -> Tuple[list, Dict[str, float]]:
+        """로그 검색 서비스 (검색 결과와 단계별 지연(ms) 반환)"""
+        db_project = ProjectService.get_project_by_id(self, project_id=project_id)
+
+        _validate_time_range(start_time, end_time)
+        query = normalize_query(query)
+        latency_ms: Dict[str, float] = {}
+
+        def search() -> list:
+            result = OpenSearchRepository.retrieve_logs(
+                index_name=db_project.index,
+                query=query,
+                keyword=keyword,
+                log_level=log_level,
+                start_time=start_time,
+                end_time=end_time,
+                k=k,
+                fields=FULL_LOG_FIELDS,
+                mode=mode,
+            )
+            latency_ms.update(result["latency_ms"])
+            return extract_full_logs(result["hits"])
+
+        if not settings.RESULT_CACHE_ENABLED:
+            return search(), latency_ms
+
+        # 검색 쿼리는 요청한 기간 그대로 실행하고, 캐시 키만 분 단위로 넓혀 매 요청마다 달라지지 않도록 함
+        key_start, key_end = round_time_range(start_time, end_time)
+        started = time.perf_counter()
+        logs = result_cache.get_or_compute(
+            "logs.search",
+            db_project.id,
+            (mode.value, query, keyword, log_level.value if log_level else None, k, key_start, key_end),
+            search,
+            start=parse_query_time(key_start),
+            end=parse_query_time(key_end),
         )
-        
-        return extract_full_logs(logs)
\ No newline at end of file
+        if not latency_ms:
+            # 캐시 적중 시 OpenSearch를 거치지 않음
+            latency_ms["cache"] = (time.perf_counter() - started) * 1000
+        return _within_time_range(logs, start_time, end_time), latency_ms
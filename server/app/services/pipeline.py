@@ -1,17 +1,23 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from uuid import UUID
+from datetime import datetime
 from langchain_core.prompts import PromptTemplate
 from langchain_core.messages import HumanMessage
 
 from app.core.llm.base import LLMFactory
+from app.core.config.opensearch_config import get_ingest_denylist
+from app.core.config.settings import get_settings
+from app.core.utils.rollup_utils import rollup_buffer
+from app.core.utils.result_cache import ingest_watermark
 from app.core.enums.language import Language
 from app.infra.database.opensearch import OpenSearchClient
 from app.core.llm.prompts import LOG_COMMENT_TEMPLATE, AIMessage
-from app.models.project import Project
+from app.repositories.project import get_project_by_api_key
 
 from app.core.utils import log_utils as LogUtils
 
+settings = get_settings()
 
 
 class PipelineService:
@@ -26,11 +32,20 @@ class PipelineService:
         2. 임베딩 모델을 사용하여 메세지 내용을 임베딩
         """
         # 데이터베이스에서 유저 설정 카테고리, 언어, 인덱스 정보를 가져옴
-        log_message = log_data.get("message", "")
-        project = self.db.query(Project).filter(Project.api_key == api_key).first()
+        project = get_project_by_api_key(self.db, api_key)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
+        # 프로젝트 필드 필터 적용 (불필요한 메타데이터는 색인 전에 제거)
+        log_data = LogUtils.filter_log_fields(
+            log_data,
+            allowlist=project.setting.ingest_field_allowlist,
+            denylist=get_ingest_denylist(
+                project.setting.ingest_field_denylist, project.setting.mapping_profile
+            ),
+        )
+        log_message = log_data.get("message", "")
+
         category_list = project.setting.log_keywords
         language = project.language
         ai_msg = self._gen_ai_msg(log_message, category_list, language)
@@ -50,9 +65,36 @@ class PipelineService:
         body = log_data
         index = project.index
         self.client.save_document(index=index, document=body)
+        # 이 로그의 시간대를 조회한 캐시 결과 무효화
+        ingest_watermark.mark(
+            project.id,
+            datetime.fromisoformat(log_data["message_timestamp"])
+            if log_data.get("message_timestamp")
+            else None,
+        )
+
+        # 대시보드용 분 단위 집계 누적
+        if settings.ROLLUP_ENABLED:
+            self._add_rollup(project.id, log_data)
 
         return log_data
 
+    def _add_rollup(self, project_id: int, log_data: dict) -> None:
+        """
+        적재한 로그를 분 단위 집계 버퍼에 누적하는 함수
+        (대시보드의 OpenSearch 집계는 message_timestamp 범위로 세므로 시각을 알 수 없는 로그는 집계하지 않음)
+        """
+        if not log_data.get("message_timestamp"):
+            return
+        host = log_data.get("host")
+        rollup_buffer.add(
+            project_id,
+            datetime.fromisoformat(log_data["message_timestamp"]),
+            log_level=log_data.get("log_level"),
+            keyword=log_data.get("keyword"),
+            host=host.get("name") if isinstance(host, dict) else None,
+        )
+
     def _gen_ai_msg(self, log_msg: str, category_list: list, language: Language):
         """
         로그 메세지에 대한 코멘트를 생성하는 함수
@@ -1,7 +1,16 @@
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List
+import copy
 import logging
+from app.core.config.opensearch_config import get_ingest_denylist
+from app.core.config.settings import get_settings
+from app.core.utils.log_utils import filter_log_fields, get_field_paths, get_document_size
+from app.core.utils.membership_cache import membership_cache, token_version_cache
+from app.infra.database.unit_of_work import unit_of_work
+from app.models.project import Project as ProjectModel
 from app.repositories import opensearch as OpenSearchRepository
 from app.repositories import project as ProjectRepository
 from app.repositories import user as UserRepository
@@ -11,48 +20,93 @@ from app.schemas.project import (
     Project,
     ProjectInvite,
     ProjectMembers,
+    ProjectContext,
+    ProjectIngestFields,
+    ProjectRetention,
     RoleChange,
 )
+from app.schemas.user import CurrentUser
 from app.core.enums.roles import (
     ProjectRole,
     Permission,
 )
 from app.core.utils.roles_utils import has_permission, can_manage_role
+from app.services.retention import RetentionService
 
+settings = get_settings()
+
+
+def member_context_from_row(row, user: CurrentUser) -> ProjectContext:
+    """멤버십 조회 결과를 요청 컨텍스트로 변환 (사용자/프로젝트가 없거나 멤버가 아니면 에러)"""
+    if not row:
+        raise HTTPException(status_code=400, detail="Can't find user")
+
+    if row.project_id is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    if not row.role:
+        raise HTTPException(
+            status_code=403, detail="You are not a member of this project"
+        )
+
+    return ProjectContext(
+        user_id=row.user_id,
+        username=user.username,
+        project_id=row.project_id,
+        role=ProjectRole(row.role),
+    )
 
 
 class ProjectService:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_project(self, project_dto: ProjectCreate, username: str) -> Project:
-        """프로젝트 생성 서비스"""
-        db_user = UserRepository.get_user_by_username(db=self.db, username=username)
-        if not db_user:
-            raise HTTPException(status_code=400, detail="Can't find user")
-
-        db_project = ProjectRepository.create_project(
-            db=self.db, project=project_dto, user=db_user.id
-        )
-        OpenSearchRepository.create_project_index(index_name=db_project.index)
+    def create_project(self, project_dto: ProjectCreate, user_id: int) -> Project:
+        """
+        프로젝트 생성 서비스
+        (OpenSearch 인덱스 생성에 실패하면 DB 쓰기도 rollback, 인덱스를 만든 뒤 commit에 실패하면 인덱스 삭제)
+        """
+        index_name = None
+        try:
+            with unit_of_work(self.db):
+                # 인덱스를 만든 매핑 프로필을 설정에 기록 (이후 설정이 바뀌어도 이 인덱스의 필드 이름 기준)
+                profile = settings.OPENSEARCH_MAPPING_PROFILE
+                db_project = ProjectRepository.create_project(
+                    db=self.db, project=project_dto, user=user_id, mapping_profile=profile
+                )
+                OpenSearchRepository.create_project_index(
+                    index_name=db_project.index, profile=profile
+                )
+                index_name = db_project.index
+        except Exception:
+            if index_name:
+                self._drop_orphan_index(index_name)
+            raise
 
         return db_project
 
-    def get_project_by_id(self, project_id: int) -> Project:
-        """프로젝트 조회 서비스"""
-        return ProjectRepository.get_project_by_id(self.db, project_id=project_id)
+    def _drop_orphan_index(self, index_name: str) -> None:
+        """DB에 프로젝트가 남지 않은 인덱스 삭제 (삭제 실패는 기록만 하고 원래 예외를 전달)"""
+        try:
+            OpenSearchRepository.delete_project_index(index_name=index_name)
+        except Exception as e:
+            logging.error(f"Failed to delete orphan index {index_name}: {e}")
+
+    def get_project_by_id(self, project_id: int, with_setting: bool = False) -> Project:
+        """프로젝트 조회 서비스 (with_setting이면 프로젝트 설정도 함께 로딩)"""
+        return ProjectRepository.get_project_by_id(
+            self.db, project_id=project_id, with_setting=with_setting
+        )
 
-    def get_projects_by_user(self, username: str) -> list:
+    def get_projects_by_user(self, user_id: int) -> list:
         """사용자의 프로젝트 목록 조회 서비스"""
-        db_user = UserRepository.get_user_by_username(db=self.db, username=username)
-        if not db_user:
-            raise HTTPException(status_code=400, detail="Can't find user")
-
-        return ProjectRepository.get_project_by_user(db=self.db, user_id=db_user.id)
+        return ProjectRepository.get_project_by_user(db=self.db, user_id=user_id)
 
     def get_project_keywords(self, project_id: int) -> dict:
         """프로젝트 키워드 조회 서비스"""
-        db_project = ProjectRepository.get_project_by_id(self.db, project_id=project_id)
+        db_project = ProjectRepository.get_project_by_id(
+            self.db, project_id=project_id, with_setting=True
+        )
 
         if not db_project:
             raise HTTPException(status_code=400, detail="Can't find project")
@@ -63,7 +117,9 @@ class ProjectService:
         self, project_id: int, keywords_update: ProjectKeywordsUpdate
     ) -> dict:
         """프로젝트 키워드 업데이트 서비스"""
-        project = ProjectRepository.get_project_by_id(self.db, project_id=project_id)
+        project = ProjectRepository.get_project_by_id(
+            self.db, project_id=project_id, with_setting=True
+        )
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
@@ -78,49 +134,191 @@ class ProjectService:
 
         return keywords_update
 
-    def delete_project(self, project_id: int, username: str) -> dict:
-        """프로젝트 삭제 서비스"""
-        # 프로젝트 존재 여부 확인
-        db_project = ProjectRepository.get_project_by_id(self.db, project_id=project_id)
+    def get_project_context(self, project_id: int, user: CurrentUser) -> ProjectContext:
+        """
+        요청자의 프로젝트 멤버십 확인
+        (최신 토큰의 멤버십 클레임 → 캐시 → 사용자/프로젝트/역할 단일 쿼리 순서)
+        """
+        role = user.memberships.get(project_id)
+        if role and self._is_token_current(user):
+            return ProjectContext(
+                user_id=user.user_id,
+                username=user.username,
+                project_id=project_id,
+                role=role,
+            )
+
+        context = membership_cache.get(user.user_id, project_id)
+        if context:
+            return context
+
+        row = ProjectRepository.get_member_context(
+            db=self.db, user_id=user.user_id, project_id=project_id
+        )
+        context = member_context_from_row(row, user)
+        membership_cache.put(context)
+        return context
+
+    def _is_token_current(self, user: CurrentUser) -> bool:
+        """토큰 발급 이후 멤버십이 바뀌지 않았는지 확인 (현재 버전은 짧게 캐시)"""
+        version = token_version_cache.get(user.user_id)
+        if version is None:
+            version = UserRepository.get_token_version(db=self.db, user_id=user.user_id)
+            if version is None:
+                return False
+            token_version_cache.put(user.user_id, version)
+        return user.token_version == version
+
+    @contextmanager
+    def _revoke_memberships(self, project_id: int, user_ids: List[int]) -> Iterator[None]:
+        """
+        블록의 멤버십 변경과 사용자들의 토큰 버전 올리기를 한 트랜잭션으로 커밋한 뒤 캐시를 무효화
+        (커밋 전에 무효화하면 동시 요청이 이전 버전을 다시 캐시할 수 있음)
+        """
+        with unit_of_work(self.db):
+            yield
+            UserRepository.bump_token_versions(db=self.db, user_ids=user_ids)
+        token_version_cache.invalidate(user_ids)
+        for user_id in user_ids:
+            membership_cache.invalidate(project_id, user_id=user_id)
+
+    def _get_member_project(
+        self, context: ProjectContext, permission: Permission = None
+    ) -> ProjectModel:
+        """요청자의 권한을 확인하고 프로젝트를 조회 (프로젝트 설정 포함)"""
+        if permission and not has_permission(context.role, permission):
+            raise HTTPException(
+                status_code=403, detail="You don't have permission to change settings"
+            )
+
+        db_project = ProjectRepository.get_project_by_id(
+            self.db, project_id=context.project_id, with_setting=True
+        )
         if not db_project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        # 사용자 확인
-        db_user = UserRepository.get_user_by_username(db=self.db, username=username)
-        if not db_user:
-            raise HTTPException(status_code=400, detail="Can't find user")
+        return db_project
+
+    def get_project_ingest_fields(self, context: ProjectContext) -> dict:
+        """프로젝트 적재 필드 필터 조회 서비스"""
+        db_project = self._get_member_project(context)
+        return ProjectRepository.get_project_ingest_fields(db=self.db, project=db_project)
+
+    def update_project_ingest_fields(
+        self, context: ProjectContext, ingest_fields: ProjectIngestFields
+    ) -> ProjectIngestFields:
+        """프로젝트 적재 필드 필터 변경 서비스"""
+        db_project = self._get_member_project(context, Permission.MANAGE_SETTINGS)
+
+        updated_project = ProjectRepository.update_project_ingest_fields(
+            db=self.db,
+            project=db_project,
+            allowlist=ingest_fields.allowlist,
+            denylist=ingest_fields.denylist,
+        )
+
+        if not updated_project:
+            raise HTTPException(
+                status_code=400, detail="Failed to update ingest fields"
+            )
+
+        return ingest_fields
 
-        # 사용자의 프로젝트 내 역할 확인
-        user_role = ProjectRepository.get_user_role_in_project(
-            db=self.db, user_id=db_user.id, project_id=project_id
+    def get_ingest_size_report(self, context: ProjectContext, sample: dict) -> dict:
+        """샘플 로그에 필드 필터를 적용했을 때의 문서 크기 감소량 리포트"""
+        db_project = self._get_member_project(context)
+
+        original_bytes = get_document_size(sample)
+        original_paths = get_field_paths(sample)
+        filtered = filter_log_fields(
+            copy.deepcopy(sample),
+            allowlist=db_project.setting.ingest_field_allowlist,
+            denylist=get_ingest_denylist(
+                db_project.setting.ingest_field_denylist, db_project.setting.mapping_profile
+            ),
         )
+        filtered_bytes = get_document_size(filtered)
+        filtered_paths = set(get_field_paths(filtered))
+
+        return {
+            "original_bytes": original_bytes,
+            "filtered_bytes": filtered_bytes,
+            "reduction_bytes": original_bytes - filtered_bytes,
+            "reduction_ratio": (
+                round(1 - filtered_bytes / original_bytes, 4) if original_bytes else 0.0
+            ),
+            "removed_fields": [p for p in original_paths if p not in filtered_paths],
+            "document": filtered,
+        }
+
+    def get_project_retention(self, context: ProjectContext) -> dict:
+        """프로젝트 로그 보존 정책 조회 서비스"""
+        db_project = self._get_member_project(context)
+        return ProjectRepository.get_project_retention(db=self.db, project=db_project)
+
+    def update_project_retention(
+        self, context: ProjectContext, retention: ProjectRetention
+    ) -> ProjectRetention:
+        """프로젝트 로그 보존 정책 변경 서비스"""
+        # 로그 삭제를 유발하므로 master, manager만 변경 가능
+        db_project = self._get_member_project(context, Permission.MANAGE_SETTINGS)
 
-        if not user_role:
+        updated_project = ProjectRepository.update_project_retention(
+            db=self.db,
+            project=db_project,
+            log_retention_days=retention.log_retention_days,
+            vector_retention_days=retention.vector_retention_days,
+        )
+
+        if not updated_project:
             raise HTTPException(
-                status_code=403, detail="You are not a member of this project"
+                status_code=400, detail="Failed to update retention policy"
             )
 
+        return retention
+
+    def run_project_retention(self, context: ProjectContext) -> dict:
+        """프로젝트 로그 보존 정책 즉시 실행 서비스"""
+        db_project = self._get_member_project(context, Permission.MANAGE_SETTINGS)
+        return RetentionService(self.db).expire_project_logs(db_project)
+
+    def get_project_retention_task(self, context: ProjectContext, task_id: str) -> dict:
+        """프로젝트 로그 보존 정책 삭제 작업 진행 상태 조회 서비스"""
+        db_project = self._get_member_project(context, Permission.MANAGE_SETTINGS)
+        return RetentionService(self.db).get_expiry_task(db_project, task_id)
+
+    def delete_project(self, context: ProjectContext) -> dict:
+        """프로젝트 삭제 서비스"""
+        project_id = context.project_id
+
         # 프로젝트 멤버 수 확인
         members_count = ProjectRepository.get_project_members_count(
             db=self.db, project_id=project_id
         )
 
-        if user_role == ProjectRole.MASTER:
+        if context.role == ProjectRole.MASTER:
             if members_count > 1:
                 raise HTTPException(
                     status_code=400, detail="The master cannot leave the project."
                 )
             else:
                 # 마스터가 유일한 멤버인 경우 프로젝트 전체 삭제
-                success = ProjectRepository.delete_project(
-                    db=self.db, project_id=project_id, user_id=db_user.id
+                db_project = ProjectRepository.get_project_by_id(
+                    self.db, project_id=project_id
                 )
-
-                if not success:
-                    raise HTTPException(
-                        status_code=400, detail="Failed to delete project"
+                member_ids = ProjectRepository.get_project_member_ids(
+                    db=self.db, project_id=project_id
+                )
+                with self._revoke_memberships(project_id, member_ids):
+                    success = ProjectRepository.delete_project(
+                        db=self.db, project_id=project_id, user_id=context.user_id
                     )
 
+                    if not success:
+                        raise HTTPException(
+                            status_code=400, detail="Failed to delete project"
+                        )
+
                 # Elasticsearch 인덱스도 삭제
                 try:
                     OpenSearchRepository.delete_project_index(
@@ -132,45 +330,28 @@ class ProjectService:
                 return {"message": "Project deleted successfully"}
         else:
             # 멤버인 경우 프로젝트에서 자신만 제거
-            success = ProjectRepository.delete_user_project(
-                db=self.db, user_id=db_user.id, project_id=project_id
-            )
+            with self._revoke_memberships(project_id, [context.user_id]):
+                success = ProjectRepository.delete_user_project(
+                    db=self.db, user_id=context.user_id, project_id=project_id
+                )
 
-            if not success:
-                raise HTTPException(status_code=400, detail="Failed to leave project")
+                if not success:
+                    raise HTTPException(status_code=400, detail="Failed to leave project")
 
             return {"message": "Successfully left the project"}
 
-    def get_project_invite_code(self, project_id: int, username: str) -> dict:
+    def get_project_invite_code(self, context: ProjectContext) -> dict:
         """프로젝트 초대코드 조회 서비스"""
-        # 프로젝트 존재 여부 확인
-        db_project = ProjectRepository.get_project_by_id(self.db, project_id=project_id)
+        db_project = ProjectRepository.get_project_by_id(
+            self.db, project_id=context.project_id
+        )
         if not db_project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        # 사용자 확인
-        db_user = UserRepository.get_user_by_username(db=self.db, username=username)
-        if not db_user:
-            raise HTTPException(status_code=400, detail="Can't find user")
-
-        # 사용자가 프로젝트 멤버인지 확인
-        user_role = ProjectRepository.get_user_role_in_project(
-            db=self.db, user_id=db_user.id, project_id=project_id
-        )
-
-        if not user_role:
-            raise HTTPException(
-                status_code=403, detail="You are not a member of this project"
-            )
-
         return {"invite_code": db_project.invite_code}
 
-    def join_project_by_invite(self, invite_dto: ProjectInvite, username: str) -> dict:
+    def join_project_by_invite(self, invite_dto: ProjectInvite, user_id: int) -> dict:
         """초대코드로 프로젝트 참여 서비스"""
-        db_user = UserRepository.get_user_by_username(db=self.db, username=username)
-        if not db_user:
-            raise HTTPException(status_code=400, detail="Can't find user")
-
         # 초대코드로 프로젝트 찾기
         db_project = ProjectRepository.get_project_by_invite_code(
             db=self.db, invite_code=invite_dto.invite_code
@@ -178,15 +359,24 @@ class ProjectService:
         if not db_project:
             raise HTTPException(status_code=404, detail="Invalid invite code")
 
-        # 사용자를 프로젝트에 멤버로 추가
-        success = ProjectRepository.add_user_to_project(
-            db=self.db, user_id=db_user.id, project_id=db_project.id, role=ProjectRole.MEMBER
-        )
+        # 사용자를 프로젝트에 멤버로 추가 (동시에 참여한 경우 유니크 제약 위반 → 이미 멤버)
+        try:
+            with unit_of_work(self.db):
+                success = ProjectRepository.add_user_to_project(
+                    db=self.db,
+                    user_id=user_id,
+                    project_id=db_project.id,
+                    role=ProjectRole.MEMBER,
+                )
+        except IntegrityError:
+            success = False
 
         if not success:
             raise HTTPException(
                 status_code=400, detail="Failed to join project or already a member"
             )
+        # 기존 토큰에 없는 프로젝트는 DB로 확인하므로 토큰 버전은 올리지 않음
+        membership_cache.invalidate(db_project.id, user_id=user_id)
 
         return {
             "message": "Successfully joined the project",
@@ -194,55 +384,18 @@ class ProjectService:
             "project_name": db_project.name,
         }
 
-    def get_project_members(self, project_id: int, username: str) -> List[dict]:
+    def get_project_members(self, context: ProjectContext) -> List[dict]:
         """프로젝트 역할 조회 서비스"""
-        db_project = ProjectRepository.get_project_by_id(self.db, project_id=project_id)
-        if not db_project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        # 사용자 확인
-        db_user = UserRepository.get_user_by_username(db=self.db, username=username)
-        if not db_user:
-            raise HTTPException(status_code=400, detail="Can't find user")
-
-        # 사용자가 프로젝트 멤버인지 확인
-        user_role = ProjectRepository.get_user_role_in_project(
-            db=self.db, user_id=db_user.id, project_id=project_id
+        return ProjectRepository.get_project_members(
+            db=self.db, project_id=context.project_id
         )
 
-        if not user_role:
-            raise HTTPException(
-                status_code=403, detail="You are not a member of this project"
-            )
-
-        return ProjectRepository.get_project_members(db=self.db, project_id=project_id)
-
-    def change_user_role(
-        self, project_id: int, role_change: RoleChange, username: str
-    ) -> dict:
+    def change_user_role(self, context: ProjectContext, role_change: RoleChange) -> dict:
         """사용자 역할 변경 서비스"""
-        # 프로젝트 존재 여부 확인
-        db_project = ProjectRepository.get_project_by_id(self.db, project_id=project_id)
-        if not db_project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        # 요청자 확인
-        db_user = UserRepository.get_user_by_username(db=self.db, username=username)
-        if not db_user:
-            raise HTTPException(status_code=400, detail="Can't find user")
-
-        # 요청자의 역할 확인
-        requester_role = ProjectRepository.get_user_role_in_project(
-            db=self.db, user_id=db_user.id, project_id=project_id
-        )
-
-        if not requester_role:
-            raise HTTPException(
-                status_code=403, detail="You are not a member of this project"
-            )
+        project_id = context.project_id
 
         # 역할 변경 권한 확인 (master, manager, moderator만 가능)
-        requester_project_role = ProjectRole(requester_role)
+        requester_project_role = context.role
         if not has_permission(requester_project_role, Permission.CHANGE_ROLE):
             raise HTTPException(
                 status_code=403, detail="You don't have permission to change roles"
@@ -267,14 +420,15 @@ class ProjectService:
             )
 
         # 역할 변경 실행
-        success = ProjectRepository.update_user_role_in_project(
-            db=self.db,
-            user_id=role_change.user_id,
-            project_id=project_id,
-            new_role=role_change.new_role.value,
-        )
+        with self._revoke_memberships(project_id, [role_change.user_id]):
+            success = ProjectRepository.update_user_role_in_project(
+                db=self.db,
+                user_id=role_change.user_id,
+                project_id=project_id,
+                new_role=role_change.new_role.value,
+            )
 
-        if not success:
-            raise HTTPException(status_code=400, detail="Failed to change user role")
+            if not success:
+                raise HTTPException(status_code=400, detail="Failed to change user role")
 
         return {"message": "User role changed successfully"}
@@ -0,0 +1,113 @@
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from typing import List
+import logging
+import time
+
+from app.core.config.settings import get_settings
+from app.core.utils.result_cache import ingest_watermark
+from app.core.utils.time_utils import get_retention_cutoff
+from app.models.project import Project
+from app.repositories import opensearch as OpenSearchRepository
+from app.repositories import project as ProjectRepository
+from app.services.rollup import RollupService
+
+settings = get_settings()
+
+
+class RetentionService:
+    """프로젝트별 로그 보존 정책을 적용하는 서비스 클래스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def run_retention(self) -> List[dict]:
+        """
+        보존 정책이 설정된 모든 프로젝트의 만료 로그를 정리합니다.
+        (백그라운드 스케줄러 전용 - 삭제 작업이 끝날 때까지 기다린 뒤 용량을 회수하고 결과를 기록)
+        """
+        reports = []
+        for project, _ in ProjectRepository.get_projects_with_retention(self.db):
+            try:
+                reports.append(self._expire_and_reclaim(project))
+            except HTTPException as e:
+                # 한 프로젝트의 실패가 다른 프로젝트 정리를 막지 않도록 함
+                logging.error(f"Retention failed for project {project.id}: {e.detail}")
+        return reports
+
+    def expire_project_logs(self, project: Project) -> dict:
+        """
+        프로젝트 하나의 보존 기간이 지난 로그와 벡터 정리 작업을 시작합니다.
+
+        Args:
+            project: 보존 정책을 적용할 프로젝트
+
+        Returns:
+            인덱스 이름과 시작된 OpenSearch 작업(task id) 목록
+        """
+        run = OpenSearchRepository.expire_project_logs(
+            index_name=project.index,
+            log_retention_days=project.setting.log_retention_days,
+            vector_retention_days=project.setting.vector_retention_days,
+            requests_per_second=settings.RETENTION_REQUESTS_PER_SECOND,
+        )
+        if project.setting.log_retention_days:
+            # 삭제되는 로그가 대시보드 집계에 계속 남지 않도록 같은 실행에서 집계도 정리
+            RollupService(self.db).expire(
+                project.id, get_retention_cutoff(project.setting.log_retention_days)
+            )
+        # 삭제된 로그가 캐시된 조회 결과로 다시 보이지 않도록 함
+        ingest_watermark.invalidate(project.id)
+        return run
+
+    def get_expiry_task(self, project: Project, task_id: str) -> dict:
+        """프로젝트 로그 정리 작업의 진행 상태를 조회합니다."""
+        status = OpenSearchRepository.get_expiry_task(project.index, task_id)
+        if status["completed"]:
+            # 작업 도중 캐시된 조회 결과도 버림
+            ingest_watermark.invalidate(project.id)
+        return status
+
+    def _wait_for_task(self, project: Project, task_id: str) -> dict:
+        """작업이 끝날 때까지 주기적으로 상태를 조회"""
+        while True:
+            status = OpenSearchRepository.get_expiry_task(project.index, task_id)
+            if status["completed"]:
+                return status
+            time.sleep(settings.RETENTION_TASK_POLL_SECONDS)
+
+    def _expire_and_reclaim(self, project: Project) -> dict:
+        """정리 작업을 시작하고 완료를 기다린 뒤 삭제된 문서의 공간을 회수"""
+        bytes_before = OpenSearchRepository.get_index_store_size(project.index)
+        run = self.expire_project_logs(project)
+
+        report = {
+            "index": project.index,
+            "deleted_docs": 0,
+            "removed_vectors": 0,
+            "bytes_reclaimed": 0,
+        }
+        for task in run["tasks"]:
+            status = self._wait_for_task(project, task["task_id"])
+            if status["failures"]:
+                logging.warning(
+                    f"Retention task {task['task_id']} for project {project.id} "
+                    f"finished with failures: {status['failures'][:3]}"
+                )
+            report["deleted_docs"] += status["deleted"]
+            report["removed_vectors"] += status["updated"]
+
+        if report["deleted_docs"] or report["removed_vectors"]:
+            OpenSearchRepository.expunge_deleted_logs(project.index)
+            ingest_watermark.invalidate(project.id)
+        if run["tasks"]:
+            bytes_after = OpenSearchRepository.get_index_store_size(project.index)
+            report["bytes_reclaimed"] = max(bytes_before - bytes_after, 0)
+
+        logging.info(
+            f"Retention run for project {project.id}: "
+            f"deleted_docs={report['deleted_docs']}, "
+            f"removed_vectors={report['removed_vectors']}, "
+            f"bytes_reclaimed={report['bytes_reclaimed']}"
+        )
+        return report
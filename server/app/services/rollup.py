@@ -0,0 +1,234 @@
+from sqlalchemy.orm import Session
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from app.core.config.settings import get_settings
+from app.core.enums.log_filter import LogTimeFilter
+from app.core.enums.rollup import RollupGranularity
+from app.core.utils.rollup_utils import (
+    ROLLUP_STEPS,
+    RollupBuffer,
+    RollupKey,
+    rollup_buffer,
+)
+from app.core.utils.result_cache import ingest_watermark
+from app.infra.database.unit_of_work import unit_of_work
+from app.core.utils.time_utils import (
+    DASHBOARD_INTERVALS,
+    floor_datetime,
+    get_dashboard_range,
+)
+from app.repositories import rollup as RollupRepository
+
+settings = get_settings()
+
+
+class RollupService:
+    """적재 시점에 누적한 로그 건수 집계(rollup)를 저장하고 조회하는 서비스 클래스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def flush(self, buffer: RollupBuffer = rollup_buffer) -> int:
+        """
+        메모리 버퍼의 분 단위 건수를 DB에 누적 저장합니다.
+
+        Returns:
+            저장한 버킷 수
+        """
+        counts = buffer.drain()
+        if not counts:
+            return 0
+        try:
+            with unit_of_work(self.db):
+                RollupRepository.upsert_rollups(
+                    self.db, self._to_rows(counts, RollupGranularity.MINUTE)
+                )
+                # 처음 집계되는 프로젝트는 이 프로세스가 세기 시작한 이후부터 집계 테이블로 조회
+                RollupRepository.mark_rollup_since(
+                    self.db, {key[0] for key in counts}, buffer.covered_since()
+                )
+        except Exception:
+            # 저장 실패 시 (unit_of_work가 rollback) 다음 주기에 다시 저장하도록 버퍼에 되돌림
+            buffer.restore(counts)
+            raise
+        # 집계 테이블 기반 대시보드 캐시 결과 무효화
+        for project_id, bucket_start, *_ in counts:
+            ingest_watermark.mark(project_id, bucket_start)
+        return len(counts)
+
+    def compact(self, now: datetime = None) -> Dict[str, int]:
+        """
+        닫힌 버킷을 상위 단위로 합칩니다.
+
+        - 분 단위: 현재 시간 이전 버킷은 시간 단위로
+        - 시간 단위: 대시보드 DAY 조회 범위(최근 24시간)를 벗어난 버킷은 일 단위로
+
+        Returns:
+            단위별로 합쳐진 행 수
+        """
+        now = now or datetime.now()
+        hour_start = floor_datetime(now, ROLLUP_STEPS[RollupGranularity.HOUR])
+        day_start = floor_datetime(now, ROLLUP_STEPS[RollupGranularity.DAY])
+
+        return {
+            RollupGranularity.HOUR.value: self._compact(
+                RollupGranularity.MINUTE, RollupGranularity.HOUR, hour_start
+            ),
+            RollupGranularity.DAY.value: self._compact(
+                RollupGranularity.HOUR,
+                RollupGranularity.DAY,
+                day_start - timedelta(days=1),
+            ),
+        }
+
+    def heartbeat(self, buffer: RollupBuffer = rollup_buffer, now: datetime = None) -> int:
+        """
+        이 프로세스가 집계 중임을 기록하고, 저장 기록이 끊긴 (비정상 종료로 저장하지 못한 건수가 있을 수 있는)
+        프로세스가 있으면 모든 프로젝트의 집계 시작 시각을 다음 분으로 앞당깁니다.
+        (살아 있는 프로세스는 그 이후의 적재를 모두 세므로 그 시각부터 다시 빠짐없음)
+
+        Returns:
+            비정상 종료로 판단한 프로세스 수
+        """
+        now = now or datetime.now()
+        step = ROLLUP_STEPS[RollupGranularity.MINUTE]
+        with unit_of_work(self.db):
+            RollupRepository.touch_rollup_writer(self.db, buffer.writer_id, now)
+            stale = RollupRepository.delete_stale_rollup_writers(
+                self.db, now - timedelta(seconds=settings.ROLLUP_WRITER_TIMEOUT_SECONDS)
+            )
+            if stale:
+                RollupRepository.advance_rollup_since(self.db, floor_datetime(now, step) + step)
+        if stale:
+            logging.warning(
+                f"{stale} rollup writer(s) stopped without a final flush; "
+                "dashboards fall back to OpenSearch for ranges before now"
+            )
+        return stale
+
+    def release(self, buffer: RollupBuffer = rollup_buffer) -> None:
+        """정상 종료 - 남은 건수를 모두 저장한 뒤 집계 프로세스 등록 삭제"""
+        RollupRepository.delete_rollup_writer(self.db, buffer.writer_id)
+
+    def stop_counting(self) -> int:
+        """
+        집계를 끈 프로세스는 적재 건수를 세지 않으므로 모든 프로젝트의 집계 시작 시각을 지웁니다.
+        (다시 켜면 첫 저장 때 그 프로세스가 세기 시작한 시각부터 기록)
+        """
+        return RollupRepository.clear_rollup_since(self.db)
+
+    def expire(self, project_id: int, cutoff: datetime) -> int:
+        """
+        보존 기간이 지나 원본 로그가 삭제되는 기간의 집계를 정리합니다.
+        집계 시작 시각을 cutoff로 앞당겨 그 이전이 섞인 기간은 OpenSearch로 조회하고,
+        cutoff 이전 날의 집계 행은 더 이상 읽히지 않으므로 삭제합니다.
+
+        Returns:
+            삭제한 집계 행 수
+        """
+        with unit_of_work(self.db):
+            RollupRepository.advance_rollup_since(self.db, cutoff, [project_id])
+            return RollupRepository.delete_project_rollups_before(
+                self.db, project_id, floor_datetime(cutoff, ROLLUP_STEPS[RollupGranularity.DAY])
+            )
+
+    def covers(self, project_id: int, start: datetime) -> bool:
+        """
+        start 이후 로그가 집계 테이블에 빠짐없이 있는지 여부
+        (집계를 켜기 전에 적재된 로그는 집계 테이블에 없으므로 그 기간은 원본 로그로 조회해야 함)
+        """
+        since = RollupRepository.get_rollup_since(self.db, project_id)
+        return since is not None and since <= start
+
+    def get_dashboard(self, project_id: int, log_time: LogTimeFilter) -> dict:
+        """
+        집계 테이블로 대시보드 시계열을 만듭니다.
+        (원본 로그 양과 관계없이 버킷 수 x 레벨/키워드/호스트 조합 수에 비례)
+
+        Args:
+            project_id: 프로젝트 ID
+            log_time: 조회 기간
+
+        Returns:
+            LogDashboard 형식의 집계 결과
+        """
+        start_time, end_time, interval = get_dashboard_range(log_time)
+        _, step, _ = DASHBOARD_INTERVALS[log_time]
+        start = datetime.fromisoformat(start_time)
+        end = datetime.fromisoformat(end_time)
+        bucket_count = (end - start) // step
+
+        rows = RollupRepository.get_project_rollups(self.db, project_id, start, end)
+
+        total = 0
+        series: Dict[str, List[int]] = {}
+        levels: Counter = Counter()
+        keywords: Counter = Counter()
+        for bucket_start, log_level, keyword, log_count in rows:
+            total += log_count
+            if log_level:
+                i = (floor_datetime(bucket_start, step) - start) // step
+                series.setdefault(log_level, [0] * bucket_count)[i] += log_count
+                levels[log_level] += log_count
+            if keyword:
+                keywords[keyword] += log_count
+
+        return {
+            "start_time": start_time,
+            "end_time": end_time,
+            "interval": interval,
+            "total": total,
+            "timestamps": [
+                (start + i * step).isoformat() for i in range(bucket_count)
+            ],
+            "series": series,
+            "levels": dict(levels),
+            "keywords": dict(keywords.most_common(20)),
+        }
+
+    def _compact(
+        self,
+        source: RollupGranularity,
+        target: RollupGranularity,
+        before: datetime,
+    ) -> int:
+        # 잠근 행을 옮기고 commit할 때까지 한 트랜잭션 (실패하면 잠금과 함께 모두 rollback)
+        with unit_of_work(self.db):
+            rows = RollupRepository.get_rollups_before(self.db, source, before)
+            if not rows:
+                return 0
+
+            counts: Counter = Counter()
+            for row in rows:
+                key = (
+                    row.project_id,
+                    floor_datetime(row.bucket_start, ROLLUP_STEPS[target]),
+                    row.log_level,
+                    row.keyword,
+                    row.host,
+                )
+                counts[key] += row.log_count
+
+            RollupRepository.move_rollups(
+                self.db, self._to_rows(counts, target), [row.id for row in rows]
+            )
+        return len(rows)
+
+    def _to_rows(
+        self, counts: Dict[RollupKey, int], granularity: RollupGranularity
+    ) -> List[dict]:
+        return [
+            {
+                "project_id": project_id,
+                "granularity": granularity.value,
+                "bucket_start": bucket_start,
+                "log_level": log_level,
+                "keyword": keyword,
+                "host": host,
+                "log_count": log_count,
+            }
+            for (project_id, bucket_start, log_level, keyword, host), log_count in counts.items()
+        ]
@@ -1,16 +1,40 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+import anyio
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from typing import List
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
 from langchain_core.prompts import PromptTemplate
 from langchain_core.messages import HumanMessage
 
 from app.core.llm.base import LLMFactory
-from app.core.llm.prompts import TROUBLESHOOTING_TEMPLATE, TroubleContent
+from app.core.llm.prompts import (
+    TROUBLESHOOTING_TEMPLATE,
+    TROUBLESHOOTING_STREAM_TEMPLATE,
+    TroubleContent,
+)
+from app.core.utils.log_context_utils import TROUBLE_LOG_FIELDS
+from app.core.utils.sse_utils import format_sse
+from app.core.utils.count_cache import trouble_count_cache
+from app.core.utils.cursor_utils import decode_keyset_cursor, encode_keyset_cursor
+from app.core.config.settings import get_settings
+from app.core.enums.trouble_status import TroubleStatus
+from app.infra.database.unit_of_work import unit_of_work
 from app.repositories.project import get_project_by_id
 from app.repositories.opensearch import get_logs_by_ids
 from app.repositories import trouble as trouble_repo
-from app.repositories import user as user_repo
+from app.repositories.trouble import trouble_text_relevance
+from app.services.trouble_context import (
+    TroubleContextBuilder,
+    TroubleLogContext,
+    input_tokens,
+    message_text,
+)
+from app.tasks.trouble_count import submit_trouble_count_refresh
 from app.schemas.trouble import (
     TroubleCreate,
     TroubleUpdate,
@@ -19,8 +43,11 @@ from app.schemas.trouble import (
     TroubleSummary,
     TroubleWithLogs,
 )
+from app.schemas.trouble import Trouble as TroubleResponse
+from app.schemas.project import ProjectContext
 from app.models.trouble import Trouble
-from app.core.utils.log_utils import remove_vector_from_logs
+
+settings = get_settings()
 
 
 class TroubleService:
@@ -29,84 +56,44 @@ class TroubleService:
     def __init__(self, db: Session):
         self.db = db
         self.llm = LLMFactory.create_troubleshooting_model()
+        self.context_builder = TroubleContextBuilder()
 
     def create_trouble(
-        self, create_trouble_dto: TroubleCreate, username: str
+        self, create_trouble_dto: TroubleCreate, context: ProjectContext
     ) -> Trouble:
         """
         새로운 trouble을 생성합니다.
 
         Args:
             create_trouble_dto: 생성할 trouble 데이터
-            username: 생성자 아이디 (인증된 사용자)
+            context: 요청자의 프로젝트 멤버십 (프로젝트 존재와 멤버 확인은 요청 의존성에서 완료)
 
         Returns:
-            생성된 Trouble 객체
-
-        Raises:
-            HTTPException: 프로젝트가 존재하지 않거나 권한이 없는 경우
+            생성된 Trouble 객체 (status=pending, 내용은 백그라운드 작업이 채움)
         """
-        # 1. 사용자 정보 조회
-        user = user_repo.get_user_by_username(self.db, username)
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        
-        # 2. 프로젝트 존재 여부 및 접근 권한 확인
-        project = get_project_by_id(self.db, create_trouble_dto.project_id)
-        if not project:
-            raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-
-        # 사용자가 해당 프로젝트에 접근 권한이 있는지 확인
-        if not trouble_repo.check_user_project_access(
-            self.db, create_trouble_dto.project_id, user.id
-        ):
-            raise HTTPException(
-                status_code=403, detail="프로젝트에 접근 권한이 없습니다"
-            )
-
-        # 2. 로그 데이터 조회 및 AI 분석
-        try:
-            # 연관된 로그들의 실제 내용 가져오기
-            log_contents = get_logs_by_ids(
-                index_name=project.index, ids=create_trouble_dto.related_logs
-            )
-            log_contents = remove_vector_from_logs(log_contents)
-            # AI를 사용해 트러블슈팅 내용 생성
-            ai_content = self._gen_ai_content(
-                create_trouble_dto.user_query, log_contents, project.language.value
-            )
-
-        except Exception as e:
-            # 로그 조회나 AI 분석 실패 시 기본 내용으로 대체
-            ai_content = TroubleContent(
-                title=f"사용자 질의에 대한 분석을 진행 중입니다: {create_trouble_dto.user_query}",
-                content=f"사용자 질의에 대한 분석을 진행 중입니다: {create_trouble_dto.user_query}",
+        # trouble을 대기 상태로 저장하고 연관된 로그 ID들을 연결 (한 트랜잭션, AI 분석은 백그라운드 작업에서 진행)
+        with unit_of_work(self.db):
+            trouble = trouble_repo.create_trouble(
+                self.db,
+                create_trouble_dto,
+                context.user_id,
+                create_trouble_dto.user_query,
+                "",
             )
-
-        # 3. DB에 trouble 저장
-        trouble = trouble_repo.create_trouble(
-            self.db,
-            create_trouble_dto,
-            user.id,
-            ai_content.title,
-            ai_content.content,
-        )
-
-        # 4. 연관된 로그 ID들 저장
-        if create_trouble_dto.related_logs:
-            trouble_repo.save_trouble_logs(
+            trouble_repo.add_trouble_logs(
                 self.db, trouble.id, create_trouble_dto.related_logs
             )
 
+        trouble_count_cache.invalidate_project(context.project_id)
         return trouble
 
-    def get_trouble_by_id(self, trouble_id: int, username: str) -> TroubleWithLogs:
+    def get_trouble_by_id(self, trouble_id: int, user_id: int) -> TroubleWithLogs:
         """
         ID로 trouble을 조회합니다.
 
         Args:
             trouble_id: 조회할 trouble ID
-            username: 요청한 사용자 아이디 (권한 확인용)
+            user_id: 요청한 사용자 ID (권한 확인용)
 
         Returns:
             조회된 TroubleWithLogs 객체
@@ -114,37 +101,38 @@ class TroubleService:
         Raises:
             HTTPException: trouble이 존재하지 않거나 접근 권한이 없는 경우
         """
-        # 1. 사용자 정보 조회
-        user = user_repo.get_user_by_username(self.db, username)
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        
-        # 2. trouble 존재 여부 확인
+        # 1. trouble 존재 여부 확인
         trouble = trouble_repo.get_trouble_by_id(self.db, trouble_id)
         if not trouble:
             raise HTTPException(
                 status_code=404, detail="요청한 트러블슈팅을 찾을 수 없습니다"
             )
 
-        # 3. 접근 권한 확인 (생성자이거나 공유된 trouble만 조회 가능)
-        if not self._check_trouble_access(trouble, user.id):
+        # 2. 접근 권한 확인 (생성자이거나 공유된 trouble만 조회 가능)
+        if not self._check_trouble_access(trouble, user_id):
             raise HTTPException(
                 status_code=403, detail="이 트러블슈팅에 접근할 권한이 없습니다"
             )
 
-        # 3. 연관된 로그 목록 조회
+        # 3. 연관된 로그 ID와 함께 반환
+        return self._to_trouble_with_logs(trouble)
+
+    @staticmethod
+    def _to_trouble_with_logs(trouble: Trouble) -> TroubleWithLogs:
+        """trouble과 연관 로그 ID 목록으로 응답을 구성합니다. (logs는 조회 시 함께 로딩됨)"""
+        # 1. 연관된 로그 목록 조회
         trouble_logs = trouble.logs
         if not trouble_logs:
             return TroubleWithLogs(trouble=trouble, logs=[])
 
-        # 4. 로그 데이터 가져오기
+        # 2. 로그 데이터 가져오기
         log_ids = [log.log_id for log in trouble_logs]
 
-        # 5. trouble 반환
+        # 3. trouble 반환
         return TroubleWithLogs(trouble=trouble, logs=log_ids)
 
     def update_trouble(
-        self, trouble_id: int, trouble_update_dto: TroubleUpdate, username: str
+        self, trouble_id: int, trouble_update_dto: TroubleUpdate, user_id: int
     ) -> Trouble:
         """
         기존 trouble을 업데이트합니다.
@@ -152,7 +140,7 @@ class TroubleService:
         Args:
             trouble_id: 업데이트할 trouble ID
             trouble_update: 업데이트할 데이터
-            username: 요청한 사용자 아이디 (권한 확인용)
+            user_id: 요청한 사용자 ID (권한 확인용)
 
         Returns:
             업데이트된 Trouble 객체
@@ -160,120 +148,381 @@ class TroubleService:
         Raises:
             HTTPException: trouble이 존재하지 않거나 수정 권한이 없는 경우
         """
-        # 1. 사용자 정보 조회
-        user = user_repo.get_user_by_username(self.db, username)
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        
-        # 2. trouble 존재 여부 확인
+        # 1. trouble 존재 여부 확인
         trouble = trouble_repo.get_trouble_by_id(self.db, trouble_id)
         if not trouble:
             raise HTTPException(
                 status_code=404, detail="요청한 트러블슈팅을 찾을 수 없습니다"
             )
 
-        # 3. 수정 권한 확인 (생성자만 수정 가능)
-        if trouble.created_by != user.id:
+        # 2. 수정 권한 확인 (생성자만 수정 가능)
+        if trouble.created_by != user_id:
             raise HTTPException(
                 status_code=403,
                 detail="이 트러블슈팅을 수정할 권한이 없습니다. 생성자만 수정할 수 있습니다",
             )
 
-        # 4. trouble 업데이트
+        # 3. trouble 업데이트
         updated_trouble = trouble_repo.update_trouble(
             self.db, trouble, trouble_update_dto
         )
+        # 공유 여부나 제목이 바뀌면 목록 필터별 개수도 바뀜
+        trouble_count_cache.invalidate_project(trouble.project_id)
 
         return updated_trouble
 
-    def delete_trouble(self, trouble_id: int, username: str) -> None:
+    def regenerate_trouble(self, trouble_id: int, user_id: int) -> Trouble:
+        """
+        trouble의 AI 분석을 처음부터 다시 시도하도록 대기 상태로 되돌립니다.
+
+        Args:
+            trouble_id: 다시 분석할 trouble ID
+            user_id: 요청한 사용자 ID (권한 확인용)
+
+        Returns:
+            대기 상태로 초기화된 Trouble 객체
+
+        Raises:
+            HTTPException: trouble이 존재하지 않거나, 권한이 없거나, 분석이 진행 중인 경우
+        """
+        trouble = trouble_repo.get_trouble_by_id(self.db, trouble_id)
+        if not trouble:
+            raise HTTPException(
+                status_code=404, detail="요청한 트러블슈팅을 찾을 수 없습니다"
+            )
+
+        if trouble.created_by != user_id:
+            raise HTTPException(
+                status_code=403,
+                detail="이 트러블슈팅을 다시 분석할 권한이 없습니다. 생성자만 요청할 수 있습니다",
+            )
+
+        if trouble.status in (TroubleStatus.PENDING, TroubleStatus.RUNNING):
+            raise HTTPException(
+                status_code=409, detail="이미 AI 분석이 진행 중인 트러블슈팅입니다"
+            )
+
+        return trouble_repo.reset_trouble_generation(self.db, trouble)
+
+    def generate_trouble_content(self, trouble_id: int) -> Optional[TroubleStatus]:
+        """
+        대기 중인 trouble의 AI 분석을 한 번 시도하고 결과를 저장합니다.
+        (백그라운드 작업에서 호출)
+
+        Args:
+            trouble_id: 분석할 trouble ID
+
+        Returns:
+            시도 후 trouble 상태. 실패했지만 재시도 횟수가 남았으면 PENDING,
+            trouble이 삭제되었거나 대기 상태가 아니어서 선점하지 못한 경우 None
+        """
+        # 대기 중인 trouble만 선점 (스트리밍 요청이나 다른 워커가 생성 중이면 건너뜀)
+        trouble = trouble_repo.claim_trouble_generation(self.db, trouble_id)
+        if not trouble:
+            return None
+
+        started = time.perf_counter()
+        try:
+            project = get_project_by_id(self.db, trouble.project_id)
+            # 연관된 로그들의 프롬프트에 필요한 필드만 가져와 토큰 예산 안의 컨텍스트로 구성
+            hits = get_logs_by_ids(
+                index_name=project.index,
+                ids=[log.log_id for log in trouble.logs],
+                fields=TROUBLE_LOG_FIELDS,
+            )
+            context = self.context_builder.build(
+                trouble.user_query, hits, project.language.value
+            )
+            # AI를 사용해 트러블슈팅 내용 생성
+            ai_content, prompt_tokens = self._gen_ai_content(
+                trouble.user_query, context.text, project.language.value
+            )
+        except Exception as e:
+            retry = trouble.attempts < settings.TROUBLE_JOB_MAX_ATTEMPTS
+            logging.warning(
+                f"Trouble {trouble_id} generation attempt {trouble.attempts} failed: {e}"
+            )
+            trouble = trouble_repo.fail_trouble_generation(
+                self.db, trouble, str(e) or type(e).__name__, retry
+            )
+            return trouble.status
+
+        prompt_tokens += context.summary_prompt_tokens
+        generation_ms = round((time.perf_counter() - started) * 1000)
+        self._log_usage(trouble_id, context, prompt_tokens, generation_ms)
+        trouble = trouble_repo.complete_trouble_generation(
+            self.db,
+            trouble,
+            ai_content.title,
+            ai_content.content,
+            prompt_tokens=prompt_tokens,
+            generation_ms=generation_ms,
+        )
+        return trouble.status
+
+    def check_trouble_stream(self, trouble_id: int, user_id: int) -> Trouble:
+        """
+        trouble의 AI 분석 스트리밍을 시작할 수 있는지 확인합니다.
+
+        Args:
+            trouble_id: 스트리밍할 trouble ID
+            user_id: 요청한 사용자 ID (권한 확인용)
+
+        Returns:
+            스트리밍할 Trouble 객체 (대기 중이거나 이미 완료된 trouble)
+
+        Raises:
+            HTTPException: trouble이 존재하지 않거나, 권한이 없거나, 다른 작업이 생성 중인 경우
+        """
+        trouble = trouble_repo.get_trouble_by_id(self.db, trouble_id)
+        if not trouble:
+            raise HTTPException(
+                status_code=404, detail="요청한 트러블슈팅을 찾을 수 없습니다"
+            )
+
+        if trouble.created_by != user_id:
+            raise HTTPException(
+                status_code=403,
+                detail="이 트러블슈팅의 분석을 요청할 권한이 없습니다. 생성자만 요청할 수 있습니다",
+            )
+
+        if trouble.status not in (TroubleStatus.PENDING, TroubleStatus.COMPLETED):
+            raise HTTPException(
+                status_code=409,
+                detail="다른 작업에서 AI 분석이 진행 중이거나 실패한 트러블슈팅입니다",
+            )
+        return trouble
+
+    async def astream_trouble_events(self, trouble_id: int) -> AsyncIterator[str]:
+        """
+        대기 중인 trouble의 생성을 선점하고 AI 분석 내용을 토큰 단위 SSE 이벤트로 생성합니다.
+        스트림이 끝나면 전체 텍스트를 troubles 행에 저장합니다. (이미 완료된 trouble은 저장된 내용을 다시 보냄)
+
+        이벤트:
+            token: {"text": 생성된 텍스트 조각}
+            done: 저장된 Trouble
+            error: {"detail": 실패 사유, "status": 저장된 상태}
+
+        Args:
+            trouble_id: 스트리밍할 trouble ID
+
+        Yields:
+            SSE 메시지 문자열
+        """
+        trouble = await asyncio.to_thread(
+            trouble_repo.get_trouble_by_id, self.db, trouble_id
+        )
+        if not trouble:
+            yield format_sse("error", {"detail": "요청한 트러블슈팅을 찾을 수 없습니다"})
+            return
+
+        if trouble.status == TroubleStatus.COMPLETED:
+            yield format_sse("token", {"text": trouble.content})
+            yield format_sse("done", self._to_response(trouble))
+            return
+
+        # 백그라운드 워커와 같은 trouble을 중복 생성하지 않도록 선점
+        trouble = await asyncio.to_thread(
+            trouble_repo.claim_trouble_generation, self.db, trouble_id
+        )
+        if not trouble:
+            yield format_sse(
+                "error", {"detail": "다른 작업에서 AI 분석이 진행 중인 트러블슈팅입니다"}
+            )
+            return
+
+        started = time.perf_counter()
+        first_token_ms = None
+        chunks = []
+        prompt_tokens = None
+        try:
+            project = await asyncio.to_thread(
+                get_project_by_id, self.db, trouble.project_id
+            )
+            hits = await asyncio.to_thread(
+                get_logs_by_ids,
+                index_name=project.index,
+                ids=[log.log_id for log in trouble.logs],
+                fields=TROUBLE_LOG_FIELDS,
+            )
+            context = await self.context_builder.abuild(
+                trouble.user_query, hits, project.language.value
+            )
+            formatted_prompt = self._format_prompt(
+                TROUBLESHOOTING_STREAM_TEMPLATE,
+                trouble.user_query,
+                context.text,
+                project.language.value,
+            )
+            async for chunk in self.llm.astream([HumanMessage(content=formatted_prompt)]):
+                # 사용량은 제공업체에 따라 마지막 chunk에만 실려 옴
+                if getattr(chunk, "usage_metadata", None):
+                    prompt_tokens = input_tokens(chunk, formatted_prompt)
+                text = self._chunk_text(chunk)
+                if not text:
+                    continue
+                if first_token_ms is None:
+                    first_token_ms = round((time.perf_counter() - started) * 1000)
+                chunks.append(text)
+                yield format_sse("token", {"text": text})
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트 연결이 끊기면 대기 상태로 되돌려 백그라운드 작업이 이어서 생성
+            # (취소된 상태라 취소를 막은 채 DB 작업은 스레드풀에서 실행해 이벤트 루프를 막지 않음)
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(
+                    trouble_repo.fail_trouble_generation,
+                    self.db,
+                    trouble,
+                    "스트리밍 연결이 끊어졌습니다",
+                    True,
+                )
+            raise
+        except Exception as e:
+            retry = trouble.attempts < settings.TROUBLE_JOB_MAX_ATTEMPTS
+            logging.warning(f"Trouble {trouble_id} streaming failed: {e}")
+            trouble = await asyncio.to_thread(
+                trouble_repo.fail_trouble_generation,
+                self.db,
+                trouble,
+                str(e) or type(e).__name__,
+                retry,
+            )
+            yield format_sse(
+                "error",
+                {"detail": "AI 분석 스트리밍에 실패했습니다", "status": trouble.status.value},
+            )
+            return
+
+        title, content = self._split_streamed_content("".join(chunks), trouble.user_query)
+        if prompt_tokens is None:
+            prompt_tokens = input_tokens(None, formatted_prompt)
+        prompt_tokens += context.summary_prompt_tokens
+        generation_ms = round((time.perf_counter() - started) * 1000)
+        trouble = await asyncio.to_thread(
+            trouble_repo.complete_trouble_generation,
+            self.db,
+            trouble,
+            title,
+            content,
+            prompt_tokens=prompt_tokens,
+            generation_ms=generation_ms,
+        )
+        logging.info(f"Trouble {trouble_id} streamed: first token {first_token_ms} ms")
+        self._log_usage(trouble_id, context, prompt_tokens, generation_ms)
+        yield format_sse("done", self._to_response(trouble))
+
+    def delete_trouble(self, trouble_id: int, user_id: int) -> None:
         """
         trouble을 삭제합니다.
 
         Args:
             trouble_id: 삭제할 trouble ID
-            username: 요청한 사용자 아이디 (권한 확인용)
+            user_id: 요청한 사용자 ID (권한 확인용)
 
         Raises:
             HTTPException: trouble이 존재하지 않거나 삭제 권한이 없는 경우
         """
-        # 1. 사용자 정보 조회
-        user = user_repo.get_user_by_username(self.db, username)
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        
-        # 2. trouble 존재 여부 확인
+        # 1. trouble 존재 여부 확인
         trouble = trouble_repo.get_trouble_by_id(self.db, trouble_id)
         if not trouble:
             raise HTTPException(
                 status_code=404, detail="요청한 트러블슈팅을 찾을 수 없습니다"
             )
 
-        # 3. 삭제 권한 확인 (생성자만 삭제 가능)
-        if trouble.created_by != user.id:
+        # 2. 삭제 권한 확인 (생성자만 삭제 가능)
+        if trouble.created_by != user_id:
             raise HTTPException(
                 status_code=403,
                 detail="이 트러블슈팅을 삭제할 권한이 없습니다. 생성자만 삭제할 수 있습니다",
             )
 
-        # 4. trouble 삭제 (연관된 trouble_logs도 cascade로 함께 삭제됨)
+        # 3. trouble 삭제 (연관된 trouble_logs도 cascade로 함께 삭제됨)
+        project_id = trouble.project_id
         trouble_repo.delete_trouble(self.db, trouble)
+        trouble_count_cache.invalidate_project(project_id)
 
     def get_project_troubles(
-        self, project_id: int, query_params: TroubleListQuery, username: str
+        self, context: ProjectContext, query_params: TroubleListQuery
     ) -> TroubleListResponse:
         """
         프로젝트의 trouble 목록을 페이지네이션과 함께 조회합니다.
 
         Args:
-            project_id: 프로젝트 ID
+            context: 요청자의 프로젝트 멤버십 (멤버 확인은 요청 의존성에서 완료)
             query_params: 페이지네이션 및 필터 파라미터
-            username: 요청한 사용자 아이디 (권한 확인용)
 
         Returns:
-            페이지네이션된 trouble 목록
-
-        Raises:
-            HTTPException: 프로젝트가 존재하지 않거나 접근 권한이 없는 경우
+            페이지네이션된 trouble 목록 (cursor가 있으면 keyset 페이지)
         """
-        # 1. 사용자 정보 조회
-        user = user_repo.get_user_by_username(self.db, username)
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-        
-        # 2. 프로젝트 존재 여부 확인
-        project = get_project_by_id(self.db, project_id)
-        if not project:
-            raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-
-        # 3. 페이지네이션된 trouble 목록 조회
-        troubles, total = trouble_repo.get_project_troubles_paginated(
-            self.db, project_id, query_params, user.id
+        # 1. 한 페이지 조회 (다음 페이지 확인용으로 한 행 더)
+        troubles = trouble_repo.get_project_troubles_page(
+            self.db,
+            context.project_id,
+            query_params,
+            context.user_id,
+            self._decode_cursor(query_params),
         )
 
-        # 4. 응답 데이터 구성
-        # trouble 목록을 TroubleSummary로 변환 (필요한 경우 추가 정보 포함)
-        trouble_summaries = []
-        for trouble in troubles:
-            # 생성자 이메일 조회 (선택적)
-            creator_username = trouble_repo.get_creator_username(self.db, trouble.id)
-
-            # 연관된 로그 개수 조회 (선택적)
-            logs_count = (
-                len(trouble.trouble_logs) if hasattr(trouble, "trouble_logs") else 0
+        # 2. 전체 개수 (캐시, 없을 때만 바로 셈)
+        key = self._count_key(context, query_params)
+        total, refresh = trouble_count_cache.get(key)
+        if total is None:
+            generation = trouble_count_cache.generation(context.project_id)
+            total = trouble_repo.count_project_troubles(
+                self.db, context.project_id, query_params, context.user_id
             )
-
-            summary = TroubleSummary(
-                id=trouble.id,
-                report_name=trouble.report_name,
-                created_at=trouble.created_at,
-                is_shared=trouble.is_shared,
-                creator_username=creator_username,
-                logs_count=logs_count,
+            trouble_count_cache.put(key, total, generation)
+        elif refresh:
+            submit_trouble_count_refresh(key, context.project_id, query_params, context.user_id)
+
+        # 3. 응답 데이터 구성
+        return self._to_list_response(troubles, total, query_params)
+
+    @staticmethod
+    def _decode_cursor(query_params: TroubleListQuery) -> Optional[Tuple[datetime, int]]:
+        """목록 커서를 (created_at, id)로 변환합니다. (형식이 잘못되었거나 관련도순 검색이면 400)"""
+        if not query_params.cursor:
+            return None
+        if trouble_text_relevance(query_params.search) is not None:
+            raise HTTPException(
+                status_code=400, detail="검색 결과는 관련도순이라 cursor 대신 page로 조회합니다"
             )
-            trouble_summaries.append(summary)
+        try:
+            return decode_keyset_cursor(query_params.cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    def _count_key(context: ProjectContext, query_params: TroubleListQuery) -> Tuple:
+        """전체 개수 캐시 키 (공유되지 않은 trouble은 생성자만 보므로 사용자별)"""
+        return (
+            context.project_id,
+            context.user_id,
+            query_params.search,
+            query_params.is_shared,
+            query_params.created_by,
+        )
 
-        # 5. 총 페이지 수 계산
+    @staticmethod
+    def _to_list_response(
+        troubles: List[Any], total: int, query_params: TroubleListQuery
+    ) -> TroubleListResponse:
+        """요약 행(페이지 크기 + 다음 페이지 확인용 1행)과 전체 개수로 페이지 응답을 구성합니다."""
+        # 1. 다음 페이지 커서 (마지막으로 보여주는 행 기준, 관련도순 검색 결과는 page로만 이동)
+        has_next = len(troubles) > query_params.size
+        troubles = troubles[: query_params.size]
+        next_cursor = (
+            encode_keyset_cursor(troubles[-1].created_at, troubles[-1].id)
+            if has_next and trouble_text_relevance(query_params.search) is None
+            else None
+        )
+
+        # 2. 요약 변환 (생성자 username과 로그 개수는 목록 쿼리에 포함됨)
+        trouble_summaries = [
+            TroubleSummary.model_validate(trouble) for trouble in troubles
+        ]
+
+        # 3. 총 페이지 수 계산
         total_pages = (total + query_params.size - 1) // query_params.size
 
         return TroubleListResponse(
@@ -282,9 +531,11 @@ class TroubleService:
             page=query_params.page,
             size=query_params.size,
             pages=total_pages,
+            next_cursor=next_cursor,
         )
 
-    def _check_trouble_access(self, trouble: Trouble, user_id: int) -> bool:
+    @staticmethod
+    def _check_trouble_access(trouble: Trouble, user_id: int) -> bool:
         """
         사용자가 해당 trouble에 접근 권한이 있는지 확인합니다.
         (생성자이거나 공유된 trouble인 경우)
@@ -308,33 +559,65 @@ class TroubleService:
         return False
 
     def _gen_ai_content(
-        self, user_query: str, log_contents: List[str], language: str
-    ) -> TroubleContent:
+        self, user_query: str, log_context: str, language: str
+    ) -> Tuple[TroubleContent, int]:
         """
         AI로 트러블슈팅 내용을 생성합니다.
 
         Args:
             user_query: 사용자 질의
-            log_contents: 연관된 로그 내용들
+            log_context: 토큰 예산 안으로 구성한 연관 로그 컨텍스트
 
         Returns:
-            AI가 생성한 트러블슈팅 분석 내용
+            AI가 생성한 트러블슈팅 분석 내용과 입력 토큰 수
         """
+        formatted_prompt = self._format_prompt(
+            TROUBLESHOOTING_TEMPLATE, user_query, log_context, language
+        )
+
+        # 사용량을 함께 받기 위해 원본 응답 포함 (파싱 실패는 예외로 처리해 재시도)
+        chain = self.llm.with_structured_output(TroubleContent, include_raw=True)
+        result = chain.invoke([HumanMessage(content=formatted_prompt)])
+        if result["parsing_error"] is not None:
+            raise result["parsing_error"]
+        return result["parsed"], input_tokens(result["raw"], formatted_prompt)
+
+    def _format_prompt(
+        self, template: str, user_query: str, log_context: str, language: str
+    ) -> str:
+        """트러블슈팅 프롬프트에 사용자 질의와 로그 컨텍스트를 채웁니다."""
         prompt = PromptTemplate(
-            template=TROUBLESHOOTING_TEMPLATE,
+            template=template,
             input_variables=["user_query", "log_contents", "language"],
         )
-
-        # 로그 내용들을 하나의 문자열로 결합
-        log_contents_str = "\n".join(
-            f"<log_content>\n{log_content}\n</log_content>\n"
-            for log_content in log_contents
+        return prompt.format(
+            user_query=user_query, log_contents=log_context, language=language
         )
 
-        # 프롬프트 포맷팅 및 AI 호출
-        formatted_prompt = prompt.format(
-            user_query=user_query, log_contents=log_contents_str, language=language
+    def _log_usage(
+        self, trouble_id: int, context: TroubleLogContext, prompt_tokens: int, generation_ms: int
+    ) -> None:
+        """trouble별 AI 분석 컨텍스트 크기, 입력 토큰 수, 소요 시간 기록"""
+        logging.info(
+            f"Trouble {trouble_id} generated: {context.log_count} logs -> "
+            f"{context.line_count} lines ({self.context_builder.mode.value}), "
+            f"{context.summarized_chunks} summarized chunks, "
+            f"{prompt_tokens} prompt tokens, {generation_ms} ms"
         )
 
-        chain = self.llm.with_structured_output(TroubleContent)
-        return chain.invoke([HumanMessage(content=formatted_prompt)])
+    def _chunk_text(self, chunk: Any) -> str:
+        """스트리밍 chunk에서 텍스트만 꺼냅니다."""
+        return message_text(chunk)
+
+    def _split_streamed_content(self, text: str, fallback_title: str) -> Tuple[str, str]:
+        """스트리밍으로 받은 "# 제목" 첫 줄과 본문을 나눕니다."""
+        text = text.strip()
+        first_line, _, rest = text.partition("\n")
+        if first_line.startswith("#"):
+            title = first_line.lstrip("#").strip() or fallback_title
+            return title[:1000], rest.strip()[:10000]
+        return fallback_title[:1000], text[:10000]
+
+    def _to_response(self, trouble: Trouble) -> dict:
+        """SSE 이벤트로 보낼 Trouble 응답 데이터"""
+        return TroubleResponse.model_validate(trouble).model_dump(mode="json")
@@ -0,0 +1,171 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from langchain_core.messages import HumanMessage
+from langchain_core.prompts import PromptTemplate
+
+from app.core.config.settings import get_settings
+from app.core.enums.LLMProvider import LLMProvider
+from app.core.enums.trouble_context_mode import TroubleContextMode
+from app.core.llm.base import LLMFactory
+from app.core.llm.prompts import TROUBLE_LOG_SUMMARY_TEMPLATE
+from app.core.utils.log_context_utils import (
+    estimate_tokens,
+    format_log_lines,
+    pack_lines,
+    truncate_to_tokens,
+)
+
+settings = get_settings()
+
+# 제공업체별 기본 로그 컨텍스트 토큰 예산 (프롬프트 템플릿과 응답을 뺀 로그 부분)
+PROVIDER_TOKEN_BUDGETS = {
+    LLMProvider.OPENAI: 16000,
+    LLMProvider.ANTHROPIC: 16000,
+    LLMProvider.OLLAMA: 1500,  # Ollama 기본 컨텍스트 창 2048 토큰
+    LLMProvider.HUGGINGFACE: 1500,
+}
+
+# 요약을 다시 요약하는 최대 횟수 (그래도 넘으면 예산에 맞춰 자름)
+MAX_SUMMARY_ROUNDS = 3
+
+
+def context_token_budget() -> int:
+    """로그 컨텍스트 토큰 예산 (TROUBLE_CONTEXT_TOKEN_BUDGET이 0이면 제공업체 기본값)"""
+    return settings.TROUBLE_CONTEXT_TOKEN_BUDGET or PROVIDER_TOKEN_BUDGETS[settings.LLM_PROVIDER]
+
+
+def message_text(message: Any) -> str:
+    """
+    LLM 응답(또는 스트리밍 chunk)에서 텍스트만 꺼냅니다.
+    (OpenAI/Ollama는 문자열, Anthropic은 content block 목록으로 보낼 수 있음)
+    """
+    content = getattr(message, "content", message)
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+def input_tokens(message: Any, prompt: str) -> int:
+    """응답에 기록된 입력 토큰 수 (제공업체가 알려주지 않으면 프롬프트로 어림)"""
+    usage = getattr(message, "usage_metadata", None)
+    if usage and usage.get("input_tokens"):
+        return usage["input_tokens"]
+    return estimate_tokens(prompt)
+
+
+class TroubleLogContext(NamedTuple):
+    """트러블슈팅 프롬프트에 넣을 연관 로그 컨텍스트"""
+
+    text: str
+    log_count: int  # 조회된 로그 수
+    line_count: int  # 같은 종류를 묶은 뒤의 줄 수
+    summarized_chunks: int  # 요약(map)한 묶음 수 (0이면 요약 없이 그대로 사용)
+    summary_prompt_tokens: int  # 요약 호출들의 입력 토큰 합
+
+
+class TroubleContextBuilder:
+    """
+    연관 로그를 토큰 예산 안의 프롬프트 컨텍스트로 만드는 클래스
+    1. 조회한 로그를 mode에 따라 줄로 만들고 같은 종류의 로그는 한 줄로 묶음
+    2. 예산 안이면 그대로 사용
+    3. 넘으면 예산 크기 묶음으로 나눠 병렬로 요약(map)하고, 요약들로 최종 분석 (요약도 넘으면 다시 요약)
+    """
+
+    def __init__(
+        self,
+        mode: Optional[TroubleContextMode] = None,
+        token_budget: Optional[int] = None,
+        summary_llm: Any = None,
+    ):
+        self.mode = mode or settings.TROUBLE_CONTEXT_MODE
+        self.token_budget = token_budget or context_token_budget()
+        self._summary_llm = summary_llm
+
+    @property
+    def summary_llm(self) -> Any:
+        """요약용 파이프라인 모델 (요약이 필요할 때 처음 생성)"""
+        if self._summary_llm is None:
+            self._summary_llm = LLMFactory.create_pipeline_model()
+        return self._summary_llm
+
+    def build(self, user_query: str, hits: List[Dict[str, Any]], language: str) -> TroubleLogContext:
+        """
+        연관 로그 컨텍스트를 만듭니다. (요약이 필요하면 묶음들을 스레드로 병렬 요청)
+
+        Args:
+            user_query: 사용자 질의 (요약 기준)
+            hits: get_logs_by_ids 결과
+            language: 요약 언어
+
+        Returns:
+            토큰 예산 안의 로그 컨텍스트
+        """
+        lines = format_log_lines(hits, self.mode)
+        summaries, chunks, tokens = lines, 0, 0
+        for _ in range(MAX_SUMMARY_ROUNDS):
+            prompts = self._summary_prompts(user_query, summaries, language)
+            if not prompts:
+                break
+            responses = self.summary_llm.batch(
+                [[HumanMessage(content=prompt)] for prompt in prompts],
+                config={"max_concurrency": settings.TROUBLE_CONTEXT_MAP_CONCURRENCY},
+            )
+            summaries = [message_text(response).strip() for response in responses]
+            chunks += len(prompts)
+            tokens += sum(map(input_tokens, responses, prompts))
+        return self._to_context(hits, lines, summaries, chunks, tokens)
+
+    async def abuild(
+        self, user_query: str, hits: List[Dict[str, Any]], language: str
+    ) -> TroubleLogContext:
+        """build의 비동기 버전 (스트리밍 분석용, 요약 묶음을 동시에 요청)"""
+        lines = format_log_lines(hits, self.mode)
+        summaries, chunks, tokens = lines, 0, 0
+        for _ in range(MAX_SUMMARY_ROUNDS):
+            prompts = self._summary_prompts(user_query, summaries, language)
+            if not prompts:
+                break
+            responses = await self.summary_llm.abatch(
+                [[HumanMessage(content=prompt)] for prompt in prompts],
+                config={"max_concurrency": settings.TROUBLE_CONTEXT_MAP_CONCURRENCY},
+            )
+            summaries = [message_text(response).strip() for response in responses]
+            chunks += len(prompts)
+            tokens += sum(map(input_tokens, responses, prompts))
+        return self._to_context(hits, lines, summaries, chunks, tokens)
+
+    def _fits(self, lines: List[str]) -> bool:
+        return estimate_tokens("\n".join(lines)) <= self.token_budget
+
+    def _summary_prompts(self, user_query: str, lines: List[str], language: str) -> List[str]:
+        """예산을 넘는 줄들을 예산 크기 묶음별 요약 프롬프트로 나눕니다. (예산 안이면 빈 목록)"""
+        if self._fits(lines):
+            return []
+        prompt = PromptTemplate(
+            template=TROUBLE_LOG_SUMMARY_TEMPLATE,
+            input_variables=["user_query", "log_contents", "language"],
+        )
+        return [
+            prompt.format(user_query=user_query, log_contents="\n".join(chunk), language=language)
+            for chunk in pack_lines(lines, self.token_budget)
+        ]
+
+    def _to_context(
+        self,
+        hits: List[Dict[str, Any]],
+        lines: List[str],
+        summaries: List[str],
+        chunks: int,
+        tokens: int,
+    ) -> TroubleLogContext:
+        separator = "\n\n" if chunks else "\n"
+        return TroubleLogContext(
+            text=truncate_to_tokens(separator.join(summaries), self.token_budget),
+            log_count=len(hits),
+            line_count=len(lines),
+            summarized_chunks=chunks,
+            summary_prompt_tokens=tokens,
+        )
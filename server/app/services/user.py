@@ -2,8 +2,9 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.repositories import user as UserRepository
+from app.repositories import project as ProjectRepository
 from app.schemas.user import UserCreate, User, UserRegister, UserLogin, Token
-from app.core.utils.auth import get_password_hash, verify_password, create_access_token
+from app.core.utils.auth import get_password_hash, verify_password, create_user_token
 
 
 class UserService:
@@ -54,7 +55,13 @@ class UserService:
         if not verify_password(login_data.password, user.password):
             raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 잘못되었습니다")
         
-        # JWT 토큰 생성
-        access_token = create_access_token(data={"sub": user.username})
+        # JWT 토큰 생성 (이후 요청은 사용자 id와 프로젝트별 역할을 토큰에서 바로 사용)
+        memberships = ProjectRepository.get_user_memberships(self.db, user_id=user.id)
+        access_token = create_user_token(
+            username=user.username,
+            user_id=user.id,
+            token_version=user.token_version,
+            memberships=memberships,
+        )
         
         return Token(access_token=access_token, token_type="bearer")
\ No newline at end of file
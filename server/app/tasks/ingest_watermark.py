@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+
+from app.core.config.settings import get_settings
+from app.core.utils.result_cache import ingest_watermark
+from app.infra.database.session import SessionLocal
+from app.repositories import ingest_watermark as watermark_repo
+
+settings = get_settings()
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    """epoch 초를 DB에 저장하는 UTC naive datetime으로 변환"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _to_timestamp(value: datetime) -> float:
+    """DB의 UTC naive datetime을 epoch 초로 변환"""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _relevant_since() -> float:
+    """이보다 오래된 적재 기록은 아직 만료되지 않은 캐시 항목을 무효화할 수 없음"""
+    return time.time() - settings.RESULT_CACHE_TTL_SECONDS - settings.RESULT_CACHE_INGEST_GRACE_SECONDS
+
+
+def run_watermark_sync_once() -> int:
+    """
+    이 프로세스의 적재 기록을 저장하고 다른 프로세스가 저장한 기록을 반영합니다.
+    저장에 실패한 기록은 다음 동기화 때 다시 저장합니다.
+
+    Returns:
+        int: 반영한 적재 기록 수
+    """
+    pending = ingest_watermark.drain()
+    db = SessionLocal()
+    try:
+        if pending:
+            try:
+                watermark_repo.upsert_ingest_watermarks(
+                    db,
+                    [
+                        {
+                            "project_id": project_id,
+                            "bucket_start": bucket_start,
+                            "ingested_at": _to_datetime(ingested_at),
+                        }
+                        for (project_id, bucket_start), ingested_at in pending.items()
+                    ],
+                )
+            except Exception:
+                ingest_watermark.restore(pending)
+                raise
+        rows = watermark_repo.get_ingest_watermarks_since(db, _to_datetime(_relevant_since()))
+        ingest_watermark.merge(
+            (project_id, bucket_start, _to_timestamp(ingested_at))
+            for project_id, bucket_start, ingested_at in rows
+        )
+        return len(rows)
+    finally:
+        db.close()
+
+
+def run_watermark_cleanup_once() -> int:
+    """캐시 무효화에 더 이상 쓰이지 않는 오래된 적재 기록을 한 번 삭제"""
+    db = SessionLocal()
+    try:
+        return watermark_repo.delete_ingest_watermarks_before(
+            db, _to_datetime(_relevant_since() - settings.RESULT_CACHE_TTL_SECONDS)
+        )
+    finally:
+        db.close()
+
+
+async def watermark_scheduler() -> None:
+    """적재 워터마크를 다른 프로세스와 주기적으로 동기화하는 백그라운드 태스크"""
+    loop = asyncio.get_running_loop()
+    last_cleanup = loop.time()
+    while True:
+        await asyncio.sleep(settings.RESULT_CACHE_WATERMARK_SYNC_SECONDS)
+        try:
+            await asyncio.to_thread(run_watermark_sync_once)
+            if loop.time() - last_cleanup >= settings.RESULT_CACHE_TTL_SECONDS:
+                await asyncio.to_thread(run_watermark_cleanup_once)
+                last_cleanup = loop.time()
+        except Exception as e:
+            logging.error(f"Ingest watermark sync failed: {e}")
@@ -0,0 +1,28 @@
+import asyncio
+import logging
+
+from app.core.config.settings import get_settings
+from app.infra.database.session import SessionLocal
+from app.services.retention import RetentionService
+
+settings = get_settings()
+
+
+def run_retention_once() -> list:
+    """모든 프로젝트에 보존 정책을 한 번 적용"""
+    db = SessionLocal()
+    try:
+        return RetentionService(db).run_retention()
+    finally:
+        db.close()
+
+
+async def retention_scheduler() -> None:
+    """보존 정책을 주기적으로 실행하는 백그라운드 태스크"""
+    while True:
+        try:
+            # 삭제 작업 완료를 기다리며 주기적으로 조회하므로 이벤트 루프 밖에서 실행
+            await asyncio.to_thread(run_retention_once)
+        except Exception as e:
+            logging.error(f"Retention scheduler run failed: {e}")
+        await asyncio.sleep(settings.RETENTION_INTERVAL_MINUTES * 60)
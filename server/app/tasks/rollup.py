@@ -0,0 +1,73 @@
+import asyncio
+import logging
+
+from app.core.config.settings import get_settings
+from app.infra.database.session import SessionLocal
+from app.services.rollup import RollupService
+
+settings = get_settings()
+
+
+def start_rollup_writer() -> None:
+    """이 프로세스를 집계 프로세스로 등록 (다른 프로세스의 비정상 종료도 함께 확인)"""
+    db = SessionLocal()
+    try:
+        RollupService(db).heartbeat()
+    finally:
+        db.close()
+
+
+def run_rollup_flush_once() -> int:
+    """메모리 버퍼의 집계 건수를 한 번 저장하고 집계 중임을 기록"""
+    db = SessionLocal()
+    try:
+        service = RollupService(db)
+        flushed = service.flush()
+        service.heartbeat()
+        return flushed
+    finally:
+        db.close()
+
+
+def stop_rollup_writer() -> None:
+    """종료 전에 남은 집계 건수를 저장하고 등록 삭제 (저장에 실패하면 등록이 남아 비정상 종료로 처리됨)"""
+    db = SessionLocal()
+    try:
+        service = RollupService(db)
+        service.flush()
+        service.release()
+    finally:
+        db.close()
+
+
+def stop_rollup_counting() -> None:
+    """집계를 끈 프로세스 시작 시 집계 시작 시각 삭제 (이 프로세스가 적재하는 로그는 집계되지 않음)"""
+    db = SessionLocal()
+    try:
+        RollupService(db).stop_counting()
+    finally:
+        db.close()
+
+
+def run_rollup_compact_once() -> dict:
+    """닫힌 집계 버킷을 한 번 상위 단위로 합침"""
+    db = SessionLocal()
+    try:
+        return RollupService(db).compact()
+    finally:
+        db.close()
+
+
+async def rollup_scheduler() -> None:
+    """집계 버퍼 저장과 상위 단위 합치기를 주기적으로 실행하는 백그라운드 태스크"""
+    loop = asyncio.get_running_loop()
+    last_compact = loop.time()
+    while True:
+        await asyncio.sleep(settings.ROLLUP_FLUSH_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(run_rollup_flush_once)
+            if loop.time() - last_compact >= settings.ROLLUP_COMPACT_INTERVAL_MINUTES * 60:
+                await asyncio.to_thread(run_rollup_compact_once)
+                last_compact = loop.time()
+        except Exception as e:
+            logging.error(f"Rollup scheduler run failed: {e}")
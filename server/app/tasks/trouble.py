@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config.settings import get_settings
+from app.core.enums.trouble_status import TroubleStatus
+from app.infra.database.session import SessionLocal
+from app.repositories import trouble as trouble_repo
+from app.services.trouble import TroubleService
+
+settings = get_settings()
+
+# AI 리포트 생성 작업용 워커 풀 (LLM 호출이 요청 스레드를 붙잡지 않도록 분리)
+_executor = ThreadPoolExecutor(
+    max_workers=settings.TROUBLE_JOB_WORKERS, thread_name_prefix="trouble-job"
+)
+
+
+def run_trouble_generation_once(trouble_id: int) -> Optional[TroubleStatus]:
+    """trouble 하나의 AI 분석을 한 번 시도"""
+    db = SessionLocal()
+    try:
+        return TroubleService(db).generate_trouble_content(trouble_id)
+    finally:
+        db.close()
+
+
+def run_trouble_generation(
+    trouble_id: int, retry_delay: Optional[float] = None
+) -> Optional[TroubleStatus]:
+    """
+    AI 분석을 한 번 시도하고, 재시도할 수 있는 실패면 지수 백오프 뒤에 다시 등록
+    (기다리는 동안 워커를 붙잡지 않도록 워커 안에서 sleep하지 않음)
+    """
+    delay = retry_delay or settings.TROUBLE_JOB_RETRY_BACKOFF_SECONDS
+    try:
+        status = run_trouble_generation_once(trouble_id)
+    except Exception as e:
+        # 작업 중 trouble이 삭제되는 등 상태 저장 자체가 실패한 경우
+        logging.error(f"Trouble {trouble_id} generation job failed: {e}")
+        return None
+    if status == TroubleStatus.PENDING:
+        submit_trouble_generation(trouble_id, delay_seconds=delay, retry_delay=delay * 2)
+    return status
+
+
+def _submit(trouble_id: int, retry_delay: Optional[float] = None) -> None:
+    try:
+        _executor.submit(run_trouble_generation, trouble_id, retry_delay)
+    except RuntimeError:
+        # 종료 중이라 워커 풀이 닫힌 경우 (다음 실행에서 대기 상태 trouble로 다시 등록됨)
+        logging.info(f"Trouble {trouble_id} generation not queued: workers are shut down")
+
+
+def submit_trouble_generation(
+    trouble_id: int, delay_seconds: float = 0, retry_delay: Optional[float] = None
+) -> None:
+    """
+    AI 분석 작업을 워커 풀에 등록
+    (delay_seconds 후 등록하면 그 사이 스트리밍 요청이 먼저 선점 가능, 재시도 대기에도 사용)
+    """
+    if delay_seconds > 0:
+        timer = threading.Timer(delay_seconds, _submit, args=(trouble_id, retry_delay))
+        timer.daemon = True
+        timer.start()
+        return
+    _submit(trouble_id, retry_delay)
+
+
+def _claim_deadline() -> datetime:
+    """이 시각 이전에 선점된 생성 중 trouble은 중단된 작업으로 봄"""
+    return datetime.now() - timedelta(seconds=settings.TROUBLE_JOB_CLAIM_TIMEOUT_SECONDS)
+
+
+def resume_trouble_generations() -> int:
+    """이전 실행에서 끝나지 못한 AI 분석 작업을 다시 등록 (시작 시 실행)"""
+    db = SessionLocal()
+    try:
+        # 다른 인스턴스가 생성 중인 trouble은 선점 시각이 최근이므로 대기 상태로 되돌리지 않음
+        trouble_repo.requeue_running_troubles(db, _claim_deadline())
+        trouble_ids = trouble_repo.get_unfinished_trouble_ids(db)
+    finally:
+        db.close()
+    for trouble_id in trouble_ids:
+        submit_trouble_generation(trouble_id)
+    if trouble_ids:
+        logging.info(f"Resumed {len(trouble_ids)} trouble generation jobs")
+    return len(trouble_ids)
+
+
+def requeue_stale_trouble_generations() -> int:
+    """선점한 뒤 제한 시간이 지나도록 끝나지 않은 AI 분석 작업만 다시 등록"""
+    db = SessionLocal()
+    try:
+        trouble_ids = trouble_repo.requeue_running_troubles(db, _claim_deadline())
+    finally:
+        db.close()
+    for trouble_id in trouble_ids:
+        submit_trouble_generation(trouble_id)
+    if trouble_ids:
+        logging.warning(f"Requeued {len(trouble_ids)} stale trouble generation jobs")
+    return len(trouble_ids)
+
+
+async def trouble_requeue_scheduler() -> None:
+    """중단된 AI 분석 작업을 주기적으로 다시 등록하는 백그라운드 태스크"""
+    while True:
+        await asyncio.sleep(settings.TROUBLE_JOB_CLAIM_TIMEOUT_SECONDS)
+        try:
+            await asyncio.to_thread(requeue_stale_trouble_generations)
+        except Exception as e:
+            logging.error(f"Trouble requeue run failed: {e}")
+
+
+def shutdown_trouble_workers() -> None:
+    """대기 중인 작업은 버리고 워커 풀 종료 (다음 실행에서 다시 등록됨)"""
+    _executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,41 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+from app.core.utils.count_cache import trouble_count_cache
+from app.infra.database.routing import USE_REPLICAS
+from app.infra.database.session import SessionLocal
+from app.repositories import trouble as trouble_repo
+from app.schemas.trouble import TroubleListQuery
+
+# 목록 전체 개수를 다시 세는 작업 (요청은 이전 값으로 바로 응답)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="trouble-count")
+
+
+def run_trouble_count_refresh(
+    key: Tuple, project_id: int, query_params: TroubleListQuery, user_id: int
+) -> None:
+    """trouble 목록 전체 개수를 다시 세어 캐시에 저장"""
+    db = SessionLocal()
+    # 개수는 복제 지연이 있어도 괜찮으므로 복제본에서 셈
+    db.info[USE_REPLICAS] = True
+    try:
+        # 세는 도중 이 프로세스에서 trouble이 바뀌면 결과를 버림
+        generation = trouble_count_cache.generation(project_id)
+        trouble_count_cache.put(
+            key,
+            trouble_repo.count_project_troubles(db, project_id, query_params, user_id),
+            generation,
+        )
+    except Exception as e:
+        logging.warning(f"Trouble count refresh failed for project {project_id}: {e}")
+        trouble_count_cache.release(key)
+    finally:
+        db.close()
+
+
+def submit_trouble_count_refresh(
+    key: Tuple, project_id: int, query_params: TroubleListQuery, user_id: int
+) -> None:
+    """개수 다시 세기 작업 등록"""
+    _executor.submit(run_trouble_count_refresh, key, project_id, query_params, user_id)
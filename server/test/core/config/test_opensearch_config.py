@@ -1,6 +1,13 @@
 import pytest
 from unittest.mock import Mock, patch
-from app.core.config.opensearch_config import get_opensearch_mappings
+from app.core.config.opensearch_config import (
+    LEAN_DEFAULT_DENY_FIELDS,
+    get_ingest_denylist,
+    get_keyword_field,
+    get_opensearch_mappings,
+    get_opensearch_index_settings,
+)
+from app.core.enums.mapping_profile import MappingProfile
 from app.core.config.settings import Settings
 
 
@@ -124,4 +131,42 @@ class TestOpenSearchConfig:
         assert mappings_1536["properties"]["vector"]["dimension"] != mappings_384["properties"]["vector"]["dimension"]
         
         # 다른 필드들은 동일한지 확인
-        assert mappings_1536["properties"]["vector"]["type"] == mappings_384["properties"]["vector"]["type"]
\ No newline at end of file
+        assert mappings_1536["properties"]["vector"]["type"] == mappings_384["properties"]["vector"]["type"]
+
+class TestLeanMappingProfile:
+    """lean 매핑 프로필 테스트"""
+
+    def test_lean_mappings_skip_beats_metadata(self):
+        """색인하지 않는 메타데이터는 enabled: false"""
+        mappings = get_opensearch_mappings(MappingProfile.LEAN)
+        properties = mappings["properties"]
+
+        assert mappings["dynamic"] is False
+        for field in ["agent", "ecs", "event", "input", "container"]:
+            assert properties[field] == {"type": "object", "enabled": False}
+
+    def test_lean_mappings_keyword_only_and_no_norms(self):
+        """필터 전용 필드는 keyword 단일 타입, text 필드는 norms 비활성화"""
+        properties = get_opensearch_mappings(MappingProfile.LEAN)["properties"]
+
+        assert properties["keyword"]["type"] == "keyword"
+        assert properties["log_level"]["type"] == "keyword"
+        assert "fields" not in properties["message"]
+        assert properties["message"]["norms"] is False
+        assert properties["vector"]["type"] == "knn_vector"
+
+    def test_lean_index_settings_define_normalizer(self):
+        """keyword 필드가 참조하는 normalizer가 인덱스 설정에 정의됨"""
+        index_settings = get_opensearch_index_settings(MappingProfile.LEAN)
+        properties = get_opensearch_mappings(MappingProfile.LEAN)["properties"]
+
+        normalizer = properties["log_level"]["normalizer"]
+        assert normalizer in index_settings["analysis"]["normalizer"]
+        assert get_opensearch_index_settings(MappingProfile.FULL) == {}
+
+    def test_index_profile_decides_field_names(self):
+        """keyword 필드 이름과 기본 적재 제외 필드는 인덱스의 매핑 프로필 기준"""
+        assert get_keyword_field("log_level", MappingProfile.FULL) == "log_level.keyword"
+        assert get_keyword_field("log_level", MappingProfile.LEAN) == "log_level"
+        assert get_ingest_denylist(["tags"], MappingProfile.FULL) == ["tags"]
+        assert get_ingest_denylist(["tags"], MappingProfile.LEAN) == [*LEAN_DEFAULT_DENY_FIELDS, "tags"]
@@ -0,0 +1,48 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.deps import get_current_user
+from app.core.enums.roles import ProjectRole
+from app.core.utils.auth import create_access_token, create_user_token, verify_token
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestUserToken:
+    """사용자 정보를 담은 액세스 토큰 테스트 클래스"""
+
+    def test_claims_round_trip(self):
+        """토큰만으로 사용자 id, 버전, 프로젝트별 역할을 복원 (DB 조회 없음)"""
+        token = create_user_token(
+            username="alice",
+            user_id=7,
+            token_version=2,
+            memberships={1: "master", 15: "member"},
+        )
+
+        user = get_current_user(_credentials(token))
+
+        assert user.user_id == 7
+        assert user.username == "alice"
+        assert user.token_version == 2
+        assert user.memberships == {1: ProjectRole.MASTER, 15: ProjectRole.MEMBER}
+        assert verify_token(token) == "alice"
+
+    def test_legacy_token_rejected(self):
+        """사용자 id가 없는 이전 형식 토큰은 401"""
+        token = create_access_token(data={"sub": "alice"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(_credentials(token))
+
+        assert exc_info.value.status_code == 401
+
+    def test_invalid_token_rejected(self):
+        """서명이 맞지 않는 토큰은 401"""
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(_credentials("not-a-token"))
+
+        assert exc_info.value.status_code == 401
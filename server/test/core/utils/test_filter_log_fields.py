@@ -0,0 +1,56 @@
+from app.core.utils.log_utils import (
+    filter_log_fields,
+    get_field_paths,
+    get_document_size,
+)
+
+
+class TestFilterLogFields:
+    """filter_log_fields 함수 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.log_data = {
+            "@timestamp": "2024-03-20T10:00:00.000Z",
+            "message": "2024-03-20 10:00:00.000 ERROR User does not exist",
+            "event": {"original": "2024-03-20 10:00:00.000 ERROR User does not exist"},
+            "agent": {"id": "abc", "version": "8.0.0"},
+            "host": {"name": "web-1", "os": {"family": "debian"}},
+        }
+
+    def test_denylist_removes_nested_fields(self):
+        """denylist에 지정한 경로만 제거하고 빈 상위 객체도 정리"""
+        result = filter_log_fields(self.log_data, denylist=["event.original", "host.os"])
+
+        assert "event" not in result
+        assert result["host"] == {"name": "web-1"}
+        assert result["agent"] == {"id": "abc", "version": "8.0.0"}
+
+    def test_allowlist_keeps_required_fields(self):
+        """allowlist 적용 시 message, @timestamp는 항상 보존"""
+        result = filter_log_fields(self.log_data, allowlist=["host.name"])
+
+        assert result == {
+            "@timestamp": "2024-03-20T10:00:00.000Z",
+            "message": "2024-03-20 10:00:00.000 ERROR User does not exist",
+            "host": {"name": "web-1"},
+        }
+
+    def test_denylist_cannot_remove_required_fields(self):
+        """필수 필드는 denylist에 있어도 제거하지 않음"""
+        result = filter_log_fields(self.log_data, denylist=["message"])
+
+        assert "message" in result
+
+    def test_no_filters(self):
+        """필터가 없으면 원본 그대로 반환"""
+        assert filter_log_fields(self.log_data) == self.log_data
+
+    def test_size_reduction(self):
+        """필드 제거 후 문서 크기가 줄어드는지 확인"""
+        original_size = get_document_size(self.log_data)
+        original_paths = get_field_paths(self.log_data)
+        result = filter_log_fields(dict(self.log_data), denylist=["event.original", "agent"])
+
+        assert "event.original" in original_paths
+        assert get_document_size(result) < original_size
@@ -0,0 +1,120 @@
+"""
+동기(Session + 스레드풀) / 비동기(AsyncSession) DB 경로 요청 처리량 비교 벤치마크
+
+설정된 MySQL(.env)에 연결해 같은 조회(사용자 프로젝트 목록 + trouble 목록)를
+동기 라우트와 비동기 라우트로 각각 동시에 요청하고 초당 처리량과 지연 시간을 비교합니다.
+pytest 수집 대상이 아니며 직접 실행합니다.
+
+    PYTHONPATH=. python test/infra/bench_async_db.py --user-id 1 --project-id 1 --concurrency 200 --requests 5000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app.api.deps import (
+    get_async_project_service,
+    get_async_trouble_service,
+    get_project_service,
+    get_trouble_service,
+)
+from app.core.enums.roles import ProjectRole
+from app.infra.database.async_session import dispose_async_engine
+from app.infra.database.session import engine
+from app.schemas.project import ProjectContext
+from app.schemas.trouble import TroubleListQuery
+from app.services.async_project import AsyncProjectService
+from app.services.async_trouble import AsyncTroubleService
+from app.services.project import ProjectService
+from app.services.trouble import TroubleService
+
+
+def build_app(user_id: int, project_id: int) -> FastAPI:
+    """같은 조회를 동기/비동기 라우트로 노출하는 벤치마크용 앱 (인증 생략)"""
+    app = FastAPI()
+    context = ProjectContext(
+        user_id=user_id, username="bench", project_id=project_id, role=ProjectRole.MEMBER
+    )
+    query_params = TroubleListQuery(page=1, size=20)
+
+    @app.get("/sync")
+    def sync_route(
+        projects: ProjectService = Depends(get_project_service),
+        troubles: TroubleService = Depends(get_trouble_service),
+    ):
+        return {
+            "projects": len(projects.get_projects_by_user(user_id=user_id)),
+            "troubles": troubles.get_project_troubles(context, query_params).total,
+        }
+
+    @app.get("/async")
+    async def async_route(
+        projects: AsyncProjectService = Depends(get_async_project_service),
+        troubles: AsyncTroubleService = Depends(get_async_trouble_service),
+    ):
+        return {
+            "projects": len(await projects.get_projects_by_user(user_id=user_id)),
+            "troubles": (await troubles.get_project_troubles(context, query_params)).total,
+        }
+
+    return app
+
+
+async def run(client: httpx.AsyncClient, path: str, concurrency: int, requests: int) -> dict:
+    """동시 요청 concurrency개를 유지하며 requests번 호출"""
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "req_per_sec": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = build_app(args.user_id, args.project_id)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 풀 연결을 미리 열어 두고 측정
+        await run(client, "/sync", args.concurrency, args.concurrency)
+        await run(client, "/async", args.concurrency, args.concurrency)
+
+        for path in ("/sync", "/async"):
+            result = await run(client, path, args.concurrency, args.requests)
+            print(
+                f"{path:<7} {result['req_per_sec']:>8.1f} req/s  "
+                f"p50 {result['p50_ms']:>7.1f}ms  p95 {result['p95_ms']:>7.1f}ms  "
+                f"errors {result['errors']}"
+            )
+
+    print(f"sync pool: {engine.pool.stats()}")
+    await dispose_async_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--project-id", type=int, required=True)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,158 @@
+"""
+trouble 목록 검색 지연 시간 벤치마크 (부분 일치 LIKE / FULLTEXT ngram MATCH)
+
+설정된 MySQL(.env)에 벤치마크용 사용자와 프로젝트를 만들고 trouble을 --reports개 넣은 뒤,
+같은 검색어로 이전 부분 일치 조건(report_name, user_query)과 전문 검색 목록 쿼리를 각각 반복 실행해
+p50/p95 지연 시간을 비교합니다. 먼저 검색어마다 전문 검색 개수가 세 컬럼 부분 일치 개수와 같은지 확인합니다. 끝나면 벤치마크 프로젝트와 사용자를 삭제합니다.
+pytest 수집 대상이 아니며 직접 실행합니다.
+
+    PYTHONPATH=. python test/infra/bench_trouble_search.py --reports 100000 --repeat 50
+"""
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import desc, func, insert, or_, select
+
+from app.core.enums.trouble_status import TroubleStatus
+from app.infra.database.migrations import MIGRATIONS, run_migrations
+from app.infra.database.session import SessionLocal, engine
+from app.models import Project, Trouble, User, UserProject
+from app.repositories.trouble import count_project_troubles, get_project_troubles_page
+from app.schemas.trouble import TroubleListQuery
+
+TERMS = ["로그인", "타임아웃", "결제 실패", "connection refused", "OutOfMemory", "슬로우 쿼리"]
+WORDS = TERMS + [
+    "서버", "응답", "지연", "사용자", "배포", "캐시", "재시도", "권한", "토큰", "만료",
+    "nginx", "upstream", "database", "deadlock", "gateway", "worker", "pod", "restart",
+]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed(db, reports: int) -> tuple:
+    """벤치마크 사용자/프로젝트와 trouble reports개 생성 후 (project_id, user_id) 반환"""
+    suffix = uuid.uuid4().hex[:12]
+    user = User(username=f"bench-{suffix}", password="x")
+    project = Project(
+        name="bench", index=f"bench-{suffix}", api_key=f"bench-{suffix}", invite_code=suffix
+    )
+    db.add_all([user, project])
+    db.flush()
+    db.add(UserProject(user_id=user.id, project_id=project.id, role="master"))
+    db.commit()
+
+    rng = random.Random(0)
+    base = datetime(2024, 1, 1)
+    for start in range(0, reports, 5000):
+        db.execute(
+            insert(Trouble),
+            [
+                {
+                    "project_id": project.id,
+                    "created_by": user.id,
+                    "report_name": _sentence(rng, 4),
+                    "user_query": _sentence(rng, 8),
+                    "content": _sentence(rng, 300),
+                    "is_shared": True,
+                    "status": TroubleStatus.COMPLETED,
+                    "created_at": base + timedelta(seconds=i),
+                }
+                for i in range(start, min(start + 5000, reports))
+            ],
+        )
+        db.commit()
+    return project.id, user.id
+
+
+def _like_page(db, project_id: int, user_id: int, term: str) -> list:
+    """전문 검색 이전의 부분 일치 목록 쿼리 (비교 기준, 전체 개수 + 한 페이지)"""
+    filters = [
+        Trouble.project_id == project_id,
+        or_(Trouble.created_by == user_id, Trouble.is_shared == True),
+        or_(Trouble.report_name.ilike(f"%{term}%"), Trouble.user_query.ilike(f"%{term}%")),
+    ]
+    db.execute(select(func.count(Trouble.id)).where(*filters)).scalar()
+    return db.execute(
+        select(Trouble.id)
+        .where(*filters)
+        .order_by(desc(Trouble.created_at), desc(Trouble.id))
+        .limit(21)
+    ).all()
+
+
+def _fulltext_page(db, project_id: int, user_id: int, term: str) -> list:
+    """목록 API와 같은 전문 검색 쿼리 (전체 개수 + 관련도순 한 페이지)"""
+    query_params = TroubleListQuery(size=20, search=term)
+    count_project_troubles(db, project_id, query_params, user_id)
+    return get_project_troubles_page(db, project_id, query_params, user_id)
+
+
+def check_totals(db, project_id: int, user_id: int) -> list:
+    """검색어마다 전문 검색 개수가 세 컬럼 부분 일치 개수와 같은지 확인하고 다른 검색어 목록 반환"""
+    mismatches = []
+    for term in TERMS:
+        expected = db.execute(
+            select(func.count(Trouble.id)).where(
+                Trouble.project_id == project_id,
+                or_(Trouble.created_by == user_id, Trouble.is_shared == True),
+                or_(
+                    Trouble.report_name.contains(term, autoescape=True),
+                    Trouble.user_query.contains(term, autoescape=True),
+                    Trouble.content.contains(term, autoescape=True),
+                ),
+            )
+        ).scalar()
+        total = count_project_troubles(db, project_id, TroubleListQuery(search=term), user_id)
+        if total != expected:
+            mismatches.append((term, total, expected))
+    return mismatches
+
+
+def measure(db, fetch, project_id: int, user_id: int, repeat: int) -> dict:
+    latencies = []
+    for _ in range(repeat):
+        for term in TERMS:
+            started = time.perf_counter()
+            fetch(db, project_id, user_id, term)
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    run_migrations(engine, MIGRATIONS)
+    db = SessionLocal()
+    project_id = user_id = None
+    try:
+        started = time.perf_counter()
+        project_id, user_id = seed(db, args.reports)
+        print(f"seeded {args.reports} troubles in {time.perf_counter() - started:.1f}s")
+
+        for term, total, expected in check_totals(db, project_id, user_id):
+            print(f"total mismatch for {term!r}: fulltext {total}, substring {expected}")
+
+        for label, fetch in (("like", _like_page), ("fulltext", _fulltext_page)):
+            result = measure(db, fetch, project_id, user_id, args.repeat)
+            print(f"{label:<9} p50 {result['p50_ms']:>8.1f}ms  p95 {result['p95_ms']:>8.1f}ms")
+    finally:
+        if project_id is not None:
+            db.query(Project).filter(Project.id == project_id).delete()
+            db.query(User).filter(User.id == user_id).delete()
+            db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reports", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.infra.database.pool import InstrumentedQueuePool
+
+
+class TestInstrumentedQueuePool:
+    """DB 연결 풀 계측 테스트 클래스 (SQLite 파일 DB)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engine = None
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리"""
+        if self.engine is not None:
+            self.engine.dispose()
+
+    def _engine(self, tmp_path, **kwargs):
+        self.engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            connect_args={"check_same_thread": False},
+            **kwargs,
+        )
+        return self.engine
+
+    def test_checkouts_and_overflow(self, tmp_path):
+        """pool_size를 넘는 동시 사용은 오버플로 연결로 기록"""
+        engine = self._engine(tmp_path, pool_size=1, max_overflow=1)
+
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            assert engine.pool.stats()["checked_out"] == 2
+
+        stats = engine.pool.stats()
+        assert stats["checkouts"] == 2
+        assert stats["peak_checked_out"] == 2
+        assert stats["overflow_opened"] == 1
+        assert stats["checked_out"] == 0
+
+    def test_wait_and_timeout(self, tmp_path):
+        """풀이 가득 차면 반환될 때까지 기다리고, pool_timeout을 넘으면 타임아웃으로 기록"""
+        engine = self._engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+        held = engine.connect()
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+        releaser = threading.Timer(0.02, held.close)
+        releaser.start()
+        engine.pool._timeout = 1.0
+        with engine.connect():
+            pass
+        releaser.join()
+
+        stats = engine.pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["waited"] >= 1
+        assert stats["max_wait_ms"] >= 10
+
+    def test_invalidated_connections_counted(self, tmp_path):
+        """끊긴 연결로 판정되어 버려진 연결 수 기록"""
+        engine = self._engine(tmp_path, pool_size=1)
+
+        with engine.connect() as connection:
+            connection.invalidate()
+
+        assert engine.pool.stats()["invalidated"] == 1
@@ -0,0 +1,119 @@
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.infra.database.routing import USE_REPLICAS, ReplicaSet, RoutingSession, read_from_primary
+from app.infra.database.session import Base, get_db
+from app.models import Project, User, UserProject
+from app.repositories.project import get_member_context
+from app.repositories.user import get_token_version, get_user_by_username
+
+
+class TestRoutingSession:
+    """읽기 복제본 라우팅 테스트 클래스 (SQLite 파일 DB로 primary/복제본 구분)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engines = {}
+        self.executed = []
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리"""
+        for engine in self.engines.values():
+            engine.dispose()
+
+    def _engine(self, tmp_path, name: str, token_version: int):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(
+            engine, tables=[User.__table__, Project.__table__, UserProject.__table__]
+        )
+        with engine.begin() as connection:
+            connection.execute(
+                User.__table__.insert().values(
+                    id=1, username="alice", password="x", token_version=token_version
+                )
+            )
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *args: self.executed.append(name),
+        )
+        self.engines[name] = engine
+        return engine
+
+    def _session(self, tmp_path, use_replicas: bool = True):
+        # 복제본은 아직 반영되지 않은 이전 토큰 버전(0)을 가진 상태
+        primary = self._engine(tmp_path, "primary", token_version=1)
+        replicas = ReplicaSet(
+            [
+                self._engine(tmp_path, "replica1", token_version=0),
+                self._engine(tmp_path, "replica2", token_version=0),
+            ]
+        )
+        db = sessionmaker(class_=RoutingSession, bind=primary, replicas=replicas)()
+        db.info[USE_REPLICAS] = use_replicas
+        return db
+
+    def test_replica_pinned_per_session(self, tmp_path):
+        """한 세션의 SELECT는 처음 배정된 복제본 하나만 쓰고, 세션마다 복제본을 번갈아 배정"""
+        db = self._session(tmp_path)
+        factory = sessionmaker(class_=RoutingSession, bind=db.bind, replicas=db.replicas)
+
+        for _ in range(3):
+            get_user_by_username(db, "alice")
+        other = factory()
+        other.info[USE_REPLICAS] = True
+        get_user_by_username(other, "alice")
+        db.close()
+        get_user_by_username(db, "alice")
+
+        assert self.executed == ["replica1", "replica1", "replica1", "replica2", "replica1"]
+
+    def test_direct_session_uses_primary(self, tmp_path):
+        """복제본 읽기를 켜지 않은 세션(백그라운드 작업 등)은 primary만 사용"""
+        db = self._session(tmp_path, use_replicas=False)
+
+        get_user_by_username(db, "alice")
+
+        assert self.executed == ["primary"]
+
+    def test_read_after_write(self, tmp_path):
+        """쓰기 이후의 읽기는 같은 세션 동안 primary"""
+        db = self._session(tmp_path)
+
+        user = get_user_by_username(db, "alice")
+        user.password = "changed"
+        db.commit()
+        db.scalar(select(User.password).where(User.id == 1))
+
+        assert self.executed[0].startswith("replica")
+        assert set(self.executed[1:]) == {"primary"}
+        assert db.scalar(select(User.password).where(User.id == 1)) == "changed"
+
+    def test_primary_only_queries(self, tmp_path):
+        """토큰 버전 확인, 멤버십 확인, 잠금 조회는 복제 지연과 상관없이 primary"""
+        db = self._session(tmp_path)
+
+        assert get_token_version(db, 1) == 1
+        db.scalar(select(User.id).with_for_update())
+        get_member_context(db, 1, 1)
+
+        assert self.executed == ["primary", "primary", "primary"]
+
+    def test_route_override(self, tmp_path):
+        """라우트 의존성으로 요청 전체를 primary로"""
+        db = self._session(tmp_path)
+
+        read_from_primary(db)
+        get_user_by_username(db, "alice")
+
+        assert self.executed == ["primary"]
+
+    def test_get_db_by_method(self):
+        """조회 요청 세션만 복제본 읽기를 켬"""
+        for method, expected in [("GET", True), ("POST", False), ("PATCH", False)]:
+            dependency = get_db(Mock(method=method))
+            db = next(dependency)
+            assert db.info[USE_REPLICAS] is expected
+            dependency.close()
@@ -0,0 +1,148 @@
+from sqlalchemy import MetaData, UniqueConstraint, create_engine, inspect, select, text
+
+from app.infra.database.migrations import MIGRATIONS, run_migrations
+from app.infra.database.migrations.runner import schema_migrations
+from app.infra.database.session import Base
+
+HOT_INDEXES = {
+    "project": {"uq_project_api_key", "uq_project_invite_code"},
+    "user_project": {"uq_user_project_user_project"},
+    "trouble_logs": {"ix_trouble_logs_trouble_id"},
+    "troubles": {"ix_troubles_project_created"},
+}
+# 이후 마이그레이션으로 추가된 컬럼
+ADDED_COLUMNS = {
+    "project_settings": [
+        "log_retention_days",
+        "vector_retention_days",
+        "ingest_field_allowlist",
+        "ingest_field_denylist",
+        "rollup_since",
+        "mapping_profile",
+    ],
+    "troubles": [
+        "status",
+        "attempts",
+        "error_message",
+        "completed_at",
+        "claimed_at",
+        "prompt_tokens",
+        "generation_ms",
+    ],
+    "users": ["token_version"],
+}
+
+
+def _index_names(engine, table_name: str) -> set:
+    inspector = inspect(engine)
+    return {index["name"] for index in inspector.get_indexes(table_name)} | {
+        constraint["name"] for constraint in inspector.get_unique_constraints(table_name)
+    }
+
+
+def _create_legacy_schema(engine) -> None:
+    """이전처럼 create_all로 만든, 보조 인덱스와 유니크 제약, 추가된 컬럼이 없는 스키마"""
+    legacy = MetaData()
+    for table in Base.metadata.sorted_tables:
+        copy = table.to_metadata(legacy)
+        names = HOT_INDEXES.get(table.name, set())
+        for index in list(copy.indexes):
+            if index.name in names:
+                copy.indexes.discard(index)
+        for constraint in list(copy.constraints):
+            if isinstance(constraint, UniqueConstraint) and constraint.name in names:
+                copy.constraints.discard(constraint)
+    legacy.create_all(engine)
+    with engine.begin() as connection:
+        for table_name, columns in ADDED_COLUMNS.items():
+            for column in columns:
+                connection.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column}"))
+
+
+class TestRunMigrations:
+    """스키마 마이그레이션 테스트 클래스 (SQLite 파일 DB)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engine = None
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리"""
+        if self.engine is not None:
+            self.engine.dispose()
+
+    def _engine(self, tmp_path):
+        self.engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+        return self.engine
+
+    def _recorded_versions(self):
+        with self.engine.connect() as connection:
+            return list(connection.execute(select(schema_migrations.c.version)).scalars())
+
+    def test_fresh_database(self, tmp_path):
+        """빈 DB는 모델로 전체 스키마를 만들고 모든 버전을 적용된 것으로 기록"""
+        engine = self._engine(tmp_path)
+
+        applied = run_migrations(engine, MIGRATIONS)
+
+        assert applied == [migration.version for migration in MIGRATIONS]
+        assert self._recorded_versions() == applied
+        for table_name, names in HOT_INDEXES.items():
+            assert names <= _index_names(engine, table_name)
+        assert run_migrations(engine, MIGRATIONS) == []
+
+    def test_existing_database_upgraded(self, tmp_path):
+        """create_all로 만든 기존 DB에 인덱스를 추가하고 중복 멤버십은 하나만 남김"""
+        engine = self._engine(tmp_path)
+        _create_legacy_schema(engine)
+        user_project = Base.metadata.tables["user_project"]
+        with engine.begin() as connection:
+            connection.execute(text("INSERT INTO users (id, username, password) VALUES (1, 'u', 'x')"))
+            connection.execute(
+                Base.metadata.tables["project"].insert().values(
+                    id=1, name="p", index="idx", api_key="key", invite_code="code", language="KOREAN"
+                )
+            )
+            connection.execute(
+                user_project.insert(),
+                [
+                    {"id": 1, "user_id": 1, "project_id": 1, "role": "master", "email_notification": True},
+                    {"id": 2, "user_id": 1, "project_id": 1, "role": "member", "email_notification": True},
+                ],
+            )
+            # 추가될 컬럼이 없는 기존 행 (모델의 Python 기본값이 붙지 않도록 SQL로 삽입)
+            connection.execute(
+                text(
+                    "INSERT INTO project_settings (id, project_id, logstash_config, log_keywords, updated_at) "
+                    "VALUES (1, 1, '[]', '[]', '2024-01-01 00:00:00')"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO troubles (id, project_id, created_by, report_name, user_query, content, "
+                    "is_shared, created_at) VALUES (1, 1, 1, 'r', 'q', 'c', 0, '2024-01-01 00:00:00')"
+                )
+            )
+        assert not HOT_INDEXES["troubles"] & _index_names(engine, "troubles")
+
+        applied = run_migrations(engine, MIGRATIONS)
+
+        assert applied == [migration.version for migration in MIGRATIONS]
+        for table_name, names in HOT_INDEXES.items():
+            assert names <= _index_names(engine, table_name)
+        for table_name, columns in ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspect(engine).get_columns(table_name)}
+            assert set(columns) <= existing
+        with engine.connect() as connection:
+            rows = connection.execute(select(user_project.c.id, user_project.c.role)).all()
+            trouble = connection.execute(text("SELECT status, attempts, completed_at FROM troubles")).one()
+            setting = connection.execute(
+                text("SELECT ingest_field_allowlist, ingest_field_denylist, log_retention_days FROM project_settings")
+            ).one()
+            token_version = connection.execute(text("SELECT token_version FROM users")).scalar()
+        assert rows == [(1, "master")]
+        # NOT NULL로 추가된 컬럼은 기존 행을 기본값으로 채움
+        assert tuple(trouble) == ("COMPLETED", 0, None)
+        assert tuple(setting) == ("[]", "[]", None)
+        assert token_version == 0
+        assert run_migrations(engine, MIGRATIONS) == []
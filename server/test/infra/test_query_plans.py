@@ -0,0 +1,152 @@
+"""
+요청마다 실행되는 조회가 전체 스캔으로 떨어지지 않는지 MySQL 실행 계획(EXPLAIN)으로 확인
+
+테스트 전용 MySQL 스키마를 TEST_MYSQL_URL로 지정했을 때만 실행합니다. (테스트가 끝나면 모든 테이블을 삭제)
+
+    TEST_MYSQL_URL=mysql+pymysql://root:pw@localhost:3306/lognlook_test python -m pytest test/infra/test_query_plans.py
+"""
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.enums.trouble_status import TroubleStatus
+from app.infra.database.migrations import MIGRATIONS, run_migrations
+from app.infra.database.migrations.runner import schema_migrations
+from app.infra.database.session import Base
+from app.models import Project, Trouble, TroubleLog, User, UserProject
+from app.repositories import project as project_repo
+from app.repositories import trouble as trouble_repo
+from app.repositories import user as user_repo
+from app.schemas.trouble import TroubleListQuery
+
+TEST_MYSQL_URL = os.environ.get("TEST_MYSQL_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_MYSQL_URL, reason="TEST_MYSQL_URL is not set")
+
+# 인덱스 없이 테이블 전체(ALL) 또는 인덱스 전체(index)를 읽는 접근 방식
+FULL_SCAN_TYPES = {"ALL", "index"}
+
+
+def _full_scans(connection, statement: str, parameters) -> list:
+    """EXPLAIN에서 쓸 수 있는 인덱스 없이 전체를 읽는 테이블 접근"""
+    result = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    rows = [row._mapping for row in result]
+    return [
+        f"{row['table']}: type={row['type']} key={row['key']}"
+        for row in rows
+        if row["table"] and row["type"] in FULL_SCAN_TYPES and not row["possible_keys"]
+    ]
+
+
+class TestHotQueryPlans:
+    """요청마다 실행되는 조회가 전체 스캔으로 떨어지지 않는지 확인하는 테스트 클래스 (MySQL 실행 계획)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정 (마이그레이션으로 만든 스키마에 옵티마이저가 인덱스를 고를 만큼의 행 추가)"""
+        self.engine = create_engine(TEST_MYSQL_URL)
+        run_migrations(self.engine, MIGRATIONS)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add_all(
+            [User(id=user_id, username=f"user-{user_id}", password="x") for user_id in range(1, 51)]
+            + [
+                Project(
+                    id=project_id,
+                    name="p",
+                    index=f"idx-{project_id}",
+                    api_key=f"key-{project_id}",
+                    invite_code=f"code-{project_id}",
+                )
+                for project_id in range(1, 51)
+            ]
+        )
+        self.db.flush()
+        self.db.add_all(
+            UserProject(user_id=user_id, project_id=project_id, role="master")
+            for user_id in range(1, 51)
+            for project_id in range(1, 6)
+        )
+        self.db.execute(
+            insert(Trouble),
+            [
+                {
+                    "id": trouble_id,
+                    "project_id": trouble_id % 50 + 1,
+                    "created_by": trouble_id % 50 + 1,
+                    "report_name": f"report {trouble_id}",
+                    "user_query": "query",
+                    "content": "",
+                    "is_shared": True,
+                    "status": TroubleStatus.COMPLETED,
+                    "created_at": datetime(2024, 1, 1) + timedelta(minutes=trouble_id),
+                }
+                for trouble_id in range(1, 1001)
+            ],
+        )
+        self.db.execute(
+            insert(TroubleLog),
+            [{"trouble_id": trouble_id, "log_id": f"log-{trouble_id}"} for trouble_id in range(1, 1001)],
+        )
+        self.db.commit()
+        with self.engine.connect() as connection:
+            for table in ("users", "project", "user_project", "troubles", "trouble_logs"):
+                connection.exec_driver_sql(f"ANALYZE TABLE `{table}`")
+
+        self.executed = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, *args):
+        self.executed.append((statement, parameters))
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리 (테스트 스키마의 모든 테이블 삭제)"""
+        self.db.close()
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        with self.engine.begin() as connection:
+            connection.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+            Base.metadata.drop_all(connection)
+            schema_migrations.drop(connection, checkfirst=True)
+            connection.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+        self.engine.dispose()
+
+    def _assert_no_full_scans(self):
+        executed = [
+            (statement, parameters)
+            for statement, parameters in self.executed
+            if statement.lstrip().upper().startswith("SELECT")
+        ]
+        assert executed
+        with self.engine.connect() as connection:
+            for statement, parameters in executed:
+                assert _full_scans(connection, statement, parameters) == [], statement
+
+    def test_ingest_and_invite_lookups(self):
+        """로그 수집(api_key), 초대 참여(invite_code) 조회"""
+        project_repo.get_project_by_api_key(self.db, "key-1")
+        project_repo.get_project_by_invite_code(self.db, "code-1")
+
+        self._assert_no_full_scans()
+
+    def test_auth_and_membership_lookups(self):
+        """로그인, 토큰 버전, 멤버십 확인, 사용자 프로젝트 목록"""
+        user_repo.get_user_by_username(self.db, "user-1")
+        user_repo.get_token_version(self.db, 1)
+        project_repo.get_member_context(self.db, 1, 1)
+        project_repo.get_user_role_in_project(self.db, 1, 1)
+        project_repo.get_project_by_user(self.db, 1)
+
+        self._assert_no_full_scans()
+
+    def test_trouble_lookups(self):
+        """trouble 상세(연관 로그 포함), 검색/필터가 붙은 목록, 커서 페이지"""
+        trouble_repo.get_trouble_by_id(self.db, 1)
+        trouble_repo.get_project_troubles_paginated(
+            self.db, 1, TroubleListQuery(page=2, size=10, search="report"), user_id=1
+        )
+        trouble_repo.get_project_troubles_page(
+            self.db, 1, TroubleListQuery(size=10), user_id=1, after=(datetime(2024, 1, 2), 5)
+        )
+
+        self._assert_no_full_scans()
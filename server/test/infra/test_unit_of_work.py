@@ -0,0 +1,156 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.enums.mapping_profile import MappingProfile
+from app.infra.database.session import Base
+from app.infra.database.unit_of_work import unit_of_work
+from app.models import Project, ProjectSetting, Trouble, TroubleLog, User, UserProject
+from app.repositories import project as project_repo
+from app.repositories import trouble as trouble_repo
+from app.schemas.project import ProjectCreate
+from app.schemas.trouble import TroubleCreate
+from app.services.project import ProjectService, settings
+
+
+class TestUnitOfWork:
+    """저장소 쓰기 트랜잭션 묶음 테스트 클래스 (SQLite 메모리 DB)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                Project.__table__,
+                ProjectSetting.__table__,
+                UserProject.__table__,
+                Trouble.__table__,
+                TroubleLog.__table__,
+            ],
+        )
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add_all(
+            [
+                User(id=1, username="owner", password="x"),
+                Project(id=1, name="p", index="idx", api_key="key", invite_code="code"),
+            ]
+        )
+        self.db.commit()
+
+        self.statements = []
+        self.commits = 0
+        event.listen(
+            self.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: self.statements.append(statement),
+        )
+        event.listen(self.engine, "commit", self._on_commit)
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def _count(self, model) -> int:
+        return self.db.scalar(select(func.count()).select_from(model))
+
+    def _create_trouble_with_logs(self, log_ids):
+        dto = TroubleCreate(project_id=1, user_query="query", related_logs=log_ids)
+        trouble = trouble_repo.create_trouble(self.db, dto, 1, "query", "")
+        trouble_repo.add_trouble_logs(self.db, trouble.id, log_ids)
+        return trouble
+
+    def test_trouble_and_logs_in_one_commit(self):
+        """trouble과 로그 연결을 INSERT 2번, commit 1번으로 저장 (로그 수와 상관없음)"""
+        log_ids = [f"log-{i}" for i in range(50)]
+
+        with unit_of_work(self.db):
+            trouble = self._create_trouble_with_logs(log_ids)
+
+        assert [s.split()[0] for s in self.statements] == ["INSERT", "INSERT"]
+        assert self.commits == 1
+        assert self._count(TroubleLog) == 50
+        assert {log.log_id for log in self.db.get(Trouble, trouble.id).logs} == set(log_ids)
+
+    def test_rollback_on_error(self):
+        """블록에서 예외가 나면 앞선 쓰기도 모두 취소"""
+        with pytest.raises(RuntimeError):
+            with unit_of_work(self.db):
+                self._create_trouble_with_logs(["log-1", "log-2"])
+                raise RuntimeError("boom")
+
+        assert self.commits == 0
+        assert self._count(Trouble) == 0
+        assert self._count(TroubleLog) == 0
+
+    def test_nested_block_joins_outer(self):
+        """안쪽 블록은 바깥 트랜잭션에 합류해 바깥 블록이 끝날 때 한 번만 commit"""
+        with unit_of_work(self.db):
+            trouble = self._create_trouble_with_logs(["log-1"])
+            trouble_repo.save_trouble_logs(self.db, trouble.id, ["log-2", "log-3"])
+            assert self.commits == 0
+
+        assert self.commits == 1
+        assert {log.log_id for log in self.db.get(Trouble, trouble.id).logs} == {"log-2", "log-3"}
+
+    def test_create_project_round_trips(self):
+        """프로젝트, 설정, master 멤버십을 존재 확인 조회 없이 commit 1번으로 생성"""
+        project = project_repo.create_project(
+            self.db, ProjectCreate(name="new", description="d"), user=1, mapping_profile=MappingProfile.LEAN
+        )
+
+        verbs = [s.split()[0] for s in self.statements]
+        assert verbs == ["INSERT", "INSERT", "INSERT", "SELECT"]  # 마지막은 refresh
+        assert self.commits == 1
+        assert project_repo.get_user_role_in_project(self.db, 1, project.id) == "master"
+        assert self.db.scalar(
+            select(ProjectSetting.mapping_profile).where(ProjectSetting.project_id == project.id)
+        ) == MappingProfile.LEAN
+
+    @patch("app.services.project.OpenSearchRepository")
+    def test_create_project_rolled_back_when_index_fails(self, mock_opensearch):
+        """OpenSearch 인덱스 생성에 실패하면 프로젝트 행도 남기지 않음"""
+        mock_opensearch.create_project_index.side_effect = RuntimeError("opensearch down")
+
+        with pytest.raises(RuntimeError):
+            ProjectService(self.db).create_project(ProjectCreate(name="new", description="d"), user_id=1)
+
+        assert self._count(Project) == 1
+        assert self._count(UserProject) == 0
+        assert self._count(ProjectSetting) == 0
+
+    @patch("app.services.project.OpenSearchRepository")
+    def test_create_project_drops_index_when_commit_fails(self, mock_opensearch):
+        """인덱스를 만든 뒤 commit에 실패하면 남은 인덱스를 삭제"""
+        event.listen(self.db, "before_commit", self._fail_commit)
+
+        with pytest.raises(RuntimeError):
+            ProjectService(self.db).create_project(ProjectCreate(name="new", description="d"), user_id=1)
+
+        index_name = mock_opensearch.create_project_index.call_args.kwargs["index_name"]
+        assert mock_opensearch.create_project_index.call_args.kwargs["profile"] == settings.OPENSEARCH_MAPPING_PROFILE
+        mock_opensearch.delete_project_index.assert_called_once_with(index_name=index_name)
+        assert self._count(Project) == 1
+
+    def _fail_commit(self, session):
+        raise RuntimeError("commit failed")
+
+    def test_repository_errors_roll_back_whole_block(self):
+        """저장소 함수는 rollback하지 않고 예외를 올려 블록 전체가 함께 취소됨"""
+        with pytest.raises(Exception):
+            with unit_of_work(self.db):
+                self._create_trouble_with_logs(["log-1"])
+                project_repo.add_user_to_project(self.db, 1, 1, "master")
+                # 같은 멤버십을 한 번 더 추가해 다음 저장소 조회의 flush에서 유니크 제약 위반
+                self.db.add(UserProject(user_id=1, project_id=1, role="member"))
+                project_repo.update_user_role_in_project(self.db, 1, 1, "manager")
+
+        assert self._count(Trouble) == 0
+        assert self._count(UserProject) == 0
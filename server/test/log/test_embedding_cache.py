@@ -0,0 +1,73 @@
+from unittest.mock import Mock, patch
+
+from app.core.utils.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """검색어 임베딩 캐시 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.cache = EmbeddingCache(max_size=2, ttl_seconds=60)
+        self.compute = Mock(side_effect=lambda text: [float(len(text))])
+
+    def test_repeated_query_hits_cache(self):
+        """같은 검색어는 임베딩 API를 한 번만 호출"""
+        first = self.cache.get_or_compute("login failure", self.compute, "model", 1)
+        second = self.cache.get_or_compute("  login   failure ", self.compute, "model", 1)
+
+        assert first == second
+        self.compute.assert_called_once()
+        stats = self.cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_key_includes_model_and_dims(self):
+        """모델이나 차원수가 다르면 별도 항목"""
+        self.cache.get_or_compute("timeout", self.compute, "model-a", 1)
+        self.cache.get_or_compute("timeout", self.compute, "model-b", 1)
+        self.cache.get_or_compute("timeout", self.compute, "model-a", 2)
+
+        assert self.compute.call_count == 3
+
+    def test_evicts_least_recently_used(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목 제거"""
+        self.cache.get_or_compute("a", self.compute, "model", 1)
+        self.cache.get_or_compute("b", self.compute, "model", 1)
+        self.cache.get_or_compute("a", self.compute, "model", 1)
+        self.cache.get_or_compute("c", self.compute, "model", 1)
+        self.cache.get_or_compute("a", self.compute, "model", 1)
+        self.cache.get_or_compute("b", self.compute, "model", 1)
+
+        # a, b, c, b 만 계산 (a는 계속 사용되어 남아있음)
+        assert [call.args[0] for call in self.compute.call_args_list] == ["a", "b", "c", "b"]
+
+    @patch("app.core.utils.embedding_cache.time.time")
+    def test_expired_entry_is_recomputed(self, mock_time):
+        """TTL이 지나면 다시 계산"""
+        mock_time.return_value = 1000
+        self.cache.get_or_compute("a", self.compute, "model", 1)
+        mock_time.return_value = 1061
+        self.cache.get_or_compute("a", self.compute, "model", 1)
+
+        assert self.compute.call_count == 2
+
+    def test_persist_and_load(self, tmp_path):
+        """디스크에 저장한 캐시를 재시작 후 불러옴"""
+        path = str(tmp_path / "cache" / "embedding.json")
+        cache = EmbeddingCache(max_size=2, ttl_seconds=60, persist_path=path)
+        cache.get_or_compute("a", self.compute, "model", 1)
+        assert cache.save() == 1
+
+        restored = EmbeddingCache(max_size=2, ttl_seconds=60, persist_path=path)
+        assert restored.load() == 1
+        assert restored.get_or_compute("a", self.compute, "model", 1) == [1.0]
+        self.compute.assert_called_once()
+
+    def test_load_without_file(self, tmp_path):
+        """저장 파일이 없으면 빈 캐시로 시작"""
+        cache = EmbeddingCache(persist_path=str(tmp_path / "missing.json"))
+
+        assert cache.load() == 0
+        assert EmbeddingCache().save() == 0
@@ -0,0 +1,188 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import HTTPException
+from opensearchpy.exceptions import ConnectionError, RequestError
+
+from app.core.enums.search_mode import HybridSearchMode
+from app.infra.database.opensearch import OpenSearchClient
+from app.services.log import LogService
+
+
+def _hit(doc_id: str) -> dict:
+    return {"_id": doc_id, "_score": 1.0, "_source": {"message": doc_id}}
+
+
+class TestHybridSearch:
+    """BM25 + kNN 하이브리드 검색 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.client = OpenSearchClient()
+        self.client.client = Mock()
+        self.client._generate_embeddings = Mock(return_value=[0.1, 0.2])
+        self.filters = {"bool": {"must": [{"term": {"keyword": "login"}}]}}
+
+    def test_pipeline_mode_single_request(self):
+        """hybrid 쿼리 + search pipeline으로 한 번에 조회"""
+        self.client._hybrid_mode = HybridSearchMode.PIPELINE
+        self.client.client.search.return_value = {"took": 7, "hits": {"hits": [_hit("a")]}}
+
+        result = self.client.search_by_hybrid("test-index", "login failure", filters=self.filters, k=5)
+
+        self.client.client.search_pipeline.put.assert_called_once()
+        kwargs = self.client.client.search.call_args.kwargs
+        bm25, knn = kwargs["body"]["query"]["hybrid"]["queries"]
+        assert bm25["bool"]["must"][0]["multi_match"]["fields"] == ["message", "comment"]
+        assert bm25["bool"]["filter"] == [self.filters]
+        assert knn["knn"]["vector"] == {"vector": [0.1, 0.2], "k": 5, "filter": self.filters}
+        assert kwargs["search_pipeline"] == "lognlook-hybrid"
+        assert result["hits"] == [_hit("a")]
+        assert result["latency_ms"]["hybrid"] == 7
+        assert "embedding" in result["latency_ms"]
+
+    def test_pipeline_registered_once(self):
+        """search pipeline은 프로세스당 한 번만 등록"""
+        self.client._hybrid_mode = HybridSearchMode.PIPELINE
+        self.client.client.search.return_value = {"took": 1, "hits": {"hits": []}}
+
+        self.client.search_by_hybrid("test-index", "a")
+        self.client.search_by_hybrid("test-index", "b")
+
+        self.client.client.search_pipeline.put.assert_called_once()
+
+    def test_falls_back_to_msearch_without_plugin(self):
+        """pipeline 등록이 실패하면 msearch + RRF로 전환"""
+        self.client._hybrid_mode = HybridSearchMode.PIPELINE
+        self.client.client.search_pipeline.put.side_effect = RequestError(400, "unsupported", {})
+        self.client.client.msearch.return_value = {
+            "responses": [
+                {"took": 3, "hits": {"hits": [_hit("a"), _hit("b")]}},
+                {"took": 4, "hits": {"hits": [_hit("b"), _hit("c")]}},
+            ]
+        }
+
+        result = self.client.search_by_hybrid("test-index", "timeout", k=3)
+
+        self.client.client.search.assert_not_called()
+        assert self.client._hybrid_mode == HybridSearchMode.MSEARCH
+        assert len(self.client.client.msearch.call_args.kwargs["body"]) == 4
+        assert [hit["_id"] for hit in result["hits"]] == ["b", "a", "c"]
+        assert result["hits"][0]["_source"] == {"message": "b"}
+        assert result["latency_ms"]["bm25"] == 3
+        assert result["latency_ms"]["knn"] == 4
+
+    def _msearch_response(self):
+        self.client.client.msearch.return_value = {
+            "responses": [
+                {"took": 1, "hits": {"hits": [_hit("a")]}},
+                {"took": 1, "hits": {"hits": [_hit("a")]}},
+            ]
+        }
+
+    def test_unknown_hybrid_query_falls_back(self):
+        """hybrid 쿼리를 모르는 클러스터면 msearch + RRF로 전환"""
+        self.client._hybrid_mode = HybridSearchMode.PIPELINE
+        self.client.client.search.side_effect = RequestError(
+            400, "parsing_exception", {"error": {"reason": "unknown query [hybrid]"}}
+        )
+        self._msearch_response()
+
+        result = self.client.search_by_hybrid("test-index", "timeout")
+
+        assert self.client._hybrid_mode == HybridSearchMode.MSEARCH
+        assert [hit["_id"] for hit in result["hits"]] == ["a"]
+
+    def test_other_request_errors_keep_pipeline_mode(self):
+        """잘못된 검색 조건 같은 다른 오류는 그대로 전달하고 pipeline 방식 유지"""
+        self.client._hybrid_mode = HybridSearchMode.PIPELINE
+        self.client.client.search.side_effect = RequestError(
+            400, "search_phase_execution_exception", {"error": {"reason": "failed to parse date field [bad]"}}
+        )
+
+        with pytest.raises(RequestError):
+            self.client.search_by_hybrid("test-index", "timeout")
+
+        assert self.client._hybrid_mode == HybridSearchMode.PIPELINE
+        self.client.client.msearch.assert_not_called()
+
+    def test_missing_pipeline_registered_again(self):
+        """search pipeline이 없어졌으면 이번 요청은 msearch, 다음 요청에서 다시 등록"""
+        self.client._hybrid_mode = HybridSearchMode.PIPELINE
+        self.client.client.search.side_effect = [
+            RequestError(400, "illegal_argument_exception", {"error": {"reason": "Pipeline lognlook-hybrid is not defined"}}),
+            {"took": 1, "hits": {"hits": [_hit("b")]}},
+        ]
+        self._msearch_response()
+
+        first = self.client.search_by_hybrid("test-index", "timeout")
+        second = self.client.search_by_hybrid("test-index", "timeout")
+
+        assert [hit["_id"] for hit in first["hits"]] == ["a"]
+        assert [hit["_id"] for hit in second["hits"]] == ["b"]
+        assert self.client._hybrid_mode == HybridSearchMode.PIPELINE
+        assert self.client.client.search_pipeline.put.call_count == 2
+
+    def test_transient_pipeline_error_keeps_pipeline_mode(self):
+        """pipeline 등록 중 연결 오류는 이번 요청만 msearch로 처리"""
+        self.client._hybrid_mode = HybridSearchMode.PIPELINE
+        self.client.client.search_pipeline.put.side_effect = ConnectionError("N/A", "timeout", None)
+        self._msearch_response()
+
+        self.client.search_by_hybrid("test-index", "timeout")
+
+        assert self.client._hybrid_mode == HybridSearchMode.PIPELINE
+        self.client.client.search.assert_not_called()
+
+    @patch("app.services.log.OpenSearchRepository.retrieve_logs")
+    @patch("app.services.log.ProjectService.get_project_by_id")
+    def test_invalid_time_range_rejected(self, mock_get_project, mock_retrieve):
+        """형식이 잘못되었거나 순서가 뒤바뀐 검색 기간은 쿼리 전에 400"""
+        mock_get_project.return_value = Mock(id=1, index="test-index")
+        service = LogService(Mock())
+
+        for start_time, end_time in (("yesterday", None), ("2024-01-02T00:00:00", "2024-01-01T00:00:00")):
+            with pytest.raises(HTTPException) as exc_info:
+                service.get_retrieve_logs(1, "timeout", start_time=start_time, end_time=end_time)
+            assert exc_info.value.status_code == 400
+
+        mock_retrieve.assert_not_called()
+
+    @patch("app.services.log.result_cache")
+    @patch("app.services.log.OpenSearchRepository.retrieve_logs")
+    @patch("app.services.log.ProjectService.get_project_by_id")
+    def test_search_keeps_exact_time_range(self, mock_get_project, mock_retrieve, mock_cache):
+        """검색 쿼리는 요청 기간 그대로, 캐시 키만 분 단위로 넓히고 기간 밖 결과는 뺌"""
+        mock_get_project.return_value = Mock(id=1, index="test-index")
+        mock_retrieve.return_value = {"hits": [], "latency_ms": {"knn": 1.0}}
+        mock_cache.get_or_compute.side_effect = lambda endpoint, project_id, key, compute, **kw: [
+            *compute(),
+            {"id": "before", "message_timestamp": "2024-01-01T10:00:10"},
+            {"id": "inside", "message_timestamp": "2024-01-01T10:00:40"},
+            {"id": "after", "message_timestamp": "2024-01-01T10:05:01"},
+        ]
+        service = LogService(Mock())
+
+        logs, _ = service.get_retrieve_logs(
+            1, "timeout", start_time="2024-01-01T10:00:30", end_time="2024-01-01T10:05:00"
+        )
+
+        kwargs = mock_retrieve.call_args.kwargs
+        assert (kwargs["start_time"], kwargs["end_time"]) == ("2024-01-01T10:00:30", "2024-01-01T10:05:00")
+        key = mock_cache.get_or_compute.call_args.args[2]
+        assert key[-2:] == ("2024-01-01T10:00:00", "2024-01-01T10:05:00")
+        assert [log["id"] for log in logs] == ["inside"]
+
+        with patch("app.services.log.settings.RESULT_CACHE_ENABLED", False):
+            service.get_retrieve_logs(1, "timeout", start_time="2024-01-01T10:00:30", end_time="2024-01-01T10:05:00")
+        assert mock_retrieve.call_args.kwargs["start_time"] == "2024-01-01T10:00:30"
+
+    def test_reciprocal_rank_fusion(self):
+        """두 순위에 모두 있는 문서가 위로, 전체 hit 유지"""
+        fused = self.client.reciprocal_rank_fusion(
+            [[_hit("a"), _hit("b")], [_hit("b"), _hit("c")]], size=2, rank_constant=60
+        )
+
+        assert [hit["_id"] for hit in fused] == ["b", "a"]
+        assert fused[0]["_score"] == 1 / 62 + 1 / 61
+        assert self.client.reciprocal_rank_fusion([[], []]) == []
@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+
+from app.core.utils.result_cache import PROJECT_WIDE_BUCKET, IngestWatermark
+from app.repositories import ingest_watermark as watermark_repo
+from app.tasks.ingest_watermark import run_watermark_sync_once
+
+NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc).timestamp() + 0.5
+
+
+def _utc(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+@patch("app.tasks.ingest_watermark.watermark_repo")
+@patch("app.tasks.ingest_watermark.SessionLocal")
+class TestWatermarkSync:
+    """적재 워터마크 DB 동기화 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.watermark = IngestWatermark()
+        patchers = [
+            patch("app.tasks.ingest_watermark.ingest_watermark", self.watermark),
+            patch("app.core.utils.result_cache.time.time", return_value=NOW),
+            patch("app.tasks.ingest_watermark.time.time", return_value=NOW),
+        ]
+        for patcher in patchers:
+            patcher.start()
+        self.patchers = patchers
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_saves_pending_marks_as_utc(self, mock_session_local, mock_repo):
+        """저장하지 않은 기록을 UTC 시각으로 저장하고 DB의 기록을 반영"""
+        mock_repo.get_ingest_watermarks_since.return_value = []
+        self.watermark.mark(1, datetime(2024, 1, 1, 10, 30))
+        self.watermark.invalidate(2)
+
+        run_watermark_sync_once()
+
+        rows = mock_repo.upsert_ingest_watermarks.call_args.args[1]
+        ingested_at = _utc(NOW)
+        assert sorted(rows, key=lambda row: row["project_id"]) == [
+            {"project_id": 1, "bucket_start": datetime(2024, 1, 1, 10, 0), "ingested_at": ingested_at},
+            {"project_id": 2, "bucket_start": PROJECT_WIDE_BUCKET, "ingested_at": ingested_at},
+        ]
+        assert self.watermark.drain() == {}
+        mock_session_local.return_value.close.assert_called_once()
+
+    def test_merges_other_process_marks(self, mock_session_local, mock_repo):
+        """다른 프로세스가 저장한 기록을 반영해 해당 기간의 마지막 적재 시각이 바뀜"""
+        mock_repo.get_ingest_watermarks_since.return_value = [
+            (1, datetime(2024, 1, 1, 10, 0), _utc(NOW - 1)),
+        ]
+
+        assert run_watermark_sync_once() == 1
+
+        mock_repo.upsert_ingest_watermarks.assert_not_called()
+        last = self.watermark.last_ingest_at(1, datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0))
+        assert last == pytest.approx(NOW - 1)
+        assert self.watermark.last_ingest_at(1, datetime(2024, 1, 1, 11, 0), datetime(2024, 1, 1, 12, 0)) == 0.0
+
+    def test_restores_pending_marks_on_failure(self, mock_session_local, mock_repo):
+        """저장 실패 시 기록을 되돌려 다음 동기화 때 다시 저장"""
+        mock_repo.upsert_ingest_watermarks.side_effect = Exception("DB 연결 실패")
+        self.watermark.mark(1)
+
+        with pytest.raises(Exception):
+            run_watermark_sync_once()
+
+        assert self.watermark.drain() == {(1, PROJECT_WIDE_BUCKET): NOW}
+        mock_session_local.return_value.close.assert_called_once()
+
+
+class TestIngestWatermarkRepository:
+    """적재 워터마크 저장 쿼리 테스트 클래스"""
+
+    def test_upsert_keeps_latest_time_in_key_order(self):
+        """이미 있는 버킷은 더 늦은 적재 시각을 유지하고, 행은 키 순서로 정렬해 잠금 순서를 맞춤"""
+        db = Mock(spec=Session)
+        rows = [
+            {"project_id": 2, "bucket_start": datetime(2024, 1, 1), "ingested_at": datetime(2024, 1, 1, 12)},
+            {"project_id": 1, "bucket_start": datetime(2024, 1, 1), "ingested_at": datetime(2024, 1, 1, 12)},
+        ]
+
+        watermark_repo.upsert_ingest_watermarks(db, rows)
+
+        stmt = db.execute.call_args.args[0]
+        compiled = stmt.compile(dialect=mysql.dialect())
+        assert "ON DUPLICATE KEY UPDATE ingested_at = greatest(" in str(compiled)
+        assert compiled.params["project_id_m0"] == 1
+        assert compiled.params["project_id_m1"] == 2
@@ -0,0 +1,97 @@
+from unittest.mock import Mock, patch
+from datetime import datetime
+
+from app.core.enums.log_filter import LogTimeFilter
+from app.core.enums.mapping_profile import MappingProfile
+from app.core.utils.time_utils import get_dashboard_range
+from app.repositories import opensearch as OpenSearchRepository
+
+
+class TestLogDashboard:
+    """get_log_dashboard 함수 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_client = Mock()
+        self.mock_client.aggregate.return_value = {
+            "total": 6,
+            "aggregations": {
+                "timeline": {
+                    "buckets": [
+                        {
+                            "key_as_string": "2024-01-01T10:00:00",
+                            "doc_count": 4,
+                            "levels": {
+                                "buckets": [
+                                    {"key": "INFO", "doc_count": 3},
+                                    {"key": "ERROR", "doc_count": 1},
+                                ]
+                            },
+                        },
+                        {
+                            "key_as_string": "2024-01-01T11:00:00",
+                            "doc_count": 2,
+                            "levels": {"buckets": [{"key": "warn", "doc_count": 2}]},
+                        },
+                        {
+                            "key_as_string": "2024-01-01T12:00:00",
+                            "doc_count": 0,
+                            "levels": {"buckets": []},
+                        },
+                    ]
+                },
+                "levels": {
+                    "buckets": [
+                        {"key": "INFO", "doc_count": 3},
+                        {"key": "warn", "doc_count": 2},
+                        {"key": "ERROR", "doc_count": 1},
+                    ]
+                },
+                "keywords": {"buckets": [{"key": "로그인", "doc_count": 6}]},
+            },
+        }
+
+    def test_compact_series(self):
+        """버킷 결과를 레벨별 시계열로 변환"""
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            result = OpenSearchRepository.get_log_dashboard(
+                "test-index", "2024-01-01T10:00:00", "2024-01-01T12:00:00", "1h", MappingProfile.FULL
+            )
+
+        # 끝 시각 경계의 버킷은 제외
+        assert result["timestamps"] == ["2024-01-01T10:00:00", "2024-01-01T11:00:00"]
+        assert result["series"] == {"INFO": [3, 0], "WARN": [0, 2], "ERROR": [1, 0]}
+        assert result["levels"] == {"INFO": 3, "WARN": 2, "ERROR": 1}
+        assert result["keywords"] == {"로그인": 6}
+        assert result["total"] == 6
+
+        # 한 번의 요청으로 시계열, 레벨, 키워드 집계
+        self.mock_client.aggregate.assert_called_once()
+        aggs = self.mock_client.aggregate.call_args.kwargs["aggs"]
+        assert set(aggs) == {"timeline", "levels", "keywords"}
+
+    def test_keyword_fields_follow_index_profile(self):
+        """집계 필드 이름은 설정값이 아니라 인덱스를 만든 매핑 프로필 기준"""
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            for profile, level_field, keyword_field in [
+                (MappingProfile.FULL, "log_level.keyword", "keyword.keyword"),
+                (MappingProfile.LEAN, "log_level", "keyword"),
+            ]:
+                OpenSearchRepository.get_log_dashboard(
+                    "test-index", "2024-01-01T10:00:00", "2024-01-01T12:00:00", "1h", profile
+                )
+
+                aggs = self.mock_client.aggregate.call_args.kwargs["aggs"]
+                assert aggs["levels"]["terms"]["field"] == level_field
+                assert aggs["timeline"]["aggs"]["levels"]["terms"]["field"] == level_field
+                assert aggs["keywords"]["terms"]["field"] == keyword_field
+
+    def test_range_is_rounded(self):
+        """같은 버킷 안에서는 동일한 범위를 반환 (request cache 적중)"""
+        start_time, end_time, interval = get_dashboard_range(LogTimeFilter.DAY)
+
+        end = datetime.fromisoformat(end_time)
+        assert interval == "1h"
+        assert end.minute == 0 and end.second == 0 and end.microsecond == 0
+        assert end > datetime.now()
+        assert (end - datetime.fromisoformat(start_time)).days == 1
@@ -0,0 +1,146 @@
+from unittest.mock import Mock, patch
+
+from app.api.routers.log import get_log_detail
+from app.infra.database.opensearch import OpenSearchClient
+from app.core.utils.http_cache import make_etag, etag_matches
+from app.services.log import LogService
+
+
+def _doc(doc_id: str, found: bool = True) -> dict:
+    doc = {"_index": "test-index", "_id": doc_id, "_version": 1, "found": found}
+    if found:
+        doc.update(_version=3, _seq_no=7, _primary_term=1, _source={"message": doc_id})
+    return doc
+
+
+class TestGetByIds:
+    """_mget 기반 로그 상세 조회 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.client = OpenSearchClient()
+        self.client.client = Mock()
+        self.client.client.mget.side_effect = lambda index, body, params: {
+            "docs": [_doc(doc_id, found=doc_id != "missing") for doc_id in body["ids"]]
+        }
+
+    def test_chunks_large_id_lists(self):
+        """id가 많으면 chunk 단위로 나눠 모두 조회 (잘림 없음)"""
+        ids = [f"log-{i}" for i in range(5)]
+
+        result = self.client.get_by_ids("test-index", ids, chunk_size=2)
+
+        assert self.client.client.mget.call_count == 3
+        assert [doc["_id"] for doc in result] == ids
+
+    def test_skips_missing_and_duplicates(self):
+        """없는 문서는 제외하고 중복 id는 한 번만 조회"""
+        result = self.client.get_by_ids("test-index", ["b", "missing", "a", "b"])
+
+        assert self.client.client.mget.call_args.kwargs["body"] == {"ids": ["b", "missing", "a"]}
+        assert result == [
+            {"_index": "test-index", "_id": "b", "_version": 3, "_source": {"message": "b"}},
+            {"_index": "test-index", "_id": "a", "_version": 3, "_source": {"message": "a"}},
+        ]
+
+    def test_source_projection(self):
+        """요청한 필드만 받고 vector는 항상 제외"""
+        self.client.get_by_ids("test-index", ["a"], source_includes=["message", "host.name"])
+
+        params = self.client.client.mget.call_args.kwargs["params"]
+        assert params == {"_source_excludes": "vector", "_source_includes": "message,host.name"}
+
+    def test_versions_without_source(self):
+        """ETag용 버전 조회는 _source 없이 _version만 받음"""
+        versions = self.client.get_versions("test-index", ["a", "missing", "a"])
+
+        assert self.client.client.mget.call_args.kwargs["params"] == {"_source": "false"}
+        assert versions == [["a", 3]]
+
+
+class TestLogDetailRevalidation:
+    """/logs/detail 캐시 재검증 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.service = Mock()
+        self.service.get_log_detail_etag.return_value = '"v1"'
+        self.service.get_log_detail_with_etag.return_value = (
+            [{"_id": "a", "_version": 2, "_source": {"message": "a"}}],
+            '"v2"',
+        )
+        self.context = Mock(project_id=1)
+
+    def _request(self, if_none_match=None):
+        request = Mock()
+        request.headers = {"if-none-match": if_none_match} if if_none_match else {}
+        return request
+
+    def test_not_modified_skips_source_fetch(self):
+        """ETag가 같으면 본문을 조회하지 않고 304"""
+        response = get_log_detail(self._request('"v1"'), ["a"], None, self.service, self.context)
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"v1"'
+        self.service.get_log_detail_with_etag.assert_not_called()
+
+    def test_first_fetch_skips_version_lookup(self):
+        """If-None-Match가 없으면 버전만 따로 조회하지 않고 가져온 문서의 _version으로 ETag"""
+        response = get_log_detail(self._request(), ["a"], None, self.service, self.context)
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"v2"'
+        self.service.get_log_detail_etag.assert_not_called()
+
+    def test_short_max_age_with_revalidation(self):
+        """변경된 로그는 본문을 다시 조회하고 짧게 캐시한 뒤 재검증"""
+        response = get_log_detail(self._request('"v0"'), ["a"], None, self.service, self.context)
+
+        assert response.status_code == 200
+        self.service.get_log_detail_with_etag.assert_called_once_with(1, ["a"], None)
+        cache_control = response.headers["cache-control"]
+        assert "immutable" not in cache_control
+        assert "must-revalidate" in cache_control
+        assert response.headers["etag"] == '"v2"'
+
+
+@patch("app.services.log.ProjectService.get_project_by_id", return_value=Mock(index="test-index"))
+@patch("app.services.log.OpenSearchRepository")
+class TestLogDetailEtag:
+    """로그 상세 ETag 계산 테스트 클래스"""
+
+    def test_fetch_and_revalidation_agree(self, mock_opensearch, mock_get_project):
+        """본문과 함께 계산한 ETag와 버전만 조회해 계산한 ETag가 같고, 문서가 바뀌면 달라짐"""
+        mock_opensearch.get_logs_by_ids.return_value = [
+            {"_index": "test-index", "_id": "a", "_version": 2, "_source": {"message": "a"}},
+        ]
+        mock_opensearch.get_log_versions.return_value = [["a", 2]]
+        service = LogService(Mock())
+
+        logs, etag = service.get_log_detail_with_etag(1, ["a"], ["message"])
+
+        assert logs == mock_opensearch.get_logs_by_ids.return_value
+        assert service.get_log_detail_etag(1, ["a"], ["message"]) == etag
+        mock_opensearch.get_log_versions.return_value = [["a", 3]]
+        assert service.get_log_detail_etag(1, ["a"], ["message"]) != etag
+        assert service.get_log_detail_etag(1, ["a"], None) != etag
+
+
+class TestHttpCache:
+    """ETag 유틸 테스트 클래스"""
+
+    def test_etag_is_stable_per_body(self):
+        """같은 본문은 같은 strong ETag"""
+        assert make_etag(b"[1]") == make_etag(b"[1]")
+        assert make_etag(b"[1]") != make_etag(b"[2]")
+        assert not make_etag(b"[1]").startswith("W/")
+
+    def test_if_none_match(self):
+        """If-None-Match 목록, weak 표기, * 처리"""
+        etag = make_etag(b"[1]")
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
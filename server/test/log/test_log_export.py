@@ -0,0 +1,188 @@
+import io
+import json
+import pytest
+from unittest.mock import Mock, patch
+from fastapi import HTTPException
+
+from app.core.enums.export_format import ExportFormat
+from app.repositories.opensearch import iter_logs_for_export
+from app.core.utils.export_utils import (
+    with_error_trailer,
+    write_csv,
+    write_ndjson,
+    write_parquet,
+)
+from app.services.log import LogService
+
+
+def _hit(doc_id: str) -> dict:
+    return {
+        "_id": doc_id,
+        "_source": {"message": f"msg {doc_id}", "host": {"name": "web-1"}, "tags": ["a"]},
+        "sort": [doc_id],
+    }
+
+
+def _fake_search_after(**kwargs):
+    """slice마다 3건, 페이지 크기 2로 나눠 반환"""
+    docs = [_hit(f"{kwargs['slice_id']}-{i}") for i in range(3)]
+    after = kwargs["search_after"]
+    start = 0 if after is None else [d["sort"] for d in docs].index(after) + 1
+    return docs[start:start + kwargs["size"]]
+
+
+@patch("app.repositories.opensearch.client")
+class TestIterLogsForExport:
+    """point in time slice 병렬 내보내기 테스트 클래스"""
+
+    def test_streams_every_document(self, mock_client):
+        """모든 slice의 모든 문서를 배치 단위로 반환하고 PIT 해제"""
+        mock_client.create_pit.return_value = "pit-1"
+        mock_client.search_after.side_effect = _fake_search_after
+
+        batches = list(iter_logs_for_export("test-index", {"match_all": {}}, batch_size=2, slices=2))
+
+        ids = sorted(hit["_id"] for batch in batches for hit in batch)
+        assert ids == ["0-0", "0-1", "0-2", "1-0", "1-1", "1-2"]
+        assert all(len(batch) <= 2 for batch in batches)
+        assert {call.kwargs["max_slices"] for call in mock_client.search_after.call_args_list} == {2}
+        mock_client.delete_pit.assert_called_once_with("pit-1")
+
+    def test_slice_error_is_raised(self, mock_client):
+        """slice 조회 실패는 스트림 소비 중 500으로 전달"""
+        mock_client.create_pit.return_value = "pit-1"
+        mock_client.search_after.side_effect = Exception("boom")
+
+        with pytest.raises(HTTPException) as exc_info:
+            list(iter_logs_for_export("test-index", {"match_all": {}}, slices=2))
+
+        assert exc_info.value.status_code == 500
+        mock_client.delete_pit.assert_called_once_with("pit-1")
+
+    def test_pit_error_raised_before_streaming(self, mock_client):
+        """PIT 생성 실패는 응답 시작 전에 바로 발생"""
+        mock_client.create_pit.side_effect = Exception("no index")
+
+        with pytest.raises(HTTPException):
+            iter_logs_for_export("missing-index", {"match_all": {}})
+
+
+class TestExportWriters:
+    """내보내기 파일 형식 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.batches = [[_hit("a"), _hit("b")], [], [_hit("c")]]
+
+    def test_ndjson(self):
+        """한 줄에 로그 하나, _id 포함"""
+        lines = b"".join(write_ndjson(self.batches)).decode("utf-8").splitlines()
+
+        assert [json.loads(line)["_id"] for line in lines] == ["a", "b", "c"]
+        assert json.loads(lines[0])["host"] == {"name": "web-1"}
+
+    def test_csv(self):
+        """헤더 한 번, 점 표기 열, 중첩 값은 JSON 문자열"""
+        text = b"".join(write_csv(self.batches, ["message", "host.name", "tags"])).decode("utf-8")
+
+        assert text.startswith("\ufeff_id,message,host.name,tags")
+        rows = text.strip().splitlines()
+        assert len(rows) == 4
+        assert rows[1] == 'a,msg a,web-1,"[""a""]"'
+
+    def test_parquet(self):
+        """batch마다 row group을 쓰고 읽을 수 있는 파일 생성"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        pytest.importorskip("pandas")
+
+        data = b"".join(write_parquet(self.batches, ["message", "host.name"]))
+
+        table = pq.read_table(io.BytesIO(data))
+        assert table.column_names == ["_id", "message", "host.name"]
+        assert table.column("_id").to_pylist() == ["a", "b", "c"]
+
+
+def _failing_batches(batches):
+    yield from batches
+    raise HTTPException(status_code=500, detail="Failed to export logs: shard failure")
+
+
+class TestExportErrorTrailer:
+    """스트리밍 도중 실패 표시 테스트 클래스"""
+
+    def _consume(self, chunks) -> bytes:
+        received = []
+        with pytest.raises(HTTPException):
+            for chunk in chunks:
+                received.append(chunk)
+        return b"".join(received)
+
+    def test_ndjson_error_line(self):
+        """NDJSON은 오류 객체를 마지막 줄로 보내고 연결을 끊음"""
+        chunks = with_error_trailer(write_ndjson(_failing_batches([[_hit("a")]])), ExportFormat.NDJSON)
+
+        lines = self._consume(chunks).decode("utf-8").splitlines()
+
+        assert json.loads(lines[0])["_id"] == "a"
+        assert json.loads(lines[-1]) == {"_export_error": "Failed to export logs: shard failure"}
+
+    def test_csv_error_row(self):
+        """CSV는 오류 행을 마지막 행으로 보냄"""
+        chunks = with_error_trailer(write_csv(_failing_batches([[_hit("a")]]), ["message"]), ExportFormat.CSV)
+
+        rows = self._consume(chunks).decode("utf-8").strip().splitlines()
+
+        assert rows[-1].startswith("#export_error,")
+
+    def test_parquet_is_left_without_footer(self):
+        """Parquet은 footer 없이 끊겨 잘린 파일을 열 수 없음"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        pytest.importorskip("pandas")
+        chunks = with_error_trailer(
+            write_parquet(_failing_batches([[_hit("a")]]), ["message"]), ExportFormat.PARQUET
+        )
+
+        data = self._consume(chunks)
+
+        with pytest.raises(Exception):
+            pq.read_table(io.BytesIO(data))
+
+
+@patch("app.services.log.OpenSearchRepository")
+@patch("app.services.log.ProjectService")
+class TestExportValidation:
+    """내보내기 응답 시작 전 검증 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.service = LogService(Mock())
+
+    def test_first_batch_error_before_streaming(self, mock_project_service, mock_opensearch_repo):
+        """첫 배치 조회 실패는 응답을 시작하기 전에 예외로 전달"""
+        mock_project_service.return_value.get_project_by_id.return_value = Mock(index="test-index")
+        mock_opensearch_repo.iter_logs_for_export.return_value = _failing_batches([])
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.service.export_logs(1, "2024-01-01T00:00:00", "2024-01-02T00:00:00")
+
+        assert exc_info.value.status_code == 500
+
+    def test_invalid_time_range(self, mock_project_service, mock_opensearch_repo):
+        """잘못된 기간은 조회 없이 400"""
+        mock_project_service.return_value.get_project_by_id.return_value = Mock(index="test-index")
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.service.export_logs(1, "2024-01-02T00:00:00", "2024-01-01T00:00:00")
+
+        assert exc_info.value.status_code == 400
+        mock_opensearch_repo.iter_logs_for_export.assert_not_called()
+
+    def test_streams_prefetched_batch(self, mock_project_service, mock_opensearch_repo):
+        """미리 조회한 첫 배치도 빠짐없이 스트리밍"""
+        mock_project_service.return_value.get_project_by_id.return_value = Mock(index="test-index")
+        mock_opensearch_repo.iter_logs_for_export.return_value = iter([[_hit("a")], [_hit("b")]])
+
+        chunks = self.service.export_logs(1, "2024-01-01T00:00:00", "2024-01-02T00:00:00")
+
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        assert [json.loads(line)["_id"] for line in lines] == ["a", "b"]
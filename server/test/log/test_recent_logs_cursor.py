@@ -0,0 +1,163 @@
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from opensearchpy.exceptions import NotFoundError
+
+from app.repositories.opensearch import get_recent_logs_page, RECENT_LOGS_SORT
+from app.core.utils.cursor_utils import (
+    OpenPitRegistry,
+    decode_cursor,
+    encode_cursor,
+    parse_keep_alive,
+)
+
+
+def _hits(count: int, start: int = 0) -> list:
+    return [
+        {"_id": f"log-{i}", "_source": {"message": f"m{i}"}, "sort": [1700000000000 - i, 100 - i]}
+        for i in range(start, start + count)
+    ]
+
+
+class TestCursorUtils:
+    """커서 인코딩 테스트 클래스"""
+
+    def test_round_trip(self):
+        """인코딩한 커서를 같은 프로젝트에서 그대로 복원"""
+        cursor = encode_cursor(1, "pit-1", [1700000000000, 9])
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, 1) == ("pit-1", [1700000000000, 9])
+
+    @pytest.mark.parametrize(
+        "cursor", ["not-a-cursor", encode_cursor(1, "pit", [1])[:-2], encode_cursor(1, "pit", []), ""]
+    )
+    def test_invalid_cursor(self, cursor):
+        """형식이나 서명이 잘못된 커서는 ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 1)
+
+    def test_other_project_rejected(self):
+        """다른 프로젝트에서 발급한 커서는 ValueError"""
+        with pytest.raises(ValueError, match="another project|this project"):
+            decode_cursor(encode_cursor(1, "pit-1", [1, 2]), 2)
+
+    def test_tampered_payload_rejected(self):
+        """본문의 프로젝트를 바꾸면 서명이 맞지 않음"""
+        body, signature = encode_cursor(1, "pit-1", [1, 2]).split(".")
+        forged_body = encode_cursor(2, "pit-1", [1, 2]).split(".")[0]
+
+        with pytest.raises(ValueError):
+            decode_cursor(f"{forged_body}.{signature}", 2)
+
+    def test_parse_keep_alive(self):
+        """OpenSearch 시간 값을 초로 변환"""
+        assert parse_keep_alive("5m") == 300
+        assert parse_keep_alive("30s") == 30
+        assert parse_keep_alive("1500") == 1.5
+
+
+class TestOpenPitRegistry:
+    """최근 로그 커서 PIT 목록 테스트 클래스"""
+
+    def test_evicts_least_recently_used(self):
+        """한도를 넘으면 가장 오래 쓰지 않은 PIT를 해제 대상으로 반환"""
+        registry = OpenPitRegistry(max_open=2)
+
+        assert registry.touch("a", 60) == []
+        assert registry.touch("b", 60) == []
+        assert registry.touch("a", 60) == []
+        assert registry.touch("c", 60) == ["b"]
+        assert len(registry) == 2
+
+    def test_expired_pits_forgotten(self):
+        """keep_alive가 지난 PIT는 해제 요청 없이 목록에서만 뺌"""
+        registry = OpenPitRegistry(max_open=1)
+        registry.touch("a", 0)
+
+        assert registry.touch("b", 60) == []
+        assert len(registry) == 1
+
+
+@patch("app.repositories.opensearch.recent_log_pits", new_callable=lambda: OpenPitRegistry(max_open=2))
+@patch("app.repositories.opensearch.client")
+class TestRecentLogsPage:
+    """point in time + search_after 페이지 조회 테스트 클래스"""
+
+    def test_first_page_creates_pit(self, mock_client, registry):
+        """첫 페이지는 PIT를 만들고 _shard_doc 보조 정렬의 한 번의 쿼리로 조회"""
+        mock_client.create_pit.return_value = "pit-1"
+        mock_client.search_after.return_value = _hits(2)
+
+        logs, next_cursor = get_recent_logs_page("test-index", 1, size=2, keep_alive="1m")
+
+        mock_client.create_pit.assert_called_once_with(index="test-index", keep_alive="1m")
+        kwargs = mock_client.search_after.call_args.kwargs
+        assert kwargs["pit_id"] == "pit-1"
+        assert kwargs["sort"] == RECENT_LOGS_SORT
+        assert "_shard_doc" in RECENT_LOGS_SORT[-1]
+        assert kwargs["search_after"] is None
+        assert len(logs) == 2
+        assert decode_cursor(next_cursor, 1) == ("pit-1", _hits(2)[-1]["sort"])
+        assert len(registry) == 1
+
+    def test_next_page_uses_cursor(self, mock_client, registry):
+        """커서가 있으면 같은 PIT에서 search_after로 이어서 조회"""
+        mock_client.search_after.return_value = _hits(2, start=2)
+        cursor = encode_cursor(1, "pit-1", [1699999999999, 99])
+
+        get_recent_logs_page("test-index", 1, size=2, cursor=cursor)
+
+        mock_client.create_pit.assert_not_called()
+        kwargs = mock_client.search_after.call_args.kwargs
+        assert kwargs["pit_id"] == "pit-1"
+        assert kwargs["search_after"] == [1699999999999, 99]
+
+    def test_last_page_releases_pit(self, mock_client, registry):
+        """size보다 적게 오면 마지막 페이지로 보고 PIT 해제"""
+        mock_client.create_pit.return_value = "pit-1"
+        mock_client.search_after.return_value = _hits(1)
+
+        logs, next_cursor = get_recent_logs_page("test-index", 1, size=2)
+
+        assert next_cursor is None
+        mock_client.delete_pit.assert_called_once_with("pit-1")
+        assert len(registry) == 0
+
+    def test_open_pit_limit(self, mock_client, registry):
+        """다음 페이지를 요청하지 않은 PIT가 한도를 넘으면 가장 오래된 PIT 해제"""
+        mock_client.create_pit.side_effect = ["pit-1", "pit-2", "pit-3"]
+        mock_client.search_after.return_value = _hits(2)
+
+        for _ in range(3):
+            get_recent_logs_page("test-index", 1, size=2)
+
+        mock_client.delete_pit.assert_called_once_with("pit-1")
+        assert len(registry) == 2
+
+    def test_invalid_cursor(self, mock_client, registry):
+        """잘못된 커서는 400"""
+        with pytest.raises(HTTPException) as exc_info:
+            get_recent_logs_page("test-index", 1, cursor="garbage")
+
+        assert exc_info.value.status_code == 400
+        mock_client.search_after.assert_not_called()
+
+    def test_other_project_cursor(self, mock_client, registry):
+        """다른 프로젝트의 커서로는 그 프로젝트의 PIT를 읽을 수 없음"""
+        cursor = encode_cursor(1, "pit-1", [1, 0])
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_recent_logs_page("other-index", 2, cursor=cursor)
+
+        assert exc_info.value.status_code == 400
+        mock_client.search_after.assert_not_called()
+
+    def test_expired_pit(self, mock_client, registry):
+        """만료된 PIT 커서는 410"""
+        mock_client.search_after.side_effect = NotFoundError(404, "search_context_missing_exception", {})
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_recent_logs_page("test-index", 1, cursor=encode_cursor(1, "pit-1", [1, 0]))
+
+        assert exc_info.value.status_code == 410
@@ -0,0 +1,172 @@
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from app.core.utils.result_cache import (
+    PROJECT_WIDE_BUCKET,
+    IngestWatermark,
+    ResultCache,
+    round_time_range,
+)
+
+START = datetime(2024, 1, 1, 10, 0)
+END = datetime(2024, 1, 1, 12, 0)
+
+
+class TestResultCache:
+    """수집 워터마크 기반 조회 결과 캐시 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.now = 1000.0
+        patcher = patch("app.core.utils.result_cache.time.time", side_effect=lambda: self.now)
+        patcher.start()
+        self.patcher = patcher
+        self.watermark = IngestWatermark()
+        self.cache = ResultCache(self.watermark, max_bytes=1024, ttl_seconds=60, grace_seconds=2)
+        self.compute = Mock(return_value=[{"id": "a"}])
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def _get(self, key=("q",), endpoint="logs.search", start=START, end=END):
+        return self.cache.get_or_compute(endpoint, 1, key, self.compute, start=start, end=end)
+
+    def test_repeated_request_hits_cache(self):
+        """같은 조건의 요청은 한 번만 조회"""
+        self._get()
+        self.now += 1
+        assert self._get() == [{"id": "a"}]
+
+        self.compute.assert_called_once()
+        stats = self.cache.stats()["endpoints"]["logs.search"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_ingest_in_window_invalidates(self):
+        """조회 기간에 새 로그가 적재되면 다시 조회"""
+        self._get()
+        self.now += 1
+        self.watermark.mark(1, datetime(2024, 1, 1, 11, 30))
+        self.now += 1
+        self._get()
+
+        assert self.compute.call_count == 2
+        assert self.cache.stats()["endpoints"]["logs.search"]["invalidated"] == 1
+
+    def test_ingest_outside_window_keeps_entry(self):
+        """다른 시간대나 다른 프로젝트의 적재는 영향 없음"""
+        self._get()
+        self.now += 1
+        self.watermark.mark(1, datetime(2024, 1, 2, 9, 0))
+        self.watermark.mark(2, datetime(2024, 1, 1, 11, 0))
+        self.now += 1
+        self._get()
+
+        self.compute.assert_called_once()
+
+    def test_open_window_invalidated_by_any_ingest(self):
+        """기간이 없는 검색은 프로젝트의 모든 적재에 무효화"""
+        self._get(start=None, end=None)
+        self.now += 1
+        self.watermark.mark(1, datetime(2023, 6, 1))
+        self.now += 1
+        self._get(start=None, end=None)
+
+        assert self.compute.call_count == 2
+
+    def test_recent_ingest_within_grace_is_not_trusted(self):
+        """refresh 전일 수 있는 직전 적재가 있으면 다음 요청에서 다시 조회"""
+        self.watermark.mark(1, datetime(2024, 1, 1, 11, 0))
+        self.now += 1
+        self._get()
+        self.now += 1
+        self._get()
+
+        assert self.compute.call_count == 2
+
+    def test_invalidate_project(self):
+        """보존 정책 실행 후 프로젝트 캐시 전체 무효화"""
+        self._get()
+        self.now += 1
+        self.watermark.invalidate(1)
+        self.now += 3
+        self._get()
+
+        assert self.compute.call_count == 2
+
+    def test_merged_ingest_from_other_process_invalidates(self):
+        """다른 프로세스가 저장한 적재 기록을 반영하면 해당 기간의 캐시 무효화"""
+        self._get()
+        self.now += 3
+        self.watermark.merge([(1, datetime(2024, 1, 1, 11, 0), self.now - 1)])
+        self._get()
+
+        assert self.compute.call_count == 2
+        assert self.watermark.drain() == {}
+
+    def test_drain_and_restore_pending_marks(self):
+        """저장하지 않은 기록만 꺼내고, 저장 실패 시 되돌리면 다음에 다시 꺼냄"""
+        self.watermark.mark(1, datetime(2024, 1, 1, 10, 30))
+        self.watermark.invalidate(2)
+
+        pending = self.watermark.drain()
+
+        assert pending == {
+            (1, datetime(2024, 1, 1, 10, 0)): 1000.0,
+            (2, PROJECT_WIDE_BUCKET): 1000.0,
+        }
+        assert self.watermark.drain() == {}
+        self.watermark.restore(pending)
+        assert self.watermark.drain() == pending
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 다시 조회"""
+        self._get()
+        self.now += 61
+        self._get()
+
+        assert self.compute.call_count == 2
+
+    def test_memory_bound_evicts_oldest(self):
+        """메모리 한도를 넘으면 가장 오래 사용하지 않은 결과부터 제거"""
+        self.compute.return_value = ["x" * 400]
+        self._get(key=("a",))
+        self._get(key=("b",))
+        self._get(key=("c",))
+
+        stats = self.cache.stats()
+        assert stats["size"] == 2
+        assert stats["bytes"] <= 1024
+        self._get(key=("a",))
+        assert self.compute.call_count == 4
+
+    def test_endpoints_tracked_separately(self):
+        """엔드포인트별 적중률을 따로 집계"""
+        self._get(endpoint="logs.search")
+        self._get(endpoint="logs.dashboard")
+        self.now += 1
+        self._get(endpoint="logs.dashboard")
+
+        endpoints = self.cache.stats()["endpoints"]
+        assert endpoints["logs.search"]["hits"] == 0
+        assert endpoints["logs.dashboard"]["hits"] == 1
+
+
+class TestRoundTimeRange:
+    """검색 기간 반올림 테스트 클래스"""
+
+    def test_widens_to_minute(self):
+        """시작은 내림, 끝은 올림"""
+        assert round_time_range("2024-01-01T10:00:30", "2024-01-01T10:05:01.5") == (
+            "2024-01-01T10:00:00",
+            "2024-01-01T10:06:00",
+        )
+
+    def test_timezone_converted_to_utc(self):
+        """시간대가 있으면 UTC 기준으로 변환"""
+        assert round_time_range("2024-01-01T19:00:00+09:00", None) == ("2024-01-01T10:00:00", None)
+
+    def test_invalid_value_kept(self):
+        """형식이 잘못된 값은 그대로 둠"""
+        assert round_time_range("yesterday", None) == ("yesterday", None)
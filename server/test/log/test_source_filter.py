@@ -0,0 +1,43 @@
+from unittest.mock import Mock
+
+from app.infra.database.opensearch import OpenSearchClient
+from app.core.utils.log_utils import BASIC_LOG_FIELDS
+
+
+class TestSourceFilter:
+    """OpenSearch _source 필터링 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.client = OpenSearchClient()
+        self.client.client = Mock()
+        self.client.client.search.return_value = {"hits": {"hits": []}}
+
+    def _sent_body(self) -> dict:
+        return self.client.client.search.call_args.kwargs["body"]
+
+    def test_vector_always_excluded(self):
+        """필드 지정이 없어도 vector는 응답에서 제외"""
+        self.client.search_by_id("test-index", ["a", "b"])
+
+        body = self._sent_body()
+        assert body["_source"] == {"excludes": ["vector"]}
+        assert body["size"] == 2
+
+    def test_includes_requested_fields(self):
+        """엔드포인트에서 필요한 필드만 요청"""
+        self.client.search_by_datetime(
+            "test-index",
+            {"message_timestamp": {"gte": "2024-01-01", "lte": "2024-01-02"}},
+            source_includes=BASIC_LOG_FIELDS,
+        )
+
+        source = self._sent_body()["_source"]
+        assert source["includes"] == BASIC_LOG_FIELDS
+        assert "vector" in source["excludes"]
+
+    def test_explicit_source_is_preserved(self):
+        """호출자가 직접 지정한 _source는 덮어쓰지 않음"""
+        self.client._execute_search("test-index", {"query": {}, "_source": False})
+
+        assert self._sent_body()["_source"] is False
@@ -0,0 +1,139 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+from app.infra.database.session import Base
+from app.models import (
+    Notification,
+    Project,
+    ProjectSetting,
+    Trouble,
+    TroubleLog,
+    User,
+    UserProject,
+)
+from app.repositories import project as project_repo
+from app.repositories import user as user_repo
+
+PROJECTS = 20
+TROUBLES_PER_PROJECT = 50
+LOGS_PER_TROUBLE = 10
+NOTIFICATIONS_PER_PROJECT = 30
+
+
+class SqlRecorder:
+    """실행된 SQL 문 수와 가져온 행 수를 기록"""
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.rows = 0
+        event.listen(engine, "after_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+        if statement.lstrip().upper().startswith("SELECT"):
+            # SQLite는 SELECT의 rowcount를 알려주지 않으므로 같은 문장을 COUNT로 다시 실행
+            count_cursor = conn.connection.dbapi_connection.cursor()
+            count_cursor.execute(f"SELECT COUNT(*) FROM ({statement})", parameters)
+            self.rows += count_cursor.fetchone()[0]
+
+    def reset(self):
+        self.statements = 0
+        self.rows = 0
+
+
+def seed(db) -> None:
+    """사용자 1명이 여러 프로젝트에 속하고 프로젝트마다 trouble/알림이 많은 데이터셋"""
+    db.add(User(id=1, username="owner", password="x"))
+    for p in range(1, PROJECTS + 1):
+        db.add(Project(id=p, name=f"p{p}", index=f"idx-{p}", api_key=f"key-{p}", invite_code=f"code-{p}"))
+        db.add(ProjectSetting(project_id=p, log_keywords=["error"], log_retention_days=30))
+        db.add(UserProject(user_id=1, project_id=p, role="master"))
+        db.add_all(
+            Notification(project_id=p, type="info", message="m")
+            for _ in range(NOTIFICATIONS_PER_PROJECT)
+        )
+        for t in range(TROUBLES_PER_PROJECT):
+            trouble = Trouble(
+                project_id=p, created_by=1, report_name="r", user_query="q", content=""
+            )
+            trouble.logs = [TroubleLog(log_id=f"log-{i}") for i in range(LOGS_PER_TROUBLE)]
+            db.add(trouble)
+    db.commit()
+
+
+# 주요 엔드포인트가 매 요청 실행하는 조회
+HOT_QUERIES = {
+    "auth: get_user_by_username": lambda db: user_repo.get_user_by_username(db, "owner"),
+    "logs: get_project_by_id": lambda db: project_repo.get_project_by_id(db, 1),
+    "settings: get_project_by_id(with_setting)": lambda db: project_repo.get_project_by_id(
+        db, 1, with_setting=True
+    ).setting.log_keywords,
+    "projects: get_project_by_user": lambda db: project_repo.get_project_by_user(db, 1),
+    "retention: get_projects_with_retention": lambda db: [
+        project.setting.log_retention_days
+        for project, _ in project_repo.get_projects_with_retention(db)
+    ],
+}
+
+
+def measure() -> dict:
+    """조회별 (SQL 문 수, 가져온 행 수)"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    seed(db)
+    recorder = SqlRecorder(engine)
+
+    results = {}
+    for name, query in HOT_QUERIES.items():
+        db.expunge_all()
+        recorder.reset()
+        query(db)
+        results[name] = (recorder.statements, recorder.rows)
+    db.close()
+    engine.dispose()
+    return results
+
+
+class TestLoadingStrategy:
+    """ORM 관계 로딩 전략 테스트 클래스 (SQLite 메모리 DB)"""
+
+    @classmethod
+    def setup_class(cls):
+        """시드 데이터로 한 번만 측정"""
+        cls.results = measure()
+
+    def test_auth_lookup_loads_only_user_row(self):
+        """인증 사용자 조회는 사용자의 trouble/프로젝트 연결을 가져오지 않음"""
+        assert self.results["auth: get_user_by_username"] == (1, 1)
+
+    def test_project_lookup_loads_only_project_row(self):
+        """프로젝트 조회는 trouble/알림/멤버 행을 가져오지 않음"""
+        assert self.results["logs: get_project_by_id"] == (1, 1)
+        assert self.results["settings: get_project_by_id(with_setting)"] == (1, 1)
+
+    def test_collection_queries_scale_with_projects_only(self):
+        """목록 조회 행 수는 프로젝트 수에 비례 (trouble 수와 무관)"""
+        assert self.results["projects: get_project_by_user"] == (1, PROJECTS)
+        assert self.results["retention: get_projects_with_retention"] == (1, PROJECTS)
+
+    def test_unloaded_collection_raises(self):
+        """명시적으로 로딩하지 않은 컬렉션 접근은 숨은 쿼리 대신 예외"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        seed(db)
+        db.expunge_all()
+
+        project = project_repo.get_project_by_id(db, 1)
+        with pytest.raises(InvalidRequestError):
+            project.troubles
+        db.close()
+
+
+if __name__ == "__main__":
+    # 벤치마크 결과 출력
+    for name, (statements, rows) in measure().items():
+        print(f"{name:<45} statements={statements:<3} rows={rows}")
@@ -0,0 +1,71 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import HTTPException
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums.roles import ProjectRole
+from app.core.utils.membership_cache import MembershipCache, TokenVersionCache
+from app.schemas.project import ProjectContext
+from app.schemas.user import CurrentUser
+from app.services.async_project import AsyncProjectService
+
+
+def _user(token_version: int = 0, memberships: dict = None) -> CurrentUser:
+    return CurrentUser(
+        user_id=1,
+        username="user1",
+        token_version=token_version,
+        memberships=memberships or {},
+    )
+
+
+@patch("app.services.async_project.UserRepository")
+@patch("app.services.async_project.token_version_cache", new_callable=TokenVersionCache)
+@patch("app.services.async_project.membership_cache", new_callable=MembershipCache)
+@patch("app.services.async_project.ProjectRepository")
+class TestAsyncGetProjectContext:
+    """비동기 요청 권한 컨텍스트 확인 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=AsyncSession)
+        self.service = AsyncProjectService(self.mock_db)
+
+    def test_current_token_claim(self, mock_repo, mock_cache, mock_versions, mock_user_repo):
+        """최신 토큰의 멤버십 클레임은 멤버십 쿼리 없이 사용"""
+        mock_user_repo.get_token_version = AsyncMock(return_value=2)
+        mock_repo.get_member_context = AsyncMock()
+
+        context = asyncio.run(
+            self.service.get_project_context(1, _user(token_version=2, memberships={1: "manager"}))
+        )
+
+        assert context.role == ProjectRole.MANAGER
+        mock_repo.get_member_context.assert_not_awaited()
+
+    def test_cached_after_first_lookup(self, mock_repo, mock_cache, mock_versions, mock_user_repo):
+        """DB로 확인한 멤버십은 동기 경로와 같은 캐시에 저장"""
+        mock_repo.get_member_context = AsyncMock(
+            return_value=Mock(user_id=1, project_id=1, role="member")
+        )
+
+        first = asyncio.run(self.service.get_project_context(1, _user()))
+        second = asyncio.run(self.service.get_project_context(1, _user()))
+
+        assert first == second == ProjectContext(
+            user_id=1, username="user1", project_id=1, role=ProjectRole.MEMBER
+        )
+        mock_repo.get_member_context.assert_awaited_once()
+
+    def test_not_member_rejected(self, mock_repo, mock_cache, mock_versions, mock_user_repo):
+        """멤버가 아니면 403, 캐시에 남기지 않음"""
+        mock_repo.get_member_context = AsyncMock(
+            return_value=Mock(user_id=1, project_id=1, role=None)
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(self.service.get_project_context(1, _user()))
+
+        assert exc_info.value.status_code == 403
+        assert mock_cache.get(1, 1) is None
@@ -0,0 +1,206 @@
+import pytest
+from unittest.mock import Mock, patch
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.enums.roles import ProjectRole
+from app.core.utils.membership_cache import MembershipCache, TokenVersionCache
+from app.infra.database.session import Base
+from app.models import Project, User, UserProject
+from app.repositories.project import get_member_context
+from app.schemas.project import ProjectContext, RoleChange
+from app.schemas.user import CurrentUser
+from app.services.project import ProjectService
+
+
+def _context(user_id: int = 1, project_id: int = 1, role: ProjectRole = ProjectRole.MASTER):
+    return ProjectContext(
+        user_id=user_id, username=f"user{user_id}", project_id=project_id, role=role
+    )
+
+
+class TestGetMemberContext:
+    """멤버십 단일 쿼리 테스트 클래스 (SQLite 메모리 DB)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(
+            self.engine,
+            tables=[User.__table__, Project.__table__, UserProject.__table__],
+        )
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add_all(
+            [
+                User(id=1, username="member", password="x"),
+                User(id=2, username="outsider", password="x"),
+                Project(id=1, name="p", index="idx", api_key="key", invite_code="code"),
+                UserProject(user_id=1, project_id=1, role="manager"),
+            ]
+        )
+        self.db.commit()
+
+        self.statements = []
+        event.listen(
+            self.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: self.statements.append(statement),
+        )
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def test_member(self):
+        """사용자, 프로젝트, 역할을 쿼리 한 번으로 조회"""
+        row = get_member_context(self.db, 1, 1)
+
+        assert len(self.statements) == 1
+        assert (row.user_id, row.project_id, row.role) == (1, 1, "manager")
+
+    def test_not_member(self):
+        """멤버가 아니면 역할만 비어 있음"""
+        row = get_member_context(self.db, 2, 1)
+
+        assert (row.user_id, row.project_id, row.role) == (2, 1, None)
+
+    def test_missing_project_and_user(self):
+        """프로젝트가 없으면 project_id가 비어 있고, 사용자가 없으면 결과 없음"""
+        row = get_member_context(self.db, 1, 99)
+
+        assert (row.user_id, row.project_id, row.role) == (1, None, None)
+        assert get_member_context(self.db, 99, 1) is None
+
+
+def _user(user_id: int = 1, token_version: int = 0, memberships: dict = None) -> CurrentUser:
+    return CurrentUser(
+        user_id=user_id,
+        username=f"user{user_id}",
+        token_version=token_version,
+        memberships=memberships or {},
+    )
+
+
+@patch("app.services.project.UserRepository")
+@patch("app.services.project.token_version_cache", new_callable=TokenVersionCache)
+@patch("app.services.project.membership_cache", new_callable=MembershipCache)
+@patch("app.services.project.ProjectRepository")
+class TestGetProjectContext:
+    """요청 권한 컨텍스트 확인 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=Session)
+        self.service = ProjectService(self.mock_db)
+
+    def test_current_token_claim_skips_membership_query(
+        self, mock_repo, mock_cache, mock_versions, mock_user_repo
+    ):
+        """최신 토큰의 멤버십 클레임은 DB 멤버십 조회 없이 사용 (버전 확인은 캐시)"""
+        mock_user_repo.get_token_version.return_value = 3
+        user = _user(token_version=3, memberships={1: "manager"})
+
+        first = self.service.get_project_context(1, user)
+        second = self.service.get_project_context(1, user)
+
+        assert first == second == _context(role=ProjectRole.MANAGER)
+        mock_repo.get_member_context.assert_not_called()
+        mock_user_repo.get_token_version.assert_called_once()
+
+    def test_stale_token_revalidated(self, mock_repo, mock_cache, mock_versions, mock_user_repo):
+        """멤버십 변경으로 버전이 올라간 토큰은 DB에서 다시 확인"""
+        mock_user_repo.get_token_version.return_value = 4
+        mock_repo.get_member_context.return_value = Mock(user_id=1, project_id=1, role=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.service.get_project_context(1, _user(token_version=3, memberships={1: "manager"}))
+
+        assert exc_info.value.status_code == 403
+
+    def test_cached_after_first_lookup(self, mock_repo, mock_cache, mock_versions, mock_user_repo):
+        """토큰에 없는 프로젝트는 DB로 확인하고, 두 번째 요청은 쿼리 없이 캐시 사용"""
+        mock_repo.get_member_context.return_value = Mock(user_id=1, project_id=1, role="member")
+
+        first = self.service.get_project_context(1, _user())
+        second = self.service.get_project_context(1, _user())
+
+        assert first == second == _context(role=ProjectRole.MEMBER)
+        mock_repo.get_member_context.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "row, status_code",
+        [
+            (None, 400),
+            (Mock(user_id=1, project_id=None, role=None), 404),
+            (Mock(user_id=1, project_id=1, role=None), 403),
+        ],
+    )
+    def test_rejected_not_cached(
+        self, mock_repo, mock_cache, mock_versions, mock_user_repo, row, status_code
+    ):
+        """사용자/프로젝트가 없거나 멤버가 아니면 에러, 캐시에 남기지 않음"""
+        mock_repo.get_member_context.return_value = row
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.service.get_project_context(1, _user())
+
+        assert exc_info.value.status_code == status_code
+        assert mock_cache.get(1, 1) is None
+
+    def test_change_user_role_invalidates_target(
+        self, mock_repo, mock_cache, mock_versions, mock_user_repo
+    ):
+        """역할이 바뀐 사용자의 토큰 버전을 올리고 그 사용자의 캐시만 무효화"""
+        mock_versions.put(2, 0)
+        mock_cache.put(_context(user_id=1))
+        mock_cache.put(_context(user_id=2, role=ProjectRole.MEMBER))
+        mock_repo.get_user_role_in_project.return_value = "member"
+        mock_repo.update_user_role_in_project.return_value = True
+
+        self.service.change_user_role(
+            _context(user_id=1), RoleChange(user_id=2, new_role=ProjectRole.MODERATOR)
+        )
+
+        assert mock_cache.get(1, 1) is not None
+        assert mock_cache.get(2, 1) is None
+        assert mock_versions.get(2) is None
+        mock_user_repo.bump_token_versions.assert_called_once_with(db=self.mock_db, user_ids=[2])
+
+    def test_leaving_member_invalidated(self, mock_repo, mock_cache, mock_versions, mock_user_repo):
+        """프로젝트를 나가면 그 사용자의 토큰 버전을 올리고 캐시 무효화"""
+        context = _context(user_id=2, role=ProjectRole.MEMBER)
+        mock_cache.put(context)
+        mock_repo.get_project_members_count.return_value = 2
+        mock_repo.delete_user_project.return_value = True
+
+        self.service.delete_project(context)
+
+        assert mock_cache.get(2, 1) is None
+        mock_user_repo.bump_token_versions.assert_called_once_with(db=self.mock_db, user_ids=[2])
+
+
+class TestMembershipCache:
+    """멤버십 캐시 테스트 클래스"""
+
+    def test_expires_after_ttl(self):
+        """TTL이 지나면 다시 조회하도록 None 반환"""
+        cache = MembershipCache(ttl_seconds=30)
+        cache.put(_context())
+
+        with patch("app.core.utils.membership_cache.time.monotonic", return_value=10**9):
+            assert cache.get(1, 1) is None
+
+    def test_invalidate_project(self):
+        """프로젝트 전체 무효화는 다른 프로젝트에 영향 없음"""
+        cache = MembershipCache()
+        cache.put(_context(user_id=1, project_id=1))
+        cache.put(_context(user_id=2, project_id=1))
+        cache.put(_context(user_id=1, project_id=2))
+
+        cache.invalidate(1)
+
+        assert cache.get(1, 1) is None
+        assert cache.get(2, 1) is None
+        assert cache.get(1, 2) is not None
@@ -0,0 +1,190 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+from fastapi import HTTPException
+from opensearchpy.exceptions import NotFoundError
+
+from app.repositories import opensearch as OpenSearchRepository
+from app.services.retention import RetentionService
+
+
+def _task(index, completed=True, deleted=0, updated=0, failures=None):
+    return {
+        "completed": completed,
+        "task": {
+            "description": f"delete-by-query [{index}]",
+            "status": {"total": deleted + updated, "deleted": deleted, "updated": updated},
+        },
+        "response": {"failures": failures or []},
+    }
+
+
+class TestExpireProjectLogs:
+    """expire_project_logs 함수 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.index = "test-index"
+
+        self.mock_client = Mock()
+        self.mock_client.client.indices.exists.return_value = True
+        self.mock_client.delete_by_query.return_value = "node:1"
+        self.mock_client.update_by_query.return_value = "node:2"
+
+    def test_starts_delete_task(self):
+        """스로틀링된 delete-by-query를 완료를 기다리지 않는 작업으로 시작"""
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            run = OpenSearchRepository.expire_project_logs(
+                self.index, log_retention_days=30, requests_per_second=100
+            )
+
+        kwargs = self.mock_client.delete_by_query.call_args.kwargs
+        assert kwargs["index"] == self.index
+        assert kwargs["requests_per_second"] == 100
+        self.mock_client.update_by_query.assert_not_called()
+        self.mock_client.expunge_deletes.assert_not_called()
+        assert run == {
+            "index": self.index,
+            "tasks": [{"task_id": "node:1", "action": "delete_logs"}],
+        }
+
+    def test_vector_retention_only(self):
+        """벡터 보존 기간만 설정된 경우 벡터 필드만 제거"""
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            run = OpenSearchRepository.expire_project_logs(
+                self.index, vector_retention_days=7
+            )
+
+        self.mock_client.delete_by_query.assert_not_called()
+        assert "remove('vector')" in self.mock_client.update_by_query.call_args.kwargs["script"]
+        assert run["tasks"] == [{"task_id": "node:2", "action": "remove_vectors"}]
+
+    def test_vector_removal_skips_deleted_range(self):
+        """같은 실행에서 삭제될 로그는 벡터 제거 대상에서 제외"""
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            OpenSearchRepository.expire_project_logs(
+                self.index, log_retention_days=30, vector_retention_days=7
+            )
+
+        query = self.mock_client.update_by_query.call_args.kwargs["query"]
+        time_range = query["bool"]["filter"][0]["range"]["@timestamp"]
+        assert time_range["gte"] < time_range["lt"]
+
+    def test_vector_retention_longer_than_logs(self):
+        """벡터 보존 기간이 로그보다 길면 벡터 제거 작업을 만들지 않음"""
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            run = OpenSearchRepository.expire_project_logs(
+                self.index, log_retention_days=7, vector_retention_days=30
+            )
+
+        self.mock_client.update_by_query.assert_not_called()
+        assert [task["action"] for task in run["tasks"]] == ["delete_logs"]
+
+    def test_missing_index(self):
+        """인덱스가 없으면 아무 작업도 하지 않음"""
+        self.mock_client.client.indices.exists.return_value = False
+
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            run = OpenSearchRepository.expire_project_logs(
+                self.index, log_retention_days=30
+            )
+
+        self.mock_client.delete_by_query.assert_not_called()
+        assert run["tasks"] == []
+
+
+class TestGetExpiryTask:
+    """get_expiry_task 함수 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_client = Mock()
+
+    def test_task_status(self):
+        """작업 진행 상태와 실패 목록 반환"""
+        self.mock_client.get_task.return_value = _task(
+            "test-index", completed=True, deleted=12, failures=[{"cause": "x"}]
+        )
+
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            status = OpenSearchRepository.get_expiry_task("test-index", "node:1")
+
+        assert status["completed"] is True
+        assert status["deleted"] == 12
+        assert len(status["failures"]) == 1
+
+    def test_other_index_task_hidden(self):
+        """다른 인덱스의 작업은 404"""
+        self.mock_client.get_task.return_value = _task("other-index")
+
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            with pytest.raises(HTTPException) as exc_info:
+                OpenSearchRepository.get_expiry_task("test-index", "node:1")
+
+        assert exc_info.value.status_code == 404
+
+    def test_unknown_task(self):
+        """없는 작업은 404"""
+        self.mock_client.get_task.side_effect = NotFoundError(404, "resource_not_found_exception", {})
+
+        with patch.object(OpenSearchRepository, "client", self.mock_client):
+            with pytest.raises(HTTPException) as exc_info:
+                OpenSearchRepository.get_expiry_task("test-index", "node:1")
+
+        assert exc_info.value.status_code == 404
+
+
+@patch("app.services.retention.RollupService")
+@patch("app.services.retention.time.sleep")
+@patch("app.services.retention.OpenSearchRepository")
+@patch("app.services.retention.ProjectRepository")
+class TestRetentionScheduler:
+    """스케줄러용 run_retention 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.project = Mock(id=1, index="test-index")
+        self.project.setting.log_retention_days = 30
+        self.project.setting.vector_retention_days = None
+
+    def test_waits_for_tasks_then_reclaims(self, mock_project_repo, mock_opensearch_repo, mock_sleep, mock_rollup_service):
+        """작업 완료를 기다린 뒤 삭제 공간을 회수하고 결과를 기록"""
+        mock_project_repo.get_projects_with_retention.return_value = [(self.project, None)]
+        mock_opensearch_repo.get_index_store_size.side_effect = [1000, 400]
+        mock_opensearch_repo.expire_project_logs.return_value = {
+            "index": "test-index",
+            "tasks": [{"task_id": "node:1", "action": "delete_logs"}],
+        }
+        mock_opensearch_repo.get_expiry_task.side_effect = [
+            {"completed": False, "deleted": 1, "updated": 0, "failures": []},
+            {"completed": True, "deleted": 3, "updated": 0, "failures": []},
+        ]
+
+        reports = RetentionService(Mock()).run_retention()
+
+        assert mock_sleep.call_count == 1
+        mock_opensearch_repo.expunge_deleted_logs.assert_called_once_with("test-index")
+        assert reports == [
+            {"index": "test-index", "deleted_docs": 3, "removed_vectors": 0, "bytes_reclaimed": 600}
+        ]
+        # 같은 실행에서 만료 기준 시각 이전의 대시보드 집계도 정리
+        project_id, cutoff = mock_rollup_service.return_value.expire.call_args.args
+        assert project_id == 1
+        assert abs(cutoff - (datetime.now() - timedelta(days=30))) < timedelta(minutes=1)
+
+    def test_project_failure_does_not_stop_others(self, mock_project_repo, mock_opensearch_repo, mock_sleep, mock_rollup_service):
+        """한 프로젝트가 실패해도 나머지 프로젝트는 계속 정리"""
+        other = Mock(id=2, index="other-index")
+        other.setting.log_retention_days = 30
+        other.setting.vector_retention_days = None
+        mock_project_repo.get_projects_with_retention.return_value = [(self.project, None), (other, None)]
+        mock_opensearch_repo.get_index_store_size.return_value = 0
+        mock_opensearch_repo.expire_project_logs.side_effect = [
+            HTTPException(status_code=500, detail="boom"),
+            {"index": "other-index", "tasks": []},
+        ]
+
+        reports = RetentionService(Mock()).run_retention()
+
+        assert [report["index"] for report in reports] == ["other-index"]
+        mock_opensearch_repo.expunge_deleted_logs.assert_not_called()
@@ -0,0 +1,247 @@
+from unittest.mock import Mock, patch
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.enums.log_filter import LogTimeFilter
+from app.core.enums.mapping_profile import MappingProfile
+from app.core.utils.rollup_utils import RollupBuffer
+from app.core.utils.time_utils import get_dashboard_range
+from app.infra.database.session import Base
+from app.models import LogRollup, Project, ProjectSetting, RollupWriter, User
+from app.services.log import LogService
+from app.services.pipeline import PipelineService
+from app.services.rollup import RollupService
+
+
+class TestRollupService:
+    """RollupService 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=Session)
+        self.service = RollupService(self.mock_db)
+        self.buffer = RollupBuffer()
+
+    def test_buffer_groups_by_minute(self):
+        """같은 분, 같은 레벨/키워드/호스트는 하나의 버킷으로 누적"""
+        self.buffer.add(1, datetime(2024, 1, 1, 10, 0, 5), "error", "로그인", "web-1")
+        self.buffer.add(1, datetime(2024, 1, 1, 10, 0, 55), "ERROR", "로그인", "web-1")
+        self.buffer.add(1, datetime(2024, 1, 1, 10, 1, 0), "ERROR", "로그인", "web-1")
+
+        counts = self.buffer.drain()
+
+        assert counts == {
+            (1, datetime(2024, 1, 1, 10, 0), "ERROR", "로그인", "web-1"): 2,
+            (1, datetime(2024, 1, 1, 10, 1), "ERROR", "로그인", "web-1"): 1,
+        }
+        assert self.buffer.drain() == {}
+
+    @patch("app.services.rollup.RollupRepository.upsert_rollups")
+    def test_flush_restores_buffer_on_failure(self, mock_upsert):
+        """저장 실패 시 건수를 버퍼에 되돌림"""
+        self.buffer.add(1, datetime(2024, 1, 1, 10, 0), "INFO")
+        mock_upsert.side_effect = Exception("DB 연결 실패")
+
+        with pytest.raises(Exception):
+            self.service.flush(self.buffer)
+
+        assert sum(self.buffer.drain().values()) == 1
+
+    @patch("app.services.rollup.RollupRepository.mark_rollup_since")
+    @patch("app.services.rollup.RollupRepository.upsert_rollups")
+    def test_flush_marks_rollup_coverage(self, mock_upsert, mock_mark):
+        """저장한 프로젝트에 버퍼가 세기 시작한 다음 분부터 집계되었다고 기록하고 한 번에 commit"""
+        self.buffer.started_at = datetime(2024, 1, 1, 9, 59, 30)
+        self.buffer.add(1, datetime(2024, 1, 1, 10, 0), "INFO")
+        self.buffer.add(2, datetime(2024, 1, 1, 10, 0), "INFO")
+
+        self.service.flush(self.buffer)
+
+        mock_mark.assert_called_once_with(self.mock_db, {1, 2}, datetime(2024, 1, 1, 10, 0))
+        self.mock_db.commit.assert_called_once()
+
+    @patch("app.services.pipeline.rollup_buffer")
+    def test_logs_without_timestamp_not_counted(self, mock_buffer):
+        """시각을 알 수 없는 로그는 OpenSearch 대시보드 집계처럼 세지 않음"""
+        PipelineService._add_rollup(Mock(), 1, {"message": "no time", "log_level": "INFO"})
+        mock_buffer.add.assert_not_called()
+
+        PipelineService._add_rollup(Mock(), 1, {"message_timestamp": "2024-01-01T10:00:05", "log_level": "INFO"})
+        assert mock_buffer.add.call_args.args == (1, datetime(2024, 1, 1, 10, 0, 5))
+
+    @patch("app.services.rollup.RollupRepository.move_rollups")
+    @patch("app.services.rollup.RollupRepository.get_rollups_before")
+    def test_compact_minutes_into_hours(self, mock_get_rollups, mock_move):
+        """분 단위 행을 시간 단위로 합치고 원본 행을 삭제"""
+        minute_rows = [
+            Mock(id=1, project_id=1, bucket_start=datetime(2024, 1, 1, 10, 1),
+                 log_level="INFO", keyword="", host="", log_count=3),
+            Mock(id=2, project_id=1, bucket_start=datetime(2024, 1, 1, 10, 59),
+                 log_level="INFO", keyword="", host="", log_count=4),
+        ]
+        mock_get_rollups.side_effect = [minute_rows, []]
+
+        moved = self.service.compact(now=datetime(2024, 1, 1, 11, 30))
+
+        rows, source_ids = mock_move.call_args.args[1:]
+        assert rows == [
+            {
+                "project_id": 1,
+                "granularity": "hour",
+                "bucket_start": datetime(2024, 1, 1, 10, 0),
+                "log_level": "INFO",
+                "keyword": "",
+                "host": "",
+                "log_count": 7,
+            }
+        ]
+        assert source_ids == [1, 2]
+        assert moved == {"hour": 2, "day": 0}
+
+    @patch("app.services.rollup.RollupRepository.get_project_rollups")
+    def test_get_dashboard_from_rollups(self, mock_get_rollups):
+        """서로 다른 단위의 행을 대시보드 버킷으로 합산"""
+        start_time, _, _ = get_dashboard_range(LogTimeFilter.DAY)
+        start = datetime.fromisoformat(start_time)
+        mock_get_rollups.return_value = [
+            (start, "ERROR", "로그인", 2),  # 시간 단위 행
+            (start + timedelta(minutes=30), "ERROR", "결제", 1),  # 분 단위 행
+            (start + timedelta(hours=2), "INFO", "", 5),
+        ]
+
+        result = self.service.get_dashboard(1, LogTimeFilter.DAY)
+
+        assert len(result["timestamps"]) == 24
+        assert result["series"]["ERROR"][0] == 3
+        assert result["series"]["INFO"][2] == 5
+        assert result["levels"] == {"ERROR": 3, "INFO": 5}
+        assert result["keywords"] == {"로그인": 2, "결제": 1}
+        assert result["total"] == 8
+
+    @patch("app.services.rollup.RollupRepository.get_rollup_since")
+    def test_covers_only_after_rollup_since(self, mock_since):
+        """집계 시작 전 기간이 섞이거나 아직 집계 전이면 집계 테이블로 조회하지 않음"""
+        mock_since.return_value = datetime(2024, 1, 1, 10, 0)
+        assert self.service.covers(1, datetime(2024, 1, 1, 10, 0))
+        assert not self.service.covers(1, datetime(2024, 1, 1, 9, 0))
+
+        mock_since.return_value = None
+        assert not self.service.covers(1, datetime(2024, 1, 1, 10, 0))
+
+    @patch("app.services.log.OpenSearchRepository.get_log_dashboard")
+    @patch("app.services.log.RollupService")
+    @patch("app.services.log.ProjectService.get_project_by_id")
+    def test_dashboard_falls_back_to_opensearch(self, mock_get_project, mock_rollup_service, mock_opensearch):
+        """집계 테이블이 기간을 덮지 못하면 OpenSearch 집계로 조회"""
+        mock_get_project.return_value = Mock(id=1, index="test-index")
+        mock_get_project.return_value.setting.mapping_profile = MappingProfile.LEAN
+        mock_rollup_service.return_value.covers.return_value = False
+        mock_opensearch.return_value = {"total": 3}
+
+        with patch("app.services.log.settings.RESULT_CACHE_ENABLED", False):
+            result = LogService(self.mock_db).get_dashboard(1, LogTimeFilter.DAY)
+
+        assert result == {"total": 3}
+        assert mock_opensearch.call_args.kwargs["profile"] == MappingProfile.LEAN
+        mock_rollup_service.return_value.get_dashboard.assert_not_called()
+
+
+
+class TestRollupCoverage:
+    """집계 테이블이 빠짐없는 기간(rollup_since) 관리 테스트 클래스 (SQLite 메모리 DB)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                Project.__table__,
+                ProjectSetting.__table__,
+                LogRollup.__table__,
+                RollupWriter.__table__,
+            ],
+        )
+        self.db = sessionmaker(bind=self.engine)()
+        self.now = datetime(2024, 1, 10, 12, 0, 30)
+        self.since = datetime(2024, 1, 1, 0, 0)
+        self.db.add_all(
+            [
+                User(id=1, username="owner", password="x"),
+                Project(id=1, name="p", index="idx-1", api_key="key-1", invite_code="code-1"),
+                Project(id=2, name="q", index="idx-2", api_key="key-2", invite_code="code-2"),
+                ProjectSetting(project_id=1, rollup_since=self.since),
+                ProjectSetting(project_id=2),
+            ]
+        )
+        self.db.commit()
+        self.service = RollupService(self.db)
+        self.buffer = RollupBuffer()
+
+    def teardown_method(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _since(self, project_id: int = 1):
+        self.db.expire_all()
+        return self.db.scalar(
+            select(ProjectSetting.rollup_since).where(ProjectSetting.project_id == project_id)
+        )
+
+    def test_live_writers_keep_coverage(self):
+        """저장 기록이 이어지는 동안에는 집계 시작 시각 유지"""
+        other = RollupBuffer()
+        self.service.heartbeat(other, now=self.now - timedelta(seconds=30))
+
+        assert self.service.heartbeat(self.buffer, now=self.now) == 0
+        assert self._since() == self.since
+        assert self.db.scalar(select(func.count()).select_from(RollupWriter)) == 2
+
+    def test_crashed_writer_moves_coverage_forward(self):
+        """정상 종료 없이 저장 기록이 끊긴 프로세스가 있으면 다음 분부터 다시 빠짐없다고 봄"""
+        crashed = RollupBuffer()
+        self.service.heartbeat(crashed, now=self.now - timedelta(minutes=10))
+
+        with patch("app.services.rollup.settings.ROLLUP_WRITER_TIMEOUT_SECONDS", 120):
+            assert self.service.heartbeat(self.buffer, now=self.now) == 1
+
+        assert self._since() == datetime(2024, 1, 10, 12, 1)
+        assert self._since(2) is None
+        assert self.db.get(RollupWriter, crashed.writer_id) is None
+
+    def test_clean_shutdown_releases_writer(self):
+        """정상 종료한 프로세스는 등록이 지워져 비정상 종료로 보지 않음"""
+        stopped = RollupBuffer()
+        self.service.heartbeat(stopped, now=self.now - timedelta(minutes=10))
+        self.service.release(stopped)
+
+        assert self.service.heartbeat(self.buffer, now=self.now) == 0
+        assert self._since() == self.since
+
+    def test_disabled_process_clears_coverage(self):
+        """집계를 끈 프로세스가 시작하면 집계 시작 시각을 지워 OpenSearch로 조회"""
+        self.service.stop_counting()
+
+        assert self._since() is None
+
+    def test_retention_expires_rollups(self):
+        """원본 로그 만료 시 기준 시각 이전 날의 집계 삭제, 그 이전이 섞인 기간은 OpenSearch로 조회"""
+        cutoff = datetime(2024, 1, 5, 8, 30)
+        self.db.add_all(
+            [
+                LogRollup(project_id=1, granularity="day", bucket_start=datetime(2024, 1, 4), log_count=5),
+                LogRollup(project_id=1, granularity="day", bucket_start=datetime(2024, 1, 5), log_count=5),
+                LogRollup(project_id=2, granularity="day", bucket_start=datetime(2024, 1, 4), log_count=5),
+            ]
+        )
+        self.db.commit()
+
+        assert self.service.expire(1, cutoff) == 1
+
+        assert self._since() == cutoff
+        assert not self.service.covers(1, datetime(2024, 1, 5))
+        remaining = self.db.execute(select(LogRollup.project_id, LogRollup.bucket_start)).all()
+        assert sorted(remaining) == [(1, datetime(2024, 1, 5)), (2, datetime(2024, 1, 4))]
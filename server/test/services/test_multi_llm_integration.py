@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from sqlalchemy.orm import Session
+from langchain_core.messages import AIMessage as ChatMessage
 from app.services.pipeline import PipelineService
 from app.services.trouble import TroubleService
 from app.core.enums.language import Language
@@ -57,20 +58,20 @@ class TestPipelineServiceMultiLLM:
         mock_embedding_model.embed_query.assert_called_once_with("테스트 코멘트")
         assert result == test_vector
     
-    @patch('app.services.pipeline.Project')
+    @patch('app.services.pipeline.get_project_by_api_key')
     @patch('app.services.pipeline.LLMFactory.create_pipeline_model')
     @patch('app.services.pipeline.LLMFactory.create_embedding_model')
     @patch.object(PipelineService, '_gen_ai_msg')
     @patch.object(PipelineService, '_embed_comment')
     def test_process_log_integration(self, mock_embed, mock_gen_ai, mock_create_embedding, 
-                                   mock_create_pipeline, mock_project_class):
+                                   mock_create_pipeline, mock_get_project):
         """process_log 메서드 통합 테스트"""
         # Mock 프로젝트 설정
         mock_project = Mock()
         mock_project.setting.log_keywords = ["error", "warning"]
         mock_project.language = Language.KOREAN
         mock_project.index = "test-index"
-        self.mock_db.query.return_value.filter.return_value.first.return_value = mock_project
+        mock_get_project.return_value = mock_project
         
         # Mock AI 응답 설정
         mock_ai_msg = AIMessage(comment="데이터베이스 연결 오류", keyword="database_error")
@@ -127,7 +128,11 @@ class TestTroubleServiceMultiLLM:
             title="데이터베이스 연결 문제 분석",
             content="상세한 트러블슈팅 내용"
         )
-        mock_chain.invoke.return_value = mock_trouble_content
+        mock_chain.invoke.return_value = {
+            "raw": ChatMessage(content="", usage_metadata={"input_tokens": 321, "output_tokens": 40, "total_tokens": 361}),
+            "parsed": mock_trouble_content,
+            "parsing_error": None,
+        }
         
         # TroubleService 생성
         trouble_service = TroubleService(self.mock_db)
@@ -135,14 +140,14 @@ class TestTroubleServiceMultiLLM:
         # 테스트 실행
         result = trouble_service._gen_ai_content(
             user_query="데이터베이스에 연결할 수 없습니다",
-            log_contents=["ERROR: Connection timeout", "ERROR: Database unreachable"],
+            log_context="ERROR: Connection timeout\nERROR: Database unreachable",
             language="korean"
         )
         
         # 검증
-        mock_model.with_structured_output.assert_called_once_with(TroubleContent)
+        mock_model.with_structured_output.assert_called_once_with(TroubleContent, include_raw=True)
         mock_chain.invoke.assert_called_once()
-        assert result == mock_trouble_content
+        assert result == (mock_trouble_content, 321)
 
 
 class TestMultiProviderScenarios:
@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import HTTPException
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums.roles import ProjectRole
+from app.core.enums.trouble_status import TroubleStatus
+from app.core.utils.count_cache import CountCache
+from app.schemas.project import ProjectContext
+from app.schemas.trouble import TroubleListQuery
+from app.services.async_trouble import AsyncTroubleService
+
+
+@patch("app.services.async_trouble.trouble_repo")
+class TestAsyncTroubleService:
+    """비동기 trouble 조회 서비스 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=AsyncSession)
+        self.service = AsyncTroubleService(self.mock_db)
+
+        self.trouble = Mock()
+        self.trouble.id = 1
+        self.trouble.created_by = 100
+        self.trouble.is_shared = False
+        self.trouble.logs = [Mock(log_id="log-1"), Mock(log_id="log-2")]
+
+    def test_get_trouble_by_creator(self, mock_repo):
+        """생성자는 로그 ID 목록과 함께 조회"""
+        mock_repo.get_trouble_by_id = AsyncMock(return_value=self.trouble)
+
+        with patch("app.services.trouble.TroubleWithLogs", lambda trouble, logs: (trouble, logs)):
+            result = asyncio.run(self.service.get_trouble_by_id(1, 100))
+
+        assert result == (self.trouble, ["log-1", "log-2"])
+        mock_repo.get_trouble_by_id.assert_awaited_once_with(self.mock_db, 1)
+
+    @pytest.mark.parametrize("trouble, status_code", [(None, 404), ("private", 403)])
+    def test_get_trouble_rejected(self, mock_repo, trouble, status_code):
+        """없는 trouble은 404, 공유되지 않은 남의 trouble은 403"""
+        mock_repo.get_trouble_by_id = AsyncMock(
+            return_value=self.trouble if trouble else None
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(self.service.get_trouble_by_id(1, 200))
+
+        assert exc_info.value.status_code == status_code
+
+    def test_get_project_troubles(self, mock_repo):
+        """요약 행과 전체 개수로 페이지 응답 구성"""
+        row = SimpleNamespace(
+            id=1,
+            report_name="report",
+            created_at=datetime(2024, 1, 1),
+            is_shared=True,
+            status=TroubleStatus.COMPLETED,
+            creator_username="owner",
+            logs_count=3,
+        )
+        mock_repo.get_project_troubles_page = AsyncMock(return_value=[row])
+        mock_repo.count_project_troubles = AsyncMock(return_value=11)
+        context = ProjectContext(
+            user_id=100, username="owner", project_id=1, role=ProjectRole.MEMBER
+        )
+        query_params = TroubleListQuery(page=1, size=10)
+
+        with patch("app.services.async_trouble.trouble_count_cache", CountCache()):
+            result = asyncio.run(self.service.get_project_troubles(context, query_params))
+
+        assert result.total == 11
+        assert result.pages == 2
+        assert result.items[0].creator_username == "owner"
+        assert result.next_cursor is None
+        mock_repo.get_project_troubles_page.assert_awaited_once_with(
+            self.mock_db, 1, query_params, 100, None
+        )
@@ -6,7 +6,9 @@ from sqlalchemy.orm import Session
 from app.services.trouble import TroubleService
 from app.schemas.trouble import TroubleCreate
 from app.models.trouble import Trouble
-from app.core.llm.prompts import TroubleContent
+from app.api.deps import get_trouble_create_context
+from app.core.enums.roles import ProjectRole
+from app.schemas.project import ProjectContext
 
 
 class TestCreateTrouble:
@@ -26,122 +28,73 @@ class TestCreateTrouble:
             related_logs=["log_id_1", "log_id_2"]
         )
         
-        self.created_by = 100
+        self.context = ProjectContext(
+            user_id=100, username="tester", project_id=1, role=ProjectRole.MEMBER
+        )
     
-    @patch('app.services.trouble.trouble_repo.save_trouble_logs')
+    @patch('app.services.trouble.trouble_repo.add_trouble_logs')
     @patch('app.services.trouble.trouble_repo.create_trouble')
-    @patch('app.services.trouble.trouble_repo.check_user_project_access')
     @patch('app.services.trouble.get_logs_by_ids')
     @patch('app.services.trouble.get_project_by_id')
     def test_create_trouble_success(
         self, 
         mock_get_project,
         mock_get_logs,
-        mock_check_access,
         mock_create_trouble,
-        mock_save_logs
+        mock_add_logs
     ):
-        """정상적인 trouble 생성 테스트"""
-        
-        # Mock 설정
-        mock_project = Mock()
-        mock_project.id = 1
-        mock_get_project.return_value = mock_project
-        mock_check_access.return_value = True
-        mock_get_logs.return_value = ["에러 로그 내용 1", "에러 로그 내용 2"]
+        """정상적인 trouble 생성 테스트 (멤버 확인은 요청 의존성에서 끝나 프로젝트를 다시 조회하지 않음)"""
         
         mock_trouble = Mock(spec=Trouble)
         mock_trouble.id = 1
         mock_create_trouble.return_value = mock_trouble
         
-        # AI 응답 모킹
-        with patch.object(self.service, '_gen_ai_content') as mock_ai:
-            mock_ai.return_value = TroubleContent(
-                title="로그인 오류 분석",
-                content="비밀번호 검증 로직에 문제가 있습니다."
-            )
-            
-            # 테스트 실행
-            result = self.service.create_trouble(self.test_dto, self.created_by)
-            
-            # 결과 검증
-            assert result == mock_trouble
-            mock_get_project.assert_called_once_with(self.mock_db, 1)
-            mock_check_access.assert_called_once_with(self.mock_db, 1, 100)
-            mock_create_trouble.assert_called_once()
-            mock_save_logs.assert_called_once_with(
-                self.mock_db, 1, ["log_id_1", "log_id_2"]
-            )
-    
-    @patch('app.services.trouble.get_project_by_id')
-    def test_create_trouble_project_not_found(self, mock_get_project):
-        """프로젝트가 존재하지 않는 경우 테스트"""
-        
-        # 프로젝트가 None 반환
-        mock_get_project.return_value = None
-        
-        # HTTPException 발생 확인
-        with pytest.raises(HTTPException) as exc_info:
-            self.service.create_trouble(self.test_dto, self.created_by)
+        # 테스트 실행
+        result = self.service.create_trouble(self.test_dto, self.context)
         
-        assert exc_info.value.status_code == 404
-        assert "프로젝트를 찾을 수 없습니다" in exc_info.value.detail
+        # 결과 검증
+        assert result == mock_trouble
+        mock_get_project.assert_not_called()
+        assert mock_create_trouble.call_args[0][2] == 100
+        mock_add_logs.assert_called_once_with(
+            self.mock_db, 1, ["log_id_1", "log_id_2"]
+        )
     
-    @patch('app.services.trouble.trouble_repo.check_user_project_access')
-    @patch('app.services.trouble.get_project_by_id')
-    def test_create_trouble_no_permission(self, mock_get_project, mock_check_access):
-        """프로젝트 접근 권한이 없는 경우 테스트"""
-        
-        # Mock 설정
-        mock_project = Mock()
-        mock_get_project.return_value = mock_project
-        mock_check_access.return_value = False  # 권한 없음
+    def test_context_uses_body_project(self):
+        """trouble 생성 멤버 확인은 요청 본문의 프로젝트로 (멤버가 아니면 get_project_context가 403)"""
+        project_service = Mock()
+        user = Mock(user_id=100)
         
-        # HTTPException 발생 확인
-        with pytest.raises(HTTPException) as exc_info:
-            self.service.create_trouble(self.test_dto, self.created_by)
+        get_trouble_create_context(self.test_dto, user, project_service)
         
-        assert exc_info.value.status_code == 403
-        assert "프로젝트에 접근 권한이 없습니다" in exc_info.value.detail
+        project_service.get_project_context.assert_called_once_with(project_id=1, user=user)
     
-    @patch('app.services.trouble.trouble_repo.save_trouble_logs')
+    @patch('app.services.trouble.trouble_repo.add_trouble_logs')
     @patch('app.services.trouble.trouble_repo.create_trouble')
-    @patch('app.services.trouble.trouble_repo.check_user_project_access')
     @patch('app.services.trouble.get_logs_by_ids')
-    @patch('app.services.trouble.get_project_by_id')
-    def test_create_trouble_ai_failure_fallback(
+    def test_create_trouble_defers_ai_analysis(
         self,
-        mock_get_project,
         mock_get_logs,
-        mock_check_access,
         mock_create_trouble,
-        mock_save_logs
+        mock_add_logs
     ):
-        """AI 분석 실패 시 fallback 처리 테스트"""
-        
-        # Mock 설정
-        mock_project = Mock()
-        mock_project.id = 1
-        mock_get_project.return_value = mock_project
-        mock_check_access.return_value = True
-        
-        # 로그 조회는 실패하도록 설정
-        mock_get_logs.side_effect = Exception("Elasticsearch 연결 실패")
+        """AI 분석 없이 바로 저장하고 분석은 백그라운드 작업에 맡기는지 테스트"""
         
         mock_trouble = Mock(spec=Trouble)
         mock_trouble.id = 1
         mock_create_trouble.return_value = mock_trouble
         
         # 테스트 실행
-        result = self.service.create_trouble(self.test_dto, self.created_by)
+        with patch.object(self.service, '_gen_ai_content') as mock_ai:
+            result = self.service.create_trouble(self.test_dto, self.context)
+            mock_ai.assert_not_called()
         
-        # 결과 검증 - fallback 내용으로 생성되었는지 확인
+        # 결과 검증 - 로그 조회와 AI 호출 없이 질의를 제목으로 저장
         assert result == mock_trouble
-        
-        # create_trouble 호출 인수 확인
-        call_args = mock_create_trouble.call_args[0][1]  # trouble_data
-        assert "사용자 질의에 대한 분석을 진행 중입니다" in call_args["content"]
-
+        mock_get_logs.assert_not_called()
+        call_args = mock_create_trouble.call_args[0]
+        assert call_args[3] == "로그인 문제를 해결해주세요"
+        assert call_args[4] == ""
 
 def test_create_trouble_manual():
     """수동 테스트용 함수 - 실제 의존성과 함께 테스트"""
@@ -164,7 +117,7 @@ def test_create_trouble_manual():
     #     from app.infra.database.session import get_db
     #     db = next(get_db())
     #     service = TroubleService(db)
-    #     result = service.create_trouble(test_dto, 999)
+    #     result = service.create_trouble(test_dto, context)
     #     print(f"성공! 생성된 trouble ID: {result.id}")
     # except Exception as e:
     #     print(f"에러 발생: {e}")
@@ -8,6 +8,9 @@ from app.services.trouble import TroubleService
 from app.models.trouble import Trouble
 from app.models.project import Project
 from app.schemas.trouble import TroubleListQuery, TroubleListResponse, TroubleSummary
+from app.schemas.project import ProjectContext
+from app.core.enums.roles import ProjectRole
+from app.core.utils.count_cache import CountCache
 
 
 class TestGetProjectTroubles:
@@ -91,21 +94,29 @@ class TestGetProjectTroubles:
         mock_get_project.assert_called_once_with(self.mock_db, self.project_id)
         mock_get_troubles.assert_called_once_with(self.mock_db, self.project_id, query_params, self.user_id)
     
+    @patch('app.services.trouble.trouble_count_cache', new_callable=CountCache)
+    @patch('app.services.trouble.trouble_repo.count_project_troubles')
+    @patch('app.services.trouble.trouble_repo.get_project_troubles_page')
     @patch('app.services.trouble.get_project_by_id')
-    def test_get_project_troubles_project_not_found(self, mock_get_project):
-        """존재하지 않는 프로젝트로 조회 시 404 에러"""
-        
-        # 프로젝트가 None 반환
-        mock_get_project.return_value = None
-        
+    def test_get_project_troubles_uses_context(
+        self, mock_get_project, mock_get_page, mock_count, mock_cache
+    ):
+        """프로젝트/멤버 확인은 요청 의존성에서 끝났으므로 사용자, 프로젝트를 다시 조회하지 않음"""
+        mock_get_page.return_value = []
+        mock_count.return_value = 0
+        context = ProjectContext(
+            user_id=self.user_id, username="user", project_id=self.project_id, role=ProjectRole.MEMBER
+        )
         query_params = TroubleListQuery(page=1, size=10)
-        
-        # HTTPException 발생 확인
-        with pytest.raises(HTTPException) as exc_info:
-            self.service.get_project_troubles(self.project_id, query_params, self.user_id)
-        
-        assert exc_info.value.status_code == 404
-        assert "프로젝트를 찾을 수 없습니다" in exc_info.value.detail
+
+        result = self.service.get_project_troubles(context, query_params)
+
+        assert result.total == 0
+        assert result.next_cursor is None
+        mock_get_page.assert_called_once_with(
+            self.mock_db, self.project_id, query_params, self.user_id, None
+        )
+        mock_get_project.assert_not_called()
     
     @patch('app.services.trouble.trouble_repo.get_creator_email')
     @patch('app.services.trouble.trouble_repo.get_project_troubles_paginated')
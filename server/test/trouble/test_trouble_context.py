@@ -0,0 +1,124 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from langchain_core.messages import AIMessage
+
+from app.core.enums.trouble_context_mode import TroubleContextMode
+from app.core.utils.log_context_utils import (
+    estimate_tokens,
+    format_log_lines,
+    log_template,
+    pack_lines,
+)
+from app.services.trouble_context import TroubleContextBuilder
+
+
+def _hit(message, timestamp=None, comment=None, **source):
+    source.update(message=message, message_timestamp=timestamp, comment=comment)
+    return {"_id": message, "_source": source}
+
+
+class TestTroubleLogLines:
+    """연관 로그 줄 만들기 테스트 클래스"""
+
+    def test_template_masks_variables(self):
+        """시각, id, IP, 숫자는 가려서 같은 종류의 로그가 같은 템플릿이 됨"""
+        first = log_template("2024-05-01 10:00:01 user 42 from 10.0.0.1:8080 req deadbeef12 failed")
+        second = log_template("2024-05-02T11:30:00Z user 7 from 10.0.0.2:443 req 0a1b2c3d4e failed")
+
+        assert first == second == "<*> user <*> from <*> req <*> failed"
+
+    def test_template_mode_groups_repeated_logs(self):
+        """템플릿 모드는 반복 로그를 개수와 시간 범위가 붙은 한 줄로 묶음"""
+        hits = [
+            _hit("timeout after 3000ms", "2024-05-01 10:00:02", "업스트림 타임아웃", log_level="ERROR"),
+            _hit("disk full", "2024-05-01 10:00:05"),
+            _hit("timeout after 5000ms", "2024-05-01 10:00:01", log_level="ERROR"),
+        ]
+
+        lines = format_log_lines(hits, TroubleContextMode.TEMPLATE)
+
+        assert lines == [
+            "(x2) 2024-05-01 10:00:01 ~ 2024-05-01 10:00:02 ERROR timeout after 3000ms // 업스트림 타임아웃",
+            "(x1) 2024-05-01 10:00:05 disk full",
+        ]
+
+    def test_comment_mode_groups_by_comment(self):
+        """코멘트 모드는 같은 코멘트의 로그를 코멘트 한 줄로 묶음"""
+        hits = [
+            _hit("a failed", comment="결제 실패"),
+            _hit("b failed", comment="결제 실패"),
+            _hit("no comment"),
+        ]
+
+        lines = format_log_lines(hits, TroubleContextMode.COMMENT)
+
+        assert lines == ["(x2) 결제 실패", "(x1) no comment"]
+
+    def test_raw_mode_keeps_every_log(self):
+        """원문 모드는 로그마다 한 줄"""
+        hits = [_hit("same 1", "t1"), _hit("same 2", "t2")]
+
+        assert format_log_lines(hits, TroubleContextMode.RAW) == ["t1 same 1", "t2 same 2"]
+
+    def test_pack_lines_respects_budget(self):
+        """묶음마다 토큰 예산을 넘지 않고 줄 순서 유지"""
+        lines = [f"line {i} " + "x" * 30 for i in range(10)]
+
+        chunks = pack_lines(lines, 30)
+
+        assert [line for chunk in chunks for line in chunk] == lines
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert sum(estimate_tokens(line) + 1 for line in chunk) <= 30
+
+
+class TestTroubleContextBuilder:
+    """연관 로그 컨텍스트 생성 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.summary_llm = Mock()
+        self.hits = [_hit(f"event {i} " + "payload " * 10 + f"kind{chr(97 + i)}") for i in range(8)]
+
+    def test_within_budget_skips_summary(self):
+        """예산 안이면 요약 없이 로그 줄을 그대로 사용"""
+        builder = TroubleContextBuilder(TroubleContextMode.TEMPLATE, 10000, self.summary_llm)
+
+        context = builder.build("결제 오류", self.hits, "Korean")
+
+        self.summary_llm.batch.assert_not_called()
+        assert context.summarized_chunks == 0
+        assert context.log_count == 8
+        assert context.text.count("\n") == context.line_count - 1
+
+    def test_over_budget_summarizes_chunks(self):
+        """예산을 넘으면 묶음별 요약을 한 번에 요청하고 요약들을 컨텍스트로 사용"""
+        self.summary_llm.batch.side_effect = lambda inputs, config: [
+            AIMessage(content=f"요약 {i}", usage_metadata={"input_tokens": 50, "output_tokens": 5, "total_tokens": 55})
+            for i in range(len(inputs))
+        ]
+        builder = TroubleContextBuilder(TroubleContextMode.TEMPLATE, 60, self.summary_llm)
+
+        context = builder.build("결제 오류", self.hits, "Korean")
+
+        self.summary_llm.batch.assert_called_once()
+        inputs = self.summary_llm.batch.call_args.args[0]
+        assert len(inputs) > 1
+        assert context.summarized_chunks == len(inputs)
+        assert context.summary_prompt_tokens == 50 * len(inputs)
+        assert context.text.startswith("요약 0\n\n요약 1")
+        assert estimate_tokens(context.text) <= 60
+
+    def test_async_build_uses_abatch(self):
+        """비동기 버전은 abatch로 요약 요청"""
+        self.summary_llm.abatch = AsyncMock(
+            side_effect=lambda inputs, config: [AIMessage(content="요약") for _ in inputs]
+        )
+        builder = TroubleContextBuilder(TroubleContextMode.TEMPLATE, 60, self.summary_llm)
+
+        context = asyncio.run(builder.abuild("결제 오류", self.hits, "Korean"))
+
+        self.summary_llm.abatch.assert_awaited_once()
+        assert context.summarized_chunks > 0
+        assert context.summary_prompt_tokens > 0
@@ -0,0 +1,246 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.services.trouble import TroubleService
+from app.core.enums.language import Language
+from app.core.enums.trouble_status import TroubleStatus
+from app.core.llm.prompts import TroubleContent
+from app.core.utils.log_context_utils import TROUBLE_LOG_FIELDS
+from app.infra.database.session import Base
+from app.models import Project, Trouble, TroubleLog, User
+from app.repositories.trouble import requeue_running_troubles
+from app.tasks.trouble import run_trouble_generation, submit_trouble_generation
+
+
+def _trouble(status: TroubleStatus = TroubleStatus.PENDING, attempts: int = 0) -> Mock:
+    trouble = Mock()
+    trouble.id = 1
+    trouble.project_id = 1
+    trouble.created_by = 100
+    trouble.user_query = "로그인 문제를 해결해주세요"
+    trouble.status = status
+    trouble.attempts = attempts
+    trouble.logs = [Mock(log_id="log_id_1"), Mock(log_id="log_id_2")]
+    return trouble
+
+
+def _claim(trouble: Mock):
+    """대기 중인 trouble만 선점하는 claim_trouble_generation 대체 함수"""
+    def claim(db, trouble_id):
+        if trouble.status != TroubleStatus.PENDING:
+            return None
+        trouble.status = TroubleStatus.RUNNING
+        trouble.attempts += 1
+        return trouble
+    return claim
+
+
+def _fail(db, trouble, error_message, retry):
+    trouble.status = TroubleStatus.PENDING if retry else TroubleStatus.FAILED
+    trouble.error_message = error_message
+    return trouble
+
+
+@patch("app.services.trouble.trouble_repo")
+@patch("app.services.trouble.get_logs_by_ids")
+@patch("app.services.trouble.get_project_by_id")
+class TestGenerateTroubleContent:
+    """백그라운드 AI 분석 작업 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=Session)
+        self.service = TroubleService(self.mock_db)
+        self.project = Mock(index="test-index", language=Language.KOREAN)
+
+    def test_completes_pending_trouble(self, mock_get_project, mock_get_logs, mock_repo):
+        """로그 조회 후 AI 결과를 저장하고 완료 상태로 변경"""
+        trouble = _trouble()
+        mock_repo.claim_trouble_generation.side_effect = _claim(trouble)
+        mock_repo.complete_trouble_generation.return_value = _trouble(TroubleStatus.COMPLETED)
+        mock_get_project.return_value = self.project
+        mock_get_logs.return_value = [
+            {"_id": "log_id_1", "_source": {"message": "ERROR login failed for user 1"}},
+            {"_id": "log_id_2", "_source": {"message": "ERROR login failed for user 2"}},
+        ]
+
+        with patch.object(self.service, "_gen_ai_content") as mock_ai:
+            mock_ai.return_value = (TroubleContent(title="로그인 오류 분석", content="원인"), 250)
+            status = self.service.generate_trouble_content(1)
+
+        assert status == TroubleStatus.COMPLETED
+        mock_get_logs.assert_called_once_with(
+            index_name="test-index", ids=["log_id_1", "log_id_2"], fields=TROUBLE_LOG_FIELDS
+        )
+        # 같은 템플릿의 두 로그는 한 줄로 묶임
+        assert mock_ai.call_args.args[1] == "(x2) ERROR login failed for user 1"
+        args, kwargs = mock_repo.complete_trouble_generation.call_args
+        assert args == (self.mock_db, trouble, "로그인 오류 분석", "원인")
+        assert kwargs["prompt_tokens"] == 250
+        assert kwargs["generation_ms"] >= 0
+
+    def test_failure_keeps_pending_for_retry(self, mock_get_project, mock_get_logs, mock_repo):
+        """재시도 횟수가 남아 있으면 실패를 기록하고 대기 상태로 되돌림"""
+        trouble = _trouble()
+        mock_repo.claim_trouble_generation.side_effect = _claim(trouble)
+        mock_repo.fail_trouble_generation.side_effect = _fail
+        mock_get_project.return_value = self.project
+        mock_get_logs.side_effect = Exception("OpenSearch 연결 실패")
+
+        status = self.service.generate_trouble_content(1)
+
+        assert status == TroubleStatus.PENDING
+        assert trouble.error_message == "OpenSearch 연결 실패"
+        mock_repo.complete_trouble_generation.assert_not_called()
+
+    def test_last_attempt_marks_failed(self, mock_get_project, mock_get_logs, mock_repo):
+        """마지막 시도까지 실패하면 실패 상태로 저장 (placeholder 내용 저장 없음)"""
+        mock_repo.claim_trouble_generation.side_effect = _claim(_trouble(attempts=2))
+        mock_repo.fail_trouble_generation.side_effect = _fail
+        mock_get_project.return_value = self.project
+        mock_get_logs.return_value = []
+
+        with patch.object(self.service, "_gen_ai_content", side_effect=Exception("timeout")):
+            status = self.service.generate_trouble_content(1)
+
+        assert status == TroubleStatus.FAILED
+
+    def test_skips_unclaimed_trouble(self, mock_get_project, mock_get_logs, mock_repo):
+        """생성 중이거나 이미 끝난 trouble은 선점하지 못해 분석하지 않음"""
+        for status in (TroubleStatus.RUNNING, TroubleStatus.COMPLETED, TroubleStatus.FAILED):
+            mock_repo.claim_trouble_generation.side_effect = _claim(_trouble(status))
+
+            assert self.service.generate_trouble_content(1) is None
+
+        mock_get_logs.assert_not_called()
+
+
+@patch("app.services.trouble.trouble_repo")
+class TestRegenerateTrouble:
+    """AI 분석 재요청 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=Session)
+        self.service = TroubleService(self.mock_db)
+
+    def test_resets_failed_trouble(self, mock_repo):
+        """실패한 trouble은 대기 상태로 초기화"""
+        trouble = _trouble(TroubleStatus.FAILED, attempts=3)
+        mock_repo.get_trouble_by_id.return_value = trouble
+
+        self.service.regenerate_trouble(1, 100)
+
+        mock_repo.reset_trouble_generation.assert_called_once_with(self.mock_db, trouble)
+
+    def test_rejects_running_trouble(self, mock_repo):
+        """분석 중인 trouble은 409"""
+        mock_repo.get_trouble_by_id.return_value = _trouble(TroubleStatus.RUNNING)
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.service.regenerate_trouble(1, 100)
+
+        assert exc_info.value.status_code == 409
+        mock_repo.reset_trouble_generation.assert_not_called()
+
+
+@patch("app.tasks.trouble.threading.Timer")
+@patch("app.tasks.trouble._executor")
+@patch("app.tasks.trouble.run_trouble_generation_once")
+class TestRunTroubleGeneration:
+    """워커 재시도 테스트 클래스"""
+
+    def test_retry_is_resubmitted_with_backoff(self, mock_once, mock_executor, mock_timer):
+        """대기 상태로 돌아오면 워커를 붙잡지 않고 백오프 뒤 다시 등록"""
+        mock_once.side_effect = [TroubleStatus.PENDING, TroubleStatus.PENDING, TroubleStatus.COMPLETED]
+
+        assert run_trouble_generation(1) == TroubleStatus.PENDING
+        first_delay, submit = mock_timer.call_args.args
+        # 타이머가 만료되면 다음 백오프 시간과 함께 워커 풀에 등록
+        submit(*mock_timer.call_args.kwargs["args"])
+        _, trouble_id, retry_delay = mock_executor.submit.call_args.args
+
+        assert run_trouble_generation(trouble_id, retry_delay) == TroubleStatus.PENDING
+        second_delay = mock_timer.call_args.args[0]
+
+        assert run_trouble_generation(1, second_delay * 2) == TroubleStatus.COMPLETED
+        assert second_delay == first_delay * 2
+        assert mock_timer.call_count == 2
+        assert mock_timer.return_value.start.call_count == 2
+
+    def test_stops_on_unexpected_error(self, mock_once, mock_executor, mock_timer):
+        """상태 저장 자체가 실패하면 재시도하지 않음"""
+        mock_once.side_effect = Exception("deleted")
+
+        assert run_trouble_generation(1) is None
+        mock_timer.assert_not_called()
+
+    def test_resubmit_after_shutdown_is_ignored(self, mock_once, mock_executor, mock_timer):
+        """종료 뒤 재시도 등록은 예외 없이 건너뜀 (다음 실행에서 다시 등록)"""
+        mock_executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+
+        submit_trouble_generation(1)
+
+        mock_executor.submit.assert_called_once()
+
+
+class TestRequeueRunningTroubles:
+    """중단된 AI 분석 작업 재등록 테스트 클래스 (SQLite 메모리 DB)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(
+            self.engine,
+            tables=[User.__table__, Project.__table__, Trouble.__table__, TroubleLog.__table__],
+        )
+        self.db = sessionmaker(bind=self.engine)()
+        self.now = datetime(2024, 1, 1, 12, 0)
+        self.db.add_all(
+            [
+                User(id=1, username="owner", password="x"),
+                Project(id=1, name="p", index="idx", api_key="key", invite_code="code"),
+            ]
+        )
+        claims = {
+            1: (TroubleStatus.RUNNING, self.now - timedelta(hours=1)),
+            2: (TroubleStatus.RUNNING, self.now - timedelta(seconds=30)),
+            3: (TroubleStatus.RUNNING, None),
+            4: (TroubleStatus.COMPLETED, self.now - timedelta(hours=1)),
+        }
+        self.db.add_all(
+            Trouble(
+                id=trouble_id,
+                project_id=1,
+                created_by=1,
+                report_name="r",
+                user_query="q",
+                content="",
+                status=status,
+                claimed_at=claimed_at,
+            )
+            for trouble_id, (status, claimed_at) in claims.items()
+        )
+        self.db.commit()
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def test_requeues_only_stale_claims(self):
+        """선점 시각이 오래되었거나 없는 생성 중 trouble만 대기 상태로 되돌림"""
+        requeued = requeue_running_troubles(self.db, self.now - timedelta(minutes=15))
+
+        assert sorted(requeued) == [1, 3]
+        statuses = {trouble.id: trouble.status for trouble in self.db.query(Trouble)}
+        assert statuses == {
+            1: TroubleStatus.PENDING,
+            2: TroubleStatus.RUNNING,
+            3: TroubleStatus.PENDING,
+            4: TroubleStatus.COMPLETED,
+        }
@@ -0,0 +1,141 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from fastapi import HTTPException
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.enums.roles import ProjectRole
+from app.core.enums.trouble_status import TroubleStatus
+from app.core.utils.count_cache import CountCache
+from app.core.utils.cursor_utils import decode_keyset_cursor
+from app.schemas.project import ProjectContext
+from app.schemas.trouble import TroubleListQuery
+from app.services.trouble import TroubleService
+
+
+def _row(row_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=row_id,
+        report_name=f"report {row_id}",
+        created_at=datetime(2024, 1, 1, 0, row_id),
+        is_shared=True,
+        status=TroubleStatus.COMPLETED,
+        creator_username="owner",
+        logs_count=0,
+    )
+
+
+@patch("app.services.trouble.submit_trouble_count_refresh")
+@patch("app.services.trouble.trouble_count_cache", new_callable=CountCache)
+@patch("app.services.trouble.trouble_repo")
+class TestTroubleListCursor:
+    """trouble 목록 커서 페이지와 전체 개수 캐시 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=Session)
+        self.service = TroubleService(self.mock_db)
+        self.context = ProjectContext(
+            user_id=100, username="owner", project_id=1, role=ProjectRole.MEMBER
+        )
+
+    def test_next_cursor(self, mock_repo, mock_cache, mock_submit):
+        """한 행 더 읽혔으면 보여준 마지막 행으로 다음 커서를 만들고, 그 커서로 다음 페이지 조회"""
+        mock_repo.get_project_troubles_page.return_value = [_row(9), _row(8), _row(7)]
+        mock_repo.count_project_troubles.return_value = 9
+
+        first = self.service.get_project_troubles(self.context, TroubleListQuery(size=2))
+
+        assert [item.id for item in first.items] == [9, 8]
+        assert decode_keyset_cursor(first.next_cursor) == (datetime(2024, 1, 1, 0, 8), 8)
+
+        mock_repo.get_project_troubles_page.return_value = [_row(7)]
+        query_params = TroubleListQuery(size=2, cursor=first.next_cursor)
+        second = self.service.get_project_troubles(self.context, query_params)
+
+        assert second.next_cursor is None
+        mock_repo.get_project_troubles_page.assert_called_with(
+            self.mock_db, 1, query_params, 100, (datetime(2024, 1, 1, 0, 8), 8)
+        )
+
+    def test_invalid_cursor(self, mock_repo, mock_cache, mock_submit):
+        """형식이 잘못된 커서는 400"""
+        with pytest.raises(HTTPException) as exc_info:
+            self.service.get_project_troubles(self.context, TroubleListQuery(cursor="not-a-cursor"))
+
+        assert exc_info.value.status_code == 400
+
+    def test_search_pages_by_number(self, mock_repo, mock_cache, mock_submit):
+        """관련도순 검색 결과는 next_cursor 없이 page로 이동, cursor를 함께 주면 400"""
+        mock_repo.get_project_troubles_page.return_value = [_row(9), _row(8), _row(7)]
+        mock_repo.count_project_troubles.return_value = 9
+
+        result = self.service.get_project_troubles(
+            self.context, TroubleListQuery(size=2, search="로그인")
+        )
+
+        assert result.next_cursor is None
+        assert result.pages == 5
+
+        cursor = self.service.get_project_troubles(self.context, TroubleListQuery(size=2)).next_cursor
+        with pytest.raises(HTTPException) as exc_info:
+            self.service.get_project_troubles(
+                self.context, TroubleListQuery(size=2, search="로그인", cursor=cursor)
+            )
+
+        assert exc_info.value.status_code == 400
+
+    def test_total_counted_once_then_cached(self, mock_repo, mock_cache, mock_submit):
+        """처음 한 번만 바로 세고, 다음 페이지들은 캐시된 개수 사용"""
+        mock_repo.get_project_troubles_page.return_value = []
+        mock_repo.count_project_troubles.return_value = 42
+
+        for page in (1, 2, 3):
+            result = self.service.get_project_troubles(self.context, TroubleListQuery(page=page))
+            assert result.total == 42
+
+        mock_repo.count_project_troubles.assert_called_once()
+        mock_submit.assert_not_called()
+
+    def test_stale_total_refreshed_in_background(self, mock_repo, mock_cache, mock_submit):
+        """TTL이 지난 개수는 그대로 응답하고 다시 세기는 한 번만 백그라운드로 등록"""
+        mock_repo.get_project_troubles_page.return_value = []
+        key = (1, 100, None, None, None)
+        mock_cache.put(key, 42)
+
+        with patch("app.core.utils.count_cache.time.monotonic", return_value=10**9):
+            first = self.service.get_project_troubles(self.context, TroubleListQuery())
+            second = self.service.get_project_troubles(self.context, TroubleListQuery())
+
+        assert first.total == second.total == 42
+        mock_repo.count_project_troubles.assert_not_called()
+        mock_submit.assert_called_once_with(key, 1, TroubleListQuery(), 100)
+
+    def test_count_started_before_invalidate_is_discarded(self, mock_repo, mock_cache, mock_submit):
+        """세는 도중 무효화되면 그 전에 센 개수는 저장하지 않음"""
+        key = (1, 100, None, None, None)
+        mock_repo.get_project_troubles_page.return_value = []
+
+        def count_then_invalidate(*args):
+            # 세는 동안 다른 요청이 trouble을 삭제
+            mock_cache.invalidate_project(1)
+            return 42
+
+        mock_repo.count_project_troubles.side_effect = count_then_invalidate
+
+        result = self.service.get_project_troubles(self.context, TroubleListQuery())
+
+        assert result.total == 42
+        assert mock_cache.get(key) == (None, True)
+
+    def test_delete_invalidates_project_total(self, mock_repo, mock_cache, mock_submit):
+        """삭제하면 그 프로젝트의 개수를 다시 셈"""
+        mock_cache.put((1, 100, None, None, None), 42)
+        mock_cache.put((2, 100, None, None, None), 7)
+        mock_repo.get_trouble_by_id.return_value = Mock(created_by=100, project_id=1)
+
+        self.service.delete_trouble(1, 100)
+
+        assert mock_cache.get((1, 100, None, None, None)) == (None, True)
+        assert mock_cache.get((2, 100, None, None, None)) == (7, False)
@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import sessionmaker
+
+from app.infra.database.session import Base
+from app.models import Project, Trouble, TroubleLog, User, UserProject
+from app.repositories.trouble import (
+    get_project_troubles_page,
+    get_project_troubles_paginated,
+    project_troubles_count_statement,
+)
+from app.schemas.trouble import TroubleListQuery
+
+
+class TestTroubleListQuery:
+    """trouble 목록 조회 쿼리 수 테스트 클래스 (SQLite 메모리 DB)"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                Project.__table__,
+                UserProject.__table__,
+                Trouble.__table__,
+                TroubleLog.__table__,
+            ],
+        )
+        self.db = sessionmaker(bind=self.engine)()
+
+        owner = User(id=1, username="owner", password="x")
+        other = User(id=2, username="other", password="x")
+        project = Project(
+            id=1, name="p", index="idx", api_key="key", invite_code="code"
+        )
+        self.db.add_all([owner, other, project])
+        base = datetime(2024, 1, 1)
+        for i in range(15):
+            self.db.add(
+                Trouble(
+                    id=i + 1,
+                    project_id=1,
+                    created_by=1 if i % 2 == 0 else 2,
+                    report_name=f"report {i}",
+                    user_query="query",
+                    content="",
+                    is_shared=True,
+                    created_at=base + timedelta(minutes=i),
+                )
+            )
+            # trouble마다 로그 i개 (LIMIT이 로그 행 수에 영향을 받는지 확인)
+            self.db.add_all(TroubleLog(trouble_id=i + 1, log_id=f"log-{i}-{j}") for j in range(i))
+        self.db.commit()
+        self.db.expire_all()
+
+        self.statements = []
+        event.listen(
+            self.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: self.statements.append(statement),
+        )
+
+    def teardown_method(self):
+        """각 테스트 실행 후 정리"""
+        self.db.close()
+        self.engine.dispose()
+
+    def test_page_uses_two_queries(self):
+        """전체 개수 + 요약 목록, 페이지 크기와 상관없이 쿼리 2번"""
+        rows, total = get_project_troubles_paginated(
+            self.db, 1, TroubleListQuery(page=1, size=10), user_id=1
+        )
+
+        assert len(self.statements) == 2
+        assert total == 15
+        assert len(rows) == 10
+        assert [row.id for row in rows[:3]] == [15, 14, 13]
+        assert rows[0].logs_count == 14
+        assert rows[0].creator_username == "owner"
+        assert rows[1].creator_username == "other"
+
+    def test_last_page_and_zero_logs(self):
+        """마지막 페이지, 로그가 없는 trouble은 0개"""
+        rows, total = get_project_troubles_paginated(
+            self.db, 1, TroubleListQuery(page=2, size=10), user_id=1
+        )
+
+        assert len(self.statements) == 2
+        assert len(rows) == 5
+        assert rows[-1].id == 1
+        assert rows[-1].logs_count == 0
+
+    def test_access_filter(self):
+        """공유되지 않은 다른 사용자의 trouble은 제외"""
+        self.db.query(Trouble).filter(Trouble.created_by == 2).update({Trouble.is_shared: False})
+        self.db.commit()
+        self.statements.clear()
+
+        rows, total = get_project_troubles_paginated(
+            self.db, 1, TroubleListQuery(page=1, size=100), user_id=1
+        )
+
+        assert total == 8
+        assert {row.creator_username for row in rows} == {"owner"}
+
+    def test_keyset_pages(self):
+        """커서로 이어 읽은 목록은 OFFSET 페이지와 같고, 페이지마다 쿼리 1번 (생성 시각이 같은 trouble 포함)"""
+        self.db.query(Trouble).filter(Trouble.id.in_([7, 8, 9])).update(
+            {Trouble.created_at: datetime(2024, 1, 1, 0, 7)}, synchronize_session=False
+        )
+        self.db.commit()
+        query_params = TroubleListQuery(size=4)
+        expected, _ = get_project_troubles_paginated(
+            self.db, 1, TroubleListQuery(page=1, size=100), user_id=1
+        )
+        self.statements.clear()
+
+        ids, after, pages = [], None, 0
+        while True:
+            rows = get_project_troubles_page(self.db, 1, query_params, user_id=1, after=after)
+            pages += 1
+            ids += [row.id for row in rows[:4]]
+            if len(rows) <= 4:
+                break
+            after = (rows[3].created_at, rows[3].id)
+
+        assert ids == [row.id for row in expected]
+        assert len(self.statements) == pages == 4
+        assert "(troubles.created_at, troubles.id) <" in self.statements[-1]
+
+    def test_search_includes_content(self):
+        """두 글자 이상 검색어는 본문까지 검색, 한 글자는 제목/질의 부분 일치"""
+        self.db.query(Trouble).filter(Trouble.id == 3).update(
+            {Trouble.content: "결제 서버 타임아웃으로 주문 실패"}
+        )
+        self.db.commit()
+
+        rows, total = get_project_troubles_paginated(
+            self.db, 1, TroubleListQuery(search="타임아웃"), user_id=1
+        )
+        assert total == 1
+        assert [row.id for row in rows] == [3]
+
+        rows, total = get_project_troubles_paginated(
+            self.db, 1, TroubleListQuery(search="타"), user_id=1
+        )
+        assert total == 0
+
+    def test_mysql_search_uses_boolean_phrase(self):
+        """MySQL은 BOOLEAN MODE 구문 검색 - ngram 하나만 겹치는 trouble은 일치하지 않음"""
+        statement = project_troubles_count_statement(
+            1, TroubleListQuery(search='login "failed'), user_id=1
+        ).compile(dialect=mysql.dialect())
+
+        assert "MATCH (troubles.report_name, troubles.user_query, troubles.content) AGAINST" in str(statement)
+        assert "IN BOOLEAN MODE" in str(statement)
+        assert '"login failed"' in statement.params.values()
+
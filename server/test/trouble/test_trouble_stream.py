@@ -0,0 +1,162 @@
+import asyncio
+import json
+import threading
+from unittest.mock import Mock, patch
+from sqlalchemy.orm import Session
+from langchain_core.messages import AIMessageChunk
+
+from app.services.trouble import TroubleService
+from app.core.enums.language import Language
+from app.core.enums.trouble_status import TroubleStatus
+from app.core.utils.sse_utils import format_sse
+
+
+def _trouble(status: TroubleStatus = TroubleStatus.PENDING, attempts: int = 0) -> Mock:
+    trouble = Mock()
+    trouble.id = 1
+    trouble.project_id = 1
+    trouble.user_query = "로그인 문제를 해결해주세요"
+    trouble.status = status
+    trouble.attempts = attempts
+    trouble.content = ""
+    trouble.logs = [Mock(log_id="log_id_1")]
+    return trouble
+
+
+def _collect(service: TroubleService, trouble_id: int = 1) -> list:
+    """SSE 메시지를 (event, data) 목록으로 모음"""
+    async def run():
+        return [event async for event in service.astream_trouble_events(trouble_id)]
+
+    events = []
+    for message in asyncio.run(run()):
+        event_line, data_line = message.strip().split("\n")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return events
+
+
+def _astream(*chunks, error: Exception = None):
+    async def astream(messages):
+        for chunk in chunks:
+            yield chunk
+        if error:
+            raise error
+    return astream
+
+
+@patch("app.services.trouble.TroubleService._to_response", lambda self, trouble: {"id": trouble.id})
+@patch("app.services.trouble.trouble_repo")
+@patch("app.services.trouble.get_logs_by_ids")
+@patch("app.services.trouble.get_project_by_id")
+class TestStreamTrouble:
+    """SSE 트러블슈팅 스트리밍 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.mock_db = Mock(spec=Session)
+        self.service = TroubleService(self.mock_db)
+        self.service.llm = Mock()
+        self.trouble = _trouble()
+
+    def _prepare(self, mock_get_project, mock_get_logs, mock_repo):
+        mock_repo.get_trouble_by_id.return_value = self.trouble
+        mock_repo.claim_trouble_generation.return_value = self.trouble
+        mock_repo.complete_trouble_generation.side_effect = lambda db, trouble, title, content, **usage: trouble
+        mock_get_project.return_value = Mock(index="test-index", language=Language.KOREAN)
+        mock_get_logs.return_value = [{"_id": "log_id_1", "_source": {"message": "에러 로그"}}]
+
+    def test_streams_tokens_and_persists(self, mock_get_project, mock_get_logs, mock_repo):
+        """토큰마다 이벤트를 보내고 끝나면 제목/본문을 나눠 저장"""
+        self._prepare(mock_get_project, mock_get_logs, mock_repo)
+        self.service.llm.astream = _astream(
+            AIMessageChunk(content="# 로그인 "),
+            AIMessageChunk(content="오류\n\n1. 비밀번호"),
+            AIMessageChunk(content=""),
+            AIMessageChunk(content=[{"type": "text", "text": " 검증 실패"}]),
+        )
+
+        events = _collect(self.service)
+
+        assert [event for event, _ in events] == ["token", "token", "token", "done"]
+        assert events[2][1] == {"text": " 검증 실패"}
+        args, kwargs = mock_repo.complete_trouble_generation.call_args
+        assert args == (self.mock_db, self.trouble, "로그인 오류", "1. 비밀번호 검증 실패")
+        assert kwargs["prompt_tokens"] > 0
+
+    def test_completed_trouble_is_replayed(self, mock_get_project, mock_get_logs, mock_repo):
+        """이미 완료된 trouble은 LLM 호출 없이 저장된 내용을 보냄"""
+        trouble = _trouble(TroubleStatus.COMPLETED)
+        trouble.content = "저장된 분석"
+        mock_repo.get_trouble_by_id.return_value = trouble
+
+        events = _collect(self.service)
+
+        assert events == [("token", {"text": "저장된 분석"}), ("done", {"id": 1})]
+        mock_repo.claim_trouble_generation.assert_not_called()
+
+    def test_already_claimed(self, mock_get_project, mock_get_logs, mock_repo):
+        """백그라운드 워커가 먼저 선점했으면 error 이벤트"""
+        self._prepare(mock_get_project, mock_get_logs, mock_repo)
+        mock_repo.claim_trouble_generation.return_value = None
+
+        events = _collect(self.service)
+
+        assert [event for event, _ in events] == ["error"]
+        mock_get_logs.assert_not_called()
+
+    def test_llm_error_returns_to_pending(self, mock_get_project, mock_get_logs, mock_repo):
+        """스트리밍 중 실패하면 재시도할 수 있도록 대기 상태로 기록"""
+        self._prepare(mock_get_project, mock_get_logs, mock_repo)
+        mock_repo.fail_trouble_generation.side_effect = lambda db, trouble, error, retry: Mock(
+            status=TroubleStatus.PENDING if retry else TroubleStatus.FAILED
+        )
+        self.service.llm.astream = _astream(
+            AIMessageChunk(content="# 제목"), error=Exception("rate limit")
+        )
+
+        events = _collect(self.service)
+
+        assert [event for event, _ in events] == ["token", "error"]
+        assert events[1][1]["status"] == "pending"
+        assert mock_repo.fail_trouble_generation.call_args.args[2:] == ("rate limit", True)
+        mock_repo.complete_trouble_generation.assert_not_called()
+
+
+    def test_disconnect_returns_to_pending_off_loop(self, mock_get_project, mock_get_logs, mock_repo):
+        """클라이언트 연결이 끊기면 이벤트 루프 밖(스레드풀)에서 대기 상태로 기록"""
+        self._prepare(mock_get_project, mock_get_logs, mock_repo)
+        threads = []
+        mock_repo.fail_trouble_generation.side_effect = lambda *args: threads.append(
+            threading.current_thread()
+        )
+        self.service.llm.astream = _astream(
+            AIMessageChunk(content="# 제목"), AIMessageChunk(content="본문")
+        )
+
+        async def disconnect():
+            events = self.service.astream_trouble_events(1)
+            await events.__anext__()
+            await events.aclose()
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(disconnect())
+
+        assert mock_repo.fail_trouble_generation.call_args.args[2:] == ("스트리밍 연결이 끊어졌습니다", True)
+        assert threads and threads[0] is not loop_thread
+        mock_repo.complete_trouble_generation.assert_not_called()
+
+
+class TestStreamHelpers:
+    """스트리밍 보조 함수 테스트 클래스"""
+
+    def setup_method(self):
+        """각 테스트 실행 전 설정"""
+        self.service = TroubleService(Mock(spec=Session))
+
+    def test_without_title_line(self):
+        """제목 줄이 없으면 사용자 질의를 제목으로 사용"""
+        assert self.service._split_streamed_content("본문만 있음", "질의") == ("질의", "본문만 있음")
+
+    def test_format_sse(self):
+        """이벤트 이름과 JSON 데이터, 빈 줄로 끝나는 메시지"""
+        assert format_sse("token", {"text": "한글"}) == 'event: token\ndata: {"text": "한글"}\n\n'